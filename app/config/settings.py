@@ -8,3 +8,113 @@ ODOO_URL = os.getenv('ODOO_URL')
 ODOO_DB = os.getenv('ODOO_DB')
 ODOO_USERNAME = os.getenv('ODOO_USERNAME')
 ODOO_PASSWORD = os.getenv('ODOO_PASSWORD')
+
+# Controle de admissão das chamadas ao Odoo (limite adaptativo por servidor)
+ODOO_MAX_WORKERS = int(os.getenv('ODOO_MAX_WORKERS', '20'))
+ODOO_CONCURRENCY_INITIAL = int(os.getenv('ODOO_CONCURRENCY_INITIAL', '8'))
+ODOO_CONCURRENCY_MIN = int(os.getenv('ODOO_CONCURRENCY_MIN', '2'))
+# Fração do limite disponível para jobs em segundo plano
+ODOO_BACKGROUND_SHARE = float(os.getenv('ODOO_BACKGROUND_SHARE', '0.5'))
+# Espera máxima (segundos) na fila antes de responder 503
+ODOO_QUEUE_TIMEOUT = float(os.getenv('ODOO_QUEUE_TIMEOUT', '5'))
+ODOO_BACKGROUND_QUEUE_TIMEOUT = float(
+    os.getenv('ODOO_BACKGROUND_QUEUE_TIMEOUT', '60')
+)
+
+# Novas tentativas de leituras após falhas transitórias do Odoo
+ODOO_RETRY_ATTEMPTS = int(os.getenv('ODOO_RETRY_ATTEMPTS', '3'))
+ODOO_RETRY_BASE_DELAY = float(os.getenv('ODOO_RETRY_BASE_DELAY', '0.2'))
+ODOO_RETRY_MAX_DELAY = float(os.getenv('ODOO_RETRY_MAX_DELAY', '2'))
+# Tempo total (segundos) que uma leitura pode gastar entre tentativas
+ODOO_RETRY_DEADLINE = float(os.getenv('ODOO_RETRY_DEADLINE', '10'))
+
+# Tempo limite (segundos) de cada chamada XML-RPC ao Odoo
+ODOO_READ_TIMEOUT = float(os.getenv('ODOO_READ_TIMEOUT', '15'))
+ODOO_WRITE_TIMEOUT = float(os.getenv('ODOO_WRITE_TIMEOUT', '60'))
+ODOO_EXPORT_TIMEOUT = float(os.getenv('ODOO_EXPORT_TIMEOUT', '120'))
+# Decodificador rápido das respostas XML-RPC (ver xmlrpc_decoder)
+XMLRPC_FAST_DECODER = (
+    os.getenv('XMLRPC_FAST_DECODER', 'false').lower() == 'true'
+)
+
+# Disjuntor: falhas seguidas até abrir e segundos aberto até testar de novo
+ODOO_BREAKER_FAILURES = int(os.getenv('ODOO_BREAKER_FAILURES', '5'))
+ODOO_BREAKER_RESET_TIMEOUT = float(
+    os.getenv('ODOO_BREAKER_RESET_TIMEOUT', '30')
+)
+# Segundos em que leituras que aceitam dados antigos (ex: nomes de estágio)
+# podem ser servidas do cache com o Odoo fora do ar
+ODOO_STALE_CACHE_TTL = int(os.getenv('ODOO_STALE_CACHE_TTL', '3600'))
+
+# Hedging: cópia de leituras que passam do p95 da latência observada
+ODOO_HEDGING = os.getenv('ODOO_HEDGING', 'false').lower() == 'true'
+# Fração máxima das leituras que pode gerar cópia
+ODOO_HEDGE_BUDGET = float(os.getenv('ODOO_HEDGE_BUDGET', '0.05'))
+ODOO_HEDGE_MIN_SAMPLES = int(os.getenv('ODOO_HEDGE_MIN_SAMPLES', '50'))
+
+# Feed de alterações: atraso (segundos) antes de servir um write_date. Deve
+# superar a transação mais longa do Odoo (limit_time_real, 120 por padrão)
+CHANGE_FEED_LAG = int(os.getenv('CHANGE_FEED_LAG', '120'))
+
+# Réplica local (SQLite) dos modelos mais lidos
+MIRROR_ENABLED = os.getenv('MIRROR_ENABLED', 'false').lower() == 'true'
+MIRROR_DB_PATH = os.getenv('MIRROR_DB_PATH', 'mirror.sqlite3')
+MIRROR_SYNC_INTERVAL = int(os.getenv('MIRROR_SYNC_INTERVAL', '60'))
+MIRROR_RECONCILE_INTERVAL = int(os.getenv('MIRROR_RECONCILE_INTERVAL', '3600'))
+# Defasagem máxima (segundos) aceita por padrão; 0 desativa a leitura
+MIRROR_MAX_STALENESS = int(os.getenv('MIRROR_MAX_STALENESS', '0'))
+
+# Cache compartilhado: 'memory' (por processo), 'sqlite' (por host) ou 'redis'
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'memory').lower()
+CACHE_PATH = os.getenv('CACHE_PATH', 'cache.sqlite3')
+CACHE_URL = os.getenv('CACHE_URL', 'redis://localhost:6379/0')
+CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', '1024'))
+# Máximo de conexões simultâneas de cada processo com o Redis
+CACHE_POOL_SIZE = int(os.getenv('CACHE_POOL_SIZE', '8'))
+
+# Listagens de painéis: validade (segundos) no cache e tempo extra em que a
+# leitura vencida ainda é servida enquanto é atualizada em segundo plano
+READ_CACHE_TTL = int(os.getenv('READ_CACHE_TTL', '10'))
+READ_STALE_TTL = int(os.getenv('READ_STALE_TTL', '300'))
+
+# Validade (segundos) dos metadados de schema (fields_get e ir.model)
+SCHEMA_CACHE_TTL = int(os.getenv('SCHEMA_CACHE_TTL', '600'))
+
+# Serializa respostas montadas a partir do Odoo sem revalidá-las
+TRUSTED_RESPONSES = os.getenv('TRUSTED_RESPONSES', 'true').lower() == 'true'
+
+# Respostas menores que isto (bytes) não são comprimidas
+COMPRESSION_MINIMUM_SIZE = int(os.getenv('COMPRESSION_MINIMUM_SIZE', '1024'))
+# Segundos em que um ETag responde 304 sem consultar o Odoo; 0 desativa
+ETAG_CACHE_TTL = int(os.getenv('ETAG_CACHE_TTL', '30'))
+
+# Segundos em que a resposta de uma escrita com Idempotency-Key é guardada
+IDEMPOTENCY_TTL = int(os.getenv('IDEMPOTENCY_TTL', '86400'))
+
+# Rastreamento distribuído: exportador ('' desliga, 'file' ou 'otlp'),
+# destino dos spans e fração das requisições rastreadas
+TRACE_EXPORTER = os.getenv('TRACE_EXPORTER', '').lower()
+TRACE_FILE = os.getenv('TRACE_FILE', 'traces.jsonl')
+TRACE_OTLP_ENDPOINT = os.getenv(
+    'TRACE_OTLP_ENDPOINT', 'http://localhost:4318/v1/traces'
+)
+TRACE_SAMPLE_RATE = float(os.getenv('TRACE_SAMPLE_RATE', '0.1'))
+
+# Chamadas ao Odoo mais lentas que isto (segundos) vão para o registro de
+# chamadas lentas; 0 desliga. Tamanho do registro (últimas N chamadas)
+SLOW_CALL_THRESHOLD = float(os.getenv('SLOW_CALL_THRESHOLD', '1'))
+SLOW_CALL_LOG_SIZE = int(os.getenv('SLOW_CALL_LOG_SIZE', '200'))
+# Token exigido no cabeçalho X-Admin-Token pelos endpoints /admin; vazio
+# desativa esses endpoints
+ADMIN_TOKEN = os.getenv('ADMIN_TOKEN', '')
+
+# Detector de N+1: 'off', 'warn' (loga) ou 'raise' (falha a requisição,
+# usado nos testes) quando a mesma chamada ao Odoo (modelo, método e
+# forma do domínio) se repete mais de N vezes numa requisição
+N_PLUS_ONE_MODE = os.getenv(
+    'N_PLUS_ONE_MODE',
+    'off'
+    if os.getenv('ENVIRONMENT', 'development').lower() == 'production'
+    else 'warn',
+).lower()
+N_PLUS_ONE_THRESHOLD = int(os.getenv('N_PLUS_ONE_THRESHOLD', '10'))
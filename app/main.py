@@ -3,6 +3,7 @@
 import logging
 import os
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 
 # Removido: from sched import scheduler
 import pytz
@@ -12,21 +13,43 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from scalar_fastapi import get_scalar_api_reference
 
+from app.config.settings import MIRROR_RECONCILE_INTERVAL, MIRROR_SYNC_INTERVAL
+from app.middleware.cache_age import CacheAgeMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.conditional import ConditionalGetMiddleware
+from app.middleware.idempotency import IdempotencyMiddleware
+from app.middleware.load_shedding import (
+    LoadSheddingMiddleware,
+    overloaded_exception_handler,
+)
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.request_context import RequestContextMiddleware
+from app.middleware.rpc_recorder import RpcRecorderMiddleware
+from app.middleware.tracing import TracingMiddleware
+from app.routers.admin_endpoints import router as admin_router
 from app.routers.analytics_endpoints import router as analytics_router
+from app.routers.change_feed_endpoints import router as change_feed_router
 from app.routers.company_endpoints import router as company_router
 from app.routers.cron_jobs_endpoints import router as cron_jobs_router
 from app.routers.crm_endpoints import router as crm_router
 from app.routers.custom_fields_endpoints import router as custom_fields_router
+from app.routers.export_endpoints import router as export_router
 from app.routers.fields_inspection_endpoints import (
     router as fields_inspection_router,
 )
 from app.routers.health_endpoints import router as health_router
 from app.routers.helpdesk_endpoints import router as helpdesk_router
+from app.routers.metrics_endpoints import router as metrics_router
 from app.routers.migracao_endpoints import router as migracao_router
 from app.routers.sales_orders_endpoints import router as sales_orders_router
 from app.routers.tasks_endpoints import router as tasks_router
+from app.services.admission import UpstreamOverloadedError, in_background_lane
 from app.services.async_odoo_client import AsyncOdooClient
+from app.services.cache import close_cache
+from app.services.mirror_service import get_mirror
 from app.services.stale_opportunities_service import check_and_report_stale_opportunities
+from app.services.tracing import close_tracer
+from app.utils.responses import FastJSONResponse
 
 is_production = os.getenv('ENVIRONMENT', 'development').lower() == 'production'
 
@@ -41,7 +64,7 @@ async def lifespan(app: FastAPI):
     
     # Adiciona a tarefa ao agendador
     scheduler.add_job(
-        check_and_report_stale_opportunities,
+        in_background_lane(check_and_report_stale_opportunities),
         'cron',
         day_of_week='mon-fri',
         hour=8, # Ajuste o horário conforme necessário
@@ -50,6 +73,27 @@ async def lifespan(app: FastAPI):
         id="report_stale_opportunities_job",
         replace_existing=True
     )
+
+    # Réplica local: sincroniza deltas por write_date e reconcilia exclusões
+    mirror = get_mirror()
+    if mirror:
+        scheduler.add_job(
+            in_background_lane(mirror.sync_all),
+            'interval',
+            seconds=MIRROR_SYNC_INTERVAL,
+            next_run_time=datetime.now(timezone.utc),
+            id='mirror_sync_job',
+            replace_existing=True,
+        )
+        scheduler.add_job(
+            in_background_lane(mirror.reconcile_all),
+            'interval',
+            seconds=MIRROR_RECONCILE_INTERVAL,
+            id='mirror_reconcile_job',
+            replace_existing=True,
+        )
+        logger.info(f"Réplica local habilitada em {mirror.path}")
+
     scheduler.start()
     logger.info("Agendador iniciado com sucesso.")
     
@@ -63,10 +107,17 @@ async def lifespan(app: FastAPI):
     for client in AsyncOdooClient._instances.values():
         client.close()
 
+    if mirror:
+        mirror.close()
+
+    await close_cache()
+    close_tracer()
+
 
 # CORREÇÃO: Passando a função 'lifespan' para o FastAPI
 app = FastAPI(
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     title='API Odoo',
     description='API para integração com o ERP do Odoo',
     version='0.1.0',
@@ -74,7 +125,28 @@ app = FastAPI(
     openapi_url=None if is_production else '/openapi.json',
 )
 
-# Configure CORS middleware
+# Rota da requisição para o registro de chamadas lentas
+app.add_middleware(RequestContextMiddleware)
+# Contagem de chamadas ao Odoo por requisição (detector de N+1)
+app.add_middleware(RpcRecorderMiddleware)
+# Age/X-Cache nas respostas montadas com leituras do cache
+app.add_middleware(CacheAgeMiddleware)
+# 503 quando o Odoo está saturado, mesmo se o serviço engolir o erro
+app.add_middleware(LoadSheddingMiddleware)
+app.add_exception_handler(
+    UpstreamOverloadedError, overloaded_exception_handler
+)
+# Por fora do LoadShedding, para não guardar respostas trocadas por 503
+app.add_middleware(IdempotencyMiddleware)
+# ETag/304 nas listagens; a compressão fica por fora para ver o corpo final
+app.add_middleware(ConditionalGetMiddleware)
+app.add_middleware(CompressionMiddleware)
+# Latência por rota, medida por fora de tudo (inclui 304 e compressão)
+app.add_middleware(MetricsMiddleware)
+# Span da requisição (traceparent W3C), pai das chamadas ao Odoo
+app.add_middleware(TracingMiddleware)
+# CORS por último (camada mais externa), para que 304, 503 e respostas
+# repetidas pela idempotência também recebam os cabeçalhos
 origins = os.getenv('CORS_ORIGINS', '*').split(',')
 app.add_middleware(
     CORSMiddleware,
@@ -91,11 +163,15 @@ app.include_router(tasks_router)
 app.include_router(helpdesk_router)
 app.include_router(sales_orders_router)
 app.include_router(health_router)
+app.include_router(metrics_router)
 app.include_router(migracao_router)
 app.include_router(fields_inspection_router)
 app.include_router(analytics_router)
 app.include_router(custom_fields_router)
 app.include_router(cron_jobs_router)
+app.include_router(export_router)
+app.include_router(change_feed_router)
+app.include_router(admin_router)
 
 
 @app.get('/')
@@ -0,0 +1,42 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.cache import cache_age_state
+
+
+class CacheAgeMiddleware:
+    """
+    Informa ao cliente a idade dos dados servidos do cache de leituras.
+
+    Quando a rota usa alguma leitura em cache do Odoo (ver
+    AsyncOdooClient.search_read), a resposta recebe o cabeçalho Age com
+    os segundos desde a leitura mais antiga e X-Cache com 'hit' (dentro da
+    validade) ou 'stale' (vencida, servida enquanto é revalidada ou com o
+    Odoo fora do ar). Respostas montadas só com dados novos não mudam.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        state = {'age': None, 'stale': False}
+        token = cache_age_state.set(state)
+
+        async def send_wrapper(message: Message):
+            if (
+                message['type'] == 'http.response.start'
+                and state['age'] is not None
+            ):
+                headers = MutableHeaders(scope=message)
+                headers['Age'] = str(int(state['age']))
+                headers['X-Cache'] = 'stale' if state['stale'] else 'hit'
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            cache_age_state.reset(token)
@@ -0,0 +1,205 @@
+import zlib
+from http import HTTPStatus
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.settings import COMPRESSION_MINIMUM_SIZE
+
+# brotli é opcional (extra 'brotli'); sem ele só gzip é negociado
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Nível do gzip e qualidade do brotli: bom equilíbrio para JSON dinâmico
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+
+# Tipos de conteúdo que valem a pena comprimir
+COMPRESSIBLE_TYPES = (
+    'text/',
+    'application/json',
+    'application/x-ndjson',
+    'application/xml',
+    'application/javascript',
+)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Escolhe a codificação a partir do cabeçalho Accept-Encoding.
+
+    Prefere brotli (quando instalado) a gzip e respeita q=0.
+
+    Args:
+        accept_encoding: Valor do cabeçalho enviado pelo cliente
+
+    Returns:
+        'br', 'gzip' ou None se nenhuma for aceita
+    """
+    weights = {}
+    for item in accept_encoding.split(','):
+        name, _, params = item.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name.strip().lower()] = quality
+
+    wildcard = weights.get('*', 0.0)
+    supported = ['br', 'gzip'] if brotli is not None else ['gzip']
+    ranked = [
+        (weights.get(name, wildcard), -index, name)
+        for index, name in enumerate(supported)
+    ]
+    quality, _, name = max(ranked)
+    return name if quality > 0 else None
+
+
+def _compressible(headers: Headers) -> bool:
+    content_type = headers.get('content-type', '')
+    return 'content-encoding' not in headers and (
+        content_type.startswith(COMPRESSIBLE_TYPES) or '+json' in content_type
+    )
+
+
+class _Compressor:
+    """Compressor incremental com a mesma interface para gzip e brotli."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == 'br':
+            self._brotli = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            # wbits=31: formato gzip (cabeçalho e CRC) em vez de zlib puro
+            self._zlib = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        """Comprime um pedaço e o libera para o cliente imediatamente."""
+        if self.encoding == 'br':
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b'') -> bytes:
+        if self.encoding == 'br':
+            return self._brotli.process(data) + self._brotli.finish()
+        return self._zlib.compress(data) + self._zlib.flush()
+
+
+class CompressionMiddleware:
+    """
+    Comprime respostas com brotli ou gzip conforme o Accept-Encoding.
+
+    Respostas completas abaixo de `minimum_size` bytes seguem sem
+    compressão. Respostas em streaming são comprimidas pedaço a pedaço.
+    Respostas que já têm Content-Encoding (ex: exportação com gzip) ou
+    cujo tipo não é textual passam intactas. Um ETag forte recebe o
+    sufixo da codificação, pois o corpo enviado é outro.
+    """
+
+    def __init__(
+        self, app: ASGIApp, minimum_size: int = COMPRESSION_MINIMUM_SIZE
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(
+            Headers(scope=scope).get('accept-encoding', '')
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    def _encode_headers(self, length: Optional[int]) -> None:
+        headers = MutableHeaders(scope=self.start)
+        headers['Content-Encoding'] = self.encoding
+        headers.add_vary_header('Accept-Encoding')
+        if length is None:
+            del headers['Content-Length']
+        else:
+            headers['Content-Length'] = str(length)
+
+        etag = headers.get('etag')
+        if etag and not etag.startswith('W/') and etag.endswith('"'):
+            headers['ETag'] = f'{etag[:-1]}-{self.encoding}"'
+
+    async def send(self, message: Message) -> None:
+        if message['type'] == 'http.response.start':
+            self.start = message
+            if message['status'] == HTTPStatus.NOT_MODIFIED:
+                # O 304 varia com a codificação como o 200 que ele valida
+                MutableHeaders(scope=message).add_vary_header(
+                    'Accept-Encoding'
+                )
+            headers = Headers(raw=message['headers'])
+            self.passthrough = not _compressible(headers)
+            if self.passthrough:
+                await self._send(message)
+            return
+
+        if self.passthrough or message['type'] != 'http.response.body':
+            await self._send(message)
+            return
+
+        body = message.get('body', b'')
+        more_body = message.get('more_body', False)
+
+        if self.compressor is None:
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self._send(self.start)
+                await self._send(message)
+                return
+
+            self.compressor = _Compressor(self.encoding)
+            if not more_body:
+                body = self.compressor.finish(body)
+                self._encode_headers(len(body))
+                await self._send(self.start)
+                await self._send({'type': 'http.response.body', 'body': body})
+                return
+
+            self._encode_headers(None)
+            await self._send(self.start)
+
+        if more_body:
+            chunk = self.compressor.chunk(body)
+        else:
+            chunk = self.compressor.finish(body)
+        await self._send({
+            'type': 'http.response.body',
+            'body': chunk,
+            'more_body': more_body,
+        })
+
+
+def strip_encoding_suffix(etag: str) -> str:
+    """Remove de um ETag o sufixo de codificação adicionado aqui."""
+    for encoding in ('br', 'gzip'):
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[: -len(suffix)] + '"'
+    return etag
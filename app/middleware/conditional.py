@@ -0,0 +1,195 @@
+import hashlib
+from http import HTTPStatus
+from typing import Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.settings import ETAG_CACHE_TTL
+from app.middleware.compression import strip_encoding_suffix
+from app.services.cache import (
+    cache_delete_prefix,
+    cache_get,
+    cache_set,
+    make_cache_key,
+)
+
+# Rotas de leitura que recebem ETag e respondem 304
+CONDITIONAL_GET_PREFIXES = (
+    '/company',
+    '/tickets',
+    '/projects',
+    '/opportunities',
+    '/sales_orders',
+    '/analytics',
+)
+
+# Namespace das chaves de ETag no cache compartilhado
+ETAG_NAMESPACE = 'etag:'
+
+
+def compute_etag(body: bytes) -> str:
+    """Gera um ETag forte a partir do corpo serializado da resposta."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def matching_etag(if_none_match: str, etag: str) -> Optional[str]:
+    """
+    Procura no If-None-Match um ETag equivalente ao atual.
+
+    Usa a comparação fraca exigida para If-None-Match e ignora o sufixo
+    de codificação adicionado pelo CompressionMiddleware.
+
+    Returns:
+        O ETag do cliente que corresponde, com o sufixo de codificação
+        que ele recebeu no 200 (é o que o 304 deve repetir), ou None
+    """
+    for item in if_none_match.split(','):
+        candidate = item.strip()
+        if candidate == '*':
+            return etag
+        candidate = candidate.removeprefix('W/')
+        if strip_encoding_suffix(candidate) == etag:
+            return candidate
+    return None
+
+
+def _etag_key(scope: Scope) -> str:
+    query = scope.get('query_string', b'').decode()
+    return make_cache_key(
+        ETAG_NAMESPACE + scope['path'], sorted(query.split('&'))
+    )
+
+
+class ConditionalGetMiddleware:
+    """
+    ETag e 304 Not Modified para as listagens de leitura.
+
+    O ETag é um hash do corpo JSON e fica guardado no cache compartilhado
+    por `ttl` segundos, indexado pela rota e pela query string. Enquanto
+    ele estiver no cache, um If-None-Match igual é respondido com 304 sem
+    executar a rota, ou seja, sem consultar o Odoo nem serializar nada.
+    Depois do TTL a rota volta a ser executada e, se o corpo não mudou, o
+    cliente ainda recebe 304 (economizando a transferência).
+
+    Escritas bem-sucedidas nas mesmas rotas invalidam todos os ETags, para
+    que alterações feitas pela própria API apareçam na próxima leitura.
+    Alterações feitas direto no Odoo aparecem em até `ttl` segundos.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        prefixes: Tuple[str, ...] = CONDITIONAL_GET_PREFIXES,
+        ttl: float = ETAG_CACHE_TTL,
+    ):
+        self.app = app
+        self.prefixes = prefixes
+        self.ttl = ttl
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http' or not scope['path'].startswith(
+            self.prefixes
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if scope['method'] != 'GET':
+            await self._write(scope, receive, send)
+            return
+
+        key = _etag_key(scope)
+        if_none_match = Headers(scope=scope).get('if-none-match')
+
+        if if_none_match and self.ttl:
+            etag = await cache_get(key)
+            matched = etag and matching_etag(if_none_match, etag)
+            if matched:
+                await _send_not_modified(send, matched)
+                return
+
+        responder = _ETagResponder(send, key, if_none_match, self.ttl)
+        await self.app(scope, receive, responder.send)
+
+    async def _write(self, scope: Scope, receive: Receive, send: Send):
+        status = None
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        if status is not None and status < HTTPStatus.BAD_REQUEST:
+            await cache_delete_prefix(ETAG_NAMESPACE)
+
+
+async def _send_not_modified(send: Send, etag: str) -> None:
+    await send({
+        'type': 'http.response.start',
+        'status': 304,
+        'headers': [(b'etag', etag.encode())],
+    })
+    await send({'type': 'http.response.body', 'body': b''})
+
+
+class _ETagResponder:
+    def __init__(
+        self,
+        send: Send,
+        key: str,
+        if_none_match: Optional[str],
+        ttl: float,
+    ):
+        self._send = send
+        self.key = key
+        self.if_none_match = if_none_match
+        self.ttl = ttl
+        self.start: Optional[Message] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message['type'] == 'http.response.start':
+            headers = Headers(raw=message['headers'])
+            # Só respostas 200 em JSON, ainda sem ETag, são versionadas
+            self.passthrough = (
+                message['status'] != HTTPStatus.OK
+                or 'etag' in headers
+                or not headers.get('content-type', '').startswith(
+                    'application/json'
+                )
+            )
+            if self.passthrough:
+                await self._send(message)
+            else:
+                self.start = message
+            return
+
+        if self.passthrough or message['type'] != 'http.response.body':
+            await self._send(message)
+            return
+
+        body = message.get('body', b'')
+        if message.get('more_body', False):
+            # Streaming: não há corpo completo para gerar o hash
+            self.passthrough = True
+            await self._send(self.start)
+            await self._send(message)
+            return
+
+        etag = compute_etag(body)
+        if self.ttl:
+            await cache_set(self.key, etag, self.ttl)
+
+        matched = self.if_none_match and matching_etag(
+            self.if_none_match, etag
+        )
+        if matched:
+            await _send_not_modified(self._send, matched)
+            return
+
+        MutableHeaders(scope=self.start)['ETag'] = etag
+        await self._send(self.start)
+        await self._send(message)
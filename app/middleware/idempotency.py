@@ -0,0 +1,259 @@
+import base64
+import hashlib
+import logging
+from http import HTTPStatus
+from typing import List, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.settings import IDEMPOTENCY_TTL
+from app.services.cache import (
+    cache_add,
+    cache_delete,
+    cache_get,
+    cache_set,
+    make_cache_key,
+)
+from app.utils.responses import FastJSONResponse
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# Métodos cujas requisições podem ser protegidas por Idempotency-Key
+UNSAFE_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+# Namespace das chaves de idempotência no cache compartilhado
+IDEMPOTENCY_NAMESPACE = 'idempotency:'
+
+# Segundos em que uma escrita em andamento bloqueia repetições da mesma
+# chave; depois disso a chave é liberada mesmo que o worker tenha caído
+IN_PROGRESS_TTL = 120
+
+MAX_KEY_LENGTH = 255
+
+
+def _idempotency_key(scope: Scope, key: str) -> str:
+    return make_cache_key(
+        IDEMPOTENCY_NAMESPACE + scope['path'], scope['method'], key
+    )
+
+
+async def _read_body(receive: Receive) -> Optional[bytes]:
+    """Lê o corpo inteiro da requisição (None se o cliente desconectou)."""
+    chunks = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return None
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+
+def _replay_receive(body: bytes, receive: Receive) -> Receive:
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if sent:
+            return await receive()
+        sent = True
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    return replay
+
+
+class IdempotencyMiddleware:
+    """
+    Evita que uma escrita repetida pelo cliente seja aplicada duas vezes.
+
+    Uma requisição POST/PUT/PATCH/DELETE com o cabeçalho Idempotency-Key
+    tem a resposta guardada no cache compartilhado por `ttl` segundos,
+    indexada pela rota, pelo método e pela chave. Repetições com o mesmo
+    corpo recebem a resposta original (com Idempotent-Replayed: true) sem
+    chegar ao Odoo; com outro corpo recebem 422. Enquanto a primeira
+    requisição ainda está em andamento, as repetições recebem 409.
+
+    Respostas 5xx não são guardadas, para que o cliente possa tentar de
+    novo depois de uma falha ou de um 503 por sobrecarga. Se o cache
+    estiver fora do ar a escrita é recusada com 503, já que não haveria
+    como detectar repetições.
+    """
+
+    def __init__(self, app: ASGIApp, ttl: float = IDEMPOTENCY_TTL):
+        self.app = app
+        self.ttl = ttl
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http' or scope['method'] not in UNSAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        idempotency_key = Headers(scope=scope).get('idempotency-key')
+        if idempotency_key is None or not self.ttl:
+            await self.app(scope, receive, send)
+            return
+
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            await _error(
+                scope,
+                receive,
+                send,
+                HTTPStatus.BAD_REQUEST,
+                'Idempotency-Key inválida',
+            )
+            return
+
+        body = await _read_body(receive)
+        if body is None:
+            return
+
+        await self._run_once(
+            scope,
+            receive,
+            send,
+            _idempotency_key(scope, idempotency_key),
+            body,
+        )
+
+    async def _run_once(
+        self, scope: Scope, receive: Receive, send: Send, key: str, body: bytes
+    ) -> None:
+        """Executa a escrita se a chave estiver livre e guarda a resposta."""
+        fingerprint = hashlib.sha256(body).hexdigest()
+
+        # A chave é reservada de forma atômica (set-if-absent) antes de
+        # chamar a aplicação: de duas requisições simultâneas, só uma
+        # chega ao Odoo. Sem o cache não há essa garantia e a escrita é
+        # recusada
+        claim = {'fingerprint': fingerprint, 'status': None}
+        try:
+            claimed = await cache_add(key, claim, IN_PROGRESS_TTL)
+        except Exception as e:
+            logger.error(
+                f'Cache indisponível, escrita com Idempotency-Key '
+                f'recusada: {e}'
+            )
+            await _error(
+                scope,
+                receive,
+                send,
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                'Não foi possível garantir a idempotência, tente novamente',
+            )
+            return
+
+        if not claimed:
+            # Se a entrada sumiu desde a reserva, a primeira requisição
+            # acabou de falhar: responde como em andamento
+            entry = await cache_get(key) or claim
+            await _answer_repeat(scope, receive, send, entry, fingerprint)
+            return
+
+        recorder = _ResponseRecorder(send)
+        try:
+            await self.app(
+                scope, _replay_receive(body, receive), recorder.send
+            )
+        except BaseException:
+            await cache_delete(key)
+            raise
+
+        response = recorder.recorded()
+        if response is None or response[0] >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            await cache_delete(key)
+            return
+
+        # O cache guarda JSON: cabeçalhos vão como texto latin-1 (como no
+        # HTTP) e o corpo em base64
+        status, headers, content = response
+        await cache_set(
+            key,
+            {
+                'fingerprint': fingerprint,
+                'status': status,
+                'headers': [
+                    [name.decode('latin-1'), value.decode('latin-1')]
+                    for name, value in headers
+                ],
+                'body': base64.b64encode(content).decode('ascii'),
+            },
+            self.ttl,
+        )
+
+
+async def _answer_repeat(
+    scope: Scope,
+    receive: Receive,
+    send: Send,
+    entry: dict,
+    fingerprint: str,
+) -> None:
+    if entry['fingerprint'] != fingerprint:
+        await _error(
+            scope,
+            receive,
+            send,
+            HTTPStatus.UNPROCESSABLE_ENTITY,
+            'Idempotency-Key já usada com outro corpo',
+        )
+        return
+
+    if entry['status'] is None:
+        await _error(
+            scope,
+            receive,
+            send,
+            HTTPStatus.CONFLICT,
+            'Requisição com esta Idempotency-Key ainda em andamento',
+        )
+        return
+
+    await send({
+        'type': 'http.response.start',
+        'status': entry['status'],
+        'headers': [
+            *(
+                (name.encode('latin-1'), value.encode('latin-1'))
+                for name, value in entry['headers']
+            ),
+            (b'idempotent-replayed', b'true'),
+        ],
+    })
+    await send({
+        'type': 'http.response.body',
+        'body': base64.b64decode(entry['body']),
+    })
+
+
+async def _error(
+    scope: Scope, receive: Receive, send: Send, status: int, detail: str
+) -> None:
+    response = FastJSONResponse({'detail': detail}, status_code=status)
+    await response(scope, receive, send)
+
+
+class _ResponseRecorder:
+    """Repassa a resposta ao cliente guardando uma cópia dela."""
+
+    def __init__(self, send: Send):
+        self._send = send
+        self.status: Optional[int] = None
+        self.headers: List[Tuple[bytes, bytes]] = []
+        self.chunks: List[bytes] = []
+        self.complete = False
+
+    async def send(self, message: Message) -> None:
+        if message['type'] == 'http.response.start':
+            self.status = message['status']
+            self.headers = [tuple(header) for header in message['headers']]
+        elif message['type'] == 'http.response.body':
+            self.chunks.append(message.get('body', b''))
+            self.complete = not message.get('more_body', False)
+        await self._send(message)
+
+    def recorded(self) -> Optional[Tuple[int, list, bytes]]:
+        if self.status is None or not self.complete:
+            return None
+        return self.status, self.headers, b''.join(self.chunks)
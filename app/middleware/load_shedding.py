@@ -0,0 +1,83 @@
+from http import HTTPStatus
+
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.admission import UpstreamOverloadedError, shed_state
+from app.utils.responses import FastJSONResponse, dumps
+
+OVERLOADED_DETAIL = 'Odoo sobrecarregado, tente novamente em instantes'
+
+
+def overloaded_response(
+    retry_after: int, detail: str = OVERLOADED_DETAIL
+) -> FastJSONResponse:
+    """Resposta 503 com Retry-After para chamadas descartadas."""
+    return FastJSONResponse(
+        {'detail': detail},
+        status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+        headers={'Retry-After': str(retry_after)},
+    )
+
+
+async def overloaded_exception_handler(
+    request: Request, exc: UpstreamOverloadedError
+) -> FastJSONResponse:
+    return overloaded_response(exc.retry_after, str(exc))
+
+
+class LoadSheddingMiddleware:
+    """
+    Garante o 503 quando uma chamada ao Odoo é descartada pelo limitador
+    ou recusada pelo disjuntor.
+
+    Muitos serviços capturam qualquer exceção e devolvem lista vazia ou
+    None, o que transformaria o descarte em um 404 ou 400 enganoso. O
+    limitador registra o descarte no estado da requisição e, se isso
+    aconteceu antes do início da resposta, ela é trocada por um 503 com
+    Retry-After.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        state = {'retry_after': None, 'detail': None}
+        token = shed_state.set(state)
+        replaced = False
+
+        async def send_wrapper(message: Message):
+            nonlocal replaced
+            if replaced:
+                return
+            if (
+                message['type'] == 'http.response.start'
+                and state['retry_after'] is not None
+                and message['status'] != HTTPStatus.SERVICE_UNAVAILABLE
+            ):
+                replaced = True
+                retry_after = str(state['retry_after']).encode()
+                detail = state['detail'] or OVERLOADED_DETAIL
+                await send({
+                    'type': 'http.response.start',
+                    'status': HTTPStatus.SERVICE_UNAVAILABLE,
+                    'headers': [
+                        (b'content-type', b'application/json'),
+                        (b'retry-after', retry_after),
+                    ],
+                })
+                await send({
+                    'type': 'http.response.body',
+                    'body': dumps({'detail': detail}),
+                })
+                return
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            shed_state.reset(token)
@@ -0,0 +1,44 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.metrics import HTTP_REQUEST_DURATION
+
+
+class MetricsMiddleware:
+    """
+    Registra a latência de cada requisição HTTP por rota.
+
+    A rota é o padrão declarado no router (ex: '/tickets/{team_id}') e não
+    o caminho da requisição, para que ids não criem uma série por valor.
+    Caminhos sem rota correspondente são agrupados em 'unmatched'. A
+    latência vai até o envio do último pedaço do corpo.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get('route')
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                method=scope['method'],
+                route=getattr(route, 'path', 'unmatched'),
+                status=str(status),
+            )
@@ -0,0 +1,27 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.services.slow_calls import request_scope
+
+
+class RequestContextMiddleware:
+    """
+    Disponibiliza o escopo da requisição para as chamadas ao Odoo.
+
+    Permite que o registro de chamadas lentas saiba qual rota fez cada
+    chamada, inclusive nas threads do executor e nas rotas síncronas,
+    que recebem uma cópia do contexto.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        token = request_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_scope.reset(token)
@@ -0,0 +1,60 @@
+import logging
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config.settings import N_PLUS_ONE_MODE, N_PLUS_ONE_THRESHOLD
+from app.services.rpc_recorder import (
+    RepeatedCallError,
+    RpcRecorder,
+    current_recorder,
+    describe_repeated,
+    route_report,
+)
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+
+class RpcRecorderMiddleware:
+    """
+    Detecta N+1 contando as chamadas ao Odoo de cada requisição.
+
+    Ao fim da requisição as chamadas entram no relatório por rota e,
+    se alguma (modelo, método, forma do domínio) se repetiu mais de
+    `threshold` vezes, o modo 'warn' registra um aviso e o modo 'raise'
+    levanta RepeatedCallError, o que faz o teste que fez a requisição
+    falhar. No modo 'off' (padrão em produção) nada é contado.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        mode: str = N_PLUS_ONE_MODE,
+        threshold: int = N_PLUS_ONE_THRESHOLD,
+    ):
+        self.app = app
+        self.mode = mode
+        self.threshold = threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http' or self.mode == 'off':
+            await self.app(scope, receive, send)
+            return
+
+        recorder = RpcRecorder()
+        token = current_recorder.set(recorder)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_recorder.reset(token)
+
+        path = getattr(scope.get('route'), 'path', 'unmatched')
+        route = f'{scope["method"]} {path}'
+        route_report.add(route, recorder)
+        repeated = recorder.repeated(self.threshold)
+        if not repeated:
+            return
+        message = describe_repeated(route, repeated)
+        if self.mode == 'raise':
+            raise RepeatedCallError(message)
+        logger.warning(message)
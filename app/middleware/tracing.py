@@ -0,0 +1,60 @@
+from http import HTTPStatus
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.tracing import STATUS_ERROR, current_span, get_tracer
+
+
+class TracingMiddleware:
+    """
+    Abre um span para cada requisição HTTP amostrada.
+
+    Continua o rastreio do cabeçalho W3C traceparent recebido, quando
+    houver. As chamadas ao Odoo feitas durante a requisição viram spans
+    filhos (ver rpc_transport.call_rpc) e a resposta recebe X-Trace-Id
+    para localizar o rastreio. O span é nomeado pelo padrão da rota (ex:
+    'POST /crm/v3/'), como nas métricas.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        tracer = get_tracer()
+        span = tracer.start_request_span(
+            scope['method'], Headers(scope=scope).get('traceparent')
+        )
+        if span is None:
+            await self.app(scope, receive, send)
+            return
+
+        span.attributes['http.request.method'] = scope['method']
+        span.attributes['url.path'] = scope['path']
+
+        async def send_wrapper(message: Message):
+            if message['type'] == 'http.response.start':
+                status = message['status']
+                span.attributes['http.response.status_code'] = status
+                if status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                    span.status = STATUS_ERROR
+                MutableHeaders(scope=message)['X-Trace-Id'] = span.trace_id
+            await send(message)
+
+        token = current_span.set(span)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            span.set_error(e)
+            raise
+        finally:
+            current_span.reset(token)
+            route = getattr(scope.get('route'), 'path', None)
+            if route:
+                span.name = f'{scope["method"]} {route}'
+                span.attributes['http.route'] = route
+            tracer.finish(span)
@@ -0,0 +1,131 @@
+import asyncio
+import secrets
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse, Response
+
+from app.config.settings import ADMIN_TOKEN
+from app.services.profiler import (
+    ProfilerBusyError,
+    render_folded,
+    sample_stacks,
+)
+from app.services.rpc_recorder import route_report
+from app.services.slow_calls import slow_calls
+
+# Duração máxima de uma captura do profiler (segundos)
+MAX_PROFILE_SECONDS = 60
+
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)):
+    """
+    Exige o token de administração no cabeçalho X-Admin-Token.
+
+    Raises:
+        HTTPException: 404 se ADMIN_TOKEN não estiver configurado e 401
+        se o token estiver ausente ou incorreto
+    """
+    if not ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail='Endpoints administrativos desativados',
+        )
+    if not x_admin_token or not secrets.compare_digest(
+        x_admin_token.encode(), ADMIN_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=HTTPStatus.UNAUTHORIZED,
+            detail='Token de administração inválido',
+        )
+
+
+router = APIRouter(
+    prefix='/admin',
+    tags=['Admin'],
+    dependencies=[Depends(require_admin_token)],
+)
+
+
+@router.get('/slow-calls', summary='Lista as chamadas lentas ao Odoo')
+async def get_slow_calls(
+    limit: Optional[int] = Query(None, ge=1, description='Máximo de itens'),
+):
+    """
+    Endpoint para inspecionar o registro de chamadas lentas do worker.
+
+    Cada item traz modelo, método, forma do domínio (sem valores),
+    quantidade de ids enviados e de registros retornados, duração, rota
+    que fez a chamada e o erro, se houve. Com vários workers cada um
+    guarda o próprio registro.
+
+    Returns:
+        Limite configurado e chamadas, da mais recente para a mais antiga
+    """
+    return {
+        'threshold': slow_calls.threshold,
+        'calls': slow_calls.entries(limit),
+    }
+
+
+@router.delete(
+    '/slow-calls',
+    summary='Limpa o registro de chamadas lentas',
+    status_code=HTTPStatus.NO_CONTENT,
+)
+async def clear_slow_calls():
+    slow_calls.clear()
+    return Response(status_code=HTTPStatus.NO_CONTENT)
+
+
+@router.get('/rpc-report', summary='Chamadas ao Odoo por rota')
+async def get_rpc_report():
+    """
+    Endpoint com o relatório do detector de N+1 do worker.
+
+    Para cada rota traz requisições atendidas, total e máximo de chamadas
+    ao Odoo por requisição e o máximo de cada chamada (modelo, método e
+    forma do domínio). Vazio com N_PLUS_ONE_MODE=off.
+    """
+    return route_report.report()
+
+
+@router.delete(
+    '/rpc-report',
+    summary='Zera o relatório de chamadas por rota',
+    status_code=HTTPStatus.NO_CONTENT,
+)
+async def clear_rpc_report():
+    route_report.clear()
+    return Response(status_code=HTTPStatus.NO_CONTENT)
+
+
+@router.get(
+    '/profile',
+    summary='Captura um perfil de CPU do worker',
+    response_class=PlainTextResponse,
+)
+async def get_profile(
+    seconds: float = Query(10, gt=0, le=MAX_PROFILE_SECONDS),
+    interval: float = Query(0.005, ge=0.001, le=1),
+    idle: bool = Query(False, description='Inclui threads ociosas'),
+):
+    """
+    Endpoint de profiling sob demanda do worker que atende a requisição.
+
+    Amostra as pilhas de todas as threads durante `seconds` segundos e
+    retorna o formato "folded" (uma pilha e sua contagem por linha),
+    aceito por flamegraph.pl, speedscope e inferno. A captura roda em
+    uma thread à parte, então o worker continua atendendo durante ela.
+
+    Raises:
+        HTTPException: 409 se já houver uma captura em andamento
+    """
+    try:
+        samples = await asyncio.to_thread(
+            sample_stacks, seconds, interval, idle
+        )
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=HTTPStatus.CONFLICT, detail=str(e))
+    return PlainTextResponse(render_folded(samples))
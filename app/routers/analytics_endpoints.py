@@ -9,10 +9,9 @@ from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from app.config.settings import ODOO_DB, ODOO_PASSWORD, ODOO_URL, ODOO_USERNAME
 from app.schemas.schemas import DateRangeParams, SalesAnalyticsResponse
-from app.services.authentication import authenticate_odoo, connect_to_odoo
 from app.services.sales_analytics_service import get_sales_analytics
+from app.utils.responses import trusted_response
 
 router = APIRouter(prefix='/analytics', tags=['Analytics'])
 
@@ -61,28 +60,14 @@ async def sales_analytics(
         Dicionário com métricas de vendas
 
     Raises:
-        HTTPException: Em caso de falha na autenticação ou erro interno
+        HTTPException: Em caso de erro ao consultar o Odoo
     """
-    common, models = connect_to_odoo(ODOO_URL)
-    uid = authenticate_odoo(common, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD)
-
-    if not uid:
-        raise HTTPException(
-            status_code=HTTPStatus.UNAUTHORIZED,
-            detail='Falha na autenticação no Odoo',
-        )
-
     try:
-        analytics_data = get_sales_analytics(
-            models,
-            ODOO_DB,
-            uid,
-            ODOO_PASSWORD,
-            date_params.start_date,
-            date_params.end_date,
+        analytics_data = await get_sales_analytics(
+            date_params.start_date, date_params.end_date
         )
 
-        return analytics_data
+        return trusted_response(analytics_data)
 
     except Exception as e:
         raise HTTPException(
@@ -0,0 +1,116 @@
+import logging
+from http import HTTPStatus
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.schemas.schemas import ChangeFeedReconcile
+from app.services.change_feed_service import (
+    CHANGE_FEED_MODELS,
+    find_deleted_ids,
+    get_changes,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix='/changes', tags=['Feed de Alterações'])
+
+
+def _ensure_model(model: str) -> None:
+    """Retorna 404 para modelos sem feed de alterações."""
+    if model not in CHANGE_FEED_MODELS:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=f'Modelo {model} não possui feed de alterações',
+        )
+
+
+@router.get(
+    '/{model}',
+    summary="Lista registros alterados desde a última marca d'água",
+)
+async def get_model_changes(
+    model: str,
+    watermark: Optional[str] = Query(
+        None, description="Marca d'água retornada pela chamada anterior"
+    ),
+    limit: int = Query(200, ge=1, le=2000),
+    fields: Optional[List[str]] = Query(
+        default=None,
+        description='Campos a retornar (usa os campos padrão do modelo)',
+    ),
+):
+    """
+    Endpoint para consumir alterações de forma incremental.
+
+    Os registros são ordenados por (write_date, id). Sem marca d'água o
+    feed começa do primeiro registro; depois, o consumidor envia a
+    `next_watermark` recebida e repete enquanto `has_more` for verdadeiro.
+
+    Args:
+        model: Modelo (crm.lead, helpdesk.ticket, project.task ou
+            res.partner)
+        watermark: Marca d'água da chamada anterior
+        limit: Quantidade máxima de registros
+        fields: Campos a retornar
+
+    Returns:
+        Alterações, próxima marca d'água e indicador de mais alterações
+
+    Raises:
+        HTTPException: Se o modelo não existir no feed, a marca d'água for
+        inválida ou a leitura no Odoo falhar
+    """
+    _ensure_model(model)
+
+    try:
+        return await get_changes(model, watermark, limit, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f'Erro ao consultar alterações de {model}: {e}')
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            detail=f'Erro ao consultar alterações: {str(e)}',
+        )
+
+
+@router.post(
+    '/{model}/reconcile',
+    summary='Identifica registros excluídos a partir dos ids do consumidor',
+)
+async def reconcile_model_ids(model: str, request: ChangeFeedReconcile):
+    """
+    Endpoint para detectar exclusões, que não aparecem no feed.
+
+    Deve ser chamado periodicamente com os ids mantidos pelo consumidor;
+    os ids retornados em `deleted` devem ser removidos localmente.
+
+    Args:
+        model: Modelo (crm.lead, helpdesk.ticket, project.task ou
+            res.partner)
+        request: Ids conhecidos pelo consumidor
+
+    Returns:
+        Quantidade de ids verificados e lista de ids excluídos
+
+    Raises:
+        HTTPException: Se o modelo não existir no feed ou a consulta ao
+        Odoo falhar
+    """
+    _ensure_model(model)
+
+    try:
+        deleted = await find_deleted_ids(model, request.ids)
+    except Exception as e:
+        logger.error(f'Erro ao reconciliar ids de {model}: {e}')
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            detail=f'Erro ao reconciliar ids: {str(e)}',
+        )
+
+    return {
+        'model': model,
+        'checked': len(set(request.ids)),
+        'deleted': deleted,
+    }
@@ -1,7 +1,15 @@
 import logging
 from http import HTTPStatus
-
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from typing import List, Optional
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+)
 
 from app.schemas.schemas import (
     CompanyDefault,
@@ -10,6 +18,8 @@ from app.schemas.schemas import (
     Message,
 )
 from app.services.company_service import (
+    PARTNER_DEFAULT_FIELDS,
+    PARTNER_MODEL,
     create_company,
     delete_company,
     fetch_client_by_name,
@@ -19,6 +29,9 @@ from app.services.company_service import (
     update_company,
     update_contact_fields,
 )
+from app.services.mirror_service import read_from_mirror
+from app.services.projection import requested_fields, resolve_fields
+from app.utils.responses import trusted_response
 from app.utils.utils import clean_vat
 
 logging.basicConfig(
@@ -30,21 +43,36 @@ router = APIRouter(prefix='/company', tags=['company'])
 
 
 @router.get('/', summary='Lista empresas cadastradas')
-async def list_companies(limit: int = 100, offset=0):
+async def list_companies(
+    limit: int = Query(100, ge=1, le=1000),
+    offset=0,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = Depends(requested_fields),
+):
     """
     Endpoint para listar todas as empresas cadastradas de forma assíncrona.
 
     Args:
         limit: Limite de registros a serem retornados
-        offset: Deslocamento para paginação
+        offset: Deslocamento para paginação (legado, prefira o cursor)
+        cursor: Cursor da próxima página retornado pela chamada anterior
+        fields: Campos a retornar ("*" para todos os campos leves)
 
     Returns:
-        Lista de empresas encontradas
+        Lista de empresas encontradas e o cursor da próxima página
 
     Raises:
         HTTPException: Se nenhuma empresa for encontrada ou houver um erro
     """
-    companies_info = await get_clients_info(limit, offset)
+    try:
+        fields = await resolve_fields(
+            PARTNER_MODEL, fields, PARTNER_DEFAULT_FIELDS
+        )
+        companies_info, next_cursor = await get_clients_info(
+            limit, int(offset), fields, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
     if not companies_info:
         raise HTTPException(
@@ -52,18 +80,29 @@ async def list_companies(limit: int = 100, offset=0):
             detail='Nenhuma empresa localizada',
         )
 
-    return {
+    return trusted_response({
         'companies': companies_info,
-    }
+        'next_cursor': next_cursor,
+    })
 
 
 @router.get('/vat', summary='Lista empresa por CNPJ')
-async def list_companies_by_vat(vat: str):
+async def list_companies_by_vat(
+    vat: str,
+    max_staleness: Optional[int] = Query(
+        None,
+        ge=0,
+        description='Aceita resposta da réplica local com até N segundos '
+        'de defasagem',
+    ),
+):
     """
     Endpoint para buscar uma empresa pelo VAT (CNPJ) de forma assíncrona.
 
     Args:
         vat: Número do VAT (CNPJ)
+        max_staleness: Defasagem máxima aceita para ler da réplica local
+            (usa MIRROR_MAX_STALENESS se None)
 
     Returns:
         Empresa correspondente ao VAT
@@ -76,7 +115,16 @@ async def list_companies_by_vat(vat: str):
     except ValueError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
-    companies_info = await get_company_by_vat(vat)
+    mirrored = await read_from_mirror(
+        PARTNER_MODEL,
+        [('vat', '=', vat)],
+        PARTNER_DEFAULT_FIELDS,
+        max_staleness,
+    )
+    if mirrored is not None:
+        companies_info, _ = mirrored
+    else:
+        companies_info = await get_company_by_vat(vat)
 
     if not companies_info:
         raise HTTPException(
@@ -90,24 +138,33 @@ async def list_companies_by_vat(vat: str):
 
 
 @router.get('/name', summary='Retorna clientes pelo nome da empresa')
-async def get_clients_by_name(name: str, limit: int = 100, offset: int = 0):
+async def get_clients_by_name(
+    name: str,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = 0,
+    cursor: Optional[str] = None,
+):
     """
     Endpoint para buscar clientes pelo nome (ou parte do nome) da empresa de forma assíncrona.
 
     Args:
         name: Nome ou parte do nome da empresa
         limit: Limite de registros a serem retornados
-        offset: Deslocamento para paginação
+        offset: Deslocamento para paginação (legado, prefira o cursor)
+        cursor: Cursor da próxima página retornado pela chamada anterior
 
     Returns:
-        Lista de clientes correspondentes ao nome
+        Lista de clientes correspondentes ao nome e o cursor da próxima página
 
     Raises:
         HTTPException: Se nenhum cliente for encontrado ou houver um erro
     """
-    companies_info = await fetch_client_by_name(
-        name, limit=limit, offset=offset
-    )
+    try:
+        companies_info, next_cursor = await fetch_client_by_name(
+            name, limit=limit, offset=offset, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
     if not companies_info:
         raise HTTPException(
@@ -119,6 +176,7 @@ async def get_clients_by_name(name: str, limit: int = 100, offset: int = 0):
         'clients': companies_info,
         'count': len(companies_info),
         'search_term': name,
+        'next_cursor': next_cursor,
     }
 
 
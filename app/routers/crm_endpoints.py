@@ -2,13 +2,15 @@ import base64
 import json
 import logging # Adicionado
 from http import HTTPStatus
-from typing import List
+from typing import List, Optional
 
 from fastapi import (
     APIRouter,
+    Depends,
     File,
     Form,
     HTTPException,
+    Query,
     UploadFile,
     status,
 )
@@ -25,30 +27,36 @@ from app.schemas.schemas import (
 from app.services.authentication import authenticate_odoo, connect_to_odoo
 from app.services.company_service import get_or_create_partner 
 from app.services.crm_service import (
+    OPPORTUNITY_DEFAULT_FIELDS,
+    OPPORTUNITY_DETAIL_FIELDS,
     create_opportunity_in_crm,
     create_opportunity_intelligent_async,
     fetch_opportunity_by_id,
-    get_opportunities_info,
+    get_opportunities_page,
 )
+from app.services.projection import requested_fields, resolve_fields
+from app.utils.responses import trusted_response
 
 logger = logging.getLogger(__name__) 
 router = APIRouter(prefix='/opportunities', tags=['Oportunidades'])
 
 
 @router.get('/', summary='Lista oportunidades cadastradas')
-async def list_opportunities_endpoint(limit: int = 100, offset: int = 0):
-    common, models = connect_to_odoo(ODOO_URL)
-    uid = authenticate_odoo(common, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD)
-
-    if not uid:
-        raise HTTPException(
-            status_code=HTTPStatus.UNAUTHORIZED,
-            detail='Falha na autenticação no Odoo',
+async def list_opportunities_endpoint(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = Depends(requested_fields),
+):
+    try:
+        fields = await resolve_fields(
+            'crm.lead', fields, OPPORTUNITY_DEFAULT_FIELDS
         )
-
-    opportunities_info = get_opportunities_info(
-        models, ODOO_DB, uid, ODOO_PASSWORD, limit, offset
-    )
+        opportunities_info, next_cursor = await get_opportunities_page(
+            limit, offset, cursor, fields
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
     if not opportunities_info:
         raise HTTPException(
@@ -56,11 +64,24 @@ async def list_opportunities_endpoint(limit: int = 100, offset: int = 0):
             detail='Nenhuma oportunidade localizada',
         )
 
-    return {'opportunities': opportunities_info}
+    return trusted_response({
+        'opportunities': opportunities_info,
+        'next_cursor': next_cursor,
+    })
 
 
 @router.get('/{opportunity_id}', summary='Oportunidade pelo ID')
-async def get_opportunity_by_id_endpoint(opportunity_id: int):
+async def get_opportunity_by_id_endpoint(
+    opportunity_id: int,
+    fields: Optional[List[str]] = Depends(requested_fields),
+):
+    try:
+        fields = await resolve_fields(
+            'crm.lead', fields, OPPORTUNITY_DETAIL_FIELDS
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
+
     common, models = connect_to_odoo(ODOO_URL)
     uid = authenticate_odoo(common, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD)
     if not uid:
@@ -69,7 +90,7 @@ async def get_opportunity_by_id_endpoint(opportunity_id: int):
             detail='Falha na autenticação no Odoo',
         )
     opportunity_info = fetch_opportunity_by_id(
-        models, ODOO_DB, uid, ODOO_PASSWORD, opportunity_id
+        models, ODOO_DB, uid, ODOO_PASSWORD, opportunity_id, fields=fields
     )
     if not opportunity_info:
         raise HTTPException(
@@ -2,6 +2,7 @@ from fastapi import APIRouter, BackgroundTasks, status
 from http import HTTPStatus
 import logging
 
+from app.services.admission import in_background_lane
 from app.services.stale_opportunities_service import check_and_report_stale_opportunities
 
 router = APIRouter(prefix='/cron', tags=['Tarefas Agendadas'])
@@ -18,5 +19,7 @@ async def trigger_stale_opportunities_report(background_tasks: BackgroundTasks):
     de oportunidades estagnadas por mais de 72 horas.
     """
     logger.info("Endpoint de relatório de oportunidades estagnadas acionado.")
-    background_tasks.add_task(check_and_report_stale_opportunities)
+    background_tasks.add_task(
+        in_background_lane(check_and_report_stale_opportunities)
+    )
     return {"message": "A geração do relatório de oportunidades estagnadas foi iniciada em background."}
\ No newline at end of file
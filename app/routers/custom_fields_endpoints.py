@@ -6,6 +6,7 @@ from app.config.settings import ODOO_DB, ODOO_PASSWORD, ODOO_URL, ODOO_USERNAME
 from app.schemas.schemas import SelectionFieldUpdate
 from app.services.authentication import authenticate_odoo, connect_to_odoo
 from app.services.custom_fields_service import update_selection_field_values
+from app.services.schema_registry import schema_registry
 
 router = APIRouter(prefix='/custom-fields', tags=['Custom Fields'])
 
@@ -35,4 +36,8 @@ async def update_selection_field(update_data: SelectionFieldUpdate):
         update_data.values,
     )
 
+    # O fields_get em cache ainda tem a seleção antiga
+    if 'new_values_added' in result:
+        await schema_registry.invalidate(update_data.model_name)
+
     return result
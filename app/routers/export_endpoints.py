@@ -0,0 +1,150 @@
+import logging
+from http import HTTPStatus
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from app.config.settings import ODOO_EXPORT_TIMEOUT
+from app.services.arrow_export import (
+    ARROW_FORMATS,
+    build_arrow_schema,
+    encode_arrow_stream,
+    get_field_types,
+    require_pyarrow,
+)
+from app.services.async_odoo_client import odoo_timeout
+from app.services.export_service import (
+    EXPORT_FORMATS,
+    check_export_fields,
+    encode_export_stream,
+    gzip_stream,
+    iter_model_pages,
+    resolve_export_fields,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix='/export', tags=['Exportação'])
+
+
+@router.get(
+    '/{model}',
+    summary='Exporta todos os registros de um modelo',
+    response_description='Arquivo transmitido em streaming',
+    dependencies=[Depends(odoo_timeout(ODOO_EXPORT_TIMEOUT))],
+)
+async def export_model(  # noqa: PLR0913
+    model: str,
+    *,
+    export_format: Literal['ndjson', 'csv', 'arrow', 'parquet'] = Query(
+        'ndjson', alias='format', description='Formato de saída'
+    ),
+    fields: Optional[List[str]] = Query(
+        default=None,
+        description='Campos a exportar (usa os campos padrão do modelo)',
+    ),
+    page_size: int = Query(
+        500, ge=1, le=5000, description='Registros por chamada ao Odoo'
+    ),
+    prefetch: int = Query(
+        1, ge=0, le=8, description='Páginas buscadas antecipadamente'
+    ),
+    gzip: bool = Query(False, description='Comprime a resposta com gzip'),
+):
+    """
+    Endpoint para exportar um modelo inteiro em uma única requisição.
+
+    As páginas são lidas do Odoo com paginação por cursor e enviadas ao
+    cliente à medida que chegam, mantendo o uso de memória constante.
+    Os formatos 'arrow' (Arrow IPC stream) e 'parquet' geram colunas
+    tipadas a partir dos tipos de campo do Odoo e exigem o pyarrow.
+
+    Args:
+        model: Modelo a exportar (crm.lead, res.partner, sale.order ou
+            helpdesk.ticket)
+        export_format: Formato de saída ('ndjson', 'csv', 'arrow' ou
+            'parquet')
+        fields: Campos a exportar
+        page_size: Quantidade de registros por chamada ao Odoo
+        prefetch: Número de páginas buscadas antecipadamente
+        gzip: Se a resposta deve ser comprimida com gzip
+
+    Returns:
+        StreamingResponse com os registros exportados
+
+    Raises:
+        HTTPException: Se o modelo não for exportável, algum campo não
+        existir, o pyarrow não estiver instalado ou a primeira leitura no
+        Odoo falhar
+    """
+    try:
+        export_fields = resolve_export_fields(model, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=str(e))
+
+    if fields:
+        try:
+            await check_export_fields(model, export_fields)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST, detail=str(e)
+            )
+
+    columnar = export_format in ARROW_FORMATS
+    if columnar:
+        try:
+            require_pyarrow()
+        except RuntimeError as e:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_IMPLEMENTED, detail=str(e)
+            )
+
+    pages = iter_model_pages(model, export_fields, page_size, prefetch)
+
+    # A primeira página é lida antes de iniciar a resposta para que erros
+    # de campos ou de conexão ainda possam ser retornados como HTTP
+    try:
+        if columnar:
+            field_types = await get_field_types(model, export_fields)
+            schema, columns = build_arrow_schema(export_fields, field_types)
+        first_page = await anext(pages, None)
+    except Exception as e:
+        logger.error(f'Erro ao iniciar exportação de {model}: {e}')
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            detail=f'Erro ao exportar {model}: {str(e)}',
+        )
+
+    async def all_pages():
+        if first_page:
+            yield first_page
+        async for page in pages:
+            yield page
+
+    media_type, extension = {**EXPORT_FORMATS, **ARROW_FORMATS}[export_format]
+    headers = {
+        'Content-Disposition': f'attachment; filename="{model}.{extension}"'
+    }
+    if gzip:
+        headers['Content-Encoding'] = 'gzip'
+
+    logger.info(
+        f'Exportando {model} em {export_format} '
+        f'(page_size={page_size}, prefetch={prefetch}, gzip={gzip})'
+    )
+
+    if columnar:
+        body = encode_arrow_stream(all_pages(), export_format, schema, columns)
+        if gzip:
+            body = gzip_stream(body)
+    else:
+        body = encode_export_stream(
+            all_pages(), export_format, export_fields, gzip
+        )
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers=headers,
+    )
@@ -1,10 +1,7 @@
-from http import HTTPStatus
 from typing import Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Query
 
-from app.config.settings import ODOO_DB, ODOO_PASSWORD, ODOO_URL, ODOO_USERNAME
-from app.services.authentication import authenticate_odoo, connect_to_odoo
 from app.services.fields_inspection_service import (
     get_available_models,
     get_model_fields,
@@ -33,18 +30,7 @@ async def list_available_models(
     Returns:
         A list of available models with basic information
     """
-    common, models = connect_to_odoo(ODOO_URL)
-    uid = authenticate_odoo(common, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD)
-
-    if not uid:
-        raise HTTPException(
-            status_code=HTTPStatus.UNAUTHORIZED,
-            detail='Failed to authenticate with Odoo',
-        )
-
-    model_records = get_available_models(
-        models, ODOO_DB, uid, ODOO_PASSWORD, search
-    )
+    model_records = await get_available_models(search)
 
     return {'count': len(model_records), 'models': model_records}
 
@@ -86,20 +72,7 @@ async def inspect_model_fields(
     Returns:
         A dictionary containing filtered information about the model's fields
     """
-    common, models = connect_to_odoo(ODOO_URL)
-    uid = authenticate_odoo(common, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD)
-
-    if not uid:
-        raise HTTPException(
-            status_code=HTTPStatus.UNAUTHORIZED,
-            detail='Failed to authenticate with Odoo',
-        )
-
-    fields_info = get_model_fields(
-        models,
-        ODOO_DB,
-        uid,
-        ODOO_PASSWORD,
+    fields_info = await get_model_fields(
         model_name,
         attributes,
         fields,
@@ -129,18 +102,7 @@ async def get_model_field_types(model_name: str):
     Returns:
         A dictionary with field types as keys and counts as values
     """
-    common, models = connect_to_odoo(ODOO_URL)
-    uid = authenticate_odoo(common, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD)
-
-    if not uid:
-        raise HTTPException(
-            status_code=HTTPStatus.UNAUTHORIZED,
-            detail='Failed to authenticate with Odoo',
-        )
-
-    fields_info = get_model_fields(
-        models, ODOO_DB, uid, ODOO_PASSWORD, model_name, ['type']
-    )
+    fields_info = await get_model_fields(model_name, ['type'])
 
     # Collect field types
     field_types: Dict[str, int] = {}
@@ -1,7 +1,8 @@
 import logging
 from http import HTTPStatus
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
 
 from app.schemas.schemas import (
@@ -9,6 +10,8 @@ from app.schemas.schemas import (
     HelpdeskTicketUpdate,
 )
 from app.services.helpdesk_service import (
+    HELPDESK_DEFAULT_FIELDS,
+    HELPDESK_TICKET_MODEL,
     create_ticket,
     get_helpdesk_info,
     get_helpdesk_info_by_team_and_id,
@@ -17,6 +20,9 @@ from app.services.helpdesk_service import (
     get_helpdesk_tickets_by_vat_and_team,
     update_ticket_team_and_stage,
 )
+from app.services.mirror_service import read_from_mirror
+from app.services.projection import requested_fields, resolve_fields
+from app.utils.responses import trusted_response
 
 # Configurar logging
 logging.basicConfig(
@@ -28,21 +34,36 @@ router = APIRouter(prefix='/tickets', tags=['Central de Ajuda'])
 
 
 @router.get('/', summary='Lista todos os chamados abertos')
-async def list_tickets(limit: int = 100, offset: int = 0):
+async def list_tickets(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = Depends(requested_fields),
+):
     """
     Endpoint para listar todos os chamados de helpdesk de forma assíncrona.
 
     Args:
         limit: Limite de registros a serem retornados
-        offset: Deslocamento para paginação
+        offset: Deslocamento para paginação (legado, prefira o cursor)
+        cursor: Cursor da próxima página retornado pela chamada anterior
+        fields: Campos a retornar ("*" para todos os campos leves)
 
     Returns:
-        Lista de chamados encontrados
+        Lista de chamados encontrados e o cursor da próxima página
 
     Raises:
         HTTPException: Se nenhum chamado for encontrado ou houver um erro
     """
-    helpdesk_info = await get_helpdesk_info(limit, offset)
+    try:
+        fields = await resolve_fields(
+            HELPDESK_TICKET_MODEL, fields, HELPDESK_DEFAULT_FIELDS
+        )
+        helpdesk_info, next_cursor = await get_helpdesk_info(
+            limit, offset, fields, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
     if not helpdesk_info:
         raise HTTPException(
@@ -50,12 +71,24 @@ async def list_tickets(limit: int = 100, offset: int = 0):
             detail='Nenhum chamado localizado',
         )
 
-    return {'chamados': helpdesk_info}
+    return trusted_response({
+        'chamados': helpdesk_info,
+        'next_cursor': next_cursor,
+    })
 
 
 @router.get('/{team_id}', summary='Lista todos os chamados abertos do time')
 async def list_tickets_by_team_id(
-    team_id: int, limit: int = 100, offset: int = 0
+    team_id: int,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    max_staleness: Optional[int] = Query(
+        None,
+        ge=0,
+        description='Aceita resposta da réplica local com até N segundos '
+        'de defasagem',
+    ),
 ):
     """
     Endpoint para listar chamados filtrados por time de forma assíncrona.
@@ -63,15 +96,34 @@ async def list_tickets_by_team_id(
     Args:
         team_id: ID do time
         limit: Limite de registros a serem retornados
-        offset: Deslocamento para paginação
+        offset: Deslocamento para paginação (legado, prefira o cursor)
+        cursor: Cursor da próxima página retornado pela chamada anterior
+        max_staleness: Defasagem máxima aceita para ler da réplica local
+            (usa MIRROR_MAX_STALENESS se None)
 
     Returns:
-        Lista de chamados do time
+        Lista de chamados do time e o cursor da próxima página
 
     Raises:
         HTTPException: Se nenhum chamado for encontrado ou houver um erro
     """
-    helpdesk_info = await get_helpdesk_info_by_team_id(team_id, limit, offset)
+    try:
+        page = await read_from_mirror(
+            HELPDESK_TICKET_MODEL,
+            [('team_id', '=', team_id)],
+            HELPDESK_DEFAULT_FIELDS,
+            max_staleness,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        if page is None:
+            page = await get_helpdesk_info_by_team_id(
+                team_id, limit, offset, cursor=cursor
+            )
+        helpdesk_info, next_cursor = page
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
     if not helpdesk_info:
         raise HTTPException(
@@ -79,7 +131,10 @@ async def list_tickets_by_team_id(
             detail=f'Nenhum chamado localizado para o time {team_id}',
         )
 
-    return {'chamados': helpdesk_info}
+    return trusted_response({
+        'chamados': helpdesk_info,
+        'next_cursor': next_cursor,
+    })
 
 
 @router.get(
@@ -115,8 +170,19 @@ async def get_ticket_by_team_and_id(team_id: int, ticket_id: int):
     '/{team_id}/stage/{stage_id}',
     summary='Lista todos os chamados do time por estágio',
 )
-async def list_tickets_by_team_and_stage_id(
-    team_id: int, stage_id: int, limit: int = 100, offset: int = 0
+async def list_tickets_by_team_and_stage_id(  # noqa: PLR0913
+    team_id: int,
+    stage_id: int,
+    *,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    max_staleness: Optional[int] = Query(
+        None,
+        ge=0,
+        description='Aceita resposta da réplica local com até N segundos '
+        'de defasagem',
+    ),
 ):
     """
     Endpoint para listar chamados de um time filtrados por estágio de forma assíncrona.
@@ -125,17 +191,35 @@ async def list_tickets_by_team_and_stage_id(
         team_id: ID do time
         stage_id: ID do estágio
         limit: Limite de registros a serem retornados
-        offset: Deslocamento para paginação
+        offset: Deslocamento para paginação (legado, prefira o cursor)
+        cursor: Cursor da próxima página retornado pela chamada anterior
+        max_staleness: Defasagem máxima aceita para ler da réplica local
+            (usa MIRROR_MAX_STALENESS se None)
 
     Returns:
-        Lista de chamados do time no estágio especificado
+        Lista de chamados do time no estágio especificado e o cursor da
+        próxima página
 
     Raises:
         HTTPException: Se nenhum chamado for encontrado ou houver um erro
     """
-    helpdesk_info = await get_helpdesk_info_by_team_and_stage(
-        team_id, stage_id, limit, offset
-    )
+    try:
+        page = await read_from_mirror(
+            HELPDESK_TICKET_MODEL,
+            [('team_id', '=', team_id), ('stage_id', '=', stage_id)],
+            HELPDESK_DEFAULT_FIELDS,
+            max_staleness,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        if page is None:
+            page = await get_helpdesk_info_by_team_and_stage(
+                team_id, stage_id, limit, offset, cursor=cursor
+            )
+        helpdesk_info, next_cursor = page
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
     if not helpdesk_info:
         raise HTTPException(
@@ -143,7 +227,10 @@ async def list_tickets_by_team_and_stage_id(
             detail=f'Nenhum chamado localizado no estágio {stage_id} para o time {team_id}',
         )
 
-    return {'chamados': helpdesk_info}
+    return trusted_response({
+        'chamados': helpdesk_info,
+        'next_cursor': next_cursor,
+    })
 
 
 @router.patch(
@@ -326,9 +413,15 @@ async def create_helpdesk_ticket(
 async def list_tickets_by_vat_for_team_1(
     vat: str,
     limit: int = Query(
-        100, description='Limite de registros a serem retornados'
+        100,
+        ge=1,
+        le=1000,
+        description='Limite de registros a serem retornados',
     ),
     offset: int = Query(0, description='Deslocamento para paginação'),
+    cursor: Optional[str] = Query(
+        None, description='Cursor da próxima página'
+    ),
 ):
     """
     Endpoint para listar chamados de helpdesk para um cliente específico (identificado por VAT/CNPJ)
@@ -338,17 +431,22 @@ async def list_tickets_by_vat_for_team_1(
         vat: CNPJ do cliente.
         limit: Limite de registros a serem retornados.
         offset: Deslocamento para paginação.
+        cursor: Cursor da próxima página retornado pela chamada anterior.
 
     Returns:
-        Lista de chamados do cliente na equipe 1.
+        Lista de chamados do cliente na equipe 1 e o cursor da próxima página.
 
     Raises:
         HTTPException: Se o VAT for inválido, nenhum chamado for encontrado, ou ocorrer um erro interno.
     """
     team_id_fixed = 1  # As per requirement, team_id is 1
     try:
-        tickets = await get_helpdesk_tickets_by_vat_and_team(
-            vat=vat, team_id=team_id_fixed, limit=limit, offset=offset
+        tickets, next_cursor = await get_helpdesk_tickets_by_vat_and_team(
+            vat=vat,
+            team_id=team_id_fixed,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
         )
 
         if (
@@ -358,7 +456,10 @@ async def list_tickets_by_vat_for_team_1(
                 status_code=HTTPStatus.NOT_FOUND,
                 detail=f'Nenhum chamado encontrado para o VAT {vat} na equipe {team_id_fixed}',
             )
-        return {'chamados': tickets}
+        return trusted_response({
+            'chamados': tickets,
+            'next_cursor': next_cursor,
+        })
     except ValueError as e:  # Catch VAT validation errors specifically
         logger.error(f"Erro de valor ao buscar chamados por VAT '{vat}': {e}")
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
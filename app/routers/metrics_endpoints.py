@@ -0,0 +1,18 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.services.metrics import CONTENT_TYPE, render_metrics
+
+router = APIRouter(tags=['Healthcheck'])
+
+
+@router.get('/metrics', summary='Métricas no formato do Prometheus')
+async def metrics_route():
+    """
+    Endpoint de coleta do Prometheus.
+
+    Expõe latência, erros e tamanho de payload das chamadas ao Odoo por
+    modelo e método, estado do executor, do limitador e do disjuntor,
+    latência HTTP por rota e acertos do cache.
+    """
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
@@ -1,36 +1,44 @@
 from http import HTTPStatus
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from app.config.settings import ODOO_DB, ODOO_PASSWORD, ODOO_URL, ODOO_USERNAME
 from app.schemas.schemas import SaleOrderCreate, SaleOrderUpdate
 from app.services.authentication import authenticate_odoo, connect_to_odoo
+from app.services.projection import requested_fields, resolve_fields
 from app.services.sales_orders import (
+    SALE_ORDER_DEFAULT_FIELDS,
+    SALE_ORDER_DETAIL_FIELDS,
+    SALE_ORDER_MODEL,
     SalesOrderService,
     get_sales_order_by_id,
-    get_sales_orders,
-    search_sales_orders_by_name,
+    get_sales_orders_page,
+    search_sales_orders_page,
     update_sales_order_fields,
 )
+from app.utils.responses import trusted_response
 
 router = APIRouter(prefix='/sales_orders', tags=['Pedidos de venda'])
 
 
 @router.get('/', summary='Lista pedidos de venda cadastrados')
-async def list_sales_orders(limit: int = 100, offset: int = 0):
+async def list_sales_orders(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = Depends(requested_fields),
+):
     # Endpoint para listar todos os pedidos de venda com paginação.
-    common, models = connect_to_odoo(ODOO_URL)
-    uid = authenticate_odoo(common, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD)
-
-    if not uid:
-        raise HTTPException(
-            status_code=HTTPStatus.UNAUTHORIZED,
-            detail='Falha na autenticação no Odoo',
+    try:
+        fields = await resolve_fields(
+            SALE_ORDER_MODEL, fields, SALE_ORDER_DEFAULT_FIELDS
         )
-
-    sales_orders_info = get_sales_orders(
-        models, ODOO_DB, uid, ODOO_PASSWORD, limit, offset
-    )
+        sales_orders_info, next_cursor = await get_sales_orders_page(
+            limit, offset, cursor, fields
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
     if not sales_orders_info:
         raise HTTPException(
@@ -38,12 +46,24 @@ async def list_sales_orders(limit: int = 100, offset: int = 0):
             detail='Nenhum pedido de venda localizado',
         )
 
-    return {'sales_orders': sales_orders_info}
+    return trusted_response({
+        'sales_orders': sales_orders_info,
+        'next_cursor': next_cursor,
+    })
 
 
 @router.get('/{order_id}', summary='Busca pedido de venda por ID')
-async def get_order_by_id(order_id: int):
+async def get_order_by_id(
+    order_id: int,
+    fields: Optional[List[str]] = Depends(requested_fields),
+):
     # Endpoint para buscar um pedido de venda específico pelo ID.
+    try:
+        fields = await resolve_fields(
+            SALE_ORDER_MODEL, fields, SALE_ORDER_DETAIL_FIELDS
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
     common, models = connect_to_odoo(ODOO_URL)
     uid = authenticate_odoo(common, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD)
@@ -55,7 +75,7 @@ async def get_order_by_id(order_id: int):
         )
 
     sales_order = get_sales_order_by_id(
-        models, ODOO_DB, uid, ODOO_PASSWORD, order_id
+        models, ODOO_DB, uid, ODOO_PASSWORD, order_id, fields=fields
     )
 
     if not sales_order:
@@ -68,21 +88,23 @@ async def get_order_by_id(order_id: int):
 
 
 @router.get('/search/', summary='Busca pedidos de venda por nome')
-async def search_orders_by_name(name: str, limit: int = 100, offset: int = 0):
+async def search_orders_by_name(
+    name: str,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = Depends(requested_fields),
+):
     # Endpoint para buscar pedidos de venda pelo nome ou nome do cliente.
-
-    common, models = connect_to_odoo(ODOO_URL)
-    uid = authenticate_odoo(common, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD)
-
-    if not uid:
-        raise HTTPException(
-            status_code=HTTPStatus.UNAUTHORIZED,
-            detail='Falha na autenticação no Odoo',
+    try:
+        fields = await resolve_fields(
+            SALE_ORDER_MODEL, fields, SALE_ORDER_DEFAULT_FIELDS
         )
-
-    sales_orders = search_sales_orders_by_name(
-        models, ODOO_DB, uid, ODOO_PASSWORD, name, limit, offset
-    )
+        sales_orders, next_cursor = await search_sales_orders_page(
+            name, limit, offset, cursor, fields
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
     if not sales_orders:
         raise HTTPException(
@@ -90,7 +112,10 @@ async def search_orders_by_name(name: str, limit: int = 100, offset: int = 0):
             detail=f'Nenhum pedido de venda encontrado com o nome contendo "{name}"',
         )
 
-    return {'sales_orders': sales_orders}
+    return trusted_response({
+        'sales_orders': sales_orders,
+        'next_cursor': next_cursor,
+    })
 
 
 @router.post(
@@ -174,7 +199,7 @@ async def update_sales_order_fields_route(
         )
 
     order = get_sales_order_by_id(
-        models, ODOO_DB, uid, ODOO_PASSWORD, order_id
+        models, ODOO_DB, uid, ODOO_PASSWORD, order_id, fields=['id']
     )
 
     if not order:
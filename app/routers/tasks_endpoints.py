@@ -1,12 +1,15 @@
 import base64
 import logging
 from http import HTTPStatus
+from typing import List, Optional
 
 from fastapi import (
     APIRouter,
     BackgroundTasks,
+    Depends,
     File,
     HTTPException,
+    Query,
     Request,
     UploadFile,
 )
@@ -15,12 +18,22 @@ from app.schemas.schemas import (
     TarefaCreate,
     TarefaUpdate,
     TaskMessageTransfer,
+    TaskSaleOrderBulkUpdate,
     TaskSaleOrderUpdate,
+    TaskStageBulkUpdate,
     TaskStageUpdate,
 )
+from app.services.admission import UpstreamOverloadedError
+from app.services.mirror_service import read_from_mirror
+from app.services.projection import requested_fields, resolve_fields
+from app.services.retry import is_retryable
 from app.services.tasks_project_service import (
+    TASK_DEFAULT_FIELDS,
+    TASK_MODEL,
+    TASK_STAGE_FIELDS,
     create_task,
     create_task_attachment,
+    get_stage_ids_by_name,
     get_task_by_id,
     get_task_by_project_and_id,
     get_tasks_by_client_vat_in_projects,
@@ -30,7 +43,10 @@ from app.services.tasks_project_service import (
     update_task_fields,
     update_task_sale_order,
     update_task_stage,
+    update_tasks_sale_order_bulk,
+    update_tasks_stage_bulk,
 )
+from app.utils.responses import trusted_response
 from app.utils.utils import clean_vat
 
 # Configuração de logging
@@ -40,22 +56,35 @@ router = APIRouter(prefix='/projects', tags=['Projetos'])
 
 
 @router.get('/', summary='Lista tarefas cadastradas')
-async def list_tasks(limit: int = 100, offset: int = 0):
+async def list_tasks(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = Depends(requested_fields),
+):
     """
     Endpoint para listar todas as tarefas cadastradas de forma assíncrona.
 
     Args:
         limit: Limite de registros a serem retornados
-        offset: Deslocamento para paginação
+        offset: Deslocamento para paginação (legado, prefira o cursor)
+        cursor: Cursor da próxima página retornado pela chamada anterior
+        fields: Campos a retornar ("*" para todos os campos leves)
 
     Returns:
-        Lista de tarefas encontradas
+        Lista de tarefas encontradas e o cursor da próxima página
 
     Raises:
         HTTPException: Se nenhuma tarefa for encontrada ou houver um erro
     """
     # Busca as tarefas de forma assíncrona
-    tasks_info = await get_tasks_info(limit, offset)
+    try:
+        fields = await resolve_fields(TASK_MODEL, fields, TASK_DEFAULT_FIELDS)
+        tasks_info, next_cursor = await get_tasks_info(
+            limit, offset, fields, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
     if not tasks_info:
         raise HTTPException(
@@ -63,7 +92,7 @@ async def list_tasks(limit: int = 100, offset: int = 0):
             detail='Nenhuma tarefa localizada',
         )
 
-    return {'tasks': tasks_info}
+    return trusted_response({'tasks': tasks_info, 'next_cursor': next_cursor})
 
 
 @router.get(
@@ -255,6 +284,86 @@ async def link_task_to_sales_order(update_data: TaskSaleOrderUpdate):
     }
 
 
+async def _run_bulk_update(update, pairs: list) -> dict:
+    """
+    Executa uma atualização em lote, convertendo falhas do Odoo em HTTP.
+
+    Raises:
+        HTTPException: 503 se o Odoo estiver inacessível e 502 se ele
+        recusar a leitura das tarefas
+    """
+    try:
+        return await update(pairs)
+    except UpstreamOverloadedError:
+        # Tratado pelo handler global (503 com Retry-After)
+        raise
+    except Exception as e:
+        if is_retryable(e):
+            raise HTTPException(
+                status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                detail='Odoo indisponível, tente novamente',
+            )
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_GATEWAY,
+            detail=f'Erro do Odoo ao ler as tarefas: {e}',
+        )
+
+
+def _bulk_update_response(result: dict, message: str) -> dict:
+    """Converte o resultado de uma atualização em lote na resposta HTTP."""
+    if not result['updated'] and not result['unchanged']:
+        if result['failed']:
+            raise HTTPException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail='Falha ao atualizar as tarefas informadas',
+            )
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=f'Tarefas não encontradas: {result["not_found"]}',
+        )
+
+    return {
+        'message': message,
+        'updated_count': len(result['updated']),
+        **result,
+    }
+
+
+@router.patch(
+    '/tasks/link-order/bulk',
+    summary='Vincula pedidos de venda a várias tarefas em lote',
+    response_description='Resumo das tarefas vinculadas',
+)
+async def link_tasks_to_sales_orders_bulk(
+    bulk_data: TaskSaleOrderBulkUpdate,
+):
+    """
+    Endpoint para vincular pedidos de venda a várias tarefas de uma só vez.
+
+    Todas as tarefas são validadas com uma única leitura e os writes são
+    agrupados por pedido de venda.
+
+    Args:
+        bulk_data: Lista de pares contendo os IDs da tarefa e do pedido
+
+    Returns:
+        Resumo com as tarefas atualizadas, inalteradas, não encontradas e
+        com falha
+
+    Raises:
+        HTTPException: Se nenhuma tarefa for encontrada, todos os writes
+        falharem ou o Odoo não responder à leitura das tarefas
+    """
+    result = await _run_bulk_update(
+        update_tasks_sale_order_bulk,
+        [(link.task_id, link.sale_order_id) for link in bulk_data.links],
+    )
+
+    return _bulk_update_response(
+        result, 'Tarefas vinculadas aos pedidos de venda'
+    )
+
+
 @router.post(
     '/{project_id}/tasks/{task_id}/attachment',
     summary='Adiciona um arquivo anexo à tarefa',
@@ -322,8 +431,19 @@ async def add_task_attachment_route(
     summary='Busca tarefas por nome do estágio dentro de um projeto',
     response_description='Lista de tarefas no estágio especificado',
 )
-async def get_tasks_by_stage_name_route(
-    project_id: int, stage_name: str, limit: int = 100, offset: int = 0
+async def get_tasks_by_stage_name_route(  # noqa: PLR0913
+    project_id: int,
+    stage_name: str,
+    *,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    max_staleness: Optional[int] = Query(
+        None,
+        ge=0,
+        description='Aceita resposta da réplica local com até N segundos '
+        'de defasagem',
+    ),
 ):
     """
     Endpoint para buscar tarefas por nome do estágio dentro de um projeto específico de forma assíncrona.
@@ -332,17 +452,45 @@ async def get_tasks_by_stage_name_route(
         project_id: ID do projeto
         stage_name: Nome do estágio para filtrar
         limit: Limite de registros a serem retornados
-        offset: Deslocamento para paginação
+        offset: Deslocamento para paginação (legado, prefira o cursor)
+        cursor: Cursor da próxima página retornado pela chamada anterior
+        max_staleness: Defasagem máxima aceita para ler da réplica local
+            (usa MIRROR_MAX_STALENESS se None)
 
     Returns:
-        Lista de tarefas que correspondem ao filtro
+        Lista de tarefas que correspondem ao filtro e o cursor da próxima
+        página
 
     Raises:
         HTTPException: Se nenhuma tarefa for encontrada ou houver erro
     """
-    tasks_info = await get_tasks_by_stage_name(
-        project_id, stage_name, limit, offset
-    )
+    # O nome do estágio é resolvido na leitura: renomear um estágio não
+    # altera o write_date das tarefas, e a réplica guardaria o antigo
+    stage_ids = await get_stage_ids_by_name(stage_name)
+    try:
+        page = (
+            await read_from_mirror(
+                TASK_MODEL,
+                [
+                    ('project_id', '=', project_id),
+                    ('stage_id', 'in', stage_ids),
+                ],
+                TASK_STAGE_FIELDS,
+                max_staleness,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+            )
+            if stage_ids
+            else None
+        )
+        if page is None:
+            page = await get_tasks_by_stage_name(
+                project_id, stage_name, limit, offset, cursor=cursor
+            )
+        tasks_info, next_cursor = page
+    except ValueError as e:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
     if not tasks_info:
         raise HTTPException(
@@ -355,6 +503,7 @@ async def get_tasks_by_stage_name_route(
         'stage_name': stage_name,
         'tasks': tasks_info,
         'count': len(tasks_info),
+        'next_cursor': next_cursor,
     }
 
 
@@ -410,6 +559,37 @@ async def update_task_stage_route(
     }
 
 
+@router.patch(
+    '/tasks/stage/bulk',
+    summary='Atualiza o estágio de várias tarefas em lote',
+    response_description='Resumo das tarefas atualizadas',
+)
+async def update_tasks_stage_bulk_route(bulk_data: TaskStageBulkUpdate):
+    """
+    Endpoint para mover várias tarefas de estágio de uma só vez.
+
+    Todas as tarefas são validadas com uma única leitura e os writes são
+    agrupados por estágio de destino.
+
+    Args:
+        bulk_data: Lista de pares contendo o ID da tarefa e o novo stage_id
+
+    Returns:
+        Resumo com as tarefas atualizadas, inalteradas, não encontradas e
+        com falha
+
+    Raises:
+        HTTPException: Se nenhuma tarefa for encontrada, todos os writes
+        falharem ou o Odoo não responder à leitura das tarefas
+    """
+    result = await _run_bulk_update(
+        update_tasks_stage_bulk,
+        [(item.task_id, item.stage_id) for item in bulk_data.updates],
+    )
+
+    return _bulk_update_response(result, 'Estágios das tarefas atualizados')
+
+
 @router.post(
     '/tasks/transfer-messages',
     summary='Transfere mensagens de uma tarefa para outra',
@@ -519,9 +699,9 @@ async def get_tasks_by_client_vat(vat: str):
         }
         formatted_tasks.append(formatted_task)
 
-    return {
+    return trusted_response({
         'vat': vat,
         'projects_searched': [25, 26],
         'total_tasks': len(formatted_tasks),
         'tasks': formatted_tasks,
-    }
+    })
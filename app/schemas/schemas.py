@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import (
     BaseModel,
@@ -34,6 +34,7 @@ class HealthCheck(BaseModel):
     version: str
     timestamp: datetime
     uptime: float
+    odoo: Dict[str, Dict[str, Any]] = {}
 
 
 class PingResponse(BaseModel):
@@ -374,6 +375,31 @@ class TaskStageUpdate(BaseModel):
     )
 
 
+class TaskStageBulkItem(BaseModel):
+    """Item de atualização de estágio em lote."""
+
+    task_id: int = Field(..., description='ID da tarefa a ser atualizada')
+    stage_id: int = Field(
+        ..., description='ID do estágio para o qual a tarefa deve ser movida'
+    )
+
+
+class TaskStageBulkUpdate(BaseModel):
+    """Modelo para atualização de estágio de várias tarefas."""
+
+    updates: List[TaskStageBulkItem] = Field(
+        ..., min_length=1, description='Pares de tarefa e novo estágio'
+    )
+
+
+class TaskSaleOrderBulkUpdate(BaseModel):
+    """Modelo para vincular várias tarefas a pedidos de venda."""
+
+    links: List[TaskSaleOrderUpdate] = Field(
+        ..., min_length=1, description='Pares de tarefa e pedido de venda'
+    )
+
+
 class TaskMessageTransfer(BaseModel):
     """Modelo para transferência de mensagens entre tarefas."""
 
@@ -454,6 +480,18 @@ class HelpdeskTicketsByVatResponse(BaseModel):
     """Modelo de resposta para lista de chamados de helpdesk por VAT."""
 
     chamados: List[HelpdeskTicketByVat]
+    next_cursor: Optional[str] = None
+
+
+# ------------ Feed de Alterações ------------
+
+
+class ChangeFeedReconcile(BaseModel):
+    """Modelo para reconciliação dos ids mantidos por um consumidor."""
+
+    ids: List[int] = Field(
+        ..., min_length=1, description='Ids conhecidos pelo consumidor'
+    )
 
 
 # ------------ Outros Esquemas ------------
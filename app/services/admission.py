@@ -0,0 +1,298 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import math
+import time
+import xmlrpc.client
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.config.settings import (
+    ODOO_BACKGROUND_QUEUE_TIMEOUT,
+    ODOO_BACKGROUND_SHARE,
+    ODOO_CONCURRENCY_INITIAL,
+    ODOO_CONCURRENCY_MIN,
+    ODOO_MAX_WORKERS,
+    ODOO_QUEUE_TIMEOUT,
+)
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# Filas de admissão: requisições de usuários têm prioridade sobre jobs
+INTERACTIVE = 'interactive'
+BACKGROUND = 'background'
+LANES = (INTERACTIVE, BACKGROUND)
+
+# Latência acima de LATENCY_TOLERANCE x a referência conta como lenta
+LATENCY_TOLERANCE = 2.0
+# Amostras lentas seguidas do mesmo método que indicam sobrecarga
+SUSTAINED_SAMPLES = 3
+# Fator do decremento multiplicativo do limite
+BACKOFF_RATIO = 0.9
+# Quanto a latência de referência acompanha amostras mais lentas
+BASELINE_DRIFT = 0.01
+# Chave das chamadas feitas sem identificar o método
+DEFAULT_KEY = 'default'
+
+# Erros que indicam Odoo sobrecarregado ou inacessível (um Fault do
+# XML-RPC é uma resposta normal do servidor e não entra aqui)
+OVERLOAD_ERRORS = (OSError, xmlrpc.client.ProtocolError)
+
+# Fila usada pelas chamadas ao Odoo na tarefa atual
+current_lane: contextvars.ContextVar[str] = contextvars.ContextVar(
+    'odoo_lane', default=INTERACTIVE
+)
+
+# Estado da requisição HTTP atual, preenchido pelo LoadSheddingMiddleware
+shed_state: contextvars.ContextVar[Optional[Dict[str, Any]]] = (
+    contextvars.ContextVar('odoo_shed_state', default=None)
+)
+
+
+class UpstreamOverloadedError(Exception):
+    """O Odoo está saturado e a chamada não foi admitida a tempo."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def mark_shed(retry_after: int, detail: Optional[str] = None) -> None:
+    """Registra na requisição atual que uma chamada ao Odoo foi recusada."""
+    state = shed_state.get()
+    if state is not None:
+        state['retry_after'] = retry_after
+        state['detail'] = detail
+
+
+def clear_shed() -> None:
+    """Desfaz o registro quando a leitura foi atendida de outra forma."""
+    state = shed_state.get()
+    if state is not None:
+        state['retry_after'] = None
+
+
+def in_background_lane(
+    func: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """Executa uma corrotina com as chamadas ao Odoo na fila de background."""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = current_lane.set(BACKGROUND)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            current_lane.reset(token)
+
+    return wrapper
+
+
+class AdaptiveLimiter:
+    """
+    Limite adaptativo (AIMD) de chamadas simultâneas a um servidor Odoo.
+
+    O limite sobe de forma aditiva (cerca de +1 a cada janela de chamadas)
+    enquanto está todo em uso e a latência se mantém perto da referência,
+    e cai de forma multiplicativa quando o Odoo falha por conexão ou
+    tempo esgotado, ou quando SUSTAINED_SAMPLES chamadas seguidas de um
+    mesmo método passam de LATENCY_TOLERANCE vezes a referência. Uma
+    amostra lenta isolada não reduz o limite.
+
+    A referência é mantida por chave (`model.method`), já que um
+    read_group pesado é naturalmente mais lento que um read: é a menor
+    latência observada da chave, que sobe devagar para acompanhar
+    mudanças reais no servidor.
+
+    A fila de background usa no máximo `background_share` do limite e só
+    é atendida quando não há chamadas interativas esperando. Quem espera
+    mais que o prazo da sua fila recebe UpstreamOverloadedError.
+    """
+
+    def __init__(
+        self,
+        initial: int = ODOO_CONCURRENCY_INITIAL,
+        min_limit: int = ODOO_CONCURRENCY_MIN,
+        max_limit: int = ODOO_MAX_WORKERS,
+        background_share: float = ODOO_BACKGROUND_SHARE,
+        queue_timeouts: Optional[Dict[str, float]] = None,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.background_share = background_share
+        self.queue_timeouts = queue_timeouts or {
+            INTERACTIVE: ODOO_QUEUE_TIMEOUT,
+            BACKGROUND: ODOO_BACKGROUND_QUEUE_TIMEOUT,
+        }
+        self.inflight = dict.fromkeys(LANES, 0)
+        self.shed = dict.fromkeys(LANES, 0)
+        self._waiters = {lane: deque() for lane in LANES}
+        self._baselines: Dict[str, float] = {}
+        self._slow_streaks: Dict[str, int] = {}
+        self._last_decrease = 0.0
+
+    def _capacity(self, lane: str) -> int:
+        limit = int(self.limit)
+        if lane == BACKGROUND:
+            return max(1, int(limit * self.background_share))
+        return limit
+
+    def _has_room(self, lane: str) -> bool:
+        if sum(self.inflight.values()) >= int(self.limit):
+            return False
+        return self.inflight[lane] < self._capacity(lane)
+
+    def _can_start(self, lane: str) -> bool:
+        # Sem furar fila: a própria fila e, no background, a interativa
+        queued = self._waiters[lane] or (
+            lane == BACKGROUND and self._waiters[INTERACTIVE]
+        )
+        return not queued and self._has_room(lane)
+
+    def _wake(self) -> None:
+        for lane in LANES:
+            waiters = self._waiters[lane]
+            while waiters and self._has_room(lane):
+                waiter = waiters.popleft()
+                if waiter.done():
+                    continue
+                self.inflight[lane] += 1
+                waiter.set_result(None)
+            if waiters:
+                # Background só avança quando a fila interativa esvazia
+                return
+
+    def _typical_latency(self) -> float:
+        if not self._baselines:
+            return 1.0
+        return sum(self._baselines.values()) / len(self._baselines)
+
+    def _retry_after(self) -> int:
+        queued = sum(len(waiters) for waiters in self._waiters.values())
+        latency = self._typical_latency()
+        return max(1, math.ceil(queued * latency / max(self.limit, 1)))
+
+    def has_room(self, lane: Optional[str] = None) -> bool:
+        """Indica se uma chamada na fila seria admitida sem esperar."""
+        return self._can_start(lane or current_lane.get())
+
+    async def _acquire(self, lane: str) -> None:
+        if self._can_start(lane):
+            self.inflight[lane] += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[lane].append(waiter)
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(waiter), self.queue_timeouts[lane]
+            )
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # A vaga foi liberada no mesmo instante do prazo
+                if isinstance(e, asyncio.CancelledError):
+                    self._release(lane, DEFAULT_KEY, None, False)
+                    raise
+                return
+            waiter.cancel()
+            self._waiters[lane].remove(waiter)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self.shed[lane] += 1
+            retry_after = self._retry_after()
+            mark_shed(retry_after)
+            logger.warning(
+                f'Chamada ao Odoo descartada na fila {lane} '
+                f'(limite {int(self.limit)}, '
+                f'em uso {sum(self.inflight.values())})'
+            )
+            raise UpstreamOverloadedError(
+                'Odoo sobrecarregado, tente novamente em instantes',
+                retry_after,
+            )
+
+    def _is_slow(self, key: str, latency: float) -> bool:
+        """Atualiza a referência da chave e diz se a lentidão persiste."""
+        baseline = self._baselines.get(key)
+        if baseline is None or latency < baseline:
+            self._baselines[key] = latency
+        else:
+            self._baselines[key] = (
+                baseline + (latency - baseline) * BASELINE_DRIFT
+            )
+
+        if baseline is None or latency <= baseline * LATENCY_TOLERANCE:
+            self._slow_streaks[key] = 0
+            return False
+        streak = self._slow_streaks.get(key, 0) + 1
+        self._slow_streaks[key] = streak
+        return streak >= SUSTAINED_SAMPLES
+
+    def _release(
+        self,
+        lane: str,
+        key: str,
+        latency: Optional[float],
+        overloaded: bool,
+    ) -> None:
+        saturated = sum(self.inflight.values()) >= int(self.limit)
+        self.inflight[lane] -= 1
+        if latency is None:
+            self._wake()
+            return
+
+        if not overloaded:
+            overloaded = self._is_slow(key, latency)
+
+        if overloaded:
+            # No máximo um decremento por janela de latência
+            now = time.monotonic()
+            window = self._baselines.get(key, 0.0)
+            if now - self._last_decrease >= window:
+                self.limit = max(self.min_limit, self.limit * BACKOFF_RATIO)
+                self._last_decrease = now
+        elif saturated:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self, lane: Optional[str] = None, key: str = DEFAULT_KEY):
+        """
+        Reserva uma vaga para uma chamada ao Odoo.
+
+        Args:
+            lane: Fila da chamada (padrão: a da tarefa atual)
+            key: Identifica o tipo de chamada (`model.method`) para a
+                latência de referência
+
+        Raises:
+            UpstreamOverloadedError: Se a vaga não sair dentro do prazo
+        """
+        lane = lane or current_lane.get()
+        await self._acquire(lane)
+        started = time.monotonic()
+        overloaded = False
+        try:
+            yield
+        except OVERLOAD_ERRORS:
+            overloaded = True
+            raise
+        finally:
+            self._release(lane, key, time.monotonic() - started, overloaded)
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna o estado atual do limitador."""
+        return {
+            'limit': int(self.limit),
+            'inflight': dict(self.inflight),
+            'queued': {
+                lane: len(waiters) for lane, waiters in self._waiters.items()
+            },
+            'shed': dict(self.shed),
+            'baseline_latency': dict(self._baselines),
+        }
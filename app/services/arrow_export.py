@@ -0,0 +1,254 @@
+import io
+import logging
+from typing import Any, AsyncIterator, Dict, List, Tuple, override
+
+from app.services.schema_registry import schema_registry
+
+# pyarrow é opcional (extra 'arrow'); só as exportações colunares o usam
+try:
+    import pyarrow
+    import pyarrow.parquet  # noqa: F401
+except ImportError:
+    pyarrow = None
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+# Formatos colunares: (media type, extensão do arquivo)
+ARROW_FORMATS = {
+    'arrow': ('application/vnd.apache.arrow.stream', 'arrow'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+}
+
+# Tipos do Odoo lidos como inteiros ou números decimais
+INTEGER_TYPES = ('integer',)
+FLOAT_TYPES = ('float', 'monetary')
+X2MANY_TYPES = ('one2many', 'many2many')
+
+
+def require_pyarrow():
+    """
+    Obtém o pyarrow, exigido pelas exportações colunares.
+
+    O pyarrow é uma dependência opcional (extra 'arrow'), necessária
+    apenas para as exportações colunares.
+
+    Returns:
+        Módulo pyarrow
+
+    Raises:
+        RuntimeError: Se o pyarrow não estiver instalado
+    """
+    if pyarrow is None:
+        raise RuntimeError(
+            'Exportação colunar indisponível: instale o extra "arrow" '
+            '(pip install pyarrow)'
+        )
+    return pyarrow
+
+
+async def get_field_types(model: str, fields: List[str]) -> Dict[str, str]:
+    """
+    Obtém o tipo de cada campo exportado a partir do registro de schema.
+
+    Args:
+        model: Nome do modelo
+        fields: Campos exportados
+
+    Returns:
+        Dicionário {campo: tipo do Odoo}
+    """
+    fields_info = await schema_registry.get_fields(model)
+    field_types = {
+        name: fields_info[name].get('type', 'char')
+        for name in fields
+        if name in fields_info
+    }
+    field_types['id'] = 'integer'
+    return field_types
+
+
+def build_arrow_schema(
+    fields: List[str], field_types: Dict[str, str]
+) -> Tuple[Any, List[Tuple[str, str]]]:
+    """
+    Monta o schema Arrow a partir dos tipos de campo do Odoo.
+
+    Campos many2one viram duas colunas, <campo>_id (int64) e
+    <campo>_name (string). Datas viram timestamps em UTC, x2many viram
+    listas de ids e os demais tipos são lidos como texto.
+
+    Args:
+        fields: Campos exportados, na ordem das colunas
+        field_types: Tipos retornados por get_field_types
+
+    Returns:
+        Tupla (schema, colunas), onde colunas é a lista de
+        (campo, tipo do Odoo) usada para converter os registros
+    """
+    pa = require_pyarrow()
+    arrow_fields = []
+    columns = []
+
+    for field in fields:
+        odoo_type = field_types.get(field, 'char')
+        columns.append((field, odoo_type))
+
+        if odoo_type == 'many2one':
+            arrow_fields.append(pa.field(f'{field}_id', pa.int64()))
+            arrow_fields.append(pa.field(f'{field}_name', pa.string()))
+        elif odoo_type in INTEGER_TYPES:
+            arrow_fields.append(pa.field(field, pa.int64()))
+        elif odoo_type in FLOAT_TYPES:
+            arrow_fields.append(pa.field(field, pa.float64()))
+        elif odoo_type == 'boolean':
+            arrow_fields.append(pa.field(field, pa.bool_()))
+        elif odoo_type in {'date', 'datetime'}:
+            arrow_fields.append(pa.field(field, pa.timestamp('s', tz='UTC')))
+        elif odoo_type in X2MANY_TYPES:
+            arrow_fields.append(pa.field(field, pa.list_(pa.int64())))
+        else:
+            arrow_fields.append(pa.field(field, pa.string()))
+
+    return pa.schema(arrow_fields), columns
+
+
+def _nullable(value: Any) -> Any:
+    """Converte o False usado pelo Odoo para valores vazios em None."""
+    return None if value is False else value
+
+
+def records_to_batch(
+    records: List[Dict[str, Any]],
+    schema: Any,
+    columns: List[Tuple[str, str]],
+) -> Any:
+    """
+    Converte uma página de search_read em um RecordBatch.
+
+    Args:
+        records: Registros da página
+        schema: Schema gerado por build_arrow_schema
+        columns: Colunas geradas por build_arrow_schema
+
+    Returns:
+        pyarrow.RecordBatch com uma linha por registro
+    """
+    pa = require_pyarrow()
+    arrays = []
+
+    for field, odoo_type in columns:
+        values = [record.get(field, False) for record in records]
+
+        if odoo_type == 'many2one':
+            pairs = [v if isinstance(v, list) and v else None for v in values]
+            arrays.append(
+                pa.array([p[0] if p else None for p in pairs], pa.int64())
+            )
+            arrays.append(
+                pa.array(
+                    [p[1] if p and len(p) > 1 else None for p in pairs],
+                    pa.string(),
+                )
+            )
+        elif odoo_type == 'boolean':
+            arrays.append(pa.array(values, pa.bool_()))
+        elif odoo_type in {'date', 'datetime'}:
+            # O Odoo envia 'YYYY-MM-DD' ou 'YYYY-MM-DD HH:MM:SS' em UTC
+            texts = pa.array([_nullable(v) for v in values], pa.string())
+            naive = texts.cast(pa.timestamp('s'))
+            arrays.append(naive.cast(pa.timestamp('s', tz='UTC')))
+        elif odoo_type in X2MANY_TYPES:
+            arrays.append(
+                pa.array([v or [] for v in values], pa.list_(pa.int64()))
+            )
+        else:
+            target = schema.field(field).type
+            if target == pa.string():
+                values = [
+                    None if v is False or v is None else str(v) for v in values
+                ]
+            else:
+                values = [_nullable(v) for v in values]
+            arrays.append(pa.array(values, target))
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class _StreamSink(io.RawIOBase):
+    """
+    Destino de escrita que acumula os bytes até serem drenados.
+
+    Mantém a posição absoluta escrita, necessária para o rodapé do
+    Parquet, mesmo após os blocos já terem sido enviados ao cliente.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    @override
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+async def encode_arrow_stream(
+    pages: AsyncIterator[List[Dict[str, Any]]],
+    export_format: str,
+    schema: Any,
+    columns: List[Tuple[str, str]],
+) -> AsyncIterator[bytes]:
+    """
+    Converte páginas de registros em Arrow IPC stream ou Parquet.
+
+    Cada página vira um RecordBatch (um row group no Parquet) e é
+    enviada assim que convertida, sem materializar o modelo inteiro.
+
+    Args:
+        pages: Iterador assíncrono de páginas
+        export_format: 'arrow' ou 'parquet'
+        schema: Schema gerado por build_arrow_schema
+        columns: Colunas geradas por build_arrow_schema
+
+    Yields:
+        Blocos de bytes prontos para envio
+    """
+    pa = require_pyarrow()
+    sink = _StreamSink()
+    if export_format == 'parquet':
+        writer = pa.parquet.ParquetWriter(sink, schema)
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+    total = 0
+
+    try:
+        async for records in pages:
+            writer.write_batch(records_to_batch(records, schema, columns))
+            total += len(records)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    except Exception as e:
+        logger.error(
+            f'Exportação colunar interrompida após {total} registros: {e}'
+        )
+        raise
+
+    writer.close()
+    yield sink.drain()
+    logger.info(f'Exportação colunar concluída: {total} registros')
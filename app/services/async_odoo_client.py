@@ -1,14 +1,235 @@
 # app/services/async_odoo_client.py
 import asyncio
+import base64
+import binascii
 import concurrent.futures
-import functools
+import contextvars
+import json
 import logging
-import xmlrpc.client
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from app.config.settings import (
+    ODOO_MAX_WORKERS,
+    ODOO_READ_TIMEOUT,
+    ODOO_WRITE_TIMEOUT,
+)
+from app.services import metrics
+from app.services.admission import (
+    AdaptiveLimiter,
+    UpstreamOverloadedError,
+    clear_shed,
+    in_background_lane,
+    shed_state,
+)
+from app.services.cache import (
+    cache_get,
+    cache_incr,
+    cache_set,
+    make_cache_key,
+    record_cache_age,
+)
+from app.services.circuit_breaker import get_breaker
+from app.services.hedging import Hedger
+from app.services.retry import (
+    EXHAUSTED,
+    READ_METHODS,
+    RECOVERED,
+    RETRIED,
+    RetryPolicy,
+    is_retryable,
+)
+from app.services.rpc_transport import call_rpc, create_proxy
 
 # Configurar logger
 logger = logging.getLogger(__name__)
 
+# Chaves de ordenação suportadas pela paginação por cursor
+CURSOR_ORDER_KEYS = ('id', 'write_date')
+
+# Tipos de campo que o prefetch sabe seguir
+RELATIONAL_FIELD_TYPES = ('many2one', 'one2many', 'many2many')
+
+# Segundos em que o tipo e o modelo relacionado dos campos ficam em cache
+RELATION_CACHE_TTL = 3600
+
+# Contador de escritas por modelo, parte da chave das leituras em cache:
+# uma escrita muda a geração e as leituras anteriores deixam de ser achadas
+GENERATION_NAMESPACE = 'generation:'
+
+# Tempo limite das chamadas ao Odoo na requisição atual (None usa o padrão
+# de leitura ou escrita)
+call_timeout: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    'odoo_call_timeout', default=None
+)
+
+
+def odoo_timeout(seconds: float):
+    """
+    Dependência que define o tempo limite das chamadas ao Odoo de uma rota.
+
+    Uso: `dependencies=[Depends(odoo_timeout(120))]` em rotas que fazem
+    leituras sabidamente longas, como exportações.
+    """
+
+    async def dependency():
+        call_timeout.set(seconds)
+
+    return dependency
+
+
+def encode_cursor(
+    record: Dict[str, Any], order_by: str = 'id', descending: bool = False
+) -> str:
+    """
+    Gera um cursor opaco a partir do último registro de uma página.
+
+    Args:
+        record: Último registro retornado na página
+        order_by: Chave de ordenação ('id' ou 'write_date')
+        descending: Se a ordenação é decrescente
+
+    Returns:
+        Token base64 url-safe que identifica a posição na listagem
+    """
+    position = {'k': order_by, 'd': int(descending), 'id': record['id']}
+    if order_by == 'write_date':
+        position['w'] = record.get('write_date')
+
+    raw = json.dumps(position, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(
+    cursor: str, order_by: str = 'id', descending: bool = False
+) -> Dict[str, Any]:
+    """
+    Decodifica um cursor gerado por encode_cursor.
+
+    Args:
+        cursor: Token recebido do cliente
+        order_by: Chave de ordenação esperada
+        descending: Direção de ordenação esperada
+
+    Returns:
+        Dicionário com a posição do cursor
+
+    Raises:
+        ValueError: Se o cursor for inválido ou de outra ordenação
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded))
+        valid = (
+            isinstance(position, dict)
+            and isinstance(position.get('id'), int)
+            and position.get('k') == order_by
+            and position.get('d') == int(descending)
+            and (order_by != 'write_date' or position.get('w'))
+        )
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        valid = False
+
+    if not valid:
+        raise ValueError('Cursor de paginação inválido')
+
+    return position
+
+
+def _path_tree(paths: List[str]) -> Dict[str, Dict]:
+    """Agrupa caminhos como 'team_id.user_id.login' em uma árvore."""
+    tree = {}
+    for path in paths:
+        node = tree
+        for name in path.split('.'):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def _merge_trees(target: Dict[str, Dict], source: Dict[str, Dict]) -> None:
+    for name, subtree in source.items():
+        _merge_trees(target.setdefault(name, {}), subtree)
+
+
+def _flatten_tree(tree: Dict[str, Dict]) -> List[str]:
+    """Lista os caminhos relativos de uma árvore, dos nós às folhas."""
+    paths = []
+    for name, subtree in tree.items():
+        paths.append(name)
+        paths.extend(f'{name}.{path}' for path in _flatten_tree(subtree))
+    return paths
+
+
+def _related_ids(value: Any, info: Dict[str, Any]) -> List[int]:
+    """Extrai os ids de um valor many2one ([id, nome]) ou x2many."""
+    if not value:
+        return []
+    if info['type'] == 'many2one':
+        return [value[0] if isinstance(value, (list, tuple)) else value]
+    return list(value)
+
+
+async def _cache_records(
+    cache_key: str, records: List[Dict[str, Any]], lifetime: float
+) -> None:
+    """Grava uma leitura no cache com o momento em que foi feita."""
+    await cache_set(
+        cache_key, {'records': records, 'stored_at': time.time()}, lifetime
+    )
+
+
+def _search_read_kwargs(
+    fields: Optional[List[str]],
+    limit: Optional[int],
+    offset: Optional[int],
+    order: Optional[str],
+    context: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Argumentos nomeados do search_read, omitindo os não informados."""
+    kwargs = {}
+    if fields:
+        kwargs['fields'] = fields
+    if limit is not None:
+        kwargs['limit'] = limit
+    if offset:
+        kwargs['offset'] = offset
+    if order:
+        kwargs['order'] = order
+    if context:
+        kwargs['context'] = context
+    return kwargs
+
+
+def keyset_domain(
+    domain: List, position: Dict[str, Any], descending: bool = False
+) -> List:
+    """
+    Acrescenta ao domínio a condição que posiciona a busca após o cursor.
+
+    Args:
+        domain: Domínio original da busca
+        position: Posição decodificada por decode_cursor
+        descending: Se a ordenação é decrescente
+
+    Returns:
+        Novo domínio com a condição de keyset
+    """
+    operator = '<' if descending else '>'
+
+    if position['k'] == 'write_date':
+        return [
+            *domain,
+            '|',
+            ['write_date', operator, position['w']],
+            '&',
+            ['write_date', '=', position['w']],
+            ['id', operator, position['id']],
+        ]
+
+    return [*domain, ['id', operator, position['id']]]
+
 
 class AsyncOdooClient:
     """
@@ -16,6 +237,12 @@ class AsyncOdooClient:
 
     Permite executar chamadas XML-RPC ao Odoo de forma assíncrona,
     usando um ThreadPoolExecutor para evitar o bloqueio do loop de eventos.
+    Cada chamada passa antes pelo disjuntor do servidor (ver
+    CircuitBreaker), que recusa chamadas enquanto o Odoo está fora do ar,
+    e pelo limite adaptativo (ver AdaptiveLimiter), que mantém o Odoo longe
+    da saturação. Toda chamada tem tempo limite e as leituras são
+    repetidas após falhas transitórias (ver RetryPolicy) e, com
+    ODOO_HEDGING, duplicadas quando demoram além do normal (ver Hedger).
     """
 
     _instances = {}  # Singleton pattern para reutilização de clientes
@@ -50,15 +277,22 @@ class AsyncOdooClient:
         self.db = db
         self.username = username
         self.password = password
-        self._common_proxy = xmlrpc.client.ServerProxy(
-            f'{url}/xmlrpc/2/common'
-        )
-        self._models_proxy = xmlrpc.client.ServerProxy(
-            f'{url}/xmlrpc/2/object'
-        )
+        # Um ServerProxy por thread: a conexão HTTP dele não é thread-safe
+        self._local = threading.local()
         self._uid = None
         # Criar um executor com número limitado de workers para evitar sobrecarga
-        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=20)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=ODOO_MAX_WORKERS
+        )
+        self.limiter = AdaptiveLimiter(max_limit=ODOO_MAX_WORKERS)
+        self.breaker = get_breaker(url)
+        self.hedger = Hedger()
+        self.retry_policy = RetryPolicy()
+        # Novas tentativas por ('modelo.método', resultado)
+        self.retry_counts = Counter()
+        # Leituras em cache sendo revalidadas em segundo plano
+        self._revalidating = set()
+        self._background_tasks = set()
 
     async def authenticate(self) -> Optional[int]:
         """
@@ -72,18 +306,18 @@ class AsyncOdooClient:
 
         try:
             # Executa a chamada síncrona de autenticação em uma thread separada
-            func = functools.partial(
-                self._common_proxy.authenticate,
+            self._uid = await asyncio.get_event_loop().run_in_executor(
+                self._executor,
+                self._rpc,
+                'common',
+                'authenticate',
+                ODOO_READ_TIMEOUT,
                 self.db,
                 self.username,
                 self.password,
                 {},
             )
 
-            self._uid = await asyncio.get_event_loop().run_in_executor(
-                self._executor, func
-            )
-
             if self._uid:
                 logger.info(f'Autenticação bem-sucedida. UID: {self._uid}')
             else:
@@ -92,9 +326,26 @@ class AsyncOdooClient:
             return self._uid
 
         except Exception as e:
+            if is_retryable(e):
+                self.breaker.record_failure()
             logger.error(f'Erro ao autenticar: {e}')
             return None
 
+    def _rpc(
+        self, service: str, method: str, timeout: float, *args: Any
+    ) -> Any:
+        """Executa uma chamada XML-RPC na thread atual do executor."""
+        proxies = getattr(self._local, 'proxies', None)
+        if proxies is None:
+            proxies = self._local.proxies = {}
+
+        if service not in proxies:
+            proxies[service] = create_proxy(self.url, service)
+
+        proxy, transport = proxies[service]
+        transport.timeout = timeout
+        return call_rpc(proxy, transport, service, method, args)
+
     async def execute_kw(
         self,
         model: str,
@@ -105,6 +356,14 @@ class AsyncOdooClient:
         """
         Executa um método no Odoo de forma assíncrona.
 
+        Leituras (ver READ_METHODS) que falham por conexão, tempo esgotado
+        ou 502/503/504 são repetidas conforme `retry_policy`, sem passar
+        do prazo total da política. Escritas são executadas uma única vez.
+        O tempo limite de cada tentativa vem de `call_timeout` ou, na
+        falta dele, de ODOO_READ_TIMEOUT / ODOO_WRITE_TIMEOUT.
+        Qualquer outro método bem-sucedido invalida as leituras do modelo
+        guardadas no cache por search_read.
+
         Args:
             model: Nome do modelo Odoo (ex: 'res.partner')
             method: Nome do método a ser executado (ex: 'search_read')
@@ -115,18 +374,24 @@ class AsyncOdooClient:
             Resultado da chamada ao método
 
         Raises:
+            UpstreamOverloadedError: Se a chamada não for admitida a tempo
+                ou se o disjuntor estiver aberto (CircuitOpenError)
             Exception: Qualquer exceção ocorrida durante a chamada
         """
-        if not self._uid:
-            await self.authenticate()
-
-            if not self._uid:
-                raise Exception('Falha na autenticação no Odoo')
+        if not self._uid and not await self.authenticate():
+            raise Exception('Falha na autenticação no Odoo')
 
         kwargs = kwargs or {}
 
-        func = functools.partial(
-            self._models_proxy.execute_kw,
+        policy = self.retry_policy
+        retry = method in READ_METHODS
+        # Só leituras podem ser duplicadas pelo hedging
+        send = self._hedged_call if retry else self._attempt
+        call = f'{model}.{method}'
+        timeout = call_timeout.get() or (
+            ODOO_READ_TIMEOUT if retry else ODOO_WRITE_TIMEOUT
+        )
+        rpc_args = (
             self.db,
             self._uid,
             self.password,
@@ -135,25 +400,138 @@ class AsyncOdooClient:
             args,
             kwargs,
         )
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            self.breaker.before_call()
+            try:
+                result = await send(call, timeout, rpc_args)
+                self.breaker.record_success()
+                if attempt > 1:
+                    self.retry_counts[call, RECOVERED] += 1
+                if not retry:
+                    # Escritas invalidam as leituras do modelo em cache
+                    await cache_incr(GENERATION_NAMESPACE + model)
+                return result
+            except UpstreamOverloadedError:
+                raise
+            except Exception as e:
+                transient = is_retryable(e)
+                if transient:
+                    self.breaker.record_failure()
+                else:
+                    # Fault e afins: o Odoo respondeu
+                    self.breaker.record_success()
+
+                if not (retry and transient):
+                    logger.error(f'Erro ao executar {call}: {e}')
+                    raise
+
+                delay = policy.backoff(attempt)
+                elapsed = time.monotonic() - started
+                if (
+                    attempt >= policy.attempts
+                    or elapsed + delay >= policy.deadline
+                ):
+                    self.retry_counts[call, EXHAUSTED] += 1
+                    logger.error(
+                        f'Erro ao executar {call} após {attempt} '
+                        f'tentativa(s): {e}'
+                    )
+                    raise
+
+                self.retry_counts[call, RETRIED] += 1
+                logger.warning(
+                    f'Falha transitória em {call} ({e}), nova tentativa '
+                    f'em {delay:.2f}s'
+                )
+                await asyncio.sleep(delay)
+            finally:
+                self.breaker.release()
+
+    async def _attempt(
+        self, call: str, timeout: float, rpc_args: Tuple[Any, ...]
+    ) -> Any:
+        """Uma tentativa de execute_kw, com vaga no limitador."""
+        async with self.limiter.slot(key=call):
+            started = time.monotonic()
+            # O executor não herda ContextVars: leva o span atual à thread
+            context = contextvars.copy_context()
+            result = await asyncio.get_event_loop().run_in_executor(
+                self._executor,
+                context.run,
+                self._rpc,
+                'object',
+                'execute_kw',
+                timeout,
+                *rpc_args,
+            )
+        self.hedger.observe(call, time.monotonic() - started)
+        return result
+
+    async def _hedged_call(
+        self, call: str, timeout: float, rpc_args: Tuple[Any, ...]
+    ) -> Any:
+        """
+        Executa uma leitura enviando uma cópia se ela demorar demais.
 
+        Se a primeira tentativa não responder dentro do p95 da chamada e
+        houver orçamento de hedging e vaga no limitador, uma cópia
+        idêntica é enviada e vale o primeiro resultado bem-sucedido. A
+        tentativa perdedora não é cancelada (a thread do executor não pode
+        ser interrompida) e termina em segundo plano, ocupando sua vaga.
+        """
+        delay = self.hedger.delay(call)
+        primary = asyncio.ensure_future(self._attempt(call, timeout, rpc_args))
+        if delay is None:
+            return await primary
+
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not self.limiter.has_room() or not self.hedger.try_spend():
+            return await primary
+
+        hedge = asyncio.ensure_future(self._attempt(call, timeout, rpc_args))
+        pending = {primary, hedge}
+        error = None
         try:
-            return await asyncio.get_event_loop().run_in_executor(
-                self._executor, func
-            )
-        except Exception as e:
-            logger.error(f'Erro ao executar {model}.{method}: {e}')
-            raise
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        self.hedger.record_winner(task is hedge)
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in pending:
+                self._track_background(task)
+
+    def _track_background(self, task: asyncio.Future) -> None:
+        # Mantém a referência e consome o erro de tarefas abandonadas
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
 
     # Métodos genéricos de CRUD
 
-    async def search_read(
+    async def search_read(  # noqa: PLR0913
         self,
         model: str,
         domain: List,
         fields: Optional[List[str]] = None,
+        *,
         limit: Optional[int] = None,
         offset: Optional[int] = 0,
         order: Optional[str] = None,
+        raise_on_error: bool = False,
+        context: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        outage_ttl: Optional[float] = None,
     ) -> List[Dict[str, Any]]:
         """
         Busca e lê registros no Odoo.
@@ -165,28 +543,311 @@ class AsyncOdooClient:
             limit: Número máximo de registros
             offset: Deslocamento para paginação
             order: Ordenação (ex: 'name ASC')
+            raise_on_error: Propaga erros em vez de retornar lista vazia
+            context: Contexto do Odoo (ex: {'active_test': False})
+            cache_ttl: Segundos em que o resultado pode ser servido do
+                cache compartilhado (None não usa cache)
+            stale_ttl: Segundos após o `cache_ttl` em que o resultado
+                vencido ainda é servido na hora, enquanto uma nova leitura
+                é feita em segundo plano (stale-while-revalidate)
+            outage_ttl: Idade máxima do resultado servido com o Odoo fora
+                do ar. Sem ela, vale o limite `cache_ttl + stale_ttl`; use
+                apenas em leituras que toleram dados bem mais antigos
 
         Returns:
             Lista de registros encontrados
         """
-        kwargs = {}
-        if fields:
-            kwargs['fields'] = fields
-        if limit is not None:
-            kwargs['limit'] = limit
-        if offset:
-            kwargs['offset'] = offset
-        if order:
-            kwargs['order'] = order
+        kwargs = _search_read_kwargs(fields, limit, offset, order, context)
+        cache_key = None
+        entry = None
+        lifetime = 0.0
+        if cache_ttl:
+            generation = await cache_get(GENERATION_NAMESPACE + model) or 0
+            cache_key = make_cache_key(
+                f'search_read:{model}',
+                self.url,
+                self.db,
+                generation,
+                domain,
+                kwargs,
+            )
+            entry = await cache_get(cache_key)
+            # A entrada vive além da validade para servir dados vencidos
+            # durante a revalidação ou com o Odoo fora do ar
+            lifetime = max(cache_ttl + (stale_ttl or 0), outage_ttl or 0)
+
+        if entry is not None:
+            age = time.time() - entry['stored_at']
+            if age <= cache_ttl:
+                record_cache_age(age)
+                return entry['records']
+            if stale_ttl and age <= cache_ttl + stale_ttl:
+                self._revalidate(cache_key, model, domain, kwargs, lifetime)
+                record_cache_age(age, stale=True)
+                return entry['records']
 
         try:
-            return await self.execute_kw(
+            records = await self.execute_kw(
                 model, 'search_read', [domain], kwargs
             )
+            if cache_key:
+                await _cache_records(cache_key, records, lifetime)
+            return records
         except Exception as e:
+            if entry is not None and (
+                isinstance(e, UpstreamOverloadedError) or is_retryable(e)
+            ):
+                age = time.time() - entry['stored_at']
+                logger.warning(
+                    f'Odoo indisponível, servindo {model} do cache com '
+                    f'{age:.0f}s: {e}'
+                )
+                clear_shed()
+                record_cache_age(age, stale=True)
+                return entry['records']
+
+            if isinstance(e, UpstreamOverloadedError):
+                # Sobrecarga vira 503 na API em vez de resultado vazio
+                raise
             logger.error(f'Erro em search_read de {model}: {e}')
+            if raise_on_error:
+                raise
             return []
 
+    def _revalidate(
+        self,
+        cache_key: str,
+        model: str,
+        domain: List,
+        kwargs: Dict[str, Any],
+        lifetime: float,
+    ) -> None:
+        """Atualiza uma leitura vencida em segundo plano (uma por chave)."""
+        if cache_key in self._revalidating:
+            return
+        self._revalidating.add(cache_key)
+
+        async def refresh():
+            # Descartes da revalidação não afetam a requisição que a
+            # disparou, que já foi atendida com o dado vencido
+            shed_state.set(None)
+            try:
+                records = await self.execute_kw(
+                    model, 'search_read', [domain], kwargs
+                )
+                await _cache_records(cache_key, records, lifetime)
+            except Exception as e:
+                logger.warning(
+                    f'Falha ao revalidar {model} em segundo plano: {e}'
+                )
+            finally:
+                self._revalidating.discard(cache_key)
+
+        self._track_background(
+            asyncio.create_task(in_background_lane(refresh)())
+        )
+
+    async def search_read_page(  # noqa: PLR0913
+        self,
+        model: str,
+        domain: List,
+        fields: Optional[List[str]] = None,
+        *,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        order_by: str = 'id',
+        descending: bool = False,
+        raise_on_error: bool = False,
+        context: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Busca uma página de registros usando paginação por cursor (keyset).
+
+        Em vez de descartar `offset` linhas no servidor, cada página filtra
+        os registros posteriores ao último item da página anterior, o que
+        mantém o custo constante mesmo no fim de tabelas grandes.
+
+        Args:
+            model: Nome do modelo
+            domain: Filtro de domínio
+            fields: Lista de campos a retornar
+            limit: Tamanho da página
+            cursor: Cursor retornado pela página anterior
+            offset: Deslocamento legado, usado apenas sem cursor
+            order_by: Chave de ordenação ('id' ou 'write_date')
+            descending: Se a ordenação é decrescente
+            raise_on_error: Propaga erros do Odoo em vez de retornar página
+                vazia
+            context: Contexto do Odoo repassado ao search_read
+            cache_ttl: Validade da página no cache (ver search_read)
+            stale_ttl: Tempo extra em que a página vencida é servida
+                enquanto é revalidada (ver search_read)
+
+        Returns:
+            Tupla com os registros da página e o cursor da próxima página
+            (None quando não há mais registros)
+
+        Raises:
+            ValueError: Se o cursor, a chave de ordenação ou o tamanho da
+                página forem inválidos
+        """
+        if limit < 1:
+            raise ValueError(f'Tamanho de página inválido: {limit}')
+        if order_by not in CURSOR_ORDER_KEYS:
+            raise ValueError(f'Ordenação não suportada: {order_by}')
+
+        if cursor:
+            position = decode_cursor(cursor, order_by, descending)
+            domain = keyset_domain(domain, position, descending)
+            offset = 0
+
+        if fields and order_by not in fields:
+            fields = [*fields, order_by]
+
+        direction = 'desc' if descending else 'asc'
+        order = f'id {direction}'
+        if order_by == 'write_date':
+            order = f'write_date {direction}, {order}'
+
+        # Busca um registro a mais para saber se existe próxima página
+        records = await self.search_read(
+            model,
+            domain,
+            fields=fields,
+            limit=limit + 1,
+            offset=offset,
+            order=order,
+            raise_on_error=raise_on_error,
+            context=context,
+            cache_ttl=cache_ttl,
+            stale_ttl=stale_ttl,
+        )
+
+        if len(records) <= limit:
+            return records, None
+
+        records = records[:limit]
+        return records, encode_cursor(records[-1], order_by, descending)
+
+    async def _field_relations(
+        self, model: str, fields: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Retorna tipo e modelo relacionado dos campos (com cache)."""
+        cache_key = make_cache_key(
+            f'relations:{model}', self.url, self.db, sorted(fields)
+        )
+        relations = await cache_get(cache_key)
+        if relations is None:
+            relations = await self.execute_kw(
+                model,
+                'fields_get',
+                [fields],
+                {'attributes': ['type', 'relation']},
+            )
+            await cache_set(cache_key, relations, RELATION_CACHE_TTL)
+        return relations
+
+    async def _prefetch_level(
+        self,
+        model: str,
+        records: List[Dict[str, Any]],
+        tree: Dict[str, Dict],
+        context: Optional[Dict[str, Any]],
+    ) -> None:
+        """Resolve um nível da árvore de caminhos e desce recursivamente."""
+        branches = {name: sub for name, sub in tree.items() if sub}
+        if not branches or not records:
+            return
+
+        relations = await self._field_relations(model, list(branches))
+
+        # Agrupa por modelo relacionado: um read por modelo em cada nível
+        targets = {}
+        for name, subtree in branches.items():
+            info = relations.get(name) or {}
+            if info.get('type') not in RELATIONAL_FIELD_TYPES:
+                raise ValueError(f'Campo {name} de {model} não é relacional')
+            target = targets.setdefault(
+                info['relation'], {'ids': set(), 'tree': {}}
+            )
+            _merge_trees(target['tree'], subtree)
+            for record in records:
+                target['ids'].update(_related_ids(record.get(name), info))
+
+        async def read_target(relation, target):
+            if not target['ids']:
+                return relation, {}
+            kwargs = {'fields': list(target['tree'])}
+            if context:
+                kwargs['context'] = context
+            related = await self.execute_kw(
+                relation, 'read', [sorted(target['ids'])], kwargs
+            )
+            await self._prefetch_level(
+                relation, related, target['tree'], context
+            )
+            return relation, {row['id']: row for row in related}
+
+        loaded = dict(
+            await asyncio.gather(
+                *(read_target(rel, t) for rel, t in targets.items())
+            )
+        )
+
+        # Grava os valores como chaves pontilhadas nos registros originais
+        for name, subtree in branches.items():
+            info = relations[name]
+            rows = loaded[info['relation']]
+            subpaths = _flatten_tree(subtree)
+            for record in records:
+                ids = _related_ids(record.get(name), info)
+                related = [rows[i] for i in ids if i in rows]
+                for subpath in subpaths:
+                    values = [row.get(subpath) for row in related]
+                    if info['type'] == 'many2one':
+                        values = values[0] if values else None
+                    record[f'{name}.{subpath}'] = values
+
+    async def prefetch_related(
+        self,
+        model: str,
+        records: List[Dict[str, Any]],
+        paths: List[str],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Resolve campos de registros relacionados em lote.
+
+        Cada caminho (ex: 'partner_id.vat' ou 'team_id.user_id.login')
+        parte de um campo relacional já lido nos registros. Em cada nível
+        os ids de todos os registros são reunidos e é feito um único
+        `read` por modelo relacionado, então o custo é proporcional à
+        profundidade dos caminhos e não ao número de registros.
+
+        Os valores são gravados nos próprios registros com a chave do
+        caminho completo (ex: record['partner_id.vat']). Em many2one o
+        valor é None quando o campo está vazio; em x2many é uma lista.
+
+        Args:
+            model: Modelo dos registros
+            records: Registros lidos com os campos do primeiro nível
+            paths: Caminhos pontilhados a resolver
+            context: Contexto do Odoo repassado aos reads
+
+        Returns:
+            Os mesmos registros, com os valores relacionados
+
+        Raises:
+            ValueError: Se um campo intermediário não for relacional
+            Exception: Qualquer erro do Odoo durante os reads
+        """
+        tree = _path_tree(paths)
+        await self._prefetch_level(model, records, tree, context)
+        return records
+
     async def create(
         self, model: str, values: Dict[str, Any]
     ) -> Optional[int]:
@@ -202,6 +863,8 @@ class AsyncOdooClient:
         """
         try:
             return await self.execute_kw(model, 'create', [values])
+        except UpstreamOverloadedError:
+            raise
         except Exception as e:
             logger.error(f'Erro ao criar registro em {model}: {e}')
             return None
@@ -228,6 +891,8 @@ class AsyncOdooClient:
 
         try:
             return await self.execute_kw(model, 'write', [record_ids, values])
+        except UpstreamOverloadedError:
+            raise
         except Exception as e:
             logger.error(f'Erro ao atualizar registros em {model}: {e}')
             return False
@@ -250,6 +915,8 @@ class AsyncOdooClient:
 
         try:
             return await self.execute_kw(model, 'unlink', [record_ids])
+        except UpstreamOverloadedError:
+            raise
         except Exception as e:
             logger.error(f'Erro ao remover registros em {model}: {e}')
             return False
@@ -258,3 +925,91 @@ class AsyncOdooClient:
         """Fecha o executor de threads."""
         if hasattr(self, '_executor'):
             self._executor.shutdown(wait=False)
+
+
+def _sum_by_server(values) -> Dict[Tuple[str, ...], float]:
+    totals = {}
+    for labels, value in values:
+        totals[labels] = totals.get(labels, 0) + value
+    return totals
+
+
+def _client_samples(read):
+    """Soma um valor de todos os clientes, agrupado por servidor."""
+
+    def collect():
+        samples = []
+        for client in list(AsyncOdooClient._instances.values()):
+            samples.extend(read(client))
+        return _sum_by_server(samples).items()
+
+    return collect
+
+
+def _retry_samples(client):
+    for (call, outcome), count in client.retry_counts.items():
+        model, method = call.rsplit('.', 1)
+        yield (model, method, outcome), count
+
+
+metrics.Gauge(
+    'odoo_executor_queue_depth',
+    'Chamadas esperando uma thread livre no executor.',
+    ('server',),
+    callback=_client_samples(
+        lambda c: [((c.url,), c._executor._work_queue.qsize())]
+    ),
+)
+metrics.Gauge(
+    'odoo_rpc_inflight',
+    'Chamadas ao Odoo em andamento por fila de admissão.',
+    ('server', 'lane'),
+    callback=_client_samples(
+        lambda c: [
+            ((c.url, lane), n) for lane, n in c.limiter.inflight.items()
+        ]
+    ),
+)
+metrics.Gauge(
+    'odoo_admission_queued',
+    'Chamadas esperando vaga no limitador adaptativo.',
+    ('server', 'lane'),
+    callback=_client_samples(
+        lambda c: [
+            ((c.url, lane), n)
+            for lane, n in c.limiter.stats()['queued'].items()
+        ]
+    ),
+)
+metrics.Gauge(
+    'odoo_admission_limit',
+    'Limite atual de chamadas simultâneas ao Odoo.',
+    ('server',),
+    callback=_client_samples(lambda c: [((c.url,), int(c.limiter.limit))]),
+)
+metrics.Counter(
+    'odoo_admission_shed_total',
+    'Chamadas descartadas por esperar demais na fila de admissão.',
+    ('server', 'lane'),
+    callback=_client_samples(
+        lambda c: [((c.url, lane), n) for lane, n in c.limiter.shed.items()]
+    ),
+)
+metrics.Counter(
+    'odoo_rpc_retries_total',
+    'Novas tentativas de leituras, por resultado.',
+    ('model', 'method', 'outcome'),
+    callback=_client_samples(_retry_samples),
+)
+metrics.Counter(
+    'odoo_hedge_requests_total',
+    'Cópias de leituras lentas enviadas ao Odoo.',
+    ('server',),
+    callback=_client_samples(lambda c: [((c.url,), c.hedger.hedged)]),
+)
+metrics.Counter(
+    'odoo_hedge_wins_total',
+    'Cópias que responderam antes da tentativa original.',
+    ('server',),
+    callback=_client_samples(lambda c: [((c.url,), c.hedger.hedge_wins)]),
+)
@@ -1,11 +1,9 @@
-import xmlrpc.client
+from app.services.rpc_transport import InstrumentedProxy
 
 
 def connect_to_odoo(url):
     """Cria e retorna o proxy para comunicação com o servidor Odoo via XML-RPC."""
-    return xmlrpc.client.ServerProxy(
-        f'{url}/xmlrpc/2/common'
-    ), xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object')
+    return InstrumentedProxy(url, 'common'), InstrumentedProxy(url, 'object')
 
 
 def authenticate_odoo(common, db, username, password):
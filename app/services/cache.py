@@ -0,0 +1,605 @@
+import asyncio
+import contextvars
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+from app.config.settings import (
+    CACHE_BACKEND,
+    CACHE_MAX_ENTRIES,
+    CACHE_PATH,
+    CACHE_POOL_SIZE,
+    CACHE_URL,
+)
+from app.services.metrics import CACHE_REQUESTS
+from app.utils.responses import dumps as _dumps
+from app.utils.responses import loads as _loads
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# Prefixo aplicado a todas as chaves, para compartilhar o Redis com outros
+# sistemas sem colisões
+CACHE_KEY_PREFIX = 'api-odoo:'
+
+# Idade dos dados em cache usados pela requisição HTTP atual, preenchida
+# pelo CacheAgeMiddleware
+cache_age_state: contextvars.ContextVar[Optional[Dict[str, Any]]] = (
+    contextvars.ContextVar('cache_age_state', default=None)
+)
+
+
+def make_cache_key(namespace: str, *parts: Any) -> str:
+    """
+    Gera uma chave de cache estável a partir de argumentos arbitrários.
+
+    Args:
+        namespace: Prefixo legível da chave (ex: 'search_read:res.partner')
+        *parts: Valores serializáveis em JSON que identificam a chamada
+
+    Returns:
+        Chave no formato '<namespace>:<sha256>'
+    """
+    raw = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    digest = hashlib.sha256(raw.encode()).hexdigest()
+    return f'{namespace}:{digest}'
+
+
+def record_cache_age(age: float, stale: bool = False) -> None:
+    """
+    Registra na requisição atual que dados do cache foram usados.
+
+    Args:
+        age: Segundos desde que os dados foram lidos do Odoo
+        stale: Se os dados já tinham passado da validade
+    """
+    state = cache_age_state.get()
+    if state is None:
+        return
+    state['age'] = max(state['age'] or 0.0, age)
+    state['stale'] = state['stale'] or stale
+
+
+class CacheBackend:
+    """
+    Interface comum dos backends de cache.
+
+    Todos os métodos são assíncronos e os valores são serializados em
+    JSON, de modo que os backends são intercambiáveis. Tuplas voltam como
+    listas; valores não serializáveis em JSON não podem ser guardados.
+    JSON (e não pickle) porque um cache compartilhado não pode executar
+    código ao ler uma entrada gravada por outro processo.
+    """
+
+    name = 'base'
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Retorna o valor da chave ou None se ausente ou expirado."""
+        raise NotImplementedError
+
+    async def set(
+        self, key: str, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        """Grava um valor, opcionalmente com validade em segundos."""
+        raise NotImplementedError
+
+    async def add(
+        self, key: str, value: Any, ttl: Optional[float] = None
+    ) -> bool:
+        """
+        Grava um valor apenas se a chave não existir, de forma atômica.
+
+        Returns:
+            True se o valor foi gravado, False se a chave já existia
+        """
+        raise NotImplementedError
+
+    async def incr(self, key: str) -> int:
+        """
+        Incrementa um contador sem validade, de forma atômica.
+
+        Returns:
+            Novo valor (1 se a chave não existia)
+        """
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        """Remove uma chave."""
+        raise NotImplementedError
+
+    async def delete_prefix(self, prefix: str) -> None:
+        """Remove todas as chaves que começam com o prefixo."""
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        """Remove todas as chaves desta aplicação."""
+        await self.delete_prefix('')
+
+    async def close(self) -> None:
+        """Libera conexões e arquivos abertos."""
+
+
+class MemoryCache(CacheBackend):
+    """Cache LRU em memória, local ao processo."""
+
+    name = 'memory'
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data: 'OrderedDict[str, Tuple[Optional[float], bytes]]' = (
+            OrderedDict()
+        )
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return _loads(data)
+
+    async def set(
+        self, key: str, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        expires_at = time.time() + ttl if ttl else None
+        self._data[key] = (expires_at, _dumps(value))
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    async def add(
+        self, key: str, value: Any, ttl: Optional[float] = None
+    ) -> bool:
+        # Sem await entre a leitura e a gravação: atômico no event loop
+        entry = self._data.get(key)
+        if entry is not None and (entry[0] is None or entry[0] > time.time()):
+            return False
+        await self.set(key, value, ttl)
+        return True
+
+    async def incr(self, key: str) -> int:
+        value = (await self.get(key) or 0) + 1
+        await self.set(key, value)
+        return value
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        for key in [k for k in self._data if k.startswith(prefix)]:
+            del self._data[key]
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Cache em arquivo SQLite, compartilhado pelos workers de um mesmo host.
+
+    O modo WAL permite leituras concorrentes entre processos; as chamadas
+    bloqueantes rodam em threads para não travar o event loop.
+    """
+
+    name = 'sqlite'
+
+    # A cada quantas gravações os itens expirados são removidos
+    PRUNE_EVERY = 500
+
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(
+            path, timeout=5, check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.Lock()
+        self._writes = 0
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS cache ('
+                'key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)'
+            )
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value FROM cache WHERE key = ? '
+                'AND (expires_at IS NULL OR expires_at > ?)',
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set(self, key: str, data: bytes, expires_at: Optional[float]):
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO cache (key, value, expires_at) '
+                'VALUES (?, ?, ?)',
+                (key, data, expires_at),
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                self._conn.execute(
+                    'DELETE FROM cache WHERE expires_at <= ?', (time.time(),)
+                )
+
+    def _add(self, key: str, data: bytes, expires_at: Optional[float]):
+        with self._lock:
+            # Uma entrada expirada não pode impedir a gravação
+            self._conn.execute(
+                'DELETE FROM cache WHERE key = ? AND expires_at <= ?',
+                (key, time.time()),
+            )
+            self._conn.execute(
+                'INSERT OR IGNORE INTO cache (key, value, expires_at) '
+                'VALUES (?, ?, ?)',
+                (key, data, expires_at),
+            )
+            return self._conn.execute('SELECT changes()').fetchone()[0] == 1
+
+    def _incr(self, key: str) -> int:
+        with self._lock:
+            # BEGIN IMMEDIATE trava a escrita entre processos até o COMMIT
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute(
+                    'SELECT value FROM cache WHERE key = ?', (key,)
+                ).fetchone()
+                value = (_loads(row[0]) if row else 0) + 1
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO cache (key, value, expires_at) '
+                    'VALUES (?, ?, NULL)',
+                    (key, _dumps(value)),
+                )
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+        return value
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
+
+    async def get(self, key: str) -> Optional[Any]:
+        data = await asyncio.to_thread(self._get, key)
+        return None if data is None else _loads(data)
+
+    async def set(
+        self, key: str, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        expires_at = time.time() + ttl if ttl else None
+        await asyncio.to_thread(self._set, key, _dumps(value), expires_at)
+
+    async def add(
+        self, key: str, value: Any, ttl: Optional[float] = None
+    ) -> bool:
+        expires_at = time.time() + ttl if ttl else None
+        return await asyncio.to_thread(
+            self._add, key, _dumps(value), expires_at
+        )
+
+    async def incr(self, key: str) -> int:
+        return await asyncio.to_thread(self._incr, key)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(
+            self._execute, 'DELETE FROM cache WHERE key = ?', (key,)
+        )
+
+    async def delete_prefix(self, prefix: str) -> None:
+        escaped = (
+            prefix
+            .replace('\\', '\\\\')
+            .replace('%', '\\%')
+            .replace('_', '\\_')
+        )
+        await asyncio.to_thread(
+            self._execute,
+            "DELETE FROM cache WHERE key LIKE ? ESCAPE '\\'",
+            (f'{escaped}%',),
+        )
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisError(RuntimeError):
+    """Erro retornado pelo servidor Redis; a conexão continua utilizável."""
+
+
+class _RedisConnection:
+    """Conexão RESP2 com o servidor, usada por um comando de cada vez."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        self._reader = reader
+        self._writer = writer
+
+    async def _read_reply(self) -> Any:
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError('Conexão com o Redis encerrada')
+        kind, payload = line[:1], line[1:-2]
+        if kind == b'+':
+            return payload.decode()
+        if kind == b'-':
+            raise RedisError(f'Erro do Redis: {payload.decode()}')
+        if kind == b':':
+            return int(payload)
+        if kind == b'$':
+            length = int(payload)
+            if length < 0:
+                return None
+            data = await self._reader.readexactly(length + 2)
+            return data[:-2]
+        if kind == b'*':
+            length = int(payload)
+            if length < 0:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+        raise RuntimeError(f'Resposta inválida do Redis: {line!r}')
+
+    async def send(self, *args: Any, timeout: float) -> Any:
+        parts = [f'*{len(args)}\r\n'.encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(f'${len(data)}\r\n'.encode() + data + b'\r\n')
+        self._writer.write(b''.join(parts))
+        await self._writer.drain()
+        return await asyncio.wait_for(self._read_reply(), timeout)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache em servidor compatível com o protocolo Redis (RESP2).
+
+    Implementa apenas os comandos necessários (AUTH, SELECT, GET, SET,
+    INCR, DEL e SCAN) sobre conexões asyncio, sem dependências externas. As
+    chaves recebem o prefixo CACHE_KEY_PREFIX.
+
+    Cada comando usa uma conexão de um pool de até `pool_size` conexões,
+    de modo que comandos concorrentes não esperam uns pelos outros. Uma
+    conexão que falhou no meio de um comando é descartada, nunca volta ao
+    pool.
+    """
+
+    name = 'redis'
+
+    def __init__(
+        self,
+        url: str = CACHE_URL,
+        timeout: float = 2.0,
+        pool_size: int = CACHE_POOL_SIZE,
+    ):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or 'localhost'
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.db = int(parsed.path.lstrip('/') or 0)
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._idle: List[_RedisConnection] = []
+        self._slots = asyncio.Semaphore(pool_size)
+
+    async def _connect(self) -> _RedisConnection:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout
+        )
+        connection = _RedisConnection(reader, writer)
+        try:
+            if self.password:
+                auth = (
+                    [self.username, self.password]
+                    if self.username
+                    else [self.password]
+                )
+                await connection.send('AUTH', *auth, timeout=self.timeout)
+            if self.db:
+                await connection.send('SELECT', self.db, timeout=self.timeout)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    async def command(self, *args: Any) -> Any:
+        """
+        Executa um comando, tentando de novo uma vez em outra conexão se
+        a conexão usada tiver caído.
+
+        Raises:
+            RedisError: Se o servidor retornar erro
+            ConnectionError: Se não for possível falar com o servidor
+        """
+        async with self._slots:
+            for attempt in range(2):
+                connection = self._idle.pop() if self._idle else None
+                reusable = False
+                try:
+                    if connection is None:
+                        connection = await self._connect()
+                    reply = await connection.send(*args, timeout=self.timeout)
+                    reusable = True
+                    return reply
+                except RedisError:
+                    reusable = True
+                    raise
+                except (ConnectionError, OSError, asyncio.TimeoutError):
+                    if attempt:
+                        raise
+                except asyncio.IncompleteReadError as e:
+                    if attempt:
+                        raise ConnectionError(str(e))
+                finally:
+                    if connection is not None:
+                        if reusable:
+                            self._idle.append(connection)
+                        else:
+                            connection.close()
+
+    async def get(self, key: str) -> Optional[Any]:
+        data = await self.command('GET', CACHE_KEY_PREFIX + key)
+        return None if data is None else _loads(data)
+
+    async def set(
+        self, key: str, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        args: List[Any] = ['SET', CACHE_KEY_PREFIX + key, _dumps(value)]
+        if ttl:
+            args += ['PX', max(1, int(ttl * 1000))]
+        await self.command(*args)
+
+    async def add(
+        self, key: str, value: Any, ttl: Optional[float] = None
+    ) -> bool:
+        args: List[Any] = ['SET', CACHE_KEY_PREFIX + key, _dumps(value), 'NX']
+        if ttl:
+            args += ['PX', max(1, int(ttl * 1000))]
+        return await self.command(*args) is not None
+
+    async def incr(self, key: str) -> int:
+        return await self.command('INCR', CACHE_KEY_PREFIX + key)
+
+    async def delete(self, key: str) -> None:
+        await self.command('DEL', CACHE_KEY_PREFIX + key)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        literal = CACHE_KEY_PREFIX + prefix
+        for char in '\\*?[]':
+            literal = literal.replace(char, '\\' + char)
+        pattern = literal + '*'
+        cursor = '0'
+        while True:
+            cursor, keys = await self.command(
+                'SCAN', cursor, 'MATCH', pattern, 'COUNT', 500
+            )
+            cursor = cursor.decode()
+            if keys:
+                await self.command('DEL', *keys)
+            if cursor == '0':
+                return
+
+    async def close(self) -> None:
+        while self._idle:
+            self._idle.pop().close()
+
+
+def create_cache(backend: str = CACHE_BACKEND) -> CacheBackend:
+    """
+    Cria o backend de cache configurado.
+
+    Args:
+        backend: 'memory', 'sqlite' ou 'redis'
+
+    Returns:
+        Instância do backend
+
+    Raises:
+        ValueError: Se o backend não for suportado
+    """
+    if backend == 'memory':
+        return MemoryCache(CACHE_MAX_ENTRIES)
+    if backend == 'sqlite':
+        return SQLiteCache(CACHE_PATH)
+    if backend == 'redis':
+        return RedisCache(CACHE_URL, pool_size=CACHE_POOL_SIZE)
+    raise ValueError(f'Backend de cache não suportado: {backend}')
+
+
+_cache: Optional[CacheBackend] = None
+
+
+def get_cache() -> CacheBackend:
+    """Obtém o backend de cache do processo, criando-o no primeiro uso."""
+    global _cache  # noqa: PLW0603
+    if _cache is None:
+        _cache = create_cache()
+        logger.info(f'Cache inicializado com backend {_cache.name}')
+    return _cache
+
+
+async def cache_get(key: str) -> Optional[Any]:
+    """
+    Lê uma chave do cache sem propagar falhas do backend.
+
+    Uma falha no cache nunca deve derrubar a requisição: o erro é
+    registrado e a leitura é tratada como ausência.
+    """
+    namespace = key.split(':', 1)[0]
+    try:
+        value = await get_cache().get(key)
+    except Exception as e:
+        logger.warning(f'Falha ao ler do cache: {e}')
+        CACHE_REQUESTS.inc(namespace=namespace, result='error')
+        return None
+    result = 'miss' if value is None else 'hit'
+    CACHE_REQUESTS.inc(namespace=namespace, result=result)
+    return value
+
+
+async def cache_set(key: str, value: Any, ttl: Optional[float] = None):
+    """Grava no cache sem propagar falhas do backend."""
+    try:
+        await get_cache().set(key, value, ttl)
+    except Exception as e:
+        logger.warning(f'Falha ao gravar no cache: {e}')
+
+
+async def cache_add(key: str, value: Any, ttl: Optional[float] = None) -> bool:
+    """
+    Grava a chave apenas se ela não existir (ver CacheBackend.add).
+
+    Ao contrário das demais funções, propaga falhas do backend: quem usa
+    a chave como trava precisa saber que não conseguiu obtê-la.
+    """
+    return await get_cache().add(key, value, ttl)
+
+
+async def cache_incr(key: str) -> Optional[int]:
+    """
+    Incrementa um contador sem propagar falhas do backend.
+
+    Returns:
+        Novo valor ou None se o backend falhou
+    """
+    try:
+        return await get_cache().incr(key)
+    except Exception as e:
+        logger.warning(f'Falha ao incrementar {key} no cache: {e}')
+        return None
+
+
+async def cache_delete(key: str) -> None:
+    """Remove uma chave sem propagar falhas do backend."""
+    try:
+        await get_cache().delete(key)
+    except Exception as e:
+        logger.warning(f'Falha ao invalidar o cache: {e}')
+
+
+async def cache_delete_prefix(prefix: str) -> None:
+    """Invalida chaves por prefixo sem propagar falhas do backend."""
+    try:
+        await get_cache().delete_prefix(prefix)
+    except Exception as e:
+        logger.warning(f'Falha ao invalidar o cache: {e}')
+
+
+async def close_cache() -> None:
+    """Fecha o backend de cache do processo, se tiver sido criado."""
+    global _cache  # noqa: PLW0603
+    if _cache is not None:
+        await _cache.close()
+        _cache = None
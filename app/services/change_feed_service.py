@@ -0,0 +1,170 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from app.config.settings import (
+    CHANGE_FEED_LAG,
+    ODOO_DB,
+    ODOO_PASSWORD,
+    ODOO_URL,
+    ODOO_USERNAME,
+)
+from app.services.async_odoo_client import AsyncOdooClient, encode_cursor
+from app.services.company_service import PARTNER_DEFAULT_FIELDS
+from app.services.export_service import EXPORT_MODELS
+from app.services.helpdesk_service import HELPDESK_DEFAULT_FIELDS
+from app.services.tasks_project_service import TASK_DEFAULT_FIELDS
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+# Modelos com feed de alterações e seus campos padrão
+CHANGE_FEED_MODELS: Dict[str, List[str]] = {
+    'crm.lead': [*EXPORT_MODELS['crm.lead'], 'active'],
+    'helpdesk.ticket': [*HELPDESK_DEFAULT_FIELDS, 'active', 'write_date'],
+    'project.task': [*TASK_DEFAULT_FIELDS, 'active', 'write_date'],
+    'res.partner': [*PARTNER_DEFAULT_FIELDS, 'active', 'write_date'],
+}
+
+# Registros arquivados também são alterações que o consumidor deve ver
+CHANGE_FEED_CONTEXT = {'active_test': False}
+
+# Quantidade de ids verificados por chamada na reconciliação
+RECONCILE_CHUNK_SIZE = 1000
+RECONCILE_CONCURRENCY = 4
+
+
+async def get_odoo_client() -> AsyncOdooClient:
+    """
+    Obtém uma instância do cliente Odoo assíncrono.
+    Reutiliza conexões existentes quando possível.
+    """
+    return await AsyncOdooClient.get_instance(
+        ODOO_URL, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD
+    )
+
+
+def _check_model(model: str) -> None:
+    """Valida se o modelo possui feed de alterações."""
+    if model not in CHANGE_FEED_MODELS:
+        raise ValueError(
+            f'Modelo {model} não possui feed de alterações. '
+            f'Modelos disponíveis: {", ".join(CHANGE_FEED_MODELS)}'
+        )
+
+
+async def get_changes(
+    model: str,
+    watermark: Optional[str] = None,
+    limit: int = 200,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Retorna os registros alterados após uma marca d'água.
+
+    A marca d'água é o par (write_date, id) do último registro entregue,
+    de modo que registros com o mesmo write_date nunca são pulados nem
+    repetidos entre chamadas.
+
+    O Odoo grava em write_date o início da transação, não o commit: uma
+    transação longa pode tornar visível, depois de uma marca d'água já
+    entregue, um registro com write_date anterior a ela. Por isso só são
+    servidos registros com write_date de pelo menos CHANGE_FEED_LAG
+    segundos atrás, prazo em que toda transação já terminou.
+
+    Args:
+        model: Nome do modelo
+        watermark: Marca d'água retornada pela chamada anterior (None
+            para começar do início)
+        limit: Quantidade máxima de registros retornados
+        fields: Campos a retornar (usa os campos padrão do modelo se None)
+
+    Returns:
+        Dicionário com as alterações, a próxima marca d'água e se ainda há
+        alterações pendentes
+
+    Raises:
+        ValueError: Se o modelo não possuir feed de alterações ou a marca
+            d'água for inválida
+        Exception: Qualquer erro do Odoo durante a leitura
+    """
+    _check_model(model)
+    client = await get_odoo_client()
+
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=CHANGE_FEED_LAG)
+    records, next_cursor = await client.search_read_page(
+        model,
+        [['write_date', '<=', cutoff.strftime('%Y-%m-%d %H:%M:%S')]],
+        fields=fields or CHANGE_FEED_MODELS[model],
+        limit=limit,
+        cursor=watermark,
+        order_by='write_date',
+        raise_on_error=True,
+        context=CHANGE_FEED_CONTEXT,
+    )
+
+    # Sem alterações, o consumidor mantém a marca d'água atual
+    next_watermark = watermark
+    if records:
+        next_watermark = next_cursor or encode_cursor(
+            records[-1], 'write_date'
+        )
+
+    return {
+        'model': model,
+        'changes': records,
+        'next_watermark': next_watermark,
+        'has_more': next_cursor is not None,
+    }
+
+
+async def find_deleted_ids(model: str, ids: List[int]) -> List[int]:
+    """
+    Identifica quais ids conhecidos pelo consumidor não existem mais.
+
+    Exclusões não alteram write_date, então não aparecem no feed. O
+    consumidor envia periodicamente os ids que possui e recebe de volta
+    os que foram excluídos no Odoo. Registros arquivados não são
+    considerados excluídos.
+
+    Args:
+        model: Nome do modelo
+        ids: Ids mantidos pelo consumidor
+
+    Returns:
+        Lista ordenada dos ids excluídos
+
+    Raises:
+        ValueError: Se o modelo não possuir feed de alterações
+        Exception: Qualquer erro do Odoo durante a verificação
+    """
+    _check_model(model)
+    client = await get_odoo_client()
+
+    unique_ids = sorted(set(ids))
+    chunks = [
+        unique_ids[i : i + RECONCILE_CHUNK_SIZE]
+        for i in range(0, len(unique_ids), RECONCILE_CHUNK_SIZE)
+    ]
+    semaphore = asyncio.Semaphore(RECONCILE_CONCURRENCY)
+
+    async def existing(chunk: List[int]) -> List[int]:
+        async with semaphore:
+            return await client.execute_kw(
+                model,
+                'search',
+                [[['id', 'in', chunk]]],
+                {'context': CHANGE_FEED_CONTEXT},
+            )
+
+    found = set()
+    for result in await asyncio.gather(*(existing(c) for c in chunks)):
+        found.update(result)
+
+    deleted = [record_id for record_id in unique_ids if record_id not in found]
+    logger.info(
+        f'Reconciliação de {model}: {len(unique_ids)} ids verificados, '
+        f'{len(deleted)} excluídos'
+    )
+    return deleted
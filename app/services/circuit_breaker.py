@@ -0,0 +1,169 @@
+import logging
+import math
+import time
+from typing import Any, Dict, Optional
+
+from app.config.settings import (
+    ODOO_BREAKER_FAILURES,
+    ODOO_BREAKER_RESET_TIMEOUT,
+)
+from app.services.admission import UpstreamOverloadedError, mark_shed
+from app.services.metrics import Counter, Gauge
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+CIRCUIT_OPEN_DETAIL = 'Odoo indisponível, tente novamente em instantes'
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+STATES = (CLOSED, OPEN, HALF_OPEN)
+
+
+class CircuitOpenError(UpstreamOverloadedError):
+    """
+    O Odoo está fora do ar e a chamada foi recusada sem ser enviada.
+
+    Herda de UpstreamOverloadedError para ter o mesmo tratamento: os
+    serviços não a engolem e a API responde 503 com Retry-After.
+    """
+
+
+class CircuitBreaker:
+    """
+    Disjuntor das chamadas a um servidor Odoo.
+
+    Fechado, as chamadas passam normalmente. Depois de `failure_threshold`
+    falhas de transporte seguidas (conexão, tempo esgotado ou 502/503/504)
+    ele abre e recusa todas as chamadas na hora com CircuitOpenError, sem
+    ocupar threads do executor esperando um servidor que não responde.
+    Passados `reset_timeout` segundos ele fica meio aberto e deixa passar
+    uma única chamada de teste: se ela funcionar o disjuntor fecha, se
+    falhar ele abre de novo.
+
+    Erros de negócio do Odoo (Fault) não contam como falha: o servidor
+    respondeu.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = ODOO_BREAKER_FAILURES,
+        reset_timeout: float = ODOO_BREAKER_RESET_TIMEOUT,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.rejected = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def _retry_after(self) -> int:
+        remaining = self.reset_timeout
+        if self._opened_at is not None:
+            remaining -= time.monotonic() - self._opened_at
+        return max(1, math.ceil(remaining))
+
+    def before_call(self) -> None:
+        """
+        Verifica se uma chamada pode ser enviada ao Odoo.
+
+        Raises:
+            CircuitOpenError: Se o disjuntor estiver aberto ou se a chamada
+                de teste do estado meio aberto já estiver em andamento
+        """
+        state = self.state
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+
+        self.rejected += 1
+        retry_after = self._retry_after()
+        mark_shed(retry_after, CIRCUIT_OPEN_DETAIL)
+        raise CircuitOpenError(CIRCUIT_OPEN_DETAIL, retry_after)
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info(f'Disjuntor de {self.name} fechado')
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._probing or (
+            self._opened_at is None and self.failures >= self.failure_threshold
+        ):
+            logger.error(
+                f'Disjuntor de {self.name} aberto após {self.failures} '
+                f'falha(s) seguidas'
+            )
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def release(self) -> None:
+        """Libera a chamada de teste que terminou sem resultado conclusivo."""
+        self._probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna o estado atual do disjuntor."""
+        state = self.state
+        return {
+            'state': state,
+            'failures': self.failures,
+            'rejected': self.rejected,
+            'retry_after': self._retry_after() if state != CLOSED else None,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(url: str) -> CircuitBreaker:
+    """Obtém o disjuntor do servidor Odoo, compartilhado entre clientes."""
+    if url not in _breakers:
+        _breakers[url] = CircuitBreaker(url)
+    return _breakers[url]
+
+
+def is_open(url: Optional[str]) -> bool:
+    """Indica se as chamadas ao servidor estão sendo recusadas."""
+    breaker = _breakers.get(url)
+    return breaker is not None and breaker.state != CLOSED
+
+
+def breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Estado dos disjuntores de todos os servidores já usados."""
+    return {url: breaker.stats() for url, breaker in _breakers.items()}
+
+
+Gauge(
+    'odoo_circuit_breaker_state',
+    'Estado do disjuntor de cada servidor (1 no estado atual).',
+    ('server', 'state'),
+    callback=lambda: [
+        ((url, state), int(breaker.state == state))
+        for url, breaker in _breakers.items()
+        for state in STATES
+    ],
+)
+Counter(
+    'odoo_circuit_breaker_rejected_total',
+    'Chamadas recusadas com o disjuntor aberto.',
+    ('server',),
+    callback=lambda: [
+        ((url,), breaker.rejected) for url, breaker in _breakers.items()
+    ],
+)
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from app.config.settings import ODOO_DB, ODOO_PASSWORD, ODOO_URL, ODOO_USERNAME
 from app.schemas.schemas import CompanyDefault, ContactUpdate
@@ -25,18 +25,25 @@ async def get_odoo_client() -> AsyncOdooClient:
 
 
 async def get_clients_info(
-    limit: int = 100, offset: int = 0, fields: Optional[List[str]] = None
-) -> List[Dict[str, Any]]:
+    limit: int = 100,
+    offset: int = 0,
+    fields: Optional[List[str]] = None,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """
     Obtém informações de vários clientes/empresas de forma assíncrona.
 
     Args:
         limit: Limite de registros a serem retornados
-        offset: Deslocamento para paginação
+        offset: Deslocamento para paginação (ignorado se houver cursor)
         fields: Campos específicos a serem retornados (usa padrão se None)
+        cursor: Cursor da próxima página retornado pela chamada anterior
 
     Returns:
-        Lista de empresas ou lista vazia em caso de erro
+        Tupla com a lista de empresas e o cursor da próxima página
+
+    Raises:
+        ValueError: Se o cursor for inválido
     """
     client = await get_odoo_client()
 
@@ -44,12 +51,19 @@ async def get_clients_info(
         fields = PARTNER_DEFAULT_FIELDS
 
     try:
-        return await client.search_read(
-            PARTNER_MODEL, [], fields=fields, limit=limit, offset=offset
+        return await client.search_read_page(
+            PARTNER_MODEL,
+            [],
+            fields=fields,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
         )
+    except ValueError:
+        raise
     except Exception as e:
         logger.error(f'Erro ao buscar e ler informações das empresas: {e}')
-        return []
+        return [], None
 
 
 async def get_company_by_vat(
@@ -85,7 +99,8 @@ async def fetch_client_by_name(
     fields: Optional[List[str]] = None,
     limit: int = 100,
     offset: int = 0,
-) -> List[Dict[str, Any]]:
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """
     Obtém empresas que correspondam ao nome de forma parcial e case-insensitive, de forma assíncrona.
 
@@ -93,10 +108,14 @@ async def fetch_client_by_name(
         name: Nome ou parte do nome da empresa
         fields: Campos específicos a serem retornados (usa padrão se None)
         limit: Limite de registros a serem retornados
-        offset: Deslocamento para paginação
+        offset: Deslocamento para paginação (ignorado se houver cursor)
+        cursor: Cursor da próxima página retornado pela chamada anterior
 
     Returns:
-        Lista de empresas correspondentes ou lista vazia se não encontrada
+        Tupla com as empresas correspondentes e o cursor da próxima página
+
+    Raises:
+        ValueError: Se o cursor for inválido
     """
     client = await get_odoo_client()
 
@@ -105,18 +124,21 @@ async def fetch_client_by_name(
 
     try:
         # Busca por correspondência parcial com "ilike"
-        return await client.search_read(
+        return await client.search_read_page(
             PARTNER_MODEL,
             [
                 ['name', 'ilike', name]
             ],  # 'ilike' para busca parcial case-insensitive
             fields=fields,
             limit=limit,
+            cursor=cursor,
             offset=offset,
         )
+    except ValueError:
+        raise
     except Exception as e:
         logger.error(f'Erro ao buscar clientes pelo nome {name}: {e}')
-        return []
+        return [], None
 
 
 async def get_company_by_id(
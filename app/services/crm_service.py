@@ -2,7 +2,7 @@
 
 import logging
 from http import HTTPStatus
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 from fastapi import HTTPException
 
@@ -16,6 +16,28 @@ from app.services.company_service import get_or_create_partner_by_vat
 
 logger = logging.getLogger(__name__) # Mantenha apenas uma atribuição para o logger
 
+# Campos padrão das listagens e do detalhe de oportunidades
+OPPORTUNITY_DEFAULT_FIELDS = [
+    'id',
+    'name',
+    'partner_id',
+    'stage_id',
+    'user_id',
+    'team_id',
+    'expected_revenue',
+    'probability',
+    'create_date',
+    'write_date',
+]
+OPPORTUNITY_DETAIL_FIELDS = [
+    *OPPORTUNITY_DEFAULT_FIELDS,
+    'contact_name',
+    'email_from',
+    'phone',
+    'date_deadline',
+    'x_studio_tese',
+]
+
 # Definição da função get_odoo_client que estava faltando neste arquivo
 async def get_odoo_client() -> AsyncOdooClient:
     """
@@ -26,8 +48,54 @@ async def get_odoo_client() -> AsyncOdooClient:
         ODOO_URL, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD
     )
 
+async def get_opportunities_page(
+    limit: int = 100,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Obtém uma página de oportunidades usando paginação por cursor.
+
+    Args:
+        limit: Limite de registros a serem retornados
+        offset: Deslocamento para paginação (ignorado se houver cursor)
+        cursor: Cursor da próxima página retornado pela chamada anterior
+        fields: Campos específicos a serem retornados (usa padrão se None)
+
+    Returns:
+        Tupla com a lista de oportunidades e o cursor da próxima página
+
+    Raises:
+        ValueError: Se o cursor for inválido
+    """
+    client = await get_odoo_client()
+
+    if fields is None:
+        fields = OPPORTUNITY_DEFAULT_FIELDS
+
+    try:
+        return await client.search_read_page(
+            'crm.lead',
+            [],
+            fields=fields,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+        )
+    except ValueError:
+        raise
+    except Exception as e:
+        logger.error(
+            f'Erro ao buscar e ler informações das oportunidades: {e}'
+        )
+        return [], None
+
+
 # --- Funções síncronas existentes ---
-def get_opportunities_info(models, db, uid, password, limit=100, offset=0):
+def get_opportunities_info(  # noqa: PLR0913
+    models, db, uid, password, *, limit=100, offset=0, fields=None
+):
     try:
         opportunities_info = models.execute_kw(
             db,
@@ -36,7 +104,11 @@ def get_opportunities_info(models, db, uid, password, limit=100, offset=0):
             'crm.lead',
             'search_read',
             [[]],
-            {'limit': limit, 'offset': offset},
+            {
+                'fields': fields or OPPORTUNITY_DEFAULT_FIELDS,
+                'limit': limit,
+                'offset': offset,
+            },
         )
         return opportunities_info
     except Exception as e:
@@ -45,10 +117,18 @@ def get_opportunities_info(models, db, uid, password, limit=100, offset=0):
         return []
 
 
-def fetch_opportunity_by_id(models, db, uid, password, opportunity_id):
+def fetch_opportunity_by_id(  # noqa: PLR0913
+    models, db, uid, password, opportunity_id, *, fields=None
+):
     try:
         opportunities_info = models.execute_kw(
-            db, uid, password, 'crm.lead', 'read', [opportunity_id]
+            db,
+            uid,
+            password,
+            'crm.lead',
+            'read',
+            [opportunity_id],
+            {'fields': fields or OPPORTUNITY_DETAIL_FIELDS},
         )
         return opportunities_info
     except Exception as e:
@@ -1,11 +1,47 @@
+import ast
 from http import HTTPStatus
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from fastapi import HTTPException
 
 from app.schemas.schemas import SelectionFieldValue
 
 
+def merge_selection_values(
+    current_selection: str, values: List[SelectionFieldValue]
+) -> Tuple[Dict[str, str], bool]:
+    """
+    Mescla novos valores à seleção atual de um campo.
+
+    Args:
+        current_selection: Seleção como gravada em ir.model.fields
+            (repr de uma lista de pares (valor, rótulo))
+        values: Valores a adicionar; rótulos de valores existentes são
+            atualizados
+
+    Returns:
+        Seleção mesclada (valor -> rótulo, na ordem original) e se algum
+        valor novo foi adicionado
+    """
+    # Converte a string de seleção atual para obter os valores existentes
+    try:
+        selection = ast.literal_eval(current_selection)
+    except (SyntaxError, ValueError):
+        selection = []
+
+    # Converte a seleção atual para um dicionário para facilitar a manipulação
+    merged = {val: name for val, name in selection}
+
+    # Adiciona novos valores aos existentes (atualizando rótulos se o valor
+    # já existir)
+    new_values_added = False
+    for new_value in values:
+        if new_value.value not in merged:
+            new_values_added = True
+        merged[new_value.value] = new_value.name
+    return merged, new_values_added
+
+
 def update_selection_field_values(
     models,
     db: str,
@@ -62,25 +98,9 @@ def update_selection_field_values(
                 detail=f"Campo '{field_name}' não é um campo de seleção. Tipo atual: {field_type}",
             )
 
-        current_selection_str = field_ids[0].get('selection', '[]')
-
-        # Converte a string de seleção atual para obter os valores existentes
-        try:
-            import ast
-
-            current_selection = ast.literal_eval(current_selection_str)
-        except (SyntaxError, ValueError):
-            current_selection = []
-
-        # Converte a seleção atual para um dicionário para facilitar a manipulação
-        current_selection_dict = {val: name for val, name in current_selection}
-
-        # Adiciona novos valores aos existentes (atualizando rótulos se o valor já existir)
-        new_values_added = False
-        for new_value in values:
-            if new_value.value not in current_selection_dict:
-                new_values_added = True
-            current_selection_dict[new_value.value] = new_value.name
+        current_selection_dict, new_values_added = merge_selection_values(
+            field_ids[0].get('selection', '[]'), values
+        )
 
         # Se nenhum valor novo foi adicionado, retorna os valores atuais
         if not new_values_added:
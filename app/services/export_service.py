@@ -0,0 +1,308 @@
+import asyncio
+import csv
+import io
+import json
+import logging
+import zlib
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.config.settings import ODOO_DB, ODOO_PASSWORD, ODOO_URL, ODOO_USERNAME
+from app.services.async_odoo_client import AsyncOdooClient
+from app.services.company_service import PARTNER_DEFAULT_FIELDS
+from app.services.helpdesk_service import HELPDESK_DEFAULT_FIELDS
+from app.services.rpc_recorder import expect_repeated_calls
+from app.services.schema_registry import schema_registry
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+# Modelos exportáveis e seus campos padrão
+EXPORT_MODELS: Dict[str, List[str]] = {
+    'crm.lead': [
+        'id',
+        'name',
+        'partner_id',
+        'stage_id',
+        'user_id',
+        'team_id',
+        'expected_revenue',
+        'write_date',
+    ],
+    'res.partner': [*PARTNER_DEFAULT_FIELDS, 'write_date'],
+    'sale.order': [
+        'id',
+        'name',
+        'partner_id',
+        'user_id',
+        'state',
+        'amount_total',
+        'date_order',
+        'write_date',
+    ],
+    'helpdesk.ticket': [*HELPDESK_DEFAULT_FIELDS, 'write_date'],
+}
+
+EXPORT_FORMATS = {
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+}
+
+
+async def get_odoo_client() -> AsyncOdooClient:
+    """
+    Obtém uma instância do cliente Odoo assíncrono.
+    Reutiliza conexões existentes quando possível.
+    """
+    return await AsyncOdooClient.get_instance(
+        ODOO_URL, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD
+    )
+
+
+def resolve_export_fields(
+    model: str, fields: Optional[List[str]] = None
+) -> List[str]:
+    """
+    Define os campos exportados de um modelo.
+
+    Args:
+        model: Nome do modelo a exportar
+        fields: Campos solicitados (usa os campos padrão do modelo se None)
+
+    Returns:
+        Lista de campos, sempre começando por 'id'
+
+    Raises:
+        ValueError: Se o modelo não for exportável
+    """
+    if model not in EXPORT_MODELS:
+        raise ValueError(
+            f'Modelo {model} não é exportável. '
+            f'Modelos disponíveis: {", ".join(EXPORT_MODELS)}'
+        )
+
+    fields = list(dict.fromkeys(fields or EXPORT_MODELS[model]))
+    if 'id' in fields:
+        fields.remove('id')
+    return ['id', *fields]
+
+
+async def check_export_fields(model: str, fields: List[str]) -> None:
+    """
+    Confere os campos pedidos contra o fields_get em cache.
+
+    Um nome inválido só seria rejeitado pelo Odoo na primeira leitura,
+    como erro interno; aqui ele vira erro de validação antes disso.
+
+    Args:
+        model: Nome do modelo a exportar
+        fields: Campos a exportar
+
+    Raises:
+        ValueError: Se algum campo não existir no modelo (lista todos)
+    """
+    try:
+        schema = await schema_registry.get_fields(model)
+    except Exception as e:
+        # Sem schema não há como validar; o Odoo rejeita nomes inválidos
+        logger.warning(f'Schema de {model} indisponível para exportação: {e}')
+        return
+
+    unknown = [name for name in fields if name != 'id' and name not in schema]
+    if unknown:
+        raise ValueError(
+            f'Campos inexistentes no modelo {model}: {", ".join(unknown)}'
+        )
+
+
+async def iter_model_pages(
+    model: str,
+    fields: List[str],
+    page_size: int = 500,
+    prefetch: int = 1,
+    domain: Optional[List] = None,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Percorre todas as páginas de um modelo usando paginação por cursor.
+
+    Até `prefetch` páginas são buscadas antecipadamente enquanto a página
+    atual é consumida, de modo que a memória fica limitada a
+    (prefetch + 1) * page_size registros, independentemente do tamanho
+    da tabela.
+
+    Args:
+        model: Nome do modelo
+        fields: Campos a serem lidos
+        page_size: Quantidade de registros por chamada ao Odoo
+        prefetch: Número de páginas buscadas antecipadamente (0 desativa)
+        domain: Filtro de domínio opcional
+
+    Yields:
+        Listas de registros, uma por página
+
+    Raises:
+        Exception: Qualquer erro do Odoo durante a leitura
+    """
+    client = await get_odoo_client()
+    domain = domain or []
+    # Uma chamada por página é esperada, não é N+1
+    expect_repeated_calls(model)
+
+    async def fetch(cursor: Optional[str]):
+        return await client.search_read_page(
+            model,
+            domain,
+            fields=fields,
+            limit=page_size,
+            cursor=cursor,
+            raise_on_error=True,
+        )
+
+    if prefetch <= 0:
+        records, cursor = await fetch(None)
+        while records:
+            yield records
+            if not cursor:
+                return
+            records, cursor = await fetch(cursor)
+        return
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+
+    async def pump():
+        cursor = None
+        while True:
+            records, cursor = await fetch(cursor)
+            if records:
+                await queue.put(records)
+            if not cursor:
+                return
+
+    async def producer():
+        try:
+            await pump()
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(None)
+
+    task = asyncio.create_task(producer())
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        task.cancel()
+
+
+def _csv_value(value: Any) -> Any:
+    """Converte um valor do Odoo para uma célula de CSV."""
+    if value is False or value is None:
+        return ''
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def serialize_page(
+    records: List[Dict[str, Any]],
+    export_format: str,
+    fields: List[str],
+    include_header: bool = False,
+) -> bytes:
+    """
+    Serializa uma página de registros no formato de exportação.
+
+    Args:
+        records: Registros da página
+        export_format: 'ndjson' ou 'csv'
+        fields: Ordem das colunas (usada no CSV)
+        include_header: Se o cabeçalho do CSV deve ser incluído
+
+    Returns:
+        Bytes codificados em UTF-8
+    """
+    if export_format == 'ndjson':
+        return ''.join(
+            json.dumps(record, ensure_ascii=False, default=str) + '\n'
+            for record in records
+        ).encode()
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if include_header:
+        writer.writerow(fields)
+    for record in records:
+        writer.writerow([_csv_value(record.get(field)) for field in fields])
+    return buffer.getvalue().encode()
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Comprime com gzip um fluxo de blocos de bytes.
+
+    Args:
+        chunks: Iterador assíncrono de blocos de bytes
+
+    Yields:
+        Blocos comprimidos, finalizando com o rodapé do gzip
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+async def _encode_pages(
+    pages: AsyncIterator[List[Dict[str, Any]]],
+    export_format: str,
+    fields: List[str],
+) -> AsyncIterator[bytes]:
+    """Serializa as páginas sem compressão."""
+    include_header = export_format == 'csv'
+    total = 0
+
+    try:
+        async for records in pages:
+            chunk = serialize_page(
+                records, export_format, fields, include_header
+            )
+            include_header, total = False, total + len(records)
+            if chunk:
+                yield chunk
+    except Exception as e:
+        logger.error(f'Exportação interrompida após {total} registros: {e}')
+        raise
+
+    # CSV vazio ainda recebe o cabeçalho
+    if include_header:
+        yield serialize_page([], export_format, fields, True)
+
+    logger.info(f'Exportação concluída: {total} registros')
+
+
+def encode_export_stream(
+    pages: AsyncIterator[List[Dict[str, Any]]],
+    export_format: str,
+    fields: List[str],
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    Converte páginas de registros em blocos de bytes para streaming.
+
+    Args:
+        pages: Iterador assíncrono de páginas
+        export_format: 'ndjson' ou 'csv'
+        fields: Campos exportados
+        compress: Se a saída deve ser comprimida com gzip
+
+    Returns:
+        Iterador assíncrono de blocos de bytes prontos para envio
+    """
+    chunks = _encode_pages(pages, export_format, fields)
+    return gzip_stream(chunks) if compress else chunks
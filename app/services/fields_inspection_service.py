@@ -3,12 +3,67 @@ from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException
 
+from app.services.schema_registry import schema_registry
 
-def get_model_fields(
-    models,
-    db: str,
-    uid: int,
-    password: str,
+# Default attributes that are most useful for inspection
+DEFAULT_FIELD_ATTRIBUTES = ['string', 'help', 'type']
+
+
+def filter_fields(
+    fields_info: Dict[str, Dict[str, Any]],
+    attributes: Optional[List[str]] = None,
+    field_names: Optional[List[str]] = None,
+    field_type: Optional[str] = None,
+    search_term: Optional[str] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Filter a cached fields_get result in memory.
+
+    Args:
+        fields_info: Full fields_get result of a model
+        attributes: Field attributes to keep (default: ['string', 'help', 'type'])
+        field_names: Optional list of specific field names to return
+        field_type: Optional filter to return only fields of a specific type
+        search_term: Optional search term to filter fields by name or label
+
+    Returns:
+        A dictionary containing the filtered fields and attributes
+    """
+    if attributes is None:
+        attributes = DEFAULT_FIELD_ATTRIBUTES
+
+    search_term_lower = search_term.lower() if search_term else None
+    filtered_fields = {}
+
+    for field_name, field_data in fields_info.items():
+        # Filter by specific field names if provided
+        if field_names and field_name not in field_names:
+            continue
+
+        # Filter by field type if provided
+        if field_type and field_data.get('type') != field_type:
+            continue
+
+        # Filter by search term (in field name or label)
+        if search_term_lower:
+            field_label = (field_data.get('string') or '').lower()
+            if (
+                search_term_lower not in field_name.lower()
+                and search_term_lower not in field_label
+            ):
+                continue
+
+        # If it passes all filters, keep only the requested attributes
+        filtered_fields[field_name] = {
+            attribute: field_data[attribute]
+            for attribute in attributes
+            if attribute in field_data
+        }
+
+    return filtered_fields
+
+
+async def get_model_fields(
     model_name: str,
     attributes: Optional[List[str]] = None,
     field_names: Optional[List[str]] = None,
@@ -18,11 +73,10 @@ def get_model_fields(
     """
     Get fields information for a specific Odoo model with filtering options.
 
+    fields_get is served from the schema registry, so only the first call
+    (or the first after an invalidation) reaches Odoo.
+
     Args:
-        models: The XML-RPC model proxy object
-        db: The Odoo database name
-        uid: The authenticated user ID
-        password: The user password
         model_name: The name of the model to inspect
         attributes: Optional list of field attributes to return (default: ['string', 'help', 'type'])
         field_names: Optional list of specific field names to return
@@ -33,102 +87,54 @@ def get_model_fields(
         A dictionary containing filtered field information for the specified model
     """
     try:
-        # Default attributes that are most useful for inspection
-        if attributes is None:
-            attributes = ['string', 'help', 'type']
-
-        # Get all fields first
-        fields_info = models.execute_kw(
-            db,
-            uid,
-            password,
-            model_name,
-            'fields_get',
-            [],
-            {'attributes': attributes},
-        )
-
-        # Apply filters
-        filtered_fields = {}
-
-        for field_name, field_data in fields_info.items():
-            # Filter by specific field names if provided
-            if field_names and field_name not in field_names:
-                continue
-
-            # Filter by field type if provided
-            if field_type and field_data.get('type') != field_type:
-                continue
-
-            # Filter by search term (in field name or label)
-            if search_term:
-                search_term_lower = search_term.lower()
-                field_label = field_data.get('string', '').lower()
-                if (
-                    search_term_lower not in field_name.lower()
-                    and search_term_lower not in field_label
-                ):
-                    continue
-
-            # If it passes all filters, add it to the result
-            filtered_fields[field_name] = field_data
-
-        return filtered_fields
-
+        fields_info = await schema_registry.get_fields(model_name)
     except Exception as e:
         # Check if exception is due to model not existing
-        if 'Object does not exist' in str(e):
+        if 'Object does not exist' in str(e) or "doesn't exist" in str(e):
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND,
                 detail=f"Model '{model_name}' does not exist in Odoo.",
             )
-        else:
-            raise HTTPException(
-                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
-                detail=f"Error fetching fields for model '{model_name}': {str(e)}",
-            )
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching fields for model '{model_name}': {str(e)}",
+        )
+
+    return filter_fields(
+        fields_info, attributes, field_names, field_type, search_term
+    )
 
 
-def get_available_models(
-    models, db: str, uid: int, password: str, search_term: Optional[str] = None
+async def get_available_models(
+    search_term: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """
     Get a list of available models in Odoo, with optional filtering by name.
 
+    The full ir.model listing is cached by the schema registry and the
+    search term is matched locally (case-insensitive, like 'ilike').
+
     Args:
-        models: The XML-RPC model proxy object
-        db: The Odoo database name
-        uid: The authenticated user ID
-        password: The user password
         search_term: Optional search term to filter models
 
     Returns:
         A list of dictionaries with model information
     """
     try:
-        # Find all models by searching for ir.model records
-        domain = []
-        if search_term:
-            domain = [
-                '|',
-                ('model', 'ilike', search_term),
-                ('name', 'ilike', search_term),
-            ]
-
-        model_records = models.execute_kw(
-            db,
-            uid,
-            password,
-            'ir.model',
-            'search_read',
-            [domain],
-            {'fields': ['model', 'name', 'info', 'state']},
-        )
-
-        return model_records
-
+        model_records = await schema_registry.get_models()
     except Exception as e:
         raise HTTPException(
             status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
             detail=f'Error fetching available models: {str(e)}',
         )
+
+    if not search_term:
+        return model_records
+
+    search_term_lower = search_term.lower()
+    return [
+        record
+        for record in model_records
+        if search_term_lower in (record.get('model') or '').lower()
+        or search_term_lower in (record.get('name') or '').lower()
+    ]
@@ -1,6 +1,8 @@
 import time
 from datetime import datetime
 
+from app.services.circuit_breaker import CLOSED, breaker_states
+
 
 class HealthCheck:
     def __init__(self):
@@ -9,11 +11,16 @@ class HealthCheck:
         self.start_time = time.time()
 
     def get_health_check(self) -> dict:
+        breakers = breaker_states()
+        degraded = any(
+            breaker['state'] != CLOSED for breaker in breakers.values()
+        )
         return {
-            'status': 'healthy',
+            'status': 'degraded' if degraded else 'healthy',
             'version': self.version,
             'timestamp': datetime.now(),
             'uptime': time.time() - self.start_time,
+            'odoo': breakers,
         }
 
     def get_ping_status(self) -> dict:
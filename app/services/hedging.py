@@ -0,0 +1,94 @@
+import math
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Optional
+
+from app.config.settings import (
+    ODOO_HEDGE_BUDGET,
+    ODOO_HEDGE_MIN_SAMPLES,
+    ODOO_HEDGING,
+)
+
+# Percentil da latência observada a partir do qual a cópia é enviada
+HEDGE_PERCENTILE = 0.95
+# Latências guardadas por 'modelo.método'
+LATENCY_WINDOW = 200
+# Cópias acumuláveis quando o tráfego está baixo
+MAX_BUDGET_TOKENS = 10.0
+
+
+class Hedger:
+    """
+    Decide quando enviar uma cópia (hedge) de uma leitura lenta.
+
+    Guarda as latências recentes de cada 'modelo.método' e, depois de
+    `min_samples` amostras, indica o p95 como espera antes da cópia. O
+    orçamento é um balde de fichas: cada leitura acrescenta `budget`
+    fichas e cada cópia gasta uma, então no longo prazo as cópias não
+    passam de `budget` (ex: 5%) das leituras, mesmo que o Odoo inteiro
+    fique lento.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = ODOO_HEDGING,
+        budget: float = ODOO_HEDGE_BUDGET,
+        min_samples: int = ODOO_HEDGE_MIN_SAMPLES,
+    ):
+        self.enabled = enabled
+        self.budget = budget
+        self.min_samples = min_samples
+        self.tokens = MAX_BUDGET_TOKENS
+        self.latencies: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=LATENCY_WINDOW)
+        )
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.denied = 0
+
+    def observe(self, call: str, latency: float) -> None:
+        """Registra a latência de uma tentativa concluída."""
+        self.latencies[call].append(latency)
+
+    def delay(self, call: str) -> Optional[float]:
+        """
+        Espera antes de enviar a cópia de uma leitura.
+
+        Também credita o orçamento da leitura que está começando.
+
+        Returns:
+            p95 das latências da chamada, ou None se o hedging estiver
+            desligado ou ainda não houver amostras suficientes
+        """
+        if not self.enabled:
+            return None
+        self.tokens = min(MAX_BUDGET_TOKENS, self.tokens + self.budget)
+        samples = self.latencies.get(call)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = math.ceil(HEDGE_PERCENTILE * len(ordered)) - 1
+        return ordered[index]
+
+    def try_spend(self) -> bool:
+        """Reserva uma ficha para enviar uma cópia."""
+        if self.tokens < 1:
+            self.denied += 1
+            return False
+        self.tokens -= 1
+        self.hedged += 1
+        return True
+
+    def record_winner(self, hedge_won: bool) -> None:
+        if hedge_won:
+            self.hedge_wins += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna os contadores de hedging."""
+        return {
+            'enabled': self.enabled,
+            'hedged': self.hedged,
+            'hedge_wins': self.hedge_wins,
+            'win_rate': self.hedge_wins / self.hedged if self.hedged else None,
+            'denied': self.denied,
+            'budget_tokens': self.tokens,
+        }
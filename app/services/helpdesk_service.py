@@ -1,7 +1,14 @@
 import logging
-from typing import Any, Dict, List, Optional
-
-from app.config.settings import ODOO_DB, ODOO_PASSWORD, ODOO_URL, ODOO_USERNAME
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config.settings import (
+    ODOO_DB,
+    ODOO_PASSWORD,
+    ODOO_URL,
+    ODOO_USERNAME,
+    READ_CACHE_TTL,
+    READ_STALE_TTL,
+)
 from app.services.async_odoo_client import AsyncOdooClient
 from app.services.company_service import (
     get_company_by_vat,
@@ -36,18 +43,25 @@ async def get_odoo_client() -> AsyncOdooClient:
 
 
 async def get_helpdesk_info(
-    limit: int = 100, offset: int = 0, fields: Optional[List[str]] = None
-) -> List[Dict[str, Any]]:
+    limit: int = 100,
+    offset: int = 0,
+    fields: Optional[List[str]] = None,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """
     Obtém informações de chamados de helpdesk de forma assíncrona.
 
     Args:
         limit: Limite de registros a serem retornados
-        offset: Deslocamento para paginação
+        offset: Deslocamento para paginação (ignorado se houver cursor)
         fields: Campos específicos a serem retornados (usa padrão se None)
+        cursor: Cursor da próxima página retornado pela chamada anterior
 
     Returns:
-        Lista de chamados ou lista vazia em caso de erro
+        Tupla com a lista de chamados e o cursor da próxima página
+
+    Raises:
+        ValueError: Se o cursor for inválido
     """
     client = await get_odoo_client()
 
@@ -55,16 +69,19 @@ async def get_helpdesk_info(
         fields = HELPDESK_DEFAULT_FIELDS
 
     try:
-        return await client.search_read(
+        return await client.search_read_page(
             HELPDESK_TICKET_MODEL,
             [],
             fields=fields,
             limit=limit,
+            cursor=cursor,
             offset=offset,
         )
+    except ValueError:
+        raise
     except Exception as e:
         logger.error(f'Erro ao buscar e ler informações dos tickets: {e}')
-        return []
+        return [], None
 
 
 async def get_helpdesk_info_by_team_id(
@@ -72,18 +89,23 @@ async def get_helpdesk_info_by_team_id(
     limit: int = 100,
     offset: int = 0,
     fields: Optional[List[str]] = None,
-) -> List[Dict[str, Any]]:
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """
     Obtém chamados de helpdesk filtrados por time de forma assíncrona.
 
     Args:
         team_id: ID do time
         limit: Limite de registros a serem retornados
-        offset: Deslocamento para paginação
+        offset: Deslocamento para paginação (ignorado se houver cursor)
         fields: Campos específicos a serem retornados (usa padrão se None)
+        cursor: Cursor da próxima página retornado pela chamada anterior
 
     Returns:
-        Lista de chamados do time ou lista vazia em caso de erro
+        Tupla com a lista de chamados do time e o cursor da próxima página
+
+    Raises:
+        ValueError: Se o cursor for inválido
     """
     client = await get_odoo_client()
 
@@ -91,16 +113,21 @@ async def get_helpdesk_info_by_team_id(
         fields = HELPDESK_DEFAULT_FIELDS
 
     try:
-        return await client.search_read(
+        return await client.search_read_page(
             HELPDESK_TICKET_MODEL,
             [['team_id', '=', team_id]],
             fields=fields,
             limit=limit,
+            cursor=cursor,
             offset=offset,
+            cache_ttl=READ_CACHE_TTL,
+            stale_ttl=READ_STALE_TTL,
         )
+    except ValueError:
+        raise
     except Exception as e:
         logger.error(f'Erro ao buscar chamados do time {team_id}: {e}')
-        return []
+        return [], None
 
 
 async def get_helpdesk_info_by_team_and_id(
@@ -135,13 +162,15 @@ async def get_helpdesk_info_by_team_and_id(
         return []
 
 
-async def get_helpdesk_info_by_team_and_stage(
+async def get_helpdesk_info_by_team_and_stage(  # noqa: PLR0913
     team_id: int,
     stage_id: int,
     limit: int = 100,
     offset: int = 0,
+    *,
     fields: Optional[List[str]] = None,
-) -> List[Dict[str, Any]]:
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """
     Obtém chamados de um time filtrados por estágio de forma assíncrona.
 
@@ -149,11 +178,16 @@ async def get_helpdesk_info_by_team_and_stage(
         team_id: ID do time
         stage_id: ID do estágio
         limit: Limite de registros a serem retornados
-        offset: Deslocamento para paginação
+        offset: Deslocamento para paginação (ignorado se houver cursor)
         fields: Campos específicos a serem retornados (usa padrão se None)
+        cursor: Cursor da próxima página retornado pela chamada anterior
 
     Returns:
-        Lista de chamados do time no estágio especificado ou lista vazia em caso de erro
+        Tupla com a lista de chamados do time no estágio especificado e o
+        cursor da próxima página
+
+    Raises:
+        ValueError: Se o cursor for inválido
     """
     client = await get_odoo_client()
 
@@ -161,18 +195,23 @@ async def get_helpdesk_info_by_team_and_stage(
         fields = HELPDESK_DEFAULT_FIELDS
 
     try:
-        return await client.search_read(
+        return await client.search_read_page(
             HELPDESK_TICKET_MODEL,
             [['team_id', '=', team_id], ['stage_id', '=', stage_id]],
             fields=fields,
             limit=limit,
+            cursor=cursor,
             offset=offset,
+            cache_ttl=READ_CACHE_TTL,
+            stale_ttl=READ_STALE_TTL,
         )
+    except ValueError:
+        raise
     except Exception as e:
         logger.error(
             f'Erro ao buscar chamados do time {team_id} no estágio {stage_id}: {e}'
         )
-        return []
+        return [], None
 
 
 async def update_ticket_team_and_stage(
@@ -322,8 +361,12 @@ async def update_ticket(ticket_id: int, ticket_data: Dict[str, Any]) -> bool:
 
 
 async def get_helpdesk_tickets_by_vat_and_team(
-    vat: str, team_id: int, limit: int = 100, offset: int = 0
-) -> List[Dict[str, Any]]:
+    vat: str,
+    team_id: int,
+    limit: int = 100,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """
     Obtém chamados de helpdesk de um cliente (por VAT) em uma equipe específica.
 
@@ -331,10 +374,12 @@ async def get_helpdesk_tickets_by_vat_and_team(
         vat: CNPJ/VAT do cliente.
         team_id: ID da equipe de helpdesk.
         limit: Limite de registros a serem retornados.
-        offset: Deslocamento para paginação.
+        offset: Deslocamento para paginação (ignorado se houver cursor).
+        cursor: Cursor da próxima página retornado pela chamada anterior.
 
     Returns:
-        Lista de chamados formatados ou lista vazia em caso de erro/não encontrado.
+        Tupla com a lista de chamados formatados (vazia em caso de não
+        encontrado) e o cursor da próxima página.
     """
     client = await get_odoo_client()
     cleaned_vat: str
@@ -347,14 +392,14 @@ async def get_helpdesk_tickets_by_vat_and_team(
     partners_info = await get_company_by_vat(cleaned_vat, fields=['id'])
     if not partners_info:
         logger.info(f'Nenhuma empresa encontrada para o VAT: {cleaned_vat}')
-        return []
+        return [], None
 
     partner_ids = [p['id'] for p in partners_info if 'id' in p]
     if not partner_ids:
         logger.info(
             f'Nenhum ID de parceiro extraído para o VAT: {cleaned_vat}'
         )
-        return []
+        return [], None
 
     fields_to_fetch = [
         'id',
@@ -371,13 +416,15 @@ async def get_helpdesk_tickets_by_vat_and_team(
     ]
 
     try:
-        tickets_data = await client.search_read(
+        # IDs decrescentes equivalem a ordenar pela data de criação
+        tickets_data, next_cursor = await client.search_read_page(
             HELPDESK_TICKET_MODEL,
             domain,
             fields=fields_to_fetch,
             limit=limit,
+            cursor=cursor,
             offset=offset,
-            order='create_date desc',  # Optional: order by creation date
+            descending=True,
         )
 
         formatted_tickets = []
@@ -415,7 +462,9 @@ async def get_helpdesk_tickets_by_vat_and_team(
                 'date_last_stage_update': ticket.get('date_last_stage_update'),
             }
             formatted_tickets.append(formatted_ticket)
-        return formatted_tickets
+        return formatted_tickets, next_cursor
+    except ValueError:
+        raise
     except Exception as e:
         logger.error(
             f'Erro ao buscar chamados de helpdesk por VAT ({vat}) e equipe ({team_id}): {e}'
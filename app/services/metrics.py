@@ -0,0 +1,238 @@
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Limites dos histogramas de latência (segundos)
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+)
+# Limites dos histogramas de tamanho de payload (bytes)
+BYTES_BUCKETS = (
+    256,
+    1024,
+    4096,
+    16384,
+    65536,
+    262144,
+    1048576,
+    4194304,
+    16777216,
+)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+Labels = Tuple[str, ...]
+Samples = Iterable[Tuple[Labels, float]]
+
+_registry: List['Metric'] = []
+
+
+def _escape(value: str) -> str:
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\n', '\\n')
+        .replace('"', '\\"')
+    )
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class Metric:
+    """
+    Base das métricas no formato de texto do Prometheus.
+
+    Os valores ficam em memória no processo e são protegidos por lock,
+    pois também são atualizados pelas threads do executor do Odoo. Com
+    vários workers do uvicorn cada processo expõe as próprias séries.
+
+    Uma métrica criada com `callback` não guarda valores: a função é
+    chamada a cada coleta e devolve pares (valores dos rótulos, valor).
+    """
+
+    type = 'untyped'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        callback: Optional[Callable[[], Samples]] = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._values: Dict[Labels, float] = {}
+        _registry.append(self)
+
+    def _key(self, labels: Dict[str, str]) -> Labels:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[str]:
+        if self.callback is not None:
+            values = list(self.callback())
+        else:
+            with self._lock:
+                values = list(self._values.items())
+        return [
+            f'{self.name}{_format_labels(self.labelnames, labels)} '
+            f'{_format_value(value)}'
+            for labels, value in values
+        ]
+
+    def render(self) -> str:
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.type}',
+            *self.samples(),
+        ]
+        return '\n'.join(lines)
+
+
+class Counter(Metric):
+    """Contador que só cresce."""
+
+    type = 'counter'
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """Valor que sobe e desce."""
+
+    type = 'gauge'
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    """Distribuição de valores em faixas cumulativas."""
+
+    type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = (*sorted(buckets), math.inf)
+        self._series: Dict[Labels, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            # Contagem por faixa, seguida de soma e total
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            series = [
+                (key, list(values)) for key, values in self._series.items()
+            ]
+
+        lines = []
+        names = (*self.labelnames, 'le')
+        for labels, values in series:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, values):
+                cumulative += count
+                bucket_labels = _format_labels(
+                    names, (*labels, _format_value(bound))
+                )
+                lines.append(
+                    f'{self.name}_bucket{bucket_labels} '
+                    f'{_format_value(cumulative)}'
+                )
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(
+                f'{self.name}_sum{label_text} {_format_value(values[-2])}'
+            )
+            lines.append(
+                f'{self.name}_count{label_text} {_format_value(values[-1])}'
+            )
+        return lines
+
+
+def render_metrics() -> str:
+    """Gera o texto de todas as métricas registradas."""
+    return '\n'.join(metric.render() for metric in _registry) + '\n'
+
+
+# Chamadas ao Odoo (cliente assíncrono e proxies síncronos)
+ODOO_RPC_DURATION = Histogram(
+    'odoo_rpc_duration_seconds',
+    'Latência das chamadas XML-RPC ao Odoo.',
+    ('model', 'method'),
+)
+ODOO_RPC_ERRORS = Counter(
+    'odoo_rpc_errors_total',
+    'Chamadas XML-RPC ao Odoo que falharam, por tipo de erro.',
+    ('model', 'method', 'error'),
+)
+ODOO_RPC_REQUEST_BYTES = Histogram(
+    'odoo_rpc_request_bytes',
+    'Tamanho do corpo XML enviado ao Odoo.',
+    ('model', 'method'),
+    BYTES_BUCKETS,
+)
+ODOO_RPC_RESPONSE_BYTES = Histogram(
+    'odoo_rpc_response_bytes',
+    'Tamanho da resposta recebida do Odoo.',
+    ('model', 'method'),
+    BYTES_BUCKETS,
+)
+
+# API HTTP
+HTTP_REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    'Latência das requisições HTTP por rota.',
+    ('method', 'route', 'status'),
+)
+
+# Cache compartilhado
+CACHE_REQUESTS = Counter(
+    'cache_requests_total',
+    'Leituras do cache compartilhado por namespace e resultado.',
+    ('namespace', 'result'),
+)
@@ -0,0 +1,467 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.config.settings import (
+    CHANGE_FEED_LAG,
+    MIRROR_DB_PATH,
+    MIRROR_ENABLED,
+    MIRROR_MAX_STALENESS,
+    ODOO_URL,
+)
+from app.services.async_odoo_client import decode_cursor, encode_cursor
+from app.services.change_feed_service import find_deleted_ids, get_changes
+from app.services.circuit_breaker import is_open
+from app.services.company_service import PARTNER_DEFAULT_FIELDS
+from app.services.export_service import EXPORT_MODELS
+from app.services.helpdesk_service import HELPDESK_DEFAULT_FIELDS
+from app.services.tasks_project_service import TASK_STAGE_FIELDS
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+# Modelos replicados: campos copiados e colunas indexadas para filtro.
+# Colunas many2one guardam o id e também <campo>_name para buscas por nome.
+# O nome é o da última gravação do registro: renomear o registro
+# relacionado não altera o write_date e não chega à réplica.
+MIRROR_MODELS: Dict[str, Dict[str, List[str]]] = {
+    'res.partner': {
+        'fields': [*PARTNER_DEFAULT_FIELDS, 'active', 'write_date'],
+        'indexes': ['vat'],
+    },
+    'crm.lead': {
+        'fields': [*EXPORT_MODELS['crm.lead'], 'active'],
+        'indexes': ['team_id', 'stage_id'],
+    },
+    'helpdesk.ticket': {
+        'fields': [*HELPDESK_DEFAULT_FIELDS, 'active', 'write_date'],
+        'indexes': ['team_id', 'stage_id'],
+    },
+    'project.task': {
+        'fields': [*TASK_STAGE_FIELDS, 'active', 'write_date'],
+        'indexes': ['project_id', 'stage_id'],
+    },
+}
+
+# Registros buscados por chamada durante a sincronização
+MIRROR_SYNC_PAGE_SIZE = 500
+
+# Operadores aceitos em search()
+MIRROR_OPERATORS = {'=': '= ?', 'in': 'IN ({})', 'ilike': "LIKE ? ESCAPE '\\'"}
+
+
+def _casefold(value: Any) -> Any:
+    """Função casefold do SQLite: o LIKE nativo só ignora caixa em ASCII."""
+    return value.casefold() if isinstance(value, str) else value
+
+
+def _table(model: str) -> str:
+    """Nome da tabela SQLite de um modelo."""
+    return model.replace('.', '_')
+
+
+def _index_columns(model: str) -> List[str]:
+    """Colunas físicas geradas a partir das colunas indexadas do modelo."""
+    columns = []
+    for column in MIRROR_MODELS[model]['indexes']:
+        columns.append(column)
+        if column.endswith('_id'):
+            columns.append(f'{column}_name')
+    return columns
+
+
+def _index_values(model: str, record: Dict[str, Any]) -> List[Any]:
+    """Extrai os valores das colunas indexadas de um registro do Odoo."""
+    values = []
+    for column in MIRROR_MODELS[model]['indexes']:
+        value = record.get(column)
+        if column.endswith('_id'):
+            pair = value if isinstance(value, list) and value else None
+            values.append(pair[0] if pair else None)
+            values.append(pair[1] if pair and len(pair) > 1 else None)
+        else:
+            values.append(value or None)
+    return values
+
+
+class OdooMirror:
+    """
+    Réplica local em SQLite de modelos do Odoo.
+
+    A sincronização consome o feed de alterações por write_date e grava
+    cada registro como JSON, com as colunas de filtro extraídas e
+    indexadas. Exclusões são detectadas por reconciliação de ids.
+    """
+
+    def __init__(self, path: str = MIRROR_DB_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.create_function(
+            'casefold', 1, _casefold, deterministic=True
+        )
+        self._lock = threading.Lock()
+        self._sync_lock = asyncio.Lock()
+        self.initialize()
+
+    def initialize(self) -> None:
+        """Cria as tabelas e índices que ainda não existem."""
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS mirror_state ('
+                'model TEXT PRIMARY KEY, watermark TEXT, synced_at REAL)'
+            )
+            for model in MIRROR_MODELS:
+                table = _table(model)
+                columns = ''.join(
+                    f', {column} '
+                    + ('INTEGER' if column.endswith('_id') else 'TEXT')
+                    for column in _index_columns(model)
+                )
+                self._conn.execute(
+                    f'CREATE TABLE IF NOT EXISTS {table} ('
+                    f'id INTEGER PRIMARY KEY, write_date TEXT, '
+                    f'active INTEGER{columns}, data TEXT NOT NULL)'
+                )
+                for column in MIRROR_MODELS[model]['indexes']:
+                    self._conn.execute(
+                        f'CREATE INDEX IF NOT EXISTS ix_{table}_{column} '
+                        f'ON {table} ({column})'
+                    )
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco local."""
+        with self._lock:
+            self._conn.close()
+
+    # Estado da sincronização
+
+    def _get_state(self, model: str) -> Tuple[Optional[str], Optional[float]]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT watermark, synced_at FROM mirror_state '
+                'WHERE model = ?',
+                (model,),
+            ).fetchone()
+        return (row['watermark'], row['synced_at']) if row else (None, None)
+
+    def _set_state(
+        self, model: str, watermark: Optional[str], synced: bool
+    ) -> None:
+        # O feed só entrega o que tem mais de CHANGE_FEED_LAG segundos
+        synced_at = time.time() - CHANGE_FEED_LAG if synced else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT INTO mirror_state (model, watermark, synced_at) '
+                'VALUES (?, ?, ?) ON CONFLICT(model) DO UPDATE SET '
+                'watermark = excluded.watermark, '
+                'synced_at = COALESCE(excluded.synced_at, synced_at)',
+                (model, watermark, synced_at),
+            )
+
+    def staleness(self, model: str) -> Optional[float]:
+        """
+        Defasagem dos dados da última sincronização completa do modelo.
+
+        Returns:
+            Defasagem em segundos ou None se o modelo nunca foi sincronizado
+        """
+        _, synced_at = self._get_state(model)
+        return None if synced_at is None else time.time() - synced_at
+
+    # Escrita
+
+    def upsert(self, model: str, records: Sequence[Dict[str, Any]]) -> None:
+        """Insere ou atualiza registros do Odoo na réplica."""
+        table = _table(model)
+        columns = ['id', 'write_date', 'active', *_index_columns(model)]
+        placeholders = ', '.join('?' for _ in range(len(columns) + 1))
+        rows = [
+            (
+                record['id'],
+                record.get('write_date'),
+                int(record.get('active', True) is not False),
+                *_index_values(model, record),
+                json.dumps(record, ensure_ascii=False),
+            )
+            for record in records
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f'INSERT OR REPLACE INTO {table} '
+                f'({", ".join(columns)}, data) VALUES ({placeholders})',
+                rows,
+            )
+
+    def delete(self, model: str, ids: Sequence[int]) -> None:
+        """Remove registros excluídos no Odoo."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f'DELETE FROM {_table(model)} WHERE id = ?',
+                [(record_id,) for record_id in ids],
+            )
+
+    def ids(self, model: str) -> List[int]:
+        """Lista os ids presentes na réplica."""
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT id FROM {_table(model)} ORDER BY id'
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    async def sync_model(self, model: str) -> int:
+        """
+        Traz para a réplica as alterações do modelo desde a última marca.
+
+        Args:
+            model: Nome do modelo
+
+        Returns:
+            Quantidade de registros gravados
+        """
+        watermark, _ = self._get_state(model)
+        total = 0
+
+        while True:
+            page = await get_changes(
+                model,
+                watermark,
+                limit=MIRROR_SYNC_PAGE_SIZE,
+                fields=MIRROR_MODELS[model]['fields'],
+            )
+            if page['changes']:
+                await asyncio.to_thread(self.upsert, model, page['changes'])
+                total += len(page['changes'])
+            watermark = page['next_watermark']
+            self._set_state(model, watermark, synced=not page['has_more'])
+            if not page['has_more']:
+                return total
+
+    async def reconcile_model(self, model: str) -> int:
+        """
+        Remove da réplica os registros excluídos no Odoo.
+
+        Returns:
+            Quantidade de registros removidos
+        """
+        ids = await asyncio.to_thread(self.ids, model)
+        if not ids:
+            return 0
+        deleted = await find_deleted_ids(model, ids)
+        if deleted:
+            await asyncio.to_thread(self.delete, model, deleted)
+        return len(deleted)
+
+    async def sync_all(self) -> None:
+        """Sincroniza todos os modelos replicados."""
+        async with self._sync_lock:
+            for model in MIRROR_MODELS:
+                try:
+                    total = await self.sync_model(model)
+                    if total:
+                        logger.info(
+                            f'Réplica de {model}: {total} registros '
+                            f'atualizados'
+                        )
+                except Exception as e:
+                    logger.error(
+                        f'Erro ao sincronizar réplica de {model}: {e}'
+                    )
+
+    async def reconcile_all(self) -> None:
+        """Reconcilia exclusões de todos os modelos replicados."""
+        async with self._sync_lock:
+            for model in MIRROR_MODELS:
+                try:
+                    deleted = await self.reconcile_model(model)
+                    if deleted:
+                        logger.info(
+                            f'Réplica de {model}: {deleted} registros '
+                            f'excluídos removidos'
+                        )
+                except Exception as e:
+                    logger.error(
+                        f'Erro ao reconciliar réplica de {model}: {e}'
+                    )
+
+    # Leitura
+
+    def search(  # noqa: PLR0913
+        self,
+        model: str,
+        conditions: Sequence[Tuple[str, str, Any]],
+        fields: Optional[List[str]] = None,
+        *,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Busca registros ativos na réplica, em ordem de id.
+
+        Aceita os mesmos cursores de search_read_page ordenado por id, de
+        modo que a paginação continua válida ao alternar entre a réplica e
+        o Odoo.
+
+        Args:
+            model: Nome do modelo
+            conditions: Filtros (coluna, operador, valor) sobre colunas
+                indexadas; operadores '=', 'in' e 'ilike'
+            fields: Campos a retornar (todos os replicados se None)
+            limit: Tamanho da página (sem limite se None)
+            offset: Deslocamento, usado apenas sem cursor
+            cursor: Cursor retornado pela página anterior
+
+        Returns:
+            Tupla com os registros e o cursor da próxima página
+
+        Raises:
+            ValueError: Se o cursor, a coluna ou o operador forem inválidos
+        """
+        allowed = _index_columns(model)
+        where = ['active = 1']
+        params: List[Any] = []
+
+        for column, operator, value in conditions:
+            if column not in allowed or operator not in MIRROR_OPERATORS:
+                raise ValueError(
+                    f'Filtro não suportado pela réplica: {column} {operator}'
+                )
+            clause = MIRROR_OPERATORS[operator]
+            target = column
+            if operator == 'in':
+                clause = clause.format(', '.join('?' for _ in value))
+                params.extend(value)
+            elif operator == 'ilike':
+                # Compara sem caixa também fora do ASCII, como o Odoo
+                target = f'casefold({column})'
+                escaped = (
+                    str(value)
+                    .casefold()
+                    .replace('\\', '\\\\')
+                    .replace('%', '\\%')
+                    .replace('_', '\\_')
+                )
+                params.append(f'%{escaped}%')
+            else:
+                params.append(value)
+            where.append(f'{target} {clause}')
+
+        if cursor:
+            where.append('id > ?')
+            params.append(decode_cursor(cursor)['id'])
+            offset = 0
+
+        sql = (
+            f'SELECT data FROM {_table(model)} '
+            f'WHERE {" AND ".join(where)} ORDER BY id'
+        )
+        if limit is not None:
+            sql += ' LIMIT ? OFFSET ?'
+            params.extend([limit + 1, offset])
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        records = [json.loads(row['data']) for row in rows]
+        next_cursor = None
+        if limit is not None and len(records) > limit:
+            records = records[:limit]
+            next_cursor = encode_cursor(records[-1])
+
+        if fields:
+            records = [
+                {field: record.get(field, False) for field in fields}
+                for record in records
+            ]
+        return records, next_cursor
+
+
+_mirror: Optional[OdooMirror] = None
+
+
+def get_mirror() -> Optional[OdooMirror]:
+    """
+    Obtém a réplica local, criando-a no primeiro uso.
+
+    Returns:
+        Instância da réplica ou None se MIRROR_ENABLED estiver desligado
+    """
+    global _mirror  # noqa: PLW0603
+    if not MIRROR_ENABLED:
+        return None
+    if _mirror is None:
+        _mirror = OdooMirror(MIRROR_DB_PATH)
+    return _mirror
+
+
+async def read_from_mirror(  # noqa: PLR0913
+    model: str,
+    conditions: Sequence[Tuple[str, str, Any]],
+    fields: Optional[List[str]] = None,
+    max_staleness: Optional[int] = None,
+    *,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> Optional[Tuple[List[Dict[str, Any]], Optional[str]]]:
+    """
+    Tenta atender uma leitura pela réplica local.
+
+    A réplica só é usada quando está habilitada, já foi sincronizada há no
+    máximo `max_staleness` segundos e contém todos os campos pedidos. Em
+    qualquer outro caso retorna None e o chamador deve consultar o Odoo.
+    Enquanto o disjuntor do Odoo estiver aberto, a réplica é usada com
+    qualquer defasagem, em vez de a requisição falhar com 503.
+
+    As consultas ao SQLite e a decodificação dos registros rodam em uma
+    thread, fora do event loop.
+
+    Args:
+        model: Nome do modelo
+        conditions: Filtros sobre colunas indexadas (ver OdooMirror.search)
+        fields: Campos a retornar
+        max_staleness: Defasagem máxima aceita em segundos (usa
+            MIRROR_MAX_STALENESS se None)
+        limit: Tamanho da página
+        offset: Deslocamento, usado apenas sem cursor
+        cursor: Cursor retornado pela página anterior
+
+    Returns:
+        Tupla (registros, próximo cursor) ou None se a réplica não puder
+        ser usada
+
+    Raises:
+        ValueError: Se o cursor for inválido
+    """
+    if max_staleness is None:
+        max_staleness = MIRROR_MAX_STALENESS
+    mirror = get_mirror()
+    if mirror is None or model not in MIRROR_MODELS:
+        return None
+    if is_open(ODOO_URL):
+        max_staleness = float('inf')
+    if max_staleness <= 0:
+        return None
+    if fields and not set(fields) <= set(MIRROR_MODELS[model]['fields']):
+        return None
+
+    def read():
+        staleness = mirror.staleness(model)
+        if staleness is None or staleness > max_staleness:
+            return None
+        return mirror.search(
+            model,
+            conditions,
+            fields,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+
+    return await asyncio.to_thread(read)
@@ -0,0 +1,101 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict
+
+# Frames mais profundos que isto são cortados na raiz da pilha
+MAX_STACK_DEPTH = 128
+
+# Um perfil por processo: duas amostragens simultâneas distorcem ambas
+_profiling = threading.Lock()
+
+
+class ProfilerBusyError(RuntimeError):
+    """Já existe um perfil sendo capturado neste processo."""
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f'{code.co_qualname} ({filename}:{code.co_firstlineno})'
+
+
+def _folded_stack(frame, thread_name: str) -> str:
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name)
+    # Formato "folded": da raiz para a folha, separado por ';'
+    return ';'.join(reversed(labels))
+
+
+# Funções em que uma thread parada apenas espera trabalho
+_IDLE_FUNCTIONS = frozenset({
+    ('threading.py', 'wait'),
+    ('queue.py', 'get'),
+    ('selectors.py', 'select'),
+    ('thread.py', '_worker'),
+})
+
+
+def _is_idle(frame) -> bool:
+    code = frame.f_code
+    location = (os.path.basename(code.co_filename), code.co_name)
+    return location in _IDLE_FUNCTIONS
+
+
+def sample_stacks(
+    seconds: float, interval: float = 0.005, idle: bool = False
+) -> Dict[str, int]:
+    """
+    Amostra as pilhas de todas as threads do processo.
+
+    A cada `interval` segundos lê o frame atual de cada thread (exceto a
+    do próprio amostrador), sem instrumentar o código, então o custo
+    sobre o worker é pequeno e independe do que ele está executando.
+
+    Args:
+        seconds: Duração da captura
+        interval: Intervalo entre amostras
+        idle: Se False, descarta threads paradas em espera (ex: workers
+            do executor sem trabalho), que só poluem o resultado
+
+    Returns:
+        Contagem de amostras por pilha no formato "folded"
+
+    Raises:
+        ProfilerBusyError: Se outra captura estiver em andamento
+    """
+    if not _profiling.acquire(blocking=False):
+        raise ProfilerBusyError('Já existe um perfil em captura')
+    try:
+        own = threading.get_ident()
+        samples: Counter = Counter()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                if not idle and _is_idle(frame):
+                    continue
+                name = names.get(ident, f'thread-{ident}')
+                samples[_folded_stack(frame, name)] += 1
+            time.sleep(interval)
+        return dict(samples)
+    finally:
+        _profiling.release()
+
+
+def render_folded(samples: Dict[str, int]) -> str:
+    """
+    Gera o texto "folded" (uma pilha e sua contagem por linha).
+
+    Compatível com flamegraph.pl, speedscope e inferno; as pilhas mais
+    frequentes vêm primeiro.
+    """
+    ordered = sorted(samples.items(), key=lambda item: -item[1])
+    return ''.join(f'{stack} {count}\n' for stack, count in ordered)
@@ -0,0 +1,91 @@
+import logging
+from typing import List, Optional
+
+from fastapi import Query
+
+from app.services.schema_registry import schema_registry
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# Tipos que só são lidos quando pedidos explicitamente pelo nome: binários e
+# html costumam ser os maiores campos do registro e x2many trazem listas
+# de ids que raramente são usadas
+HEAVY_FIELD_TYPES = ('binary', 'html', 'one2many', 'many2many')
+
+# Valor de `fields` que pede todos os campos leves do modelo
+ALL_LIGHT_FIELDS = '*'
+
+
+def requested_fields(
+    fields: Optional[List[str]] = Query(
+        default=None,
+        description=(
+            'Campos a retornar, repetidos ou separados por vírgula. '
+            'Use "*" para todos os campos exceto binários, html e x2many'
+        ),
+    ),
+) -> Optional[List[str]]:
+    """
+    Dependência que normaliza o parâmetro `fields` das rotas de leitura.
+
+    Returns:
+        Lista de campos sem repetições ou None se não informado
+    """
+    if not fields:
+        return None
+    names = [name.strip() for value in fields for name in value.split(',')]
+    return list(dict.fromkeys(name for name in names if name)) or None
+
+
+async def resolve_fields(
+    model: str,
+    requested: Optional[List[str]],
+    default: List[str],
+) -> List[str]:
+    """
+    Define a projeção de campos de uma leitura.
+
+    Sem `requested`, usa os campos padrão do endpoint. Com "*", usa todos
+    os campos do modelo exceto os de HEAVY_FIELD_TYPES. Nomes explícitos
+    são validados contra o fields_get em cache e podem incluir campos
+    pesados.
+
+    Args:
+        model: Nome técnico do modelo
+        requested: Campos pedidos pelo cliente (ver requested_fields)
+        default: Campos padrão do endpoint
+
+    Returns:
+        Lista de campos a enviar ao Odoo
+
+    Raises:
+        ValueError: Se algum campo pedido não existir no modelo
+    """
+    if not requested:
+        return default
+
+    try:
+        schema = await schema_registry.get_fields(model)
+    except Exception as e:
+        # Sem schema não há como validar; o Odoo rejeita nomes inválidos
+        logger.warning(f'Schema de {model} indisponível para projeção: {e}')
+        return [name for name in requested if name != ALL_LIGHT_FIELDS]
+
+    fields = []
+    for name in requested:
+        if name == ALL_LIGHT_FIELDS:
+            fields.extend(
+                field
+                for field, info in schema.items()
+                if info.get('type') not in HEAVY_FIELD_TYPES
+            )
+        elif name in schema or name == 'id':
+            fields.append(name)
+        else:
+            raise ValueError(f'Campo {name} não existe no modelo {model}')
+
+    fields = list(dict.fromkeys(fields))
+    if 'id' not in fields:
+        fields.insert(0, 'id')
+    return fields
@@ -0,0 +1,93 @@
+import http.client
+import random
+import xmlrpc.client
+from dataclasses import dataclass
+
+from app.config.settings import (
+    ODOO_RETRY_ATTEMPTS,
+    ODOO_RETRY_BASE_DELAY,
+    ODOO_RETRY_DEADLINE,
+    ODOO_RETRY_MAX_DELAY,
+)
+
+# Métodos sem efeito colateral no Odoo, que podem ser repetidos com
+# segurança. Escritas nunca são repetidas pelo cliente: uma resposta
+# perdida não diz se o Odoo gravou ou não (ver IdempotencyMiddleware)
+READ_METHODS = frozenset({
+    'check_access_rights',
+    'default_get',
+    'fields_get',
+    'name_get',
+    'name_search',
+    'read',
+    'read_group',
+    'search',
+    'search_count',
+    'search_read',
+})
+
+# Status HTTP devolvidos por proxies enquanto o Odoo reinicia ou está
+# sobrecarregado
+RETRYABLE_STATUS = (502, 503, 504)
+
+# Falhas de transporte: conexão recusada, resetada ou encerrada no meio da
+# resposta, e tempo esgotado
+RETRYABLE_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    http.client.IncompleteRead,
+)
+
+# Resultados registrados em AsyncOdooClient.retry_counts
+RETRIED = 'retried'
+RECOVERED = 'recovered'
+EXHAUSTED = 'exhausted'
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Indica se uma falha do Odoo é transitória.
+
+    Um Fault do XML-RPC (erro de validação, acesso negado etc.) é uma
+    resposta definitiva do servidor e nunca é repetido.
+    """
+    if isinstance(error, xmlrpc.client.ProtocolError):
+        return error.errcode in RETRYABLE_STATUS
+    return isinstance(error, RETRYABLE_ERRORS)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Política de novas tentativas das leituras no Odoo.
+
+    Attributes:
+        attempts: Número total de tentativas, incluindo a primeira
+        base_delay: Espera máxima (segundos) antes da segunda tentativa;
+            dobra a cada tentativa
+        max_delay: Teto da espera entre tentativas
+        deadline: Tempo total (segundos) desde a primeira tentativa após
+            o qual não se tenta mais
+    """
+
+    attempts: int = ODOO_RETRY_ATTEMPTS
+    base_delay: float = ODOO_RETRY_BASE_DELAY
+    max_delay: float = ODOO_RETRY_MAX_DELAY
+    deadline: float = ODOO_RETRY_DEADLINE
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Calcula a espera antes da próxima tentativa.
+
+        Usa backoff exponencial com jitter completo (valor aleatório entre
+        zero e o teto), para que os workers que falharam juntos durante um
+        reinício do Odoo não voltem todos no mesmo instante.
+
+        Args:
+            attempt: Número de tentativas já feitas (a partir de 1)
+
+        Returns:
+            Espera em segundos
+        """
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
@@ -0,0 +1,126 @@
+import contextvars
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.slow_calls import call_shape
+
+# (modelo, método, forma do domínio ou None)
+CallKey = Tuple[str, str, Optional[str]]
+
+
+class RepeatedCallError(AssertionError):
+    """A mesma chamada ao Odoo se repetiu demais numa requisição (N+1)."""
+
+
+class RpcRecorder:
+    """
+    Conta as chamadas ao Odoo feitas durante uma requisição HTTP.
+
+    As chamadas são agrupadas por modelo, método e forma do domínio, de
+    modo que um laço que busca um registro por iteração aparece como uma
+    única chave com contagem alta. É compartilhado com as threads do
+    executor pela cópia do contexto, daí o lock.
+    """
+
+    def __init__(self):
+        self.calls: Counter = Counter()
+        self.expected: set = set()
+        self._lock = threading.Lock()
+
+    @property
+    def total(self) -> int:
+        return sum(self.calls.values())
+
+    def record(self, model: str, method: str, args: Tuple[Any, ...]):
+        shape, _ = call_shape(method, args)
+        with self._lock:
+            self.calls[model, method, shape] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[CallKey, int]]:
+        """Chamadas repetidas mais de `threshold` vezes, fora as esperadas."""
+        with self._lock:
+            items = list(self.calls.items())
+        return [
+            (key, count)
+            for key, count in items
+            if count > threshold and key[:2] not in self.expected
+        ]
+
+
+# Gravador da requisição em andamento (None com o detector desligado)
+current_recorder: contextvars.ContextVar[Optional[RpcRecorder]] = (
+    contextvars.ContextVar('current_recorder', default=None)
+)
+
+
+def expect_repeated_calls(model: str, method: str = 'search_read') -> None:
+    """
+    Marca uma repetição como intencional na requisição atual.
+
+    Para laços legítimos, como a paginação de uma exportação, que fazem
+    a mesma chamada uma vez por página.
+    """
+    recorder = current_recorder.get()
+    if recorder is not None:
+        recorder.expected.add((model, method))
+
+
+def format_call(key: CallKey) -> str:
+    """Texto de uma chave, ex: "res.partner.read" ou com o domínio."""
+    model, method, shape = key
+    return f'{model}.{method} {shape}' if shape else f'{model}.{method}'
+
+
+def describe_repeated(route: str, repeated: List[Tuple[CallKey, int]]) -> str:
+    calls = '; '.join(
+        f'{format_call(key)} x{count}' for key, count in repeated
+    )
+    return f'Possível N+1 em {route}: {calls}'
+
+
+class RouteReport:
+    """
+    Chamadas ao Odoo por rota, acumuladas entre requisições.
+
+    Para cada rota guarda o número de requisições, o total e o máximo de
+    chamadas por requisição e o máximo por (modelo, método, forma do
+    domínio). Serve para comparar versões: uma rota cujo máximo cresce
+    passou a fazer mais chamadas por requisição.
+    """
+
+    def __init__(self):
+        self._routes: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, route: str, recorder: RpcRecorder) -> None:
+        with self._lock:
+            stats = self._routes.setdefault(
+                route,
+                {'requests': 0, 'calls': 0, 'max_calls': 0, 'shapes': {}},
+            )
+            stats['requests'] += 1
+            stats['calls'] += recorder.total
+            stats['max_calls'] = max(stats['max_calls'], recorder.total)
+            shapes = stats['shapes']
+            for key, count in recorder.calls.items():
+                call = format_call(key)
+                shapes[call] = max(shapes.get(call, 0), count)
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """Relatório por rota, das rotas com mais chamadas para as menos."""
+        with self._lock:
+            routes = {
+                route: {**stats, 'shapes': dict(stats['shapes'])}
+                for route, stats in self._routes.items()
+            }
+        return dict(
+            sorted(routes.items(), key=lambda item: -item[1]['max_calls'])
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+
+route_report = RouteReport()
@@ -0,0 +1,191 @@
+import time
+import xmlrpc.client
+from typing import Any, Optional, Tuple
+
+from app.config.settings import XMLRPC_FAST_DECODER
+from app.services import xmlrpc_decoder
+from app.services.metrics import (
+    ODOO_RPC_DURATION,
+    ODOO_RPC_ERRORS,
+    ODOO_RPC_REQUEST_BYTES,
+    ODOO_RPC_RESPONSE_BYTES,
+)
+from app.services.rpc_recorder import current_recorder
+from app.services.slow_calls import slow_calls
+from app.services.tracing import get_tracer
+
+# execute_kw(db, uid, password, model, method, ...)
+_EXECUTE_KW_ARGS = 5
+
+
+class _OdooTransportMixin:
+    timeout: Optional[float] = None
+    traceparent: Optional[str] = None
+    request_bytes = 0
+    response_bytes = 0
+
+    def make_connection(self, host):
+        connection = super().make_connection(host)
+        # A conexão é reaproveitada entre chamadas com tempos diferentes
+        connection.timeout = self.timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(self.timeout)
+        return connection
+
+    def request(self, host, handler, request_body, verbose=False):
+        self.request_bytes = len(request_body)
+        self.response_bytes = 0
+        return super().request(host, handler, request_body, verbose)
+
+    def send_headers(self, connection, headers):
+        if self.traceparent:
+            headers = [*headers, ('traceparent', self.traceparent)]
+        super().send_headers(connection, headers)
+
+    def getparser(self):
+        if not XMLRPC_FAST_DECODER:
+            return super().getparser()
+        return xmlrpc_decoder.getparser(
+            self._use_datetime, self._use_builtin_types
+        )
+
+    def parse_response(self, response):
+        read = response.read
+
+        def counting_read(*args):
+            data = read(*args)
+            self.response_bytes += len(data)
+            return data
+
+        response.read = counting_read
+        return super().parse_response(response)
+
+
+class TimeoutTransport(_OdooTransportMixin, xmlrpc.client.Transport):
+    """Transporte XML-RPC sobre HTTP com tempo limite por chamada."""
+
+
+class TimeoutSafeTransport(_OdooTransportMixin, xmlrpc.client.SafeTransport):
+    """Transporte XML-RPC sobre HTTPS com tempo limite por chamada."""
+
+
+def create_proxy(
+    url: str, service: str, timeout: Optional[float] = None
+) -> Tuple[xmlrpc.client.ServerProxy, _OdooTransportMixin]:
+    """
+    Cria um ServerProxy para um serviço XML-RPC do Odoo.
+
+    Args:
+        url: URL do servidor Odoo
+        service: Serviço ('common' ou 'object')
+        timeout: Tempo limite das chamadas em segundos (None não limita)
+
+    Returns:
+        Tupla (proxy, transporte); o transporte guarda o tempo limite e o
+        tamanho do último pedido e da última resposta
+    """
+    if url.startswith('https'):
+        transport = TimeoutSafeTransport()
+    else:
+        transport = TimeoutTransport()
+    transport.timeout = timeout
+    proxy = xmlrpc.client.ServerProxy(
+        f'{url}/xmlrpc/2/{service}', transport=transport
+    )
+    return proxy, transport
+
+
+def _labels(service: str, method: str, args: Tuple[Any, ...]):
+    if method == 'execute_kw' and len(args) >= _EXECUTE_KW_ARGS:
+        return {'model': str(args[3]), 'method': str(args[4])}
+    return {'model': service, 'method': method}
+
+
+def call_rpc(
+    proxy: xmlrpc.client.ServerProxy,
+    transport: _OdooTransportMixin,
+    service: str,
+    method: str,
+    args: Tuple[Any, ...],
+) -> Any:
+    """
+    Executa uma chamada XML-RPC registrando as métricas dela.
+
+    Latência, erros e tamanhos de payload são rotulados pelo modelo e
+    método do Odoo em chamadas execute_kw e pelo serviço e método nas
+    demais (ex: common/authenticate). Dentro de uma requisição rastreada
+    a chamada também vira um span filho, com o traceparent repassado ao
+    Odoo, e chamadas acima do limite vão para o registro de chamadas
+    lentas. Com o detector de N+1 ligado a chamada também é contada na
+    requisição atual.
+    """
+    labels = _labels(service, method, args)
+    recorder = current_recorder.get()
+    if recorder is not None:
+        recorder.record(labels['model'], labels['method'], args)
+    tracer = get_tracer()
+    span = tracer.start_span(
+        f'odoo {labels["model"]}.{labels["method"]}',
+        **{
+            'rpc.system': 'xmlrpc',
+            'rpc.service': service,
+            'rpc.method': method,
+            'odoo.model': labels['model'],
+            'odoo.method': labels['method'],
+        },
+    )
+    transport.traceparent = span.traceparent if span else None
+    records = error = None
+    started = time.perf_counter()
+    try:
+        result = getattr(proxy, method)(*args)
+        if isinstance(result, list):
+            records = len(result)
+        return result
+    except Exception as e:
+        error = type(e).__name__
+        ODOO_RPC_ERRORS.inc(error=error, **labels)
+        if span:
+            span.set_error(e)
+        raise
+    finally:
+        duration = time.perf_counter() - started
+        ODOO_RPC_DURATION.observe(duration, **labels)
+        ODOO_RPC_REQUEST_BYTES.observe(transport.request_bytes, **labels)
+        ODOO_RPC_RESPONSE_BYTES.observe(transport.response_bytes, **labels)
+        slow_calls.record(
+            labels['model'],
+            labels['method'],
+            args,
+            duration,
+            records=records,
+            error=error,
+        )
+        if span:
+            if records is not None:
+                span.attributes['odoo.records'] = records
+            span.attributes['odoo.request_bytes'] = transport.request_bytes
+            span.attributes['odoo.response_bytes'] = transport.response_bytes
+            tracer.finish(span)
+
+
+class InstrumentedProxy:
+    """
+    ServerProxy com métricas, para os serviços e rotas síncronos.
+
+    Mantém a mesma interface (`proxy.execute_kw(...)`,
+    `proxy.authenticate(...)`), registrando cada chamada como o
+    AsyncOdooClient.
+    """
+
+    def __init__(self, url: str, service: str):
+        self._service = service
+        self._proxy, self._transport = create_proxy(url, service)
+
+    def __getattr__(self, method: str):
+        def call(*args):
+            return call_rpc(
+                self._proxy, self._transport, self._service, method, args
+            )
+
+        return call
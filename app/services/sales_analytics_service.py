@@ -4,10 +4,42 @@ from typing import Dict, List
 
 import numpy as np  # Importando NumPy para cálculos mais precisos
 
+from app.config.settings import ODOO_DB, ODOO_PASSWORD, ODOO_URL, ODOO_USERNAME
+from app.services.async_odoo_client import AsyncOdooClient
+
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Campos lidos das oportunidades ganhas
+WON_OPPORTUNITY_FIELDS = [
+    'id',
+    'name',
+    'team_id',
+    'user_id',
+    'expected_revenue',
+    'date_closed',
+    'partner_id',
+    'x_studio_tese',
+    'date_last_stage_update',
+    'stage_id',
+    'x_studio_selection_field_37f_1ibrq64l3',
+    'x_studio_segmento',
+]
+
+# Campos dos registros relacionados resolvidos em lote
+WON_OPPORTUNITY_RELATED_PATHS = ['partner_id.vat']
+
+
+async def get_odoo_client() -> AsyncOdooClient:
+    """
+    Obtém uma instância do cliente Odoo assíncrono.
+    Reutiliza conexões existentes quando possível.
+    """
+    return await AsyncOdooClient.get_instance(
+        ODOO_URL, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD
+    )
+
 
 def parse_date(date_str: str) -> datetime:
     """
@@ -30,12 +62,31 @@ def format_decimal(value: float) -> float:
     return float(np.round(value, 2))
 
 
-def get_won_opportunities(
-    models, db: str, uid: int, password: str, start_date: str, end_date: str
-) -> List[Dict]:
+async def prefetch_opportunity_relations(
+    client: AsyncOdooClient, opportunities: List[Dict]
+) -> None:
+    """
+    Resolve em lote os campos relacionados usados no relatório.
+
+    Uma falha aqui não invalida a análise: os detalhes saem sem o VAT.
+    """
+    try:
+        await client.prefetch_related(
+            'crm.lead', opportunities, WON_OPPORTUNITY_RELATED_PATHS
+        )
+    except Exception as e:
+        logger.error(f'Erro ao buscar VAT dos parceiros: {e}')
+
+
+async def get_won_opportunities(start_date: str, end_date: str) -> List[Dict]:
     """
     Obtém as oportunidades ganhas e ativas no período especificado (stage_id = 10).
+
+    O VAT do parceiro de cada oportunidade é resolvido em um único read de
+    res.partner (chave 'partner_id.vat').
     """
+    client = await get_odoo_client()
+
     try:
         # Domínio para buscar oportunidades ganhas, ativas e dentro do período
         domain = [
@@ -55,31 +106,13 @@ def get_won_opportunities(
         )
 
         # Buscar oportunidades ganhas com todos os campos necessários
-        opportunities = models.execute_kw(
-            db,
-            uid,
-            password,
+        opportunities = await client.search_read(
             'crm.lead',
-            'search_read',
-            [domain],
-            {
-                'fields': [
-                    'id',
-                    'name',
-                    'team_id',
-                    'user_id',
-                    'expected_revenue',
-                    'date_closed',
-                    'partner_id',
-                    'x_studio_tese',
-                    'date_last_stage_update',
-                    'stage_id',
-                    'active',
-                    'x_studio_selection_field_37f_1ibrq64l3',
-                    'x_studio_segmento',
-                ]
-            },
+            domain,
+            fields=[*WON_OPPORTUNITY_FIELDS, 'active'],
+            raise_on_error=True,
         )
+        await prefetch_opportunity_relations(client, opportunities)
 
         logger.info(
             f'Encontradas {len(opportunities)} oportunidades ganhas e ativas no período'
@@ -104,30 +137,13 @@ def get_won_opportunities(
 
             logger.info("Tentando busca alternativa sem filtro de 'active'")
 
-            opportunities = models.execute_kw(
-                db,
-                uid,
-                password,
+            opportunities = await client.search_read(
                 'crm.lead',
-                'search_read',
-                [domain],
-                {
-                    'fields': [
-                        'id',
-                        'name',
-                        'team_id',
-                        'user_id',
-                        'expected_revenue',
-                        'date_closed',
-                        'partner_id',
-                        'x_studio_tese',
-                        'date_last_stage_update',
-                        'stage_id',
-                        'x_studio_selection_field_37f_1ibrq64l3',
-                        'x_studio_segmento',
-                    ]
-                },
+                domain,
+                fields=WON_OPPORTUNITY_FIELDS,
+                raise_on_error=True,
             )
+            await prefetch_opportunity_relations(client, opportunities)
 
             logger.info(
                 f"Encontradas {len(opportunities)} oportunidades ganhas no período (sem filtro 'active')"
@@ -139,18 +155,13 @@ def get_won_opportunities(
             return []
 
 
-def prepare_opportunity_details(
-    opportunities: List[Dict], models, db: str, uid: int, password: str
-) -> List[Dict]:
+def prepare_opportunity_details(opportunities: List[Dict]) -> List[Dict]:
     """
     Prepara o objeto detalhado de oportunidades com as informações solicitadas.
 
     Args:
-        opportunities: Lista de oportunidades a serem processadas
-        models: Objeto de modelos do Odoo
-        db: Nome do banco de dados
-        uid: ID do usuário autenticado
-        password: Senha do usuário
+        opportunities: Oportunidades com o VAT do parceiro já resolvido
+            (chave 'partner_id.vat', ver get_won_opportunities)
 
     Returns:
         Lista de objetos detalhados de oportunidades
@@ -177,26 +188,8 @@ def prepare_opportunity_details(
                 float(opp.get('expected_revenue', 0))
             )
 
-            # Obter o VAT do parceiro se disponível
-            vat = None
-            if opp.get('partner_id') and opp['partner_id'][0]:
-                # Busca o parceiro para obter o VAT
-                try:
-                    partner = models.execute_kw(
-                        db,
-                        uid,
-                        password,
-                        'res.partner',
-                        'search_read',
-                        [[['id', '=', opp['partner_id'][0]]]],
-                        {'fields': ['vat']},
-                    )
-                    if partner and partner[0].get('vat'):
-                        vat = partner[0]['vat']
-                except Exception as e:
-                    logger.error(
-                        f'Erro ao buscar VAT do parceiro ID {opp["partner_id"][0]}: {e}'
-                    )
+            # VAT do parceiro, resolvido em lote no prefetch
+            vat = opp.get('partner_id.vat') or None
 
             # Garantir que commercial_partner seja string ou None
             commercial_partner = opp.get(
@@ -240,10 +233,6 @@ def prepare_opportunity_details(
 
 
 def process_opportunities_analytics(
-    models,
-    db: str,
-    uid: int,
-    password: str,
     opportunities: List[Dict],
     start_date: str,
     end_date: str,
@@ -360,9 +349,7 @@ def process_opportunities_analytics(
     }
 
 
-def get_sales_analytics(
-    models, db: str, uid: int, password: str, start_date: str, end_date: str
-) -> Dict:
+async def get_sales_analytics(start_date: str, end_date: str) -> Dict:
     """
     Obtém métricas de análise de vendas por equipe, vendedor e produto.
     Baseado apenas nos dados do CRM, sem buscar pedidos de venda.
@@ -377,8 +364,8 @@ def get_sales_analytics(
         )
 
         # Obter oportunidades ganhas no período
-        won_opportunities = get_won_opportunities(
-            models, db, uid, password, start_date_odoo, end_date_odoo
+        won_opportunities = await get_won_opportunities(
+            start_date_odoo, end_date_odoo
         )
 
         if not won_opportunities:
@@ -393,13 +380,11 @@ def get_sales_analytics(
             }
 
         # Preparar os detalhes das oportunidades - Agora passando os parâmetros corretos
-        opportunity_details = prepare_opportunity_details(
-            won_opportunities, models, db, uid, password
-        )
+        opportunity_details = prepare_opportunity_details(won_opportunities)
 
         # Processar as métricas
         analytics_data = process_opportunities_analytics(
-            models, db, uid, password, won_opportunities, start_date, end_date
+            won_opportunities, start_date, end_date
         )
 
         # Adicionar os detalhes das oportunidades ao resultado
@@ -1,42 +1,60 @@
+import logging
 from datetime import datetime
 from http import HTTPStatus
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException
 
 from app.config.settings import ODOO_DB, ODOO_PASSWORD, ODOO_URL, ODOO_USERNAME
+from app.services.async_odoo_client import AsyncOdooClient
 from app.services.authentication import authenticate_odoo, connect_to_odoo
 
-
-def get_sales_orders(models, db, uid, password, limit=100, offset=0):
+logger = logging.getLogger(__name__)
+
+SALE_ORDER_MODEL = 'sale.order'
+# Campos padrão das listagens e do detalhe de pedidos de venda
+SALE_ORDER_DEFAULT_FIELDS = [
+    'id',
+    'name',
+    'partner_id',
+    'user_id',
+    'opportunity_id',
+    'state',
+    'type_name',
+    'client_order_ref',
+    'amount_total',
+    'date_order',
+]
+SALE_ORDER_DETAIL_FIELDS = [
+    *SALE_ORDER_DEFAULT_FIELDS,
+    'amount_untaxed',
+    'amount_tax',
+    'currency_id',
+    'validity_date',
+    'commitment_date',
+    'create_date',
+    'write_date',
+]
+
+
+async def get_odoo_client() -> AsyncOdooClient:
     """
-    Obtém uma lista de pedidos de venda do Odoo.
-
-    :param limit: Limite de registros a serem retornados
-    :param offset: Deslocamento para paginação
-    :return: Lista de pedidos ou lista vazia em caso de erro
+    Obtém uma instância do cliente Odoo assíncrono.
+    Reutiliza conexões existentes quando possível.
     """
-    try:
-        sales_order_info = models.execute_kw(
-            db,
-            uid,
-            password,
-            'sale.order',
-            'search_read',
-            [[]],
-            {'limit': limit, 'offset': offset},
-        )
-        return sales_order_info
-    except Exception as e:
-        print(f'Erro ao buscar as informações dos pedidos de venda: {e}')
-        return []
+    return await AsyncOdooClient.get_instance(
+        ODOO_URL, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD
+    )
 
 
-def get_sales_order_by_id(models, db, uid, password, order_id):
+def get_sales_order_by_id(  # noqa: PLR0913
+    models, db, uid, password, order_id, *, fields=None
+):
     """
     Busca um pedido de venda específico pelo ID.
 
     :param order_id: ID do pedido a ser buscado
+    :param fields: Campos a retornar (usa SALE_ORDER_DETAIL_FIELDS se None)
     :return: Dados do pedido ou None se não encontrado
     """
     try:
@@ -47,7 +65,7 @@ def get_sales_order_by_id(models, db, uid, password, order_id):
             'sale.order',
             'search_read',
             [[['id', '=', order_id]]],
-            {'limit': 1},
+            {'fields': fields or SALE_ORDER_DETAIL_FIELDS, 'limit': 1},
         )
         return sales_order[0] if sales_order else None
     except Exception as e:
@@ -55,37 +73,88 @@ def get_sales_order_by_id(models, db, uid, password, order_id):
         return None
 
 
-def search_sales_orders_by_name(
-    models, db, uid, password, name, limit=100, offset=0
-):
+def _sales_order_name_domain(name: str) -> list:
+    """Domínio de busca de pedidos pelo nome do pedido ou do cliente."""
+    return [
+        '|',
+        ['name', 'ilike', name],  # Case-insensitive contains
+        ['partner_id.name', 'ilike', name],
+    ]
+
+
+async def get_sales_orders_page(
+    limit: int = 100,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """
-    Busca pedidos de venda pelo nome ou nome do cliente.
+    Obtém uma página de pedidos de venda usando paginação por cursor.
 
-    :param name: Termo de busca para o nome
     :param limit: Limite de registros a serem retornados
-    :param offset: Deslocamento para paginação
-    :return: Lista de pedidos encontrados ou lista vazia
+    :param offset: Deslocamento para paginação (ignorado se houver cursor)
+    :param cursor: Cursor da próxima página retornado pela chamada anterior
+    :param fields: Campos a retornar (usa SALE_ORDER_DEFAULT_FIELDS se None)
+    :return: Tupla com os pedidos e o cursor da próxima página
+    :raises ValueError: Se o cursor for inválido
     """
+    client = await get_odoo_client()
+
     try:
-        domain = [
-            '|',
-            ['name', 'ilike', name],  # Case-insensitive contains
-            ['partner_id.name', 'ilike', name],
-        ]
+        return await client.search_read_page(
+            SALE_ORDER_MODEL,
+            [],
+            fields=fields or SALE_ORDER_DEFAULT_FIELDS,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+        )
+    except ValueError:
+        raise
+    except Exception as e:
+        logger.error(
+            f'Erro ao buscar as informações dos pedidos de venda: {e}'
+        )
+        return [], None
 
-        sales_orders = models.execute_kw(
-            db,
-            uid,
-            password,
-            'sale.order',
-            'search_read',
-            [domain],
-            {'limit': limit, 'offset': offset, 'order': 'create_date desc'},
+
+async def search_sales_orders_page(
+    name: str,
+    limit: int = 100,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Busca pedidos de venda pelo nome ou nome do cliente, do mais recente
+    para o mais antigo, usando paginação por cursor.
+
+    :param name: Termo de busca para o nome
+    :param limit: Limite de registros a serem retornados
+    :param offset: Deslocamento para paginação (ignorado se houver cursor)
+    :param cursor: Cursor da próxima página retornado pela chamada anterior
+    :param fields: Campos a retornar (usa SALE_ORDER_DEFAULT_FIELDS se None)
+    :return: Tupla com os pedidos e o cursor da próxima página
+    :raises ValueError: Se o cursor for inválido
+    """
+    client = await get_odoo_client()
+
+    try:
+        # IDs decrescentes equivalem a ordenar pela data de criação
+        return await client.search_read_page(
+            SALE_ORDER_MODEL,
+            _sales_order_name_domain(name),
+            fields=fields or SALE_ORDER_DEFAULT_FIELDS,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            descending=True,
         )
-        return sales_orders
+    except ValueError:
+        raise
     except Exception as e:
-        print(f'Erro ao buscar pedidos de venda por nome: {e}')
-        return []
+        logger.error(f'Erro ao buscar pedidos de venda por nome: {e}')
+        return [], None
 
 
 def create_sales_order_in_odoo(order_data: dict, models, db, uid, password):
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from app.config.settings import (
+    ODOO_DB,
+    ODOO_PASSWORD,
+    ODOO_URL,
+    ODOO_USERNAME,
+    SCHEMA_CACHE_TTL,
+)
+from app.services.async_odoo_client import AsyncOdooClient
+from app.services.cache import cache_get, cache_set
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# Campos lidos de ir.model na listagem de modelos
+MODEL_LIST_FIELDS = ['model', 'name', 'info', 'state']
+
+# Chave da listagem de modelos no registro
+MODEL_LIST_KEY = 'models'
+
+
+async def get_odoo_client() -> AsyncOdooClient:
+    """
+    Obtém uma instância do cliente Odoo assíncrono.
+    Reutiliza conexões existentes quando possível.
+    """
+    return await AsyncOdooClient.get_instance(
+        ODOO_URL, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD
+    )
+
+
+@dataclass
+class SchemaEntry:
+    """Metadados em cache e a versão em que foram lidos."""
+
+    value: Any
+    fetched_at: float
+    version: int
+
+
+class SchemaRegistry:
+    """
+    Cache dos metadados de schema do Odoo (fields_get e ir.model).
+
+    Os metadados ficam em memória no processo. Depois do TTL, a versão em
+    cache continua sendo servida enquanto uma atualização roda em segundo
+    plano. Cada chave tem um número de versão guardado no cache
+    compartilhado: invalidar incrementa a versão, o que descarta a cópia
+    local de todos os workers e impede que uma leitura iniciada antes da
+    invalidação grave dados antigos.
+    """
+
+    def __init__(self, ttl: float = SCHEMA_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[str, SchemaEntry] = {}
+        self._inflight: Dict[Tuple[str, int], asyncio.Task] = {}
+
+    @staticmethod
+    def _version_key(key: str) -> str:
+        return f'schema:version:{key}'
+
+    async def _version(self, key: str) -> int:
+        return await cache_get(self._version_key(key)) or 0
+
+    def _fetch(
+        self,
+        key: str,
+        version: int,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> asyncio.Task:
+        """Inicia (ou reaproveita) a leitura de uma versão da chave."""
+        task = self._inflight.get((key, version))
+        if task is not None:
+            return task
+
+        async def run():
+            try:
+                value = await loader()
+                # Só grava se ninguém invalidou a chave durante a leitura
+                if await self._version(key) == version:
+                    self._entries[key] = SchemaEntry(
+                        value, time.monotonic(), version
+                    )
+                return value
+            finally:
+                self._inflight.pop((key, version), None)
+
+        task = asyncio.create_task(run())
+        self._inflight[(key, version)] = task
+        return task
+
+    def _refresh_in_background(self, key, version, loader) -> None:
+        task = self._fetch(key, version, loader)
+
+        def log_failure(done: asyncio.Task):
+            if done.cancelled() or not done.exception():
+                return
+            logger.warning(
+                f'Falha ao atualizar schema de {key}: {done.exception()}'
+            )
+            # Continua servindo a cópia atual e tenta de novo após o TTL
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.fetched_at = time.monotonic()
+
+        task.add_done_callback(log_failure)
+
+    async def _get(
+        self, key: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        version = await self._version(key)
+        entry = self._entries.get(key)
+
+        if entry is not None and entry.version == version:
+            if time.monotonic() - entry.fetched_at >= self.ttl:
+                self._refresh_in_background(key, version, loader)
+            return entry.value
+
+        return await self._fetch(key, version, loader)
+
+    async def get_fields(self, model: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Retorna o fields_get completo de um modelo.
+
+        Args:
+            model: Nome técnico do modelo
+
+        Returns:
+            Dicionário {campo: atributos}
+
+        Raises:
+            Exception: Qualquer erro do Odoo na primeira leitura do modelo
+        """
+
+        async def load():
+            client = await get_odoo_client()
+            return await client.execute_kw(model, 'fields_get', [], {})
+
+        return await self._get(f'fields:{model}', load)
+
+    async def get_models(self) -> List[Dict[str, Any]]:
+        """
+        Retorna todos os registros de ir.model.
+
+        Raises:
+            Exception: Qualquer erro do Odoo na primeira leitura
+        """
+
+        async def load():
+            client = await get_odoo_client()
+            return await client.search_read(
+                'ir.model',
+                [],
+                fields=MODEL_LIST_FIELDS,
+                raise_on_error=True,
+            )
+
+        return await self._get(MODEL_LIST_KEY, load)
+
+    async def invalidate(self, model: str) -> None:
+        """
+        Invalida o fields_get em cache de um modelo.
+
+        Args:
+            model: Nome técnico do modelo
+        """
+        await self._bump(f'fields:{model}')
+
+    async def invalidate_models(self) -> None:
+        """Invalida a listagem de ir.model em cache."""
+        await self._bump(MODEL_LIST_KEY)
+
+    async def _bump(self, key: str) -> None:
+        version = await self._version(key)
+        await cache_set(self._version_key(key), version + 1)
+        self._entries.pop(key, None)
+        logger.info(f'Schema de {key} invalidado (versão {version + 1})')
+
+
+schema_registry = SchemaRegistry()
@@ -0,0 +1,152 @@
+import contextvars
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.config.settings import SLOW_CALL_LOG_SIZE, SLOW_CALL_THRESHOLD
+
+# Métodos do Odoo cujo primeiro argumento posicional é um domínio
+DOMAIN_METHODS = frozenset({
+    'read_group',
+    'search',
+    'search_count',
+    'search_read',
+})
+
+# Condição de domínio: (campo, operador, valor)
+DOMAIN_LEAF_SIZE = 3
+
+# Escopo ASGI da requisição em andamento (None fora de uma requisição)
+request_scope: contextvars.ContextVar[Optional[Dict[str, Any]]] = (
+    contextvars.ContextVar('request_scope', default=None)
+)
+
+
+def current_route() -> Optional[str]:
+    """
+    Rota da requisição em andamento.
+
+    Returns:
+        Método e padrão da rota (ex: 'POST /crm/v3/'), o caminho se a
+        rota ainda não tiver sido resolvida ou None fora de requisições
+    """
+    scope = request_scope.get()
+    if scope is None:
+        return None
+    path = getattr(scope.get('route'), 'path', None) or scope['path']
+    return f'{scope["method"]} {path}'
+
+
+def _leaf_shape(leaf: Any) -> Any:
+    if isinstance(leaf, (list, tuple)) and len(leaf) == DOMAIN_LEAF_SIZE:
+        return (leaf[0], leaf[1], '?')
+    return leaf
+
+
+def domain_shape(domain: Any) -> str:
+    """
+    Forma de um domínio do Odoo, sem os valores.
+
+    Chamadas que só diferem nos valores (ex: o id do parceiro dentro de
+    um laço) têm a mesma forma, o que permite agrupá-las.
+
+    Examples:
+        [('partner_id', '=', 7), ('active', '=', True)] ->
+        "[('partner_id', '=', '?'), ('active', '=', '?')]"
+    """
+    if not isinstance(domain, (list, tuple)):
+        return ''
+    return repr([_leaf_shape(leaf) for leaf in domain])
+
+
+def call_shape(
+    method: str, args: Tuple[Any, ...]
+) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Forma do domínio e quantidade de ids de uma chamada execute_kw.
+
+    Args:
+        method: Método do Odoo
+        args: Argumentos do execute_kw (db, uid, senha, modelo, método,
+            args, kwargs)
+
+    Returns:
+        Tupla (forma do domínio ou None, quantidade de ids ou None)
+    """
+    # execute_kw(db, uid, senha, modelo, método, args, kwargs)
+    extra = args[5:7]
+    positional = extra[0] if extra else []
+    keywords = extra[1] if len(extra) > 1 else {}
+    if not isinstance(positional, (list, tuple)):
+        positional = []
+    if not isinstance(keywords, dict):
+        keywords = {}
+    first = positional[0] if positional else None
+    if method in DOMAIN_METHODS:
+        domain = first if first is not None else keywords.get('domain')
+        return domain_shape(domain or []), None
+    if isinstance(first, (list, tuple)):
+        return None, len(first)
+    return None, None
+
+
+class SlowCallLog:
+    """
+    Buffer circular com as chamadas ao Odoo mais lentas que o limite.
+
+    Guarda as últimas `size` chamadas que passaram de `threshold`
+    segundos, com modelo, método, forma do domínio, quantidade de
+    registros, duração e rota que fez a chamada. É escrito pelas threads
+    do executor, então as operações são protegidas por lock.
+    """
+
+    def __init__(
+        self,
+        threshold: float = SLOW_CALL_THRESHOLD,
+        size: int = SLOW_CALL_LOG_SIZE,
+    ):
+        self.threshold = threshold
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(  # noqa: PLR0913
+        self,
+        model: str,
+        method: str,
+        args: Tuple[Any, ...],
+        duration: float,
+        *,
+        records: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Registra a chamada se ela passou do limite."""
+        if self.threshold <= 0 or duration < self.threshold:
+            return
+        domain, ids = call_shape(method, args)
+        entry = {
+            'at': datetime.now(timezone.utc).isoformat(),
+            'model': model,
+            'method': method,
+            'domain': domain,
+            'ids': ids,
+            'records': records,
+            'duration': round(duration, 4),
+            'route': current_route(),
+            'error': error,
+        }
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Chamadas registradas, da mais recente para a mais antiga."""
+        with self._lock:
+            entries = list(reversed(self._entries))
+        return entries[:limit] if limit else entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+slow_calls = SlowCallLog()
@@ -2,6 +2,7 @@ import io
 import json
 import logging
 from datetime import datetime, timedelta
+from typing import Dict, List
 
 import httpx
 import pandas as pd
@@ -24,6 +25,62 @@ async def get_odoo_client() -> AsyncOdooClient:
     )
 
 
+def build_stale_report_rows(opportunities: List[Dict]) -> List[Dict]:
+    """
+    Formata as oportunidades estagnadas como linhas do relatório.
+
+    Args:
+        opportunities: Resultado do search_read de crm.lead
+
+    Returns:
+        Lista de linhas com as colunas da planilha
+    """
+    processed_data = []
+    for opp in opportunities:
+        # Lógica para formatar a data
+        write_date_str = opp.get('write_date')
+        formatted_date = 'N/A'
+        if write_date_str:
+            try:
+                # Converte a string da data para um objeto datetime
+                dt_object = datetime.strptime(write_date_str, '%Y-%m-%d %H:%M:%S')
+                # Formata o objeto datetime para o padrão DD/MM/YYYY
+                formatted_date = dt_object.strftime('%d/%m/%Y %H:%M:%S')
+            except (ValueError, TypeError):
+                # Se a data não vier no formato esperado, mantém o valor original
+                logger.warning(f"Não foi possível formatar a data '{write_date_str}' para a oportunidade ID {opp.get('id')}.")
+                formatted_date = write_date_str
+
+        # Dados atualizados para o relatório
+        processed_data.append({
+            'ID da Oportunidade': opp.get('id'),
+            'Nome': opp.get('name', 'N/A'),
+            'Vendedor': opp.get('user_id')[1] if opp.get('user_id') else 'N/A',
+            'Equipe de Vendas': opp.get('team_id')[1] if opp.get('team_id') else 'N/A',
+            'Data da Última Atualização': formatted_date, # Usa a data formatada
+        })
+    return processed_data
+
+
+def render_stale_report(rows: List[Dict]) -> io.BytesIO:
+    """
+    Gera a planilha Excel do relatório de oportunidades estagnadas.
+
+    Args:
+        rows: Linhas geradas por build_stale_report_rows
+
+    Returns:
+        Buffer com o arquivo .xlsx, posicionado no início
+    """
+    df = pd.DataFrame(rows)
+
+    excel_buffer = io.BytesIO()
+    with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
+        df.to_excel(writer, index=False, sheet_name='Oportunidades Estagnadas')
+    excel_buffer.seek(0)
+    return excel_buffer
+
+
 async def check_and_report_stale_opportunities():
     """
     Busca oportunidades no Odoo que não são atualizadas há 72 horas nos estágios 8 ou 9,
@@ -56,37 +113,8 @@ async def check_and_report_stale_opportunities():
 
         logger.info(f"Encontradas {len(opportunities)} oportunidades estagnadas.")
 
-        processed_data = []
-        for opp in opportunities:
-            # Lógica para formatar a data
-            write_date_str = opp.get('write_date')
-            formatted_date = 'N/A'
-            if write_date_str:
-                try:
-                    # Converte a string da data para um objeto datetime
-                    dt_object = datetime.strptime(write_date_str, '%Y-%m-%d %H:%M:%S')
-                    # Formata o objeto datetime para o padrão DD/MM/YYYY
-                    formatted_date = dt_object.strftime('%d/%m/%Y %H:%M:%S')
-                except (ValueError, TypeError):
-                    # Se a data não vier no formato esperado, mantém o valor original
-                    logger.warning(f"Não foi possível formatar a data '{write_date_str}' para a oportunidade ID {opp.get('id')}.")
-                    formatted_date = write_date_str
-
-            # Dados atualizados para o relatório
-            processed_data.append({
-                'ID da Oportunidade': opp.get('id'),
-                'Nome': opp.get('name', 'N/A'),
-                'Vendedor': opp.get('user_id')[1] if opp.get('user_id') else 'N/A',
-                'Equipe de Vendas': opp.get('team_id')[1] if opp.get('team_id') else 'N/A',
-                'Data da Última Atualização': formatted_date, # Usa a data formatada
-            })
-        
-        df = pd.DataFrame(processed_data)
-
-        excel_buffer = io.BytesIO()
-        with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Oportunidades Estagnadas')
-        excel_buffer.seek(0)
+        processed_data = build_stale_report_rows(opportunities)
+        excel_buffer = render_stale_report(processed_data)
         
         # Envia o relatório por e-mail
         email_data = {
@@ -1,7 +1,16 @@
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
-
-from app.config.settings import ODOO_DB, ODOO_PASSWORD, ODOO_URL, ODOO_USERNAME
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from app.config.settings import (
+    ODOO_DB,
+    ODOO_PASSWORD,
+    ODOO_STALE_CACHE_TTL,
+    ODOO_URL,
+    ODOO_USERNAME,
+    READ_CACHE_TTL,
+    READ_STALE_TTL,
+)
 from app.schemas.schemas import (
     TarefaCreate,
     TarefaUpdate,
@@ -16,6 +25,16 @@ logger = logging.getLogger(__name__)
 # Constantes
 TASK_MODEL = 'project.task'
 TASK_DEFAULT_FIELDS = ['id', 'name', 'project_id', 'stage_id', 'sale_order_id']
+TASK_STAGE_FIELDS = [
+    *TASK_DEFAULT_FIELDS,
+    'x_studio_tese_2',
+    'x_studio_segmento',
+    'partner_id',
+]
+# Número máximo de writes simultâneos nas atualizações em lote
+BULK_WRITE_CONCURRENCY = 5
+# Estágios mudam raramente; a busca por nome pode vir do cache
+STAGE_CACHE_TTL = 300
 
 
 async def get_odoo_client() -> AsyncOdooClient:
@@ -29,18 +48,25 @@ async def get_odoo_client() -> AsyncOdooClient:
 
 
 async def get_tasks_info(
-    limit: int = 100, offset: int = 0, fields: Optional[List[str]] = None
-) -> List[Dict[str, Any]]:
+    limit: int = 100,
+    offset: int = 0,
+    fields: Optional[List[str]] = None,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """
     Obtém informações de várias tarefas de forma assíncrona.
 
     Args:
         limit: Limite de registros a serem retornados
-        offset: Deslocamento para paginação
+        offset: Deslocamento para paginação (ignorado se houver cursor)
         fields: Campos específicos a serem retornados (usa padrão se None)
+        cursor: Cursor da próxima página retornado pela chamada anterior
 
     Returns:
-        Lista de tarefas ou lista vazia em caso de erro
+        Tupla com a lista de tarefas e o cursor da próxima página
+
+    Raises:
+        ValueError: Se o cursor for inválido
     """
     client = await get_odoo_client()
 
@@ -48,12 +74,19 @@ async def get_tasks_info(
         fields = TASK_DEFAULT_FIELDS
 
     try:
-        return await client.search_read(
-            TASK_MODEL, [], fields=fields, limit=limit, offset=offset
+        return await client.search_read_page(
+            TASK_MODEL,
+            [],
+            fields=fields,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
         )
+    except ValueError:
+        raise
     except Exception as e:
         logger.error(f'Erro ao buscar e ler informações das tarefas: {e}')
-        return []
+        return [], None
 
 
 async def get_task_by_id(
@@ -248,9 +281,39 @@ async def create_task_attachment(
         return None
 
 
+async def get_stage_ids_by_name(stage_name: str) -> List[int]:
+    """
+    Obtém os ids dos estágios de tarefa cujo nome contém `stage_name`.
+
+    A busca usa o ilike do Odoo e vem do cache por STAGE_CACHE_TTL
+    segundos; com o Odoo fora do ar, vale o cache de até
+    ODOO_STALE_CACHE_TTL segundos.
+
+    Args:
+        stage_name: Nome (ou parte do nome) do estágio
+
+    Returns:
+        Lista de ids dos estágios encontrados
+    """
+    client = await get_odoo_client()
+    stages = await client.search_read(
+        'project.task.type',
+        [['name', 'ilike', stage_name]],
+        fields=['id'],
+        cache_ttl=STAGE_CACHE_TTL,
+        stale_ttl=STAGE_CACHE_TTL,
+        outage_ttl=ODOO_STALE_CACHE_TTL,
+    )
+    return [stage['id'] for stage in stages]
+
+
 async def get_tasks_by_stage_name(
-    project_id: int, stage_name: str, limit: int = 100, offset: int = 0
-) -> List[Dict[str, Any]]:
+    project_id: int,
+    stage_name: str,
+    limit: int = 100,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """
     Obtém tarefas de um projeto filtradas pelo nome do estágio de forma assíncrona.
 
@@ -258,51 +321,44 @@ async def get_tasks_by_stage_name(
         project_id: ID do projeto
         stage_name: Nome do estágio para filtrar
         limit: Limite de registros a serem retornados
-        offset: Deslocamento para paginação
+        offset: Deslocamento para paginação (ignorado se houver cursor)
+        cursor: Cursor da próxima página retornado pela chamada anterior
 
     Returns:
-        Lista de tarefas ou lista vazia em caso de erro
+        Tupla com a lista de tarefas e o cursor da próxima página
+
+    Raises:
+        ValueError: Se o cursor for inválido
     """
     client = await get_odoo_client()
 
     try:
         # Primeiro, busca o ID do estágio pelo nome
-        stage_ids = await client.search_read(
-            'project.task.type', [['name', 'ilike', stage_name]], fields=['id']
-        )
+        stage_ids = await get_stage_ids_by_name(stage_name)
 
         if not stage_ids:
             logger.warning(f'Nenhum estágio encontrado com nome {stage_name}')
-            return []
-
-        # Extrai os IDs dos estágios encontrados
-        stage_ids_list = [stage['id'] for stage in stage_ids]
+            return [], None
 
         # Busca tarefas com o project_id e stage_id correspondentes
-        tasks_info = await client.search_read(
+        return await client.search_read_page(
             TASK_MODEL,
             [
                 ['project_id', '=', project_id],
-                ['stage_id', 'in', stage_ids_list],
-            ],
-            fields=[
-                'id',
-                'name',
-                'project_id',
-                'stage_id',
-                'sale_order_id',
-                'x_studio_tese_2',
-                'x_studio_segmento',
-                'partner_id',
+                ['stage_id', 'in', stage_ids],
             ],
+            fields=TASK_STAGE_FIELDS,
             limit=limit,
+            cursor=cursor,
             offset=offset,
+            cache_ttl=READ_CACHE_TTL,
+            stale_ttl=READ_STALE_TTL,
         )
-
-        return tasks_info
+    except ValueError:
+        raise
     except Exception as e:
         logger.error(f'Erro ao buscar tarefas por estágio: {e}')
-        return []
+        return [], None
 
 
 async def transfer_task_messages(
@@ -416,6 +472,133 @@ async def update_task_stage(task_id: int, stage_id: int) -> bool:
         return False
 
 
+def _many2one_id(value: Any) -> Optional[int]:
+    """Extrai o ID de um valor many2one ([id, nome]) retornado pelo Odoo."""
+    if isinstance(value, (list, tuple)) and value:
+        return value[0]
+    return value or None
+
+
+async def _bulk_write_grouped(
+    assignments: List[Tuple[int, int]], field_name: str
+) -> Dict[str, List[int]]:
+    """
+    Aplica valores de um campo many2one a várias tarefas em lote.
+
+    Valida todas as tarefas com uma única leitura, agrupa as tarefas pelo
+    valor de destino e executa um write por grupo, com no máximo
+    BULK_WRITE_CONCURRENCY writes simultâneos. Um write que falha marca
+    como falha apenas as tarefas do seu grupo.
+
+    Args:
+        assignments: Lista de pares (task_id, valor de destino)
+        field_name: Nome do campo a ser atualizado
+
+    Returns:
+        Dicionário com os IDs atualizados, inalterados, não encontrados
+        e com falha
+
+    Raises:
+        Exception: Se a leitura das tarefas no Odoo falhar
+    """
+    client = await get_odoo_client()
+
+    # Em caso de IDs repetidos, prevalece a última atribuição
+    targets = dict(assignments)
+    task_ids = list(targets)
+
+    # Uma falha na leitura não pode virar "tarefas não encontradas", e
+    # tarefas arquivadas também existem e podem ser atualizadas
+    existing = await client.search_read(
+        TASK_MODEL,
+        [['id', 'in', task_ids]],
+        fields=['id', field_name],
+        raise_on_error=True,
+        context={'active_test': False},
+    )
+    current_values = {
+        task['id']: _many2one_id(task.get(field_name)) for task in existing
+    }
+
+    result = {'updated': [], 'unchanged': [], 'not_found': [], 'failed': []}
+    groups: Dict[int, List[int]] = {}
+
+    for task_id, value in targets.items():
+        if task_id not in current_values:
+            result['not_found'].append(task_id)
+        elif current_values[task_id] == value:
+            result['unchanged'].append(task_id)
+        else:
+            groups.setdefault(value, []).append(task_id)
+
+    semaphore = asyncio.Semaphore(BULK_WRITE_CONCURRENCY)
+
+    async def write_group(value: int, ids: List[int]) -> bool:
+        async with semaphore:
+            return await client.write(TASK_MODEL, ids, {field_name: value})
+
+    # A falha de um grupo (ex: Odoo sobrecarregado) não descarta o
+    # resultado dos grupos que já foram gravados
+    outcomes = await asyncio.gather(
+        *(write_group(value, ids) for value, ids in groups.items()),
+        return_exceptions=True,
+    )
+
+    for (value, ids), outcome in zip(groups.items(), outcomes):
+        error = isinstance(outcome, BaseException)
+        if outcome and not error:
+            result['updated'].extend(ids)
+        else:
+            detail = f': {outcome}' if error else ''
+            logger.error(
+                f'Falha ao atualizar {field_name}={value} nas tarefas '
+                f'{ids}{detail}'
+            )
+            result['failed'].extend(ids)
+
+    logger.info(
+        f'Atualização em lote de {field_name}: '
+        f'{len(result["updated"])} atualizadas em {len(groups)} writes, '
+        f'{len(result["unchanged"])} inalteradas, '
+        f'{len(result["not_found"])} não encontradas, '
+        f'{len(result["failed"])} com falha'
+    )
+
+    return result
+
+
+async def update_tasks_stage_bulk(
+    updates: List[Tuple[int, int]],
+) -> Dict[str, List[int]]:
+    """
+    Atualiza o estágio de várias tarefas de forma assíncrona.
+
+    Args:
+        updates: Lista de pares (task_id, stage_id)
+
+    Returns:
+        Dicionário com os IDs atualizados, inalterados, não encontrados
+        e com falha
+    """
+    return await _bulk_write_grouped(updates, 'stage_id')
+
+
+async def update_tasks_sale_order_bulk(
+    links: List[Tuple[int, int]],
+) -> Dict[str, List[int]]:
+    """
+    Vincula várias tarefas a pedidos de venda de forma assíncrona.
+
+    Args:
+        links: Lista de pares (task_id, sale_order_id)
+
+    Returns:
+        Dicionário com os IDs atualizados, inalterados, não encontrados
+        e com falha
+    """
+    return await _bulk_write_grouped(links, 'sale_order_id')
+
+
 async def get_tasks_by_client_vat_in_projects(
     vat: str, project_ids: List[int], fields: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
@@ -445,24 +628,13 @@ async def get_tasks_by_client_vat_in_projects(
         ]
 
     try:
-        # Primeiro, buscar o(s) parceiro(s) com o CNPJ informado
-        partners = await client.search_read(
-            'res.partner', [['vat', '=', vat]], fields=['id']
-        )
-
-        if not partners:
-            logger.warning(f'Nenhum parceiro encontrado com o CNPJ {vat}')
-            return []
-
-        # Extrair os IDs dos parceiros encontrados
-        partner_ids = [partner['id'] for partner in partners]
-
-        # Buscar tarefas nos projetos especificados que tenham esses parceiros
+        # O Odoo resolve o CNPJ do parceiro no próprio domínio, sem uma
+        # busca separada em res.partner
         tasks = await client.search_read(
             TASK_MODEL,
             [
                 ['project_id', 'in', project_ids],
-                ['partner_id', 'in', partner_ids],
+                ['partner_id.vat', '=', vat],
             ],
             fields=fields,
         )
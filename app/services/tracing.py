@@ -0,0 +1,323 @@
+import contextvars
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+import urllib.request
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config.settings import (
+    TRACE_EXPORTER,
+    TRACE_FILE,
+    TRACE_OTLP_ENDPOINT,
+    TRACE_SAMPLE_RATE,
+)
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = 'api-odoo'
+
+# Tipos de span do OTLP
+SERVER = 2
+CLIENT = 3
+
+# Códigos de status do OTLP
+STATUS_UNSET = 0
+STATUS_ERROR = 2
+
+# Spans guardados à espera do exportador; acima disso são descartados
+MAX_QUEUE = 2048
+# Segundos entre envios ao exportador
+EXPORT_INTERVAL = 5.0
+
+TRACEPARENT_RE = re.compile(
+    r'^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$'
+)
+
+
+@dataclass
+class Span:
+    """Operação rastreada (requisição HTTP ou chamada ao Odoo)."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    kind: int = SERVER
+    start: int = field(default_factory=time.time_ns)
+    end: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: int = STATUS_UNSET
+    status_message: str = ''
+
+    def set_error(self, error: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = f'{type(error).__name__}: {error}'
+
+    @property
+    def traceparent(self) -> str:
+        """Cabeçalho W3C traceparent que torna este span o pai."""
+        return f'00-{self.trace_id}-{self.span_id}-01'
+
+
+# Span em andamento na requisição atual (None quando não é rastreada)
+current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    'current_span', default=None
+)
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """
+    Interpreta um cabeçalho W3C traceparent.
+
+    Returns:
+        Tupla (trace_id, id do span pai, amostrado) ou None se o
+        cabeçalho estiver ausente ou inválido
+    """
+    if not value:
+        return None
+    match = TRACEPARENT_RE.match(value.strip().lower())
+    if not match:
+        return None
+    trace_id, parent_id, flags = match.groups()
+    if trace_id == '0' * 32 or parent_id == '0' * 16:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 1)
+
+
+def _new_id(size: int) -> str:
+    return os.urandom(size).hex()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {'key': key, 'value': _otlp_value(value)}
+        for key, value in attributes.items()
+    ]
+
+
+def otlp_payload(spans: List[Span]) -> Dict[str, Any]:
+    """Monta o corpo OTLP/JSON (ExportTraceServiceRequest) dos spans."""
+    encoded = []
+    for span in spans:
+        item = {
+            'traceId': span.trace_id,
+            'spanId': span.span_id,
+            'name': span.name,
+            'kind': span.kind,
+            'startTimeUnixNano': str(span.start),
+            'endTimeUnixNano': str(span.end),
+            'attributes': _otlp_attributes(span.attributes),
+            'status': {'code': span.status},
+        }
+        if span.parent_id:
+            item['parentSpanId'] = span.parent_id
+        if span.status_message:
+            item['status']['message'] = span.status_message
+        encoded.append(item)
+    return {
+        'resourceSpans': [
+            {
+                'resource': {
+                    'attributes': _otlp_attributes({
+                        'service.name': SERVICE_NAME
+                    })
+                },
+                'scopeSpans': [
+                    {'scope': {'name': __name__}, 'spans': encoded}
+                ],
+            }
+        ]
+    }
+
+
+class FileExporter:
+    """Acrescenta cada lote de spans como uma linha OTLP/JSON no arquivo."""
+
+    def __init__(self, path: str = TRACE_FILE):
+        self.path = path
+
+    def export(self, spans: List[Span]) -> None:
+        line = json.dumps(otlp_payload(spans), ensure_ascii=False)
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write(line + '\n')
+
+
+class OtlpHttpExporter:
+    """Envia os spans a um coletor OTLP/HTTP com codificação JSON."""
+
+    def __init__(self, endpoint: str = TRACE_OTLP_ENDPOINT, timeout=10.0):
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def export(self, spans: List[Span]) -> None:
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(otlp_payload(spans)).encode(),
+            headers={'Content-Type': 'application/json'},
+            method='POST',
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+class Tracer:
+    """
+    Cria, amostra e exporta os spans do processo.
+
+    A decisão de amostragem é tomada uma vez, no span da requisição: um
+    traceparent recebido manda (amostrado ou não) e, sem ele, a
+    requisição é rastreada com probabilidade `sample_rate`. Chamadas fora
+    de uma requisição rastreada não criam spans, então com a amostragem
+    desligada o custo é uma leitura de ContextVar por chamada.
+
+    Spans concluídos vão para uma fila exportada em lotes por uma thread
+    própria, para que o exportador (arquivo ou rede) nunca atrase a
+    resposta.
+    """
+
+    def __init__(self, exporter=None, sample_rate: float = TRACE_SAMPLE_RATE):
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.dropped = 0
+        self._queue: List[Span] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def start_request_span(
+        self, name: str, traceparent: Optional[str] = None
+    ) -> Optional[Span]:
+        """
+        Abre o span de uma requisição recebida, se ela for amostrada.
+
+        Returns:
+            Span aberto ou None se a requisição não for rastreada
+        """
+        if not self.enabled:
+            return None
+        parent = parse_traceparent(traceparent)
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+        else:
+            trace_id, parent_id = _new_id(16), None
+            sampled = random.random() < self.sample_rate
+        if not sampled:
+            return None
+        return Span(name, trace_id, _new_id(8), parent_id, SERVER)
+
+    def start_span(
+        self, name: str, kind: int = CLIENT, **attributes: Any
+    ) -> Optional[Span]:
+        """Abre um span filho do span atual (None fora de um rastreio)."""
+        parent = current_span.get() if self.enabled else None
+        if parent is None:
+            return None
+        return Span(
+            name,
+            parent.trace_id,
+            _new_id(8),
+            parent.span_id,
+            kind,
+            attributes=attributes,
+        )
+
+    def finish(self, span: Span) -> None:
+        """Encerra o span e o coloca na fila de exportação."""
+        span.end = time.time_ns()
+        with self._lock:
+            if len(self._queue) >= MAX_QUEUE:
+                self.dropped += 1
+                return
+            self._queue.append(span)
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(
+                    target=self._run, name='trace-exporter', daemon=True
+                )
+                self._thread.start()
+
+    def flush(self) -> None:
+        """Exporta imediatamente os spans na fila."""
+        with self._lock:
+            spans, self._queue = self._queue, []
+        if not spans:
+            return
+        try:
+            self.exporter.export(spans)
+        except Exception as e:
+            logger.warning(f'Falha ao exportar {len(spans)} spans: {e}')
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(EXPORT_INTERVAL)
+            self.flush()
+
+    def close(self) -> None:
+        """Para a thread de exportação e envia o que restou na fila."""
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=EXPORT_INTERVAL)
+        if self.enabled:
+            self.flush()
+
+
+def create_exporter(name: str = TRACE_EXPORTER):
+    """
+    Cria o exportador de spans configurado.
+
+    Args:
+        name: '' (rastreamento desligado), 'file' ou 'otlp'
+
+    Returns:
+        Exportador ou None
+
+    Raises:
+        ValueError: Se o exportador não for suportado
+    """
+    if not name:
+        return None
+    if name == 'file':
+        return FileExporter()
+    if name == 'otlp':
+        return OtlpHttpExporter()
+    raise ValueError(f'Exportador de spans não suportado: {name}')
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Obtém o tracer do processo, criando-o no primeiro uso."""
+    global _tracer  # noqa: PLW0603
+    if _tracer is None:
+        _tracer = Tracer(create_exporter())
+    return _tracer
+
+
+def close_tracer() -> None:
+    """Encerra o tracer do processo, se tiver sido criado."""
+    global _tracer  # noqa: PLW0603
+    if _tracer is not None:
+        _tracer.close()
+        _tracer = None
@@ -0,0 +1,87 @@
+import datetime
+import decimal
+import json
+from typing import Any, override
+
+from fastapi.responses import JSONResponse
+
+from app.config.settings import TRUSTED_RESPONSES
+
+# orjson é opcional (extra 'fast-json'); sem ele usa o json padrão
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Converte os tipos que o json da biblioteca padrão não serializa."""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if hasattr(value, 'item'):  # escalares do NumPy
+        return value.item()
+    if hasattr(value, 'tolist'):  # arrays do NumPy
+        return value.tolist()
+    raise TypeError(f'Tipo não serializável em JSON: {type(value).__name__}')
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serializa conteúdo em JSON (UTF-8, sem espaços).
+
+    Usa orjson quando instalado e a biblioteca padrão caso contrário.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(',', ':'),
+        default=_default,
+    ).encode('utf-8')
+
+
+def loads(data: bytes) -> Any:
+    """Lê JSON gerado por `dumps`, com orjson quando instalado."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """Resposta JSON padrão da API, serializada por `dumps`."""
+
+    @override
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def trusted_response(content: Any, status_code: int = 200) -> Any:
+    """
+    Entrega dados já montados a partir do Odoo sem reprocessá-los.
+
+    Com TRUSTED_RESPONSES ativo, o conteúdo é serializado diretamente,
+    sem passar pelo jsonable_encoder nem pela validação do
+    response_model da rota (que continua documentando o formato no
+    OpenAPI). Com a opção desligada, o conteúdo é devolvido como está e
+    o FastAPI valida e converte normalmente.
+
+    Args:
+        content: Dicionário ou lista compostos de tipos JSON
+        status_code: Código HTTP da resposta
+
+    Returns:
+        FastJSONResponse ou o próprio conteúdo
+    """
+    if not TRUSTED_RESPONSES:
+        return content
+    return FastJSONResponse(content, status_code=status_code)
@@ -0,0 +1,469 @@
+"""
+Benchmark de carga de ponta a ponta da API contra o Odoo falso.
+
+Sobe `app.main:app` com o uvicorn em um subprocesso apontando para o
+servidor Odoo em memória de tests/fake_odoo.py (com latência injetada
+configurável) e dispara cenários realistas em níveis fixos de
+concorrência:
+
+- vat: consulta de empresa por CNPJ (/company/vat)
+- helpdesk: listagem de chamados do time (/tickets/{team_id})
+- crm_v3: cadastro inteligente de oportunidade (/opportunities/v3/)
+- analytics: relatório de vendas ganhas (/analytics/sales)
+- mix: os quatro acima nas proporções de MIX
+
+Para cada cenário e concorrência reporta requisições por segundo,
+latências p50/p95/p99, chamadas ao Odoo por requisição e o pico de
+memória (RSS) do processo da API. O resultado é gravado em JSON com o
+commit medido, e `--compare` mostra a variação em relação a um JSON de
+uma execução anterior.
+
+O Odoo falso e o gerador de carga dividem o mesmo processo; em
+concorrências altas compare execuções entre si, não com produção.
+
+Uso:
+    python -m benchmarks.load_benchmark --latency 0.02 --concurrency 1 8 32
+    python -m benchmarks.load_benchmark --compare load-abc1234.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from tests.fake_odoo import FakeOdoo
+
+# Volume de dados semeado no Odoo falso
+PARTNERS = 500
+TEAMS = 5
+TICKETS_PER_TEAM = 200
+WON_OPPORTUNITIES = 300
+
+# Período consultado no relatório de vendas (dd-mm-aaaa)
+ANALYTICS_PERIOD = {'start_date': '01-01-2024', 'end_date': '31-12-2024'}
+
+# Proporção de cada cenário no mix
+MIX = {'vat': 50, 'helpdesk': 30, 'crm_v3': 15, 'analytics': 5}
+
+# Requisições descartadas antes de cada medição
+WARMUP_REQUESTS = 20
+
+Request = Tuple[str, str, Dict[str, Any]]
+
+
+def partner_vat(index: int) -> str:
+    """CNPJ (apenas dígitos) do parceiro semeado de índice `index`."""
+    return f'{index:08d}000199'
+
+
+def seed(odoo: FakeOdoo) -> None:
+    """Popula o Odoo falso com dados no formato usado pelos serviços."""
+    odoo.seed(
+        'res.partner',
+        [
+            {
+                'name': f'Empresa {i} LTDA',
+                'vat': partner_vat(i),
+                'is_company': True,
+                'email': f'contato{i}@empresa.com',
+            }
+            for i in range(1, PARTNERS + 1)
+        ],
+    )
+    odoo.seed('res.users', [{'name': f'Vendedor {i}'} for i in range(10)])
+    odoo.seed('crm.team', [{'name': f'Equipe {i}'} for i in range(TEAMS)])
+    odoo.seed('crm.stage', [{'name': f'Estágio {i}'} for i in range(1, 11)])
+    odoo.seed(
+        'helpdesk.team', [{'name': f'Suporte {i}'} for i in range(TEAMS)]
+    )
+    odoo.seed(
+        'helpdesk.ticket',
+        [
+            {
+                'name': f'Chamado {i} do time {team}',
+                'team_id': team,
+                'partner_id': i % PARTNERS + 1,
+                'stage_id': 1,
+                'priority': str(i % 4),
+            }
+            for team in range(1, TEAMS + 1)
+            for i in range(TICKETS_PER_TEAM)
+        ],
+    )
+    odoo.seed(
+        'crm.lead',
+        [
+            {
+                'name': f'Oportunidade {i}',
+                'type': 'opportunity',
+                'stage_id': 10,
+                'team_id': i % TEAMS + 1,
+                'user_id': i % 10 + 1,
+                'partner_id': i % PARTNERS + 1,
+                'expected_revenue': 1000.0 + i,
+                'date_closed': f'2024-{i % 12 + 1:02d}-15 12:00:00',
+                'date_last_stage_update': f'2024-{i % 12 + 1:02d}-15 12:00:00',
+                'x_studio_tese': f'Tese {i % 6}',
+            }
+            for i in range(WON_OPPORTUNITIES)
+        ],
+    )
+
+
+def vat_request(rng: random.Random) -> Request:
+    vat = partner_vat(rng.randint(1, PARTNERS))
+    return 'GET', '/company/vat', {'params': {'vat': vat}}
+
+
+def helpdesk_request(rng: random.Random) -> Request:
+    team_id = rng.randint(1, TEAMS)
+    return 'GET', f'/tickets/{team_id}', {'params': {'limit': 50}}
+
+
+def crm_v3_request(rng: random.Random) -> Request:
+    # Metade dos cadastros reaproveita empresas existentes
+    index = rng.randint(1, PARTNERS * 2)
+    return (
+        'POST',
+        '/opportunities/v3/',
+        {
+            'json': {
+                'name': f'Oportunidade benchmark {index}',
+                'user_id': rng.randint(1, 10),
+                'company_name': f'Empresa {index} LTDA',
+                'company_vat': partner_vat(index),
+                'team_id': rng.randint(1, TEAMS),
+                'stage_id': 1,
+                'expected_revenue': 5000.0,
+            }
+        },
+    )
+
+
+def analytics_request(rng: random.Random) -> Request:
+    return 'GET', '/analytics/sales', {'params': ANALYTICS_PERIOD}
+
+
+SCENARIOS: Dict[str, Callable[[random.Random], Request]] = {
+    'vat': vat_request,
+    'helpdesk': helpdesk_request,
+    'crm_v3': crm_v3_request,
+    'analytics': analytics_request,
+}
+
+
+def mix_request(rng: random.Random) -> Request:
+    [name] = rng.choices(list(MIX), weights=list(MIX.values()))
+    return SCENARIOS[name](rng)
+
+
+SCENARIOS['mix'] = mix_request
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_api(odoo: FakeOdoo, port: int) -> subprocess.Popen:
+    """Sobe a API com o uvicorn apontando para o Odoo falso."""
+    env = {
+        **os.environ,
+        'ODOO_URL': odoo.url,
+        'ODOO_DB': odoo.db,
+        'ODOO_USERNAME': 'admin',
+        'ODOO_PASSWORD': 'admin',
+        'ENVIRONMENT': 'production',
+        'N_PLUS_ONE_MODE': 'off',
+        'TRACE_EXPORTER': '',
+        'MIRROR_ENABLED': 'false',
+        'CACHE_BACKEND': 'memory',
+    }
+    return subprocess.Popen(
+        [
+            sys.executable,
+            '-m',
+            'uvicorn',
+            'app.main:app',
+            '--host',
+            '127.0.0.1',
+            '--port',
+            str(port),
+            '--log-level',
+            'warning',
+            '--no-access-log',
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_ready(client: httpx.AsyncClient, process, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError('A API encerrou durante a inicialização')
+        try:
+            if (await client.get('/health/ping')).is_success:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError('A API não respondeu a tempo')
+
+
+def read_status_kb(pid: int, key: str) -> Optional[int]:
+    """Lê um campo de memória (em kB) de /proc/<pid>/status."""
+    try:
+        with open(f'/proc/{pid}/status', encoding='utf-8') as status:
+            for line in status:
+                if line.startswith(f'{key}:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def reset_peak_rss(pid: int) -> None:
+    """Zera o pico de RSS (VmHWM) do processo, se o kernel permitir."""
+    try:
+        with open(
+            f'/proc/{pid}/clear_refs', 'w', encoding='utf-8'
+        ) as clear_refs:
+            clear_refs.write('5')
+    except OSError:
+        pass
+
+
+def percentile(values: List[float], q: int) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[q - 1]
+
+
+def odoo_calls(odoo: FakeOdoo) -> int:
+    return sum(odoo.calls.values())
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    scenario: str,
+    concurrency: int,
+    duration: float,
+    seed_value: int,
+) -> Tuple[List[float], int, float]:
+    """
+    Dispara o cenário com `concurrency` clientes durante `duration` s.
+
+    Returns:
+        Latências (s) das requisições, quantidade de erros e tempo total
+    """
+    build = SCENARIOS[scenario]
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.monotonic() + duration
+
+    async def worker(rng: random.Random):
+        nonlocal errors
+        while time.monotonic() < deadline:
+            method, path, kwargs = build(rng)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, **kwargs)
+                failed = response.is_error
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(worker(random.Random(seed_value + i)) for i in range(concurrency))
+    )
+    return latencies, errors, time.perf_counter() - started
+
+
+async def run_scenario(  # noqa: PLR0913
+    client: httpx.AsyncClient,
+    odoo: FakeOdoo,
+    pid: int,
+    scenario: str,
+    *,
+    concurrency: int,
+    duration: float,
+) -> Dict[str, Any]:
+    rng = random.Random(0)
+    for _ in range(WARMUP_REQUESTS):
+        method, path, kwargs = SCENARIOS[scenario](rng)
+        await client.request(method, path, **kwargs)
+
+    reset_peak_rss(pid)
+    calls_before = odoo_calls(odoo)
+    latencies, errors, elapsed = await drive(
+        client, scenario, concurrency, duration, seed_value=concurrency
+    )
+    calls = odoo_calls(odoo) - calls_before
+    peak_kb = read_status_kb(pid, 'VmHWM')
+
+    requests = len(latencies)
+    return {
+        'scenario': scenario,
+        'concurrency': concurrency,
+        'requests': requests,
+        'errors': errors,
+        'rps': round(requests / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'odoo_rpcs_per_request': round(calls / max(requests, 1), 2),
+        'peak_rss_mb': round(peak_kb / 1024, 1) if peak_kb else None,
+    }
+
+
+def git_commit() -> Dict[str, Any]:
+    def git(*args):
+        return subprocess.run(
+            ['git', *args], capture_output=True, text=True, check=False
+        ).stdout.strip()
+
+    return {
+        'commit': git('rev-parse', 'HEAD') or None,
+        'dirty': bool(git('status', '--porcelain', '--untracked-files=no')),
+    }
+
+
+def print_row(result: Dict[str, Any], baseline=None) -> None:
+    line = (
+        f'{result["scenario"]:<10}{result["concurrency"]:>5}'
+        f'{result["rps"]:>10.1f}{result["p50_ms"]:>9.1f}'
+        f'{result["p95_ms"]:>9.1f}{result["p99_ms"]:>9.1f}'
+        f'{result["odoo_rpcs_per_request"]:>8.2f}'
+        f'{result["peak_rss_mb"] or 0:>9.1f}{result["errors"]:>6}'
+    )
+    if baseline:
+        rps = result['rps'] / baseline['rps'] - 1 if baseline['rps'] else 0
+        p95 = (
+            result['p95_ms'] / baseline['p95_ms'] - 1
+            if baseline['p95_ms']
+            else 0
+        )
+        line += f'   rps {rps:+.0%} p95 {p95:+.0%}'
+    print(line)
+
+
+async def run(args) -> Dict[str, Any]:
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as previous:
+            baseline = {
+                (r['scenario'], r['concurrency']): r
+                for r in json.load(previous)['results']
+            }
+
+    results = []
+    with FakeOdoo(latency=args.latency) as odoo:
+        seed(odoo)
+        port = free_port()
+        process = start_api(odoo, port)
+        limits = httpx.Limits(max_connections=max(args.concurrency))
+        try:
+            async with httpx.AsyncClient(
+                base_url=f'http://127.0.0.1:{port}',
+                timeout=60,
+                limits=limits,
+            ) as client:
+                await wait_ready(client, process)
+                print(
+                    f'{"cenário":<10}{"conc":>5}{"req/s":>10}{"p50":>9}'
+                    f'{"p95":>9}{"p99":>9}{"rpc/req":>8}{"rss MB":>9}'
+                    f'{"erros":>6}'
+                )
+                for scenario in args.scenarios:
+                    for concurrency in args.concurrency:
+                        result = await run_scenario(
+                            client,
+                            odoo,
+                            process.pid,
+                            scenario,
+                            concurrency=concurrency,
+                            duration=args.duration,
+                        )
+                        results.append(result)
+                        print_row(
+                            result, baseline.get((scenario, concurrency))
+                        )
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+    return {
+        **git_commit(),
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'config': {
+            'latency': args.latency,
+            'duration': args.duration,
+            'concurrency': args.concurrency,
+            'scenarios': args.scenarios,
+            'mix': MIX,
+        },
+        'results': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--latency',
+        type=float,
+        default=0.01,
+        help='Latência injetada em cada chamada ao Odoo (s)',
+    )
+    parser.add_argument(
+        '--concurrency', type=int, nargs='+', default=[1, 8, 32]
+    )
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=10,
+        help='Duração de cada medição (s)',
+    )
+    parser.add_argument(
+        '--scenarios',
+        nargs='+',
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+    )
+    parser.add_argument(
+        '--output', help='Arquivo JSON (padrão: load-<commit>.json)'
+    )
+    parser.add_argument('--compare', help='JSON de uma execução anterior')
+    args = parser.parse_args()
+    # O httpx registra cada requisição em INFO, o que distorce a medição
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+
+    report = asyncio.run(run(args))
+    output = args.output or f'load-{(report["commit"] or "local")[:7]}.json'
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+    print(f'Resultados gravados em {output}')
+
+
+if __name__ == '__main__':
+    main()
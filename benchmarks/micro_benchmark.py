@@ -0,0 +1,310 @@
+"""
+Micro-benchmarks dos caminhos quentes dos serviços.
+
+Cada caso roda uma função pura sobre um conjunto de dados sintético e
+fixo (semente constante), sem Odoo nem rede:
+
+- analytics: process_opportunities_analytics e
+  prepare_opportunity_details sobre 1k e 10k oportunidades
+- stale_report: linhas e planilha Excel do relatório de oportunidades
+  estagnadas com 1k, 10k e 100k linhas
+- selection: merge_selection_values (custom fields) com 2k opções
+- xmlrpc: serialização e leitura de uma resposta de search_read com 10k
+  registros, com o xmlrpc.client e com o decodificador rápido do
+  transporte (em linhas e em colunas)
+- clean_vat: 100k CNPJs formatados
+
+O tempo reportado é o de CPU do processo, mediana de `rounds`
+execuções (após uma de aquecimento). `--save` grava o resultado em JSON
+e `--compare` falha (código de saída 1) se algum caso ficar mais lento
+que o JSON anterior além de `--threshold`.
+
+Uso:
+    python -m benchmarks.micro_benchmark --save micro-main.json
+    python -m benchmarks.micro_benchmark --compare micro-main.json
+    python -m benchmarks.micro_benchmark -k analytics -k clean_vat
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import xmlrpc.client
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+from app.schemas.schemas import SelectionFieldValue
+from app.services import xmlrpc_decoder
+from app.services.custom_fields_service import merge_selection_values
+from app.services.sales_analytics_service import (
+    prepare_opportunity_details,
+    process_opportunities_analytics,
+)
+from app.services.stale_opportunities_service import (
+    build_stale_report_rows,
+    render_stale_report,
+)
+from app.utils.utils import clean_vat
+
+SEED = 42
+
+# Variação máxima aceita em relação ao JSON comparado (0.2 = 20%)
+DEFAULT_THRESHOLD = 0.2
+
+
+@dataclass
+class Case:
+    """Caso de benchmark: `setup` monta os dados e devolve a função."""
+
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    rounds: int = 5
+
+
+def make_leads(count: int) -> List[Dict]:
+    """Oportunidades no formato do search_read de get_won_opportunities."""
+    rng = random.Random(SEED)
+    return [
+        {
+            'id': i,
+            'name': f'Oportunidade {i}',
+            'team_id': [rng.randint(1, 8), 'Equipe'],
+            'user_id': [rng.randint(1, 40), 'Vendedor'],
+            'expected_revenue': round(rng.uniform(1000, 500000), 2),
+            'date_closed': f'2024-{rng.randint(1, 12):02d}-15 12:00:00',
+            'partner_id': [rng.randint(1, 5000), f'Cliente {i} LTDA'],
+            'partner_id.vat': f'{rng.randint(0, 10**14 - 1):014d}',
+            'x_studio_tese': rng.choice(['INSS', 'PIS/COFINS', 'ICMS', False]),
+            'date_last_stage_update': '2024-06-01 08:00:00',
+            'stage_id': [10, 'Contrato assinado'],
+            'x_studio_selection_field_37f_1ibrq64l3': rng.choice([
+                'Parceiro A',
+                'Parceiro B',
+                False,
+            ]),
+            'x_studio_segmento': rng.choice(['Indústria', 'Varejo', False]),
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def make_stale_leads(count: int) -> List[Dict]:
+    """Oportunidades no formato do relatório de oportunidades estagnadas."""
+    rng = random.Random(SEED)
+    return [
+        {
+            'id': i,
+            'name': f'Oportunidade {i}',
+            'user_id': [rng.randint(1, 40), f'Vendedor {i % 40}'],
+            'team_id': [rng.randint(1, 8), f'Equipe {i % 8}'],
+            'write_date': f'2024-05-{rng.randint(1, 28):02d} 10:00:00',
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def analytics_cases(count: int) -> List[Case]:
+    def details_setup():
+        leads = make_leads(count)
+        return lambda: prepare_opportunity_details(leads)
+
+    def metrics_setup():
+        leads = make_leads(count)
+        return lambda: process_opportunities_analytics(
+            leads, '01-01-2024', '31-12-2024'
+        )
+
+    return [
+        Case(f'analytics.details[{count}]', details_setup),
+        Case(f'analytics.metrics[{count}]', metrics_setup),
+    ]
+
+
+def stale_rows_case(count: int) -> Case:
+    def setup():
+        leads = make_stale_leads(count)
+        return lambda: build_stale_report_rows(leads)
+
+    return Case(f'stale_report.rows[{count}]', setup)
+
+
+def stale_excel_case(count: int, rounds: int) -> Case:
+    def setup():
+        rows = build_stale_report_rows(make_stale_leads(count))
+        return lambda: render_stale_report(rows)
+
+    return Case(f'stale_report.excel[{count}]', setup, rounds)
+
+
+def selection_case(existing: int, new: int) -> Case:
+    def setup():
+        current = str([(f'opt_{i}', f'Opção {i}') for i in range(existing)])
+        # Metade atualiza rótulos existentes, metade acrescenta opções
+        values = [
+            SelectionFieldValue(value=f'opt_{i}', name=f'Novo rótulo {i}')
+            for i in range(existing - new // 2, existing + new // 2)
+        ]
+        return lambda: merge_selection_values(current, values)
+
+    return Case(f'selection.merge[{existing}+{new}]', setup, rounds=20)
+
+
+def xmlrpc_cases(count: int) -> List[Case]:
+    def dumps_setup():
+        response = (make_leads(count),)
+        return lambda: xmlrpc.client.dumps(response, methodresponse=True)
+
+    def payload():
+        response = (make_leads(count),)
+        return xmlrpc.client.dumps(response, methodresponse=True).encode()
+
+    def loads_setup():
+        body = payload()
+        return lambda: xmlrpc.client.loads(body)
+
+    def fast_setup():
+        body = payload()
+        return lambda: xmlrpc_decoder.loads(body)
+
+    def columnar_setup():
+        body = payload()
+        return lambda: xmlrpc_decoder.loads(body, columnar=True)
+
+    return [
+        Case(f'xmlrpc.dumps[{count}]', dumps_setup),
+        Case(f'xmlrpc.loads[{count}]', loads_setup),
+        Case(f'xmlrpc.loads.fast[{count}]', fast_setup),
+        Case(f'xmlrpc.loads.columnar[{count}]', columnar_setup),
+    ]
+
+
+def clean_vat_case(count: int) -> Case:
+    def setup():
+        rng = random.Random(SEED)
+        vats = []
+        for _ in range(count):
+            digits = f'{rng.randint(0, 10**14 - 1):014d}'
+            vats.append(
+                f'{digits[:2]}.{digits[2:5]}.{digits[5:8]}/'
+                f'{digits[8:12]}-{digits[12:]}'
+            )
+
+        def run():
+            for vat in vats:
+                clean_vat(vat)
+
+        return run
+
+    return Case(f'clean_vat[{count}]', setup)
+
+
+CASES: List[Case] = [
+    *analytics_cases(1_000),
+    *analytics_cases(10_000),
+    stale_rows_case(10_000),
+    stale_excel_case(1_000, rounds=5),
+    stale_excel_case(10_000, rounds=3),
+    stale_excel_case(100_000, rounds=1),
+    selection_case(2_000, 200),
+    *xmlrpc_cases(10_000),
+    clean_vat_case(100_000),
+]
+
+
+def measure(case: Case) -> Dict[str, Any]:
+    run = case.setup()
+    run()  # aquecimento
+    timings = []
+    for _ in range(case.rounds):
+        started = time.process_time()
+        run()
+        timings.append(time.process_time() - started)
+    return {
+        'median': statistics.median(timings),
+        'min': min(timings),
+        'rounds': case.rounds,
+    }
+
+
+def git_commit() -> Dict[str, Any]:
+    def git(*args):
+        return subprocess.run(
+            ['git', *args], capture_output=True, text=True, check=False
+        ).stdout.strip()
+
+    return {
+        'commit': git('rev-parse', 'HEAD') or None,
+        'dirty': bool(git('status', '--porcelain', '--untracked-files=no')),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '-k',
+        dest='filters',
+        action='append',
+        help='Roda apenas os casos cujo nome contém o texto',
+    )
+    parser.add_argument('--save', help='Grava os resultados neste JSON')
+    parser.add_argument('--compare', help='JSON de uma execução anterior')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='Lentidão máxima aceita no --compare (0.2 = 20%%)',
+    )
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as previous:
+            baseline = json.load(previous)['cases']
+
+    cases = [
+        case
+        for case in CASES
+        if not args.filters or any(f in case.name for f in args.filters)
+    ]
+    results = {}
+    regressions = []
+    print(f'{"caso":<32}{"CPU ms":>12}{"mín ms":>10}')
+    for case in cases:
+        result = results[case.name] = measure(case)
+        line = (
+            f'{case.name:<32}{result["median"] * 1000:>12.2f}'
+            f'{result["min"] * 1000:>10.2f}'
+        )
+        previous = baseline.get(case.name)
+        if previous:
+            change = result['median'] / previous['median'] - 1
+            line += f'{change:>+9.0%}'
+            if change > args.threshold:
+                regressions.append(case.name)
+                line += '  REGRESSÃO'
+        print(line)
+
+    if args.save:
+        report = {
+            **git_commit(),
+            'python': platform.python_version(),
+            'cases': results,
+        }
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f'Resultados gravados em {args.save}')
+
+    if regressions:
+        print(
+            f'{len(regressions)} caso(s) acima do limite de '
+            f'{args.threshold:.0%}: {", ".join(regressions)}'
+        )
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
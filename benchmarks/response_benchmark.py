@@ -0,0 +1,118 @@
+"""
+Micro-benchmark da serialização das respostas de listagem.
+
+Mede requisições por segundo por núcleo (tempo de CPU do processo) nas
+listagens de chamados (/tickets/) e tarefas (/projects/), comparando:
+
+- baseline: JSONResponse do FastAPI com jsonable_encoder
+- fast: FastJSONResponse com TRUSTED_RESPONSES ativo
+
+O Odoo não é consultado: os serviços são substituídos por funções que
+devolvem páginas sintéticas no formato do search_read, então o número
+reflete apenas o custo da API.
+
+Uso:
+    python -m benchmarks.response_benchmark --rows 200 --requests 500
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from unittest.mock import patch
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from app.routers.helpdesk_endpoints import router as helpdesk_router
+from app.routers.tasks_endpoints import router as tasks_router
+from app.utils.responses import FastJSONResponse, orjson
+
+MODES = {
+    'baseline': (JSONResponse, False),
+    'fast': (FastJSONResponse, True),
+}
+ENDPOINTS = ['/tickets/', '/projects/']
+
+
+def make_rows(count: int):
+    """Gera registros com o formato típico de um search_read."""
+    return [
+        {
+            'id': i,
+            'name': f'Registro de teste número {i} com acentuação',
+            'team_id': [1, 'Suporte'],
+            'stage_id': [i % 7 + 1, 'Em andamento'],
+            'project_id': [25, 'Restituição'],
+            'partner_id': [1000 + i, f'Cliente {i} LTDA'],
+            'sale_order_id': False,
+            'priority': '1',
+            'expected_revenue': 1234.56 + i,
+            'create_date': '2024-05-01 10:00:00',
+            'write_date': '2024-05-02 11:30:00',
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def build_app(response_class) -> FastAPI:
+    app = FastAPI(default_response_class=response_class)
+    app.include_router(helpdesk_router)
+    app.include_router(tasks_router)
+    return app
+
+
+async def measure(app: FastAPI, path: str, requests: int) -> float:
+    """Retorna requisições por segundo de CPU para a rota."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://bench'
+    ) as client:
+        for _ in range(20):  # aquecimento
+            (await client.get(path)).raise_for_status()
+
+        started = time.process_time()
+        for _ in range(requests):
+            (await client.get(path)).raise_for_status()
+        elapsed = time.process_time() - started
+
+    return requests / elapsed
+
+
+async def run(rows: int, requests: int) -> None:
+    page = (make_rows(rows), None)
+
+    async def fake_page(*args, **kwargs):
+        return page
+
+    print(f'orjson: {"sim" if orjson else "não"}; {rows} registros/página')
+    print(f'{"rota":<12}{"modo":<10}{"req/s/núcleo":>14}')
+
+    with (
+        patch('app.routers.helpdesk_endpoints.get_helpdesk_info', fake_page),
+        patch('app.routers.tasks_endpoints.get_tasks_info', fake_page),
+    ):
+        for path in ENDPOINTS:
+            results = {}
+            for mode, (response_class, trusted) in MODES.items():
+                with patch('app.utils.responses.TRUSTED_RESPONSES', trusted):
+                    app = build_app(response_class)
+                    results[mode] = await measure(app, path, requests)
+                print(f'{path:<12}{mode:<10}{results[mode]:>14.1f}')
+            speedup = results['fast'] / results['baseline']
+            print(f'{path:<12}{"ganho":<10}{speedup:>13.2f}x')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+    # O httpx registra cada requisição em INFO, o que distorce a medição
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+    asyncio.run(run(args.rows, args.requests))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,29 @@
+import json
+import os
 from unittest.mock import Mock
 
 import pytest
 
+# Nos testes um N+1 falha a requisição (ver RpcRecorderMiddleware)
+os.environ.setdefault('N_PLUS_ONE_MODE', 'raise')
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--rpc-report',
+        metavar='PATH',
+        help='Grava em PATH as chamadas ao Odoo por rota feitas nos testes',
+    )
+
+
+def pytest_sessionfinish(session):
+    path = session.config.getoption('--rpc-report')
+    if path:
+        from app.services.rpc_recorder import route_report
+
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(route_report.report(), file, indent=2)
+
 
 @pytest.fixture
 def mock_models():
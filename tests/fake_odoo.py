@@ -0,0 +1,934 @@
+"""
+Servidor Odoo falso, em memória, para testes de integração e benchmarks.
+
+Fala XML-RPC (`/xmlrpc/2/common` e `/xmlrpc/2/object`) e JSON-RPC
+(`/jsonrpc`) sobre HTTP/1.1 com keep-alive, como o Odoo, de modo que o
+transporte, a serialização e a concorrência do cliente são exercitados
+de verdade, sem rede externa.
+
+Uso:
+
+    with FakeOdoo() as odoo:
+        odoo.seed('res.partner', [{'name': 'ACME', 'vat': '123'}])
+        client = AsyncOdooClient(odoo.url, odoo.db, 'admin', 'admin')
+
+Modelos: res.partner, crm.lead, helpdesk.ticket, project.task,
+sale.order, mail.message e ir.attachment têm campos declarados (tipos e
+relações, ver FIELDS); qualquer outro modelo é aceito com campos
+inferidos dos registros. Métodos: search, search_read, search_count,
+read, create, write, unlink, copy, read_group, fields_get, name_get,
+name_search, default_get e check_access_rights. Domínios em notação
+polonesa ('&', '|', '!') com os operadores usuais e caminhos com ponto
+(ex: 'partner_id.vat') são avaliados.
+
+Latência e falhas são injetáveis por modelo e método (ver `delay` e
+`fail`).
+"""
+
+import json
+import re
+import threading
+import time
+import xmlrpc.client
+from collections import Counter, defaultdict
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+SERVER_VERSION = {
+    'server_version': '17.0',
+    'server_version_info': [17, 0, 0, 'final', 0, ''],
+    'server_serie': '17.0',
+    'protocol_version': 1,
+}
+
+# Campos comuns a todos os modelos
+BASE_FIELDS = {
+    'id': ('integer', None),
+    'name': ('char', None),
+    'display_name': ('char', None),
+    'active': ('boolean', None),
+    'create_date': ('datetime', None),
+    'write_date': ('datetime', None),
+}
+
+# Campos declarados por modelo: nome -> (tipo, modelo relacionado)
+FIELDS = {
+    'res.partner': {
+        'email': ('char', None),
+        'phone': ('char', None),
+        'vat': ('char', None),
+        'is_company': ('boolean', None),
+        'parent_id': ('many2one', 'res.partner'),
+        'child_ids': ('one2many', 'res.partner'),
+        'city': ('char', None),
+        'country_id': ('many2one', 'res.country'),
+    },
+    'crm.lead': {
+        'type': ('selection', None),
+        'partner_id': ('many2one', 'res.partner'),
+        'user_id': ('many2one', 'res.users'),
+        'team_id': ('many2one', 'crm.team'),
+        'stage_id': ('many2one', 'crm.stage'),
+        'tag_ids': ('many2many', 'crm.tag'),
+        'expected_revenue': ('monetary', None),
+        'probability': ('float', None),
+        'date_closed': ('datetime', None),
+        'date_deadline': ('date', None),
+        'description': ('html', None),
+    },
+    'helpdesk.ticket': {
+        'team_id': ('many2one', 'helpdesk.team'),
+        'stage_id': ('many2one', 'helpdesk.stage'),
+        'user_id': ('many2one', 'res.users'),
+        'partner_id': ('many2one', 'res.partner'),
+        'priority': ('selection', None),
+        'description': ('html', None),
+        'message_ids': ('one2many', 'mail.message'),
+    },
+    'project.task': {
+        'project_id': ('many2one', 'project.project'),
+        'stage_id': ('many2one', 'project.task.type'),
+        'user_ids': ('many2many', 'res.users'),
+        'partner_id': ('many2one', 'res.partner'),
+        'description': ('html', None),
+        'message_ids': ('one2many', 'mail.message'),
+        'date_deadline': ('date', None),
+    },
+    'sale.order': {
+        'partner_id': ('many2one', 'res.partner'),
+        'user_id': ('many2one', 'res.users'),
+        'state': ('selection', None),
+        'amount_total': ('monetary', None),
+        'date_order': ('datetime', None),
+        'order_line': ('one2many', 'sale.order.line'),
+    },
+    'mail.message': {
+        'model': ('char', None),
+        'res_id': ('integer', None),
+        'body': ('html', None),
+        'message_type': ('selection', None),
+        'author_id': ('many2one', 'res.partner'),
+        'attachment_ids': ('many2many', 'ir.attachment'),
+        'date': ('datetime', None),
+    },
+    'ir.attachment': {
+        'res_model': ('char', None),
+        'res_id': ('integer', None),
+        'mimetype': ('char', None),
+        'datas': ('binary', None),
+        'file_size': ('integer', None),
+    },
+}
+
+RELATIONAL_TYPES = ('many2one', 'one2many', 'many2many')
+NUMERIC_TYPES = ('integer', 'float', 'monetary')
+
+# Códigos de Fault usados pelo Odoo
+FAULT_APPLICATION = 1
+FAULT_ACCESS_DENIED = 3
+FAULT_MISSING = 4
+
+# Agrupamentos por data do read_group: (formato do rótulo, tamanho do
+# prefixo 'AAAA-MM-DD' usado no __domain do grupo)
+DATE_GRANULARITY = {
+    'day': ('%d %b %Y', 10),
+    'month': ('%B %Y', 7),
+    'year': ('%Y', 4),
+}
+
+
+class OdooError(Exception):
+    """Erro de aplicação devolvido ao cliente como Fault / erro JSON-RPC."""
+
+    def __init__(self, message: str, code: int = FAULT_APPLICATION):
+        super().__init__(message)
+        self.code = code
+
+
+def _now() -> str:
+    return datetime.now().strftime(DATETIME_FORMAT)
+
+
+def _infer_type(value: Any) -> str:
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer'
+    if isinstance(value, float):
+        return 'float'
+    if isinstance(value, list):
+        return 'many2many'
+    return 'char'
+
+
+def _false_if_none(value: Any) -> Any:
+    # O Odoo nunca envia None (nil) pelo XML-RPC
+    if value is None:
+        return False
+    if isinstance(value, dict):
+        return {k: _false_if_none(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_false_if_none(v) for v in value]
+    return value
+
+
+def _compare(operator: str, value: Any, target: Any) -> bool:
+    if operator in ('like', 'ilike', 'not like', 'not ilike'):
+        text = '' if value is False or value is None else str(value)
+        pattern = str(target)
+        if 'ilike' in operator:
+            text, pattern = text.lower(), pattern.lower()
+        found = pattern in text
+        return not found if operator.startswith('not') else found
+    if operator in ('=like', '=ilike'):
+        text = '' if value is False or value is None else str(value)
+        # '%' e '_' são os curingas do LIKE do SQL
+        pattern = ''.join(
+            '.*' if char == '%' else '.' if char == '_' else re.escape(char)
+            for char in str(target)
+        )
+        flags = re.IGNORECASE if operator == '=ilike' else 0
+        return re.fullmatch(pattern, text, flags | re.DOTALL) is not None
+    if operator in ('<', '>', '<=', '>='):
+        if value is False or value is None or target is False:
+            return False
+        if operator == '<':
+            return value < target
+        if operator == '>':
+            return value > target
+        if operator == '<=':
+            return value <= target
+        return value >= target
+    raise OdooError(f'Operador inválido no domínio: {operator!r}')
+
+
+class FakeOdoo:
+    """
+    Odoo falso com banco em memória, servido por HTTP numa thread.
+
+    Args:
+        db: Nome do banco aceito nas chamadas
+        users: {login: senha}; o uid é a posição do usuário a partir de 2
+        latency: Atraso aplicado a toda chamada execute_kw (segundos)
+    """
+
+    def __init__(
+        self,
+        db: str = 'odoo',
+        users: Optional[Dict[str, str]] = None,
+        latency: float = 0.0,
+    ):
+        self.db = db
+        self.users = {
+            login: (uid, password)
+            for uid, (login, password) in enumerate(
+                (users or {'admin': 'admin'}).items(), start=2
+            )
+        }
+        self.latency = latency
+        self.records: Dict[str, Dict[int, Dict[str, Any]]] = defaultdict(dict)
+        self.next_id: Dict[str, int] = defaultdict(lambda: 1)
+        # Chamadas recebidas por (modelo, método)
+        self.calls: Counter = Counter()
+        self._delays: List[Tuple[Optional[str], Optional[str], float]] = []
+        self._failures: List[Dict[str, Any]] = []
+        self._lock = threading.RLock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    # Servidor
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'FakeOdoo':
+        self._server = ThreadingHTTPServer(
+            ('127.0.0.1', 0), _handler_for(self)
+        )
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever,
+            args=(0.05,),
+            name='fake-odoo',
+            daemon=True,
+        ).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'FakeOdoo':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # Dados e injeção de latência/falhas
+
+    def seed(self, model: str, records: List[Dict[str, Any]]) -> List[int]:
+        """Insere registros sem passar pelo RPC; retorna os ids."""
+        with self._lock:
+            return [self._create(model, dict(values)) for values in records]
+
+    def delay(
+        self,
+        seconds: float,
+        model: Optional[str] = None,
+        method: Optional[str] = None,
+    ) -> None:
+        """Acrescenta atraso às chamadas do modelo/método (None = todos)."""
+        self._delays.append((model, method, seconds))
+
+    def fail(
+        self,
+        kind: str = 'fault',
+        model: Optional[str] = None,
+        method: Optional[str] = None,
+        times: Optional[int] = 1,
+        message: str = 'Erro injetado',
+        seconds: float = 30.0,
+    ) -> None:
+        """
+        Faz as próximas chamadas do modelo/método falharem.
+
+        Args:
+            kind: 'fault' (erro de aplicação), 'http' (503 Service
+                Unavailable), 'disconnect' (fecha a conexão sem resposta)
+                ou 'hang' (só responde depois de `seconds`)
+            model: Modelo afetado (None = todos)
+            method: Método afetado (None = todos)
+            times: Quantidade de chamadas que falham (None = sempre)
+        """
+        self._failures.append({
+            'kind': kind,
+            'model': model,
+            'method': method,
+            'times': times,
+            'message': message,
+            'seconds': seconds,
+        })
+
+    def reset_faults(self) -> None:
+        self._delays.clear()
+        self._failures.clear()
+
+    def _matches(self, rule_model, rule_method, model, method) -> bool:
+        return rule_model in (None, model) and rule_method in (None, method)
+
+    def _injected_failure(self, model, method) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            for rule in self._failures:
+                if not self._matches(
+                    rule['model'], rule['method'], model, method
+                ):
+                    continue
+                if rule['times'] is not None:
+                    rule['times'] -= 1
+                    if rule['times'] <= 0:
+                        self._failures.remove(rule)
+                return rule
+        return None
+
+    def _injected_delay(self, model, method) -> float:
+        return self.latency + sum(
+            seconds
+            for rule_model, rule_method, seconds in self._delays
+            if self._matches(rule_model, rule_method, model, method)
+        )
+
+    # Serviços RPC
+
+    def dispatch(self, service: str, method: str, args: List[Any]) -> Any:
+        """Executa uma chamada RPC já decodificada."""
+        if service == 'common':
+            if method == 'version':
+                return SERVER_VERSION
+            if method in ('login', 'authenticate'):
+                db, login, password = args[:3]
+                return self._login(db, login, password) or False
+        elif service == 'object' and method == 'execute_kw':
+            return self.execute_kw(*args)
+        elif service == 'object' and method == 'execute':
+            # execute(db, uid, senha, modelo, método, *args)
+            return self.execute_kw(*args[:5], list(args[5:]))
+        raise OdooError(f'Método {service}.{method} não existe')
+
+    def _login(self, db, login, password) -> Optional[int]:
+        uid, expected = self.users.get(login, (None, None))
+        if db == self.db and uid and password == expected:
+            return uid
+        return None
+
+    def execute_kw(
+        self,
+        db: str,
+        uid: int,
+        password: str,
+        model: str,
+        method: str,
+        args: Optional[List[Any]] = None,
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        if db != self.db or not any(
+            uid == user_uid and password == user_password
+            for user_uid, user_password in self.users.values()
+        ):
+            raise OdooError('Access Denied', FAULT_ACCESS_DENIED)
+
+        self.calls[model, method] += 1
+        handler = getattr(self, f'_method_{method}', None)
+        if handler is None:
+            raise OdooError(
+                f"O método '{method}' não existe no modelo '{model}'"
+            )
+        with self._lock:
+            return _false_if_none(
+                handler(model, *(args or []), **(kwargs or {}))
+            )
+
+    # Campos
+
+    def _fields(self, model: str) -> Dict[str, Tuple[str, Optional[str]]]:
+        fields = {**BASE_FIELDS, **FIELDS.get(model, {})}
+        for record in self.records[model].values():
+            for name, value in record.items():
+                if name not in fields:
+                    fields[name] = (_infer_type(value), None)
+        return fields
+
+    def _field(self, model: str, name: str) -> Tuple[str, Optional[str]]:
+        """Tipo e relação de um campo, sem varrer todos os registros."""
+        declared = BASE_FIELDS.get(name) or FIELDS.get(model, {}).get(name)
+        if declared:
+            return declared
+        for record in self.records[model].values():
+            if name in record:
+                return _infer_type(record[name]), None
+        return 'char', None
+
+    def _display_name(self, model: str, record_id: int) -> str:
+        record = self.records[model].get(record_id)
+        if record and record.get('name'):
+            return str(record['name'])
+        return f'{model},{record_id}'
+
+    def _read_value(self, model: str, record: Dict[str, Any], name: str):
+        field_type, relation = self._field(model, name)
+        empty = [] if field_type in ('one2many', 'many2many') else False
+        value = record.get(name, empty)
+        if field_type == 'many2one' and value:
+            return [value, self._display_name(relation, value)]
+        if name == 'display_name':
+            return self._display_name(model, record['id'])
+        return value
+
+    def _resolve(self, model: str, record: Dict[str, Any], path: str):
+        """Valor de um caminho com ponto; x2many viram lista de valores."""
+        name, _, rest = path.partition('.')
+        if name == 'display_name':
+            return self._display_name(model, record['id'])
+        value = record.get(name, False)
+        if not rest:
+            return value
+        field_type, relation = self._field(model, name)
+        if field_type not in RELATIONAL_TYPES or not relation:
+            raise OdooError(f'Campo {name} de {model} não é relacional')
+        ids = value if isinstance(value, list) else ([value] if value else [])
+        values = [
+            self._resolve(relation, self.records[relation][i], rest)
+            for i in ids
+            if i in self.records[relation]
+        ]
+        if field_type == 'many2one':
+            return values[0] if values else False
+        return values
+
+    # Domínios
+
+    def _match_leaf(self, model: str, record: Dict[str, Any], leaf) -> bool:
+        path, operator, target = leaf
+        if not isinstance(path, str):
+            # TRUE_LEAF / FALSE_LEAF: (1, '=', 1) e (0, '=', 1)
+            return path == target
+        operator = operator.lower()
+        field_type, _ = self._field(model, path.split('.', 1)[0])
+        value = self._resolve(model, record, path)
+        if (
+            field_type == 'many2one'
+            and '.' not in path
+            and isinstance(target, str)
+        ):
+            # Como no Odoo: texto comparado com o nome do registro
+            relation = self._field(model, path)[1]
+            value = self._display_name(relation, value) if value else False
+            if operator == '=':
+                operator = '=ilike'
+        many = isinstance(value, list)
+
+        if operator in ('=', '!='):
+            if many:
+                found = target in value if target else not value
+            else:
+                found = value == target
+            return found if operator == '=' else not found
+        if operator in ('in', 'not in', 'child_of', 'parent_of'):
+            targets = target if isinstance(target, (list, tuple)) else [target]
+            if many:
+                found = bool(set(value) & set(targets))
+            else:
+                found = value in targets
+            return not found if operator == 'not in' else found
+        if many:
+            return any(_compare(operator, item, target) for item in value)
+        return _compare(operator, value, target)
+
+    def _match(self, model: str, record: Dict[str, Any], domain) -> bool:
+        stack: List[bool] = []
+        for token in reversed(domain or []):
+            if token == '&':
+                stack.append(stack.pop() & stack.pop())
+            elif token == '|':
+                stack.append(stack.pop() | stack.pop())
+            elif token == '!':
+                stack.append(not stack.pop())
+            else:
+                stack.append(self._match_leaf(model, record, token))
+        return all(stack)
+
+    def _search(
+        self,
+        model: str,
+        domain=None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        active_filter = not any(
+            isinstance(leaf, (list, tuple)) and leaf[0] == 'active'
+            for leaf in domain or []
+        )
+        records = [
+            record
+            for record in self.records[model].values()
+            if not (active_filter and record.get('active') is False)
+            and self._match(model, record, domain)
+        ]
+        records = self._order(model, records, order or 'id')
+        offset = offset or 0
+        end = offset + limit if limit else None
+        return records[offset:end]
+
+    def _order(self, model: str, records, order: str):
+        for spec in reversed([s.strip() for s in order.split(',') if s]):
+            name, _, direction = spec.partition(' ')
+            descending = direction.strip().lower() == 'desc'
+
+            def key(record, name=name):
+                value = self._read_value(model, record, name)
+                if isinstance(value, list):
+                    value = value[1] if len(value) == 2 else len(value)
+                # Valores vazios primeiro na ordem crescente, como no Odoo
+                return (value is not False, value if value else 0)
+
+            records = sorted(records, key=key, reverse=descending)
+        return records
+
+    def _project(self, model: str, record: Dict[str, Any], fields):
+        if not fields:
+            fields = list(self._fields(model))
+        result = {'id': record['id']}
+        for name in fields:
+            result[name] = self._read_value(model, record, name)
+        return result
+
+    # Escrita
+
+    def _apply_commands(self, model, name, current, commands):
+        ids = list(current or [])
+        relation = self._field(model, name)[1]
+        for command in commands:
+            if not isinstance(command, (list, tuple)):
+                ids.append(command)
+                continue
+            code = command[0]
+            if code == 0:
+                ids.append(self._create(relation, dict(command[2])))
+            elif code == 1:
+                self._write(relation, [command[1]], dict(command[2]))
+            elif code in (2, 3):
+                ids = [i for i in ids if i != command[1]]
+                if code == 2:
+                    self.records[relation].pop(command[1], None)
+            elif code == 4:
+                if command[1] not in ids:
+                    ids.append(command[1])
+            elif code == 5:
+                ids = []
+            elif code == 6:
+                ids = list(command[2])
+        return ids
+
+    def _normalize(self, model, values, current=None):
+        for name, value in list(values.items()):
+            field_type = self._field(model, name)[0]
+            if field_type in ('one2many', 'many2many') and isinstance(
+                value, list
+            ):
+                values[name] = self._apply_commands(
+                    model, name, (current or {}).get(name), value
+                )
+            elif field_type == 'many2one' and isinstance(value, list):
+                values[name] = value[0] if value else False
+        return values
+
+    def _create(self, model: str, values: Dict[str, Any]) -> int:
+        record_id = values.pop('id', None) or self.next_id[model]
+        self.next_id[model] = max(self.next_id[model], record_id + 1)
+        now = _now()
+        record = {
+            'id': record_id,
+            'active': True,
+            'create_date': now,
+            'write_date': now,
+        }
+        record.update(self._normalize(model, values))
+        self.records[model][record_id] = record
+        return record_id
+
+    def _write(self, model: str, ids, values: Dict[str, Any]) -> bool:
+        for record_id in ids:
+            record = self._get(model, record_id)
+            record.update(self._normalize(model, dict(values), record))
+            record['write_date'] = _now()
+        return True
+
+    def _get(self, model: str, record_id: int) -> Dict[str, Any]:
+        record = self.records[model].get(record_id)
+        if record is None:
+            raise OdooError(
+                f'O registro não existe ou foi excluído. '
+                f'(Registro: {model}({record_id},))',
+                FAULT_MISSING,
+            )
+        return record
+
+    # Métodos do ORM (execute_kw)
+
+    def _method_search(
+        self, model, domain=None, offset=0, limit=None, order=None, **_
+    ):
+        records = self._search(model, domain, offset, limit, order)
+        return [record['id'] for record in records]
+
+    def _method_search_count(self, model, domain=None, **_):
+        return len(self._search(model, domain))
+
+    def _method_search_read(
+        self,
+        model,
+        domain=None,
+        fields=None,
+        offset=0,
+        limit=None,
+        order=None,
+        **_,
+    ):
+        records = self._search(model, domain, offset, limit, order)
+        return [self._project(model, record, fields) for record in records]
+
+    def _method_read(self, model, ids, fields=None, **_):
+        ids = ids if isinstance(ids, list) else [ids]
+        return [
+            self._project(model, self._get(model, record_id), fields)
+            for record_id in ids
+        ]
+
+    def _method_create(self, model, values, **_):
+        if isinstance(values, list):
+            return [self._create(model, dict(v)) for v in values]
+        return self._create(model, dict(values))
+
+    def _method_write(self, model, ids, values, **_):
+        ids = ids if isinstance(ids, list) else [ids]
+        return self._write(model, ids, values)
+
+    def _method_unlink(self, model, ids, **_):
+        ids = ids if isinstance(ids, list) else [ids]
+        for record_id in ids:
+            self._get(model, record_id)
+            del self.records[model][record_id]
+        return True
+
+    def _method_copy(self, model, record_id, default=None, **_):
+        if isinstance(record_id, list):
+            record_id = record_id[0]
+        values = dict(self._get(model, record_id))
+        values.pop('id')
+        values.update(default or {})
+        return self._create(model, values)
+
+    def _method_name_get(self, model, ids, **_):
+        return [[i, self._display_name(model, i)] for i in ids]
+
+    def _method_name_search(
+        self, model, name='', args=None, operator='ilike', limit=100, **_
+    ):
+        domain = list(args or [])
+        if name:
+            domain.append(('name', operator, name))
+        records = self._search(model, domain, limit=limit)
+        return [
+            [record['id'], self._display_name(model, record['id'])]
+            for record in records
+        ]
+
+    def _method_fields_get(
+        self, model, allfields=None, attributes=None, **_
+    ):
+        result = {}
+        for name, (field_type, relation) in self._fields(model).items():
+            if allfields and name not in allfields:
+                continue
+            info = {
+                'type': field_type,
+                'string': name.replace('_', ' ').title(),
+                'readonly': name in BASE_FIELDS,
+                'required': name == 'name',
+                'store': name != 'display_name',
+            }
+            if relation:
+                info['relation'] = relation
+            if attributes:
+                info = {k: v for k, v in info.items() if k in attributes}
+            result[name] = info
+        return result
+
+    def _method_default_get(self, model, fields_list=None, **_):
+        return {}
+
+    def _method_check_access_rights(self, model, operation='read', **_):
+        return True
+
+    def _method_read_group(
+        self,
+        model,
+        domain,
+        fields,
+        groupby,
+        offset=0,
+        limit=None,
+        orderby=False,
+        lazy=True,
+        **_,
+    ):
+        groupby = [groupby] if isinstance(groupby, str) else list(groupby)
+        if lazy:
+            groupby = groupby[:1]
+        records = self._search(model, domain)
+        specs = [self._aggregate_spec(model, f) for f in fields]
+        specs = [spec for spec in specs if spec and spec[0] not in groupby]
+
+        groups: Dict[Tuple, List[Dict[str, Any]]] = {}
+        labels: Dict[Tuple, List[Tuple[Any, Any]]] = {}
+        for record in records:
+            keys = [self._group_key(model, record, g) for g in groupby]
+            key = tuple(raw for raw, _, _ in keys)
+            groups.setdefault(key, []).append(record)
+            labels.setdefault(key, [(label, leaf) for _, label, leaf in keys])
+
+        count_key = (
+            f'{groupby[0].split(":")[0]}_count'
+            if lazy and groupby
+            else '__count'
+        )
+        result = []
+        for key, members in groups.items():
+            row = {count_key: len(members)}
+            group_domain = list(domain or [])
+            for spec, (label, leaf) in zip(groupby, labels[key]):
+                row[spec] = label
+                group_domain.append(leaf)
+            for alias, function, field in specs:
+                values = [
+                    r.get(field) for r in members if r.get(field) is not False
+                ]
+                values = [v for v in values if v is not None]
+                row[alias] = _aggregate(function, values)
+            row['__domain'] = group_domain
+            result.append(row)
+
+        order = orderby or ','.join(groupby)
+        for spec in reversed([s.strip() for s in order.split(',') if s]):
+            name, _, direction = spec.partition(' ')
+
+            def key(row, name=name):
+                value = row.get(name, False)
+                if isinstance(value, list):
+                    # Grupos de many2one seguem a ordem do modelo (id)
+                    value = value[0]
+                return (value is not False, value if value else 0)
+
+            result.sort(key=key, reverse=direction.lower() == 'desc')
+        offset = offset or 0
+        return result[offset : offset + limit if limit else None]
+
+    def _aggregate_spec(self, model, spec: str):
+        # 'campo', 'campo:agg' ou 'alias:agg(campo)'
+        name, _, function = spec.partition(':')
+        field = name
+        if '(' in function:
+            function, _, field = function.rstrip(')').partition('(')
+        field_type = self._field(model, field)[0]
+        if not function:
+            if field_type not in NUMERIC_TYPES:
+                return None
+            function = 'sum'
+        return name, function, field
+
+    def _group_key(self, model, record, spec: str):
+        """Valor bruto, rótulo e folha de domínio de um agrupamento."""
+        name, _, granularity = spec.partition(':')
+        value = record.get(name, False)
+        field_type, relation = self._field(model, name)
+        if field_type == 'many2one':
+            label = value and [value, self._display_name(relation, value)]
+            return value, label, (name, '=', value)
+        if field_type in ('date', 'datetime') and value:
+            parsed = datetime.strptime(value[:10], '%Y-%m-%d')
+            fmt, size = DATE_GRANULARITY[granularity or 'month']
+            label = parsed.strftime(fmt)
+            return label, label, (name, '=like', value[:size] + '%')
+        if isinstance(value, list):
+            value = tuple(value)
+        return value, value, (name, '=', value)
+
+
+def _aggregate(function: str, values: List[Any]) -> Any:
+    if function == 'count':
+        return len(values)
+    if function == 'count_distinct':
+        return len(set(values))
+    if not values:
+        return False if function in ('min', 'max') else 0
+    if function == 'sum':
+        return sum(values)
+    if function == 'avg':
+        return sum(values) / len(values)
+    if function == 'min':
+        return min(values)
+    if function == 'max':
+        return max(values)
+    if function in ('array_agg', 'bool_or', 'bool_and'):
+        if function == 'array_agg':
+            return values
+        return any(values) if function == 'bool_or' else all(values)
+    raise OdooError(f'Função de agregação inválida: {function}')
+
+
+def _handler_for(odoo: FakeOdoo):
+    class Handler(_OdooRequestHandler):
+        pass
+
+    Handler.odoo = odoo
+    return Handler
+
+
+class _OdooRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Cabeçalhos e corpo saem em writes separados; sem isso o Nagle e o
+    # ACK atrasado somam ~40 ms a cada resposta no keep-alive
+    disable_nagle_algorithm = True
+    odoo: FakeOdoo
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.path == '/jsonrpc':
+            self._handle_jsonrpc(body)
+        elif self.path.startswith('/xmlrpc/2/'):
+            self._handle_xmlrpc(self.path.rsplit('/', 1)[1], body)
+        else:
+            self._send(404, b'Not Found', 'text/plain')
+
+    def _call(self, service: str, method: str, args: List[Any]):
+        """Aplica falhas/latência injetadas e executa a chamada."""
+        model, model_method = service, method
+        if method == 'execute_kw' and len(args) > 4:
+            model, model_method = args[3], args[4]
+        delay = self.odoo._injected_delay(model, model_method)
+        if delay:
+            time.sleep(delay)
+        failure = self.odoo._injected_failure(model, model_method)
+        if failure:
+            kind = failure['kind']
+            if kind == 'fault':
+                raise OdooError(failure['message'])
+            if kind == 'hang':
+                time.sleep(failure['seconds'])
+            elif kind == 'http':
+                self._send(503, b'Service Unavailable', 'text/plain')
+                return None, False
+            elif kind == 'disconnect':
+                self.close_connection = True
+                return None, False
+        return self.odoo.dispatch(service, method, args), True
+
+    def _handle_xmlrpc(self, service: str, body: bytes):
+        try:
+            args, method = xmlrpc.client.loads(body)
+            result, respond = self._call(service, method, list(args))
+            if not respond:
+                return
+            payload = xmlrpc.client.dumps(
+                (result,), methodresponse=True, allow_none=False
+            )
+        except OdooError as e:
+            payload = xmlrpc.client.dumps(xmlrpc.client.Fault(e.code, str(e)))
+        except Exception as e:
+            payload = xmlrpc.client.dumps(
+                xmlrpc.client.Fault(FAULT_APPLICATION, repr(e))
+            )
+        self._send(200, payload.encode(), 'text/xml')
+
+    def _handle_jsonrpc(self, body: bytes):
+        request_id = None
+        try:
+            request = json.loads(body)
+            request_id = request.get('id')
+            params = request.get('params', {})
+            result, respond = self._call(
+                params['service'], params['method'], params.get('args', [])
+            )
+            if not respond:
+                return
+            response = {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+        except Exception as e:
+            response = {
+                'jsonrpc': '2.0',
+                'id': request_id,
+                'error': {
+                    'code': 200,
+                    'message': 'Odoo Server Error',
+                    'data': {
+                        'name': type(e).__name__,
+                        'message': str(e),
+                    },
+                },
+            }
+        self._send(200, json.dumps(response).encode(), 'application/json')
+
+    def _send(self, status: int, payload: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
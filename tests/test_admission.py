@@ -0,0 +1,227 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.load_shedding import (
+    LoadSheddingMiddleware,
+    overloaded_exception_handler,
+)
+from app.services import admission
+from app.services.admission import (
+    BACKGROUND,
+    INTERACTIVE,
+    AdaptiveLimiter,
+    UpstreamOverloadedError,
+    in_background_lane,
+)
+
+
+def make_limiter(**kwargs):
+    options = {
+        'initial': 2,
+        'min_limit': 1,
+        'max_limit': 10,
+        'background_share': 0.5,
+        'queue_timeouts': {INTERACTIVE: 0.05, BACKGROUND: 1},
+    }
+    options.update(kwargs)
+    return AdaptiveLimiter(**options)
+
+
+@pytest.mark.asyncio
+async def test_limite_sobe_quando_saturado_com_latencia_estavel():
+    # Arrange
+    limiter = make_limiter()
+
+    async def call():
+        async with limiter.slot():
+            await asyncio.sleep(0.01)
+
+    # Act
+    for _ in range(10):
+        await asyncio.gather(*(call() for _ in range(int(limiter.limit))))
+
+    # Assert
+    assert limiter.limit > 2
+
+
+@pytest.mark.asyncio
+async def test_limite_cai_com_erro_de_conexao():
+    # Arrange
+    limiter = make_limiter(initial=8)
+
+    # Act
+    with pytest.raises(ConnectionResetError):
+        async with limiter.slot():
+            raise ConnectionResetError()
+
+    # Assert
+    assert limiter.limit < 8
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=0.0)
+    monkeypatch.setattr(
+        admission, 'time', SimpleNamespace(monotonic=lambda: now.value)
+    )
+    return now
+
+
+async def timed_call(limiter, clock, key, latency):
+    async with limiter.slot(key=key):
+        clock.value += latency
+
+
+@pytest.mark.asyncio
+async def test_metodo_mais_lento_nao_reduz_limite(clock):
+    # Arrange
+    limiter = make_limiter(initial=8)
+
+    # Act
+    for _ in range(5):
+        await timed_call(limiter, clock, 'res.partner.read', 0.01)
+        await timed_call(limiter, clock, 'crm.lead.read_group', 0.5)
+
+    # Assert
+    assert limiter.limit == 8
+    assert limiter.stats()['baseline_latency'] == pytest.approx({
+        'res.partner.read': 0.01,
+        'crm.lead.read_group': 0.5,
+    })
+
+
+@pytest.mark.asyncio
+async def test_limite_so_cai_com_lentidao_sustentada(clock):
+    # Arrange
+    limiter = make_limiter(initial=8)
+    await timed_call(limiter, clock, 'res.partner.read', 0.01)
+
+    # Act
+    await timed_call(limiter, clock, 'res.partner.read', 0.1)
+    await timed_call(limiter, clock, 'res.partner.read', 0.01)
+    await timed_call(limiter, clock, 'res.partner.read', 0.1)
+    isolated = limiter.limit
+    for _ in range(3):
+        await timed_call(limiter, clock, 'res.partner.read', 0.1)
+
+    # Assert
+    assert isolated == 8
+    assert limiter.limit < 8
+
+
+@pytest.mark.asyncio
+async def test_fila_interativa_tem_prioridade_sobre_background():
+    # Arrange
+    limiter = make_limiter(initial=1, max_limit=1)
+    order = []
+    release = asyncio.Event()
+
+    async def hold():
+        async with limiter.slot(INTERACTIVE):
+            await release.wait()
+
+    async def call(lane):
+        async with limiter.slot(lane):
+            order.append(lane)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    background = asyncio.create_task(call(BACKGROUND))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(call(INTERACTIVE))
+    await asyncio.sleep(0)
+
+    # Act
+    release.set()
+    await asyncio.gather(holder, background, interactive)
+
+    # Assert
+    assert order == [INTERACTIVE, BACKGROUND]
+
+
+@pytest.mark.asyncio
+async def test_espera_acima_do_prazo_descarta_chamada():
+    # Arrange
+    limiter = make_limiter(initial=1, max_limit=1)
+    release = asyncio.Event()
+
+    async def hold():
+        async with limiter.slot():
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+
+    # Act
+    with pytest.raises(UpstreamOverloadedError) as error:
+        async with limiter.slot():
+            pass
+    release.set()
+    await holder
+
+    # Assert
+    assert error.value.retry_after >= 1
+    assert limiter.stats()['shed'][INTERACTIVE] == 1
+    assert limiter.stats()['queued'][INTERACTIVE] == 0
+
+
+@pytest.mark.asyncio
+async def test_in_background_lane_usa_fila_de_background():
+    # Arrange
+    limiter = make_limiter()
+    seen = {}
+
+    async def job():
+        async with limiter.slot():
+            seen.update(limiter.stats()['inflight'])
+
+    # Act
+    await in_background_lane(job)()
+
+    # Assert
+    assert seen == {INTERACTIVE: 0, BACKGROUND: 1}
+
+
+def test_descarte_engolido_pelo_servico_vira_503():
+    # Arrange
+    limiter = make_limiter(initial=1, max_limit=1)
+    app = FastAPI()
+    app.add_middleware(LoadSheddingMiddleware)
+    app.add_exception_handler(
+        UpstreamOverloadedError, overloaded_exception_handler
+    )
+
+    async def busy_call():
+        limiter.inflight[INTERACTIVE] = 1  # Odoo todo ocupado
+        try:
+            async with limiter.slot():
+                pass
+        finally:
+            limiter.inflight[INTERACTIVE] = 0
+
+    @app.get('/swallowed')
+    async def swallowed():
+        try:
+            await busy_call()
+        except Exception:
+            return []
+        return ['ok']
+
+    @app.get('/raised')
+    async def raised():
+        await busy_call()
+
+    client = TestClient(app)
+
+    # Act
+    swallowed_response = client.get('/swallowed')
+    raised_response = client.get('/raised')
+
+    # Assert
+    for response in (swallowed_response, raised_response):
+        assert response.status_code == 503
+        assert int(response.headers['retry-after']) >= 1
@@ -0,0 +1,92 @@
+import pytest
+
+from app.services.arrow_export import (
+    build_arrow_schema,
+    encode_arrow_stream,
+    records_to_batch,
+)
+
+pa = pytest.importorskip('pyarrow')
+
+FIELD_TYPES = {
+    'id': 'integer',
+    'partner_id': 'many2one',
+    'expected_revenue': 'monetary',
+    'write_date': 'datetime',
+    'tag_ids': 'many2many',
+    'name': 'char',
+}
+FIELDS = list(FIELD_TYPES)
+RECORDS = [
+    {
+        'id': 1,
+        'partner_id': [7, 'Cliente A'],
+        'expected_revenue': 1500.5,
+        'write_date': '2024-01-01 10:00:00',
+        'tag_ids': [3, 4],
+        'name': 'Oportunidade A',
+    },
+    {
+        'id': 2,
+        'partner_id': False,
+        'expected_revenue': 0.0,
+        'write_date': False,
+        'tag_ids': [],
+        'name': False,
+    },
+]
+
+
+async def _pages(*pages):
+    for page in pages:
+        yield page
+
+
+def test_records_to_batch_separa_many2one_e_converte_datas():
+    # Arrange
+    schema, columns = build_arrow_schema(FIELDS, FIELD_TYPES)
+
+    # Act
+    batch = records_to_batch(RECORDS, schema, columns)
+
+    # Assert
+    assert batch.schema.names == [
+        'id',
+        'partner_id_id',
+        'partner_id_name',
+        'expected_revenue',
+        'write_date',
+        'tag_ids',
+        'name',
+    ]
+    assert batch.column('partner_id_id').to_pylist() == [7, None]
+    assert batch.column('partner_id_name').to_pylist() == ['Cliente A', None]
+    assert batch.schema.field('write_date').type == pa.timestamp(
+        's', tz='UTC'
+    )
+    assert batch.column('write_date')[1].as_py() is None
+    assert batch.column('name').to_pylist() == ['Oportunidade A', None]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('export_format', ['arrow', 'parquet'])
+async def test_encode_arrow_stream_gera_arquivo_legivel(export_format):
+    # Arrange
+    schema, columns = build_arrow_schema(FIELDS, FIELD_TYPES)
+
+    # Act
+    data = b''.join([
+        chunk
+        async for chunk in encode_arrow_stream(
+            _pages(RECORDS[:1], RECORDS[1:]), export_format, schema, columns
+        )
+    ])
+
+    # Assert
+    if export_format == 'parquet':
+        table = pa.parquet.read_table(pa.BufferReader(data))
+    else:
+        table = pa.ipc.open_stream(data).read_all()
+    assert table.num_rows == 2
+    assert table.column('id').to_pylist() == [1, 2]
+    assert table.column('tag_ids').to_pylist() == [[3, 4], []]
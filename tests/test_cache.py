@@ -0,0 +1,214 @@
+import asyncio
+import fnmatch
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+
+from app.services.async_odoo_client import AsyncOdooClient
+from app.services.cache import MemoryCache, RedisCache, SQLiteCache
+
+
+class FakeRedisServer:
+    """Servidor mínimo que fala RESP2, usado no lugar de um Redis real."""
+
+    def __init__(self):
+        self.data = {}
+        self.server = None
+        self.connections = 0
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(
+            self._handle, '127.0.0.1', 0
+        )
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _read_command(self, reader):
+        header = await reader.readline()
+        if not header:
+            return None
+        args = []
+        for _ in range(int(header[1:-2])):
+            length = int((await reader.readline())[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    def _alive(self, key):
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.time():
+            self.data.pop(key, None)
+            return None
+        return value
+
+    def _bulk(self, value):
+        if value is None:
+            return b'$-1\r\n'
+        return b'$%d\r\n%s\r\n' % (len(value), value)
+
+    def _execute(self, args):
+        name = args[0].upper()
+        if name == b'GET':
+            return self._bulk(self._alive(args[1]))
+        if name == b'SET':
+            options = [arg.upper() for arg in args[3:]]
+            if b'NX' in options and self._alive(args[1]) is not None:
+                return self._bulk(None)
+            expires_at = None
+            if b'PX' in options:
+                px = int(options[options.index(b'PX') + 1])
+                expires_at = time.time() + px / 1000
+            self.data[args[1]] = (args[2], expires_at)
+            return b'+OK\r\n'
+        if name == b'DEL':
+            removed = sum(self.data.pop(k, None) is not None for k in args[1:])
+            return b':%d\r\n' % removed
+        if name == b'SCAN':
+            pattern = args[args.index(b'MATCH') + 1].decode()
+            keys = [
+                k
+                for k in list(self.data)
+                if self._alive(k) is not None
+                and fnmatch.fnmatchcase(k.decode(), pattern.replace('\\', ''))
+            ]
+            reply = b'*2\r\n' + self._bulk(b'0') + b'*%d\r\n' % len(keys)
+            return reply + b''.join(self._bulk(k) for k in keys)
+        return b'-ERR comando desconhecido\r\n'
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        while True:
+            args = await self._read_command(reader)
+            if args is None:
+                break
+            writer.write(self._execute(args))
+            await writer.drain()
+        writer.close()
+
+
+@pytest_asyncio.fixture(params=['memory', 'sqlite', 'redis'])
+async def cache(request, tmp_path):
+    if request.param == 'memory':
+        yield MemoryCache(max_entries=10)
+    elif request.param == 'sqlite':
+        backend = SQLiteCache(str(tmp_path / 'cache.sqlite3'))
+        yield backend
+        await backend.close()
+    else:
+        server = FakeRedisServer()
+        port = await server.start()
+        backend = RedisCache(f'redis://127.0.0.1:{port}/0')
+        yield backend
+        await backend.close()
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_backend_grava_le_e_invalida_por_prefixo(cache):
+    # Arrange
+    value = [{'id': 1, 'name': 'ACME', 'country_id': [31, 'Brasil']}]
+
+    # Act
+    await cache.set('search_read:res.partner:a', value, ttl=60)
+    await cache.set('search_read:res.partner:b', value)
+    await cache.set('fields:crm.lead', {'name': 'char'})
+    cached = await cache.get('search_read:res.partner:a')
+    await cache.delete_prefix('search_read:')
+
+    # Assert
+    assert cached == value
+    assert await cache.get('search_read:res.partner:b') is None
+    assert await cache.get('fields:crm.lead') == {'name': 'char'}
+
+
+@pytest.mark.asyncio
+async def test_backend_expira_por_ttl(cache):
+    # Act
+    await cache.set('curto', 'valor', ttl=0.05)
+    await asyncio.sleep(0.1)
+
+    # Assert
+    assert await cache.get('curto') is None
+
+
+@pytest.mark.asyncio
+async def test_backend_add_so_grava_chave_ausente(cache):
+    # Act
+    first = await cache.add('trava', 1, ttl=0.05)
+    second = await cache.add('trava', 2, ttl=60)
+    await asyncio.sleep(0.1)
+    after_expiry = await cache.add('trava', 3, ttl=60)
+
+    # Assert
+    assert (first, second, after_expiry) == (True, False, True)
+    assert await cache.get('trava') == 3
+
+
+@pytest.mark.asyncio
+async def test_backend_guarda_apenas_json(cache):
+    # Act
+    await cache.set('tupla', {'ids': (1, 2)})
+
+    # Assert
+    assert await cache.get('tupla') == {'ids': [1, 2]}
+    with pytest.raises(TypeError):
+        await cache.set('objeto', object())
+
+
+@pytest.mark.asyncio
+async def test_redis_comandos_concorrentes_usam_pool_de_conexoes():
+    # Arrange
+    server = FakeRedisServer()
+    port = await server.start()
+    backend = RedisCache(f'redis://127.0.0.1:{port}/0', pool_size=3)
+
+    # Act
+    await asyncio.gather(*(backend.set(f'k{i}', i) for i in range(20)))
+    values = await asyncio.gather(*(backend.get(f'k{i}') for i in range(20)))
+    await backend.close()
+    await server.stop()
+
+    # Assert
+    assert values == list(range(20))
+    assert 1 < server.connections <= 3
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_descarta_menos_usado():
+    # Arrange
+    cache = MemoryCache(max_entries=2)
+    await cache.set('a', 1)
+    await cache.set('b', 2)
+    await cache.get('a')
+
+    # Act
+    await cache.set('c', 3)
+
+    # Assert
+    assert await cache.get('b') is None
+    assert await cache.get('a') == 1
+
+
+@pytest.mark.asyncio
+async def test_search_read_com_cache_ttl_evita_segunda_chamada():
+    # Arrange
+    client = AsyncOdooClient('http://odoo.test', 'db', 'user', 'pass')
+    client.execute_kw = AsyncMock(return_value=[{'id': 3}])
+
+    # Act
+    with patch('app.services.cache._cache', MemoryCache()):
+        first = await client.search_read(
+            'project.task.type', [['name', 'ilike', 'Novo']], cache_ttl=60
+        )
+        second = await client.search_read(
+            'project.task.type', [['name', 'ilike', 'Novo']], cache_ttl=60
+        )
+    client.close()
+
+    # Assert
+    assert first == second == [{'id': 3}]
+    client.execute_kw.assert_awaited_once()
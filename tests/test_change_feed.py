@@ -0,0 +1,152 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.async_odoo_client import (
+    AsyncOdooClient,
+    decode_cursor,
+    encode_cursor,
+)
+from app.services.cache import MemoryCache
+from app.services.change_feed_service import (
+    RECONCILE_CHUNK_SIZE,
+    find_deleted_ids,
+    get_changes,
+)
+from tests.fake_odoo import FakeOdoo
+
+
+def _frozen_clock(now: str):
+    """Substitui datetime no serviço por um relógio parado em `now`."""
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.strptime(now, '%Y-%m-%d %H:%M:%S').replace(
+                tzinfo=timezone.utc
+            )
+
+    return patch('app.services.change_feed_service.datetime', FrozenDatetime)
+
+
+@pytest.fixture
+def mock_client():
+    client = AsyncMock()
+    with patch(
+        'app.services.change_feed_service.get_odoo_client',
+        AsyncMock(return_value=client),
+    ):
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_get_changes_retorna_marca_dagua_do_ultimo_registro(
+    mock_client,
+):
+    # Arrange
+    mock_client.search_read_page.return_value = (
+        [
+            {'id': 3, 'write_date': '2024-01-01 10:00:00'},
+            {'id': 8, 'write_date': '2024-01-02 09:00:00'},
+        ],
+        None,
+    )
+    watermark = encode_cursor(
+        {'id': 1, 'write_date': '2024-01-01 10:00:00'}, 'write_date'
+    )
+
+    # Act
+    with patch('app.services.change_feed_service.CHANGE_FEED_LAG', 60):
+        with _frozen_clock('2024-01-03 12:00:00'):
+            result = await get_changes('crm.lead', watermark, limit=50)
+
+    # Assert
+    call = mock_client.search_read_page.await_args
+    assert call.args[1] == [['write_date', '<=', '2024-01-03 11:59:00']]
+    assert call.kwargs['cursor'] == watermark
+    assert call.kwargs['order_by'] == 'write_date'
+    assert call.kwargs['context'] == {'active_test': False}
+    assert result['has_more'] is False
+    assert decode_cursor(result['next_watermark'], 'write_date') == {
+        'k': 'write_date',
+        'd': 0,
+        'id': 8,
+        'w': '2024-01-02 09:00:00',
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_changes_sem_alteracoes_mantem_marca_dagua(mock_client):
+    # Arrange
+    mock_client.search_read_page.return_value = ([], None)
+
+    # Act
+    result = await get_changes('project.task', 'marca-atual')
+
+    # Assert
+    assert result['changes'] == []
+    assert result['next_watermark'] == 'marca-atual'
+
+
+@pytest.mark.asyncio
+async def test_get_changes_nao_pula_commit_fora_de_ordem():
+    # Arrange: a transação lenta começa antes e termina depois da rápida
+    with (
+        FakeOdoo() as odoo,
+        patch('app.services.cache._cache', MemoryCache()),
+        patch('app.services.change_feed_service.CHANGE_FEED_LAG', 60),
+    ):
+        client = AsyncOdooClient(odoo.url, odoo.db, 'admin', 'admin')
+        odoo.seed(
+            'crm.lead',
+            [{'id': 2, 'name': 'Rápida', 'write_date': '2024-01-01 12:00:20'}],
+        )
+
+        with patch(
+            'app.services.change_feed_service.get_odoo_client',
+            AsyncMock(return_value=client),
+        ):
+            # Act
+            with _frozen_clock('2024-01-01 12:00:30'):
+                first = await get_changes('crm.lead')
+            odoo.seed(
+                'crm.lead',
+                [
+                    {
+                        'id': 1,
+                        'name': 'Lenta',
+                        'write_date': '2024-01-01 12:00:10',
+                    }
+                ],
+            )
+            with _frozen_clock('2024-01-01 12:01:30'):
+                second = await get_changes('crm.lead', first['next_watermark'])
+        client.close()
+
+    # Assert
+    assert first['changes'] == []
+    assert [lead['name'] for lead in second['changes']] == ['Lenta', 'Rápida']
+
+
+@pytest.mark.asyncio
+async def test_get_changes_modelo_invalido(mock_client):
+    with pytest.raises(ValueError, match='não possui feed'):
+        await get_changes('account.move')
+
+
+@pytest.mark.asyncio
+async def test_find_deleted_ids_verifica_em_lotes(mock_client):
+    # Arrange
+    ids = list(range(1, RECONCILE_CHUNK_SIZE + 3))
+    mock_client.execute_kw.side_effect = [
+        [i for i in ids[:RECONCILE_CHUNK_SIZE] if i != 5],
+        [RECONCILE_CHUNK_SIZE + 1],
+    ]
+
+    # Act
+    deleted = await find_deleted_ids('res.partner', ids + [5])
+
+    # Assert
+    assert mock_client.execute_kw.await_count == 2
+    assert deleted == [5, RECONCILE_CHUNK_SIZE + 2]
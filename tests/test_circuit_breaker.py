@@ -0,0 +1,197 @@
+import socket
+import time
+import xmlrpc.client
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.services import circuit_breaker
+from app.services.async_odoo_client import AsyncOdooClient
+from app.services.cache import MemoryCache
+from app.services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from app.services.health_service import HealthCheck
+from app.services.retry import RetryPolicy
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.before_call()
+        breaker.record_failure()
+        breaker.release()
+
+
+@pytest.fixture
+def client():
+    client = AsyncOdooClient('http://odoo.test', 'db', 'user', 'pass')
+    client._uid = 1
+    client.retry_policy = RetryPolicy(attempts=1)
+    client.breaker = CircuitBreaker(
+        'http://odoo.test', failure_threshold=2, reset_timeout=30
+    )
+    client._rpc = Mock()
+    with patch('app.services.cache._cache', MemoryCache()):
+        yield client
+    client.close()
+
+
+def test_disjuntor_abre_apos_falhas_seguidas():
+    # Arrange
+    breaker = CircuitBreaker('odoo', failure_threshold=3, reset_timeout=30)
+
+    # Act
+    open_breaker(breaker)
+
+    # Assert
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_call()
+    assert 1 <= error.value.retry_after <= 30
+    assert breaker.stats()['rejected'] == 1
+
+
+def test_meio_aberto_deixa_passar_uma_chamada_de_teste():
+    # Arrange
+    breaker = CircuitBreaker('odoo', failure_threshold=1, reset_timeout=0.01)
+    open_breaker(breaker)
+    time.sleep(0.02)
+
+    # Act
+    breaker.before_call()
+
+    # Assert
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    breaker.release()
+    assert breaker.state == CLOSED
+
+
+def test_falha_na_chamada_de_teste_reabre():
+    # Arrange
+    breaker = CircuitBreaker('odoo', failure_threshold=3, reset_timeout=0.01)
+    open_breaker(breaker)
+    time.sleep(0.02)
+    breaker.before_call()
+    breaker.reset_timeout = 30
+
+    # Act
+    breaker.record_failure()
+    breaker.release()
+
+    # Assert
+    assert breaker.state == OPEN
+
+
+@pytest.mark.asyncio
+async def test_disjuntor_aberto_falha_sem_chamar_o_odoo(client):
+    # Arrange
+    client._rpc.side_effect = ConnectionRefusedError()
+    for _ in range(2):
+        with pytest.raises(ConnectionRefusedError):
+            await client.execute_kw('res.partner', 'read', [[1]])
+
+    # Act
+    with pytest.raises(CircuitOpenError):
+        await client.execute_kw('res.partner', 'read', [[1]])
+
+    # Assert
+    assert client._rpc.call_count == 2
+    assert client.breaker.state == OPEN
+
+
+@pytest.mark.asyncio
+async def test_fault_nao_conta_como_falha(client):
+    # Arrange
+    client._rpc.side_effect = xmlrpc.client.Fault(1, 'AccessError')
+
+    # Act
+    for _ in range(3):
+        with pytest.raises(xmlrpc.client.Fault):
+            await client.execute_kw('res.partner', 'read', [[1]])
+
+    # Assert
+    assert client.breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_leitura_em_cache_servida_com_disjuntor_aberto(client):
+    # Arrange
+    client._rpc.return_value = [{'id': 1, 'name': 'Novo'}]
+    first = await client.search_read(
+        'project.task.type', [], cache_ttl=0.01, outage_ttl=60
+    )
+    time.sleep(0.02)
+    open_breaker(client.breaker)
+
+    # Act
+    stale = await client.search_read(
+        'project.task.type', [], cache_ttl=0.01, outage_ttl=60
+    )
+
+    # Assert
+    assert stale == first
+    assert client._rpc.call_count == 1
+    with pytest.raises(CircuitOpenError):
+        await client.search_read('res.partner', [])
+
+
+@pytest.mark.asyncio
+async def test_sem_outage_ttl_disjuntor_aberto_nao_serve_alem_do_limite(
+    client,
+):
+    # Arrange
+    client._rpc.return_value = [{'id': 1, 'name': 'Novo'}]
+    await client.search_read(
+        'helpdesk.ticket', [], cache_ttl=0.01, stale_ttl=0.01
+    )
+    time.sleep(0.03)
+    open_breaker(client.breaker)
+
+    # Act / Assert
+    with pytest.raises(CircuitOpenError):
+        await client.search_read(
+            'helpdesk.ticket', [], cache_ttl=0.01, stale_ttl=0.01
+        )
+
+
+def test_tempo_limite_interrompe_servidor_que_nao_responde():
+    # Arrange
+    # O socket aceita a conexão (backlog) mas nunca responde
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    host, port = server.getsockname()
+    client = AsyncOdooClient(f'http://{host}:{port}', 'db', 'user', 'pass')
+
+    # Act
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        client._rpc('object', 'execute_kw', 0.2, 'db', 1, 'pass')
+    elapsed = time.monotonic() - started
+
+    # Assert
+    assert elapsed < 2
+    client.close()
+    server.close()
+
+
+def test_health_expoe_estado_do_disjuntor():
+    # Arrange
+    breaker = CircuitBreaker('http://odoo.test', failure_threshold=1)
+    open_breaker(breaker)
+
+    # Act
+    with patch.dict(circuit_breaker._breakers, {'http://odoo.test': breaker}):
+        health = HealthCheck().get_health_check()
+
+    # Assert
+    assert health['status'] == 'degraded'
+    assert health['odoo']['http://odoo.test']['state'] == OPEN
@@ -0,0 +1,50 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers.export_endpoints import router
+from app.services.export_service import check_export_fields
+
+SCHEMA = {'name': {'type': 'char'}, 'vat': {'type': 'char'}}
+
+
+@pytest.fixture
+def mock_registry():
+    with patch('app.services.export_service.schema_registry') as registry:
+        registry.get_fields = AsyncMock(return_value=SCHEMA)
+        yield registry
+
+
+@pytest.mark.asyncio
+async def test_check_export_fields_lista_todos_os_invalidos(mock_registry):
+    # Act / Assert
+    with pytest.raises(ValueError, match='nome, cnpj'):
+        await check_export_fields('res.partner', ['id', 'nome', 'vat', 'cnpj'])
+
+
+@pytest.mark.asyncio
+async def test_check_export_fields_sem_schema_nao_bloqueia(mock_registry):
+    # Arrange
+    mock_registry.get_fields.side_effect = ConnectionRefusedError()
+
+    # Act / Assert
+    await check_export_fields('res.partner', ['nome'])
+
+
+def test_exportacao_com_campo_invalido_retorna_400(mock_registry):
+    # Arrange
+    app = FastAPI()
+    app.include_router(router)
+
+    # Act
+    with patch('app.routers.export_endpoints.iter_model_pages') as pages:
+        response = TestClient(app).get(
+            '/export/res.partner', params={'fields': ['name', 'nome']}
+        )
+
+    # Assert
+    assert response.status_code == 400
+    assert 'nome' in response.json()['detail']
+    pages.assert_not_called()
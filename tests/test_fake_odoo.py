@@ -0,0 +1,237 @@
+import asyncio
+import json
+import time
+import urllib.request
+import xmlrpc.client
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.async_odoo_client import AsyncOdooClient
+from app.services.cache import MemoryCache
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.retry import RetryPolicy
+from tests.fake_odoo import FakeOdoo
+
+
+@pytest.fixture
+def odoo():
+    with FakeOdoo() as odoo:
+        acme, globex = odoo.seed(
+            'res.partner',
+            [
+                {'name': 'ACME', 'vat': '11.111.111/0001-11'},
+                {'name': 'Globex', 'vat': '22.222.222/0001-22'},
+            ],
+        )
+        odoo.seed('crm.stage', [{'name': 'Novo'}, {'name': 'Ganho'}])
+        odoo.seed(
+            'crm.lead',
+            [
+                {
+                    'name': 'Lead 1',
+                    'partner_id': acme,
+                    'stage_id': 1,
+                    'expected_revenue': 100.0,
+                },
+                {
+                    'name': 'Lead 2',
+                    'partner_id': acme,
+                    'stage_id': 2,
+                    'expected_revenue': 250.0,
+                },
+                {
+                    'name': 'Lead 3',
+                    'partner_id': globex,
+                    'stage_id': 2,
+                    'expected_revenue': 50.0,
+                    'active': False,
+                },
+            ],
+        )
+        yield odoo
+
+
+@pytest.fixture
+def client(odoo):
+    client = AsyncOdooClient(odoo.url, odoo.db, 'admin', 'admin')
+    client.breaker = CircuitBreaker(odoo.url)
+    client.retry_policy = RetryPolicy(base_delay=0.01, max_delay=0.01)
+    with patch('app.services.cache._cache', MemoryCache()):
+        yield client
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_autentica_e_le_com_dominio(client):
+    # Act
+    uid = await client.authenticate()
+    leads = await client.search_read(
+        'crm.lead',
+        [
+            '|',
+            ('partner_id.vat', '=like', '11.%'),
+            ('stage_id', '=', 'ganho'),
+        ],
+        fields=['name', 'partner_id', 'stage_id'],
+        order='id desc',
+    )
+
+    # Assert
+    assert uid == 2
+    # O registro arquivado (Lead 3) fica de fora, como no Odoo
+    assert leads == [
+        {
+            'id': 2,
+            'name': 'Lead 2',
+            'partner_id': [1, 'ACME'],
+            'stage_id': [2, 'Ganho'],
+        },
+        {
+            'id': 1,
+            'name': 'Lead 1',
+            'partner_id': [1, 'ACME'],
+            'stage_id': [1, 'Novo'],
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_group_soma_por_estagio(client):
+    # Act
+    groups = await client.execute_kw(
+        'crm.lead',
+        'read_group',
+        [
+            [('active', 'in', [True, False])],
+            ['expected_revenue'],
+            ['stage_id'],
+        ],
+    )
+
+    # Assert
+    assert [
+        (g['stage_id'], g['stage_id_count'], g['expected_revenue'])
+        for g in groups
+    ] == [([1, 'Novo'], 1, 100.0), ([2, 'Ganho'], 2, 300.0)]
+
+
+@pytest.mark.asyncio
+async def test_escritas_de_ponta_a_ponta(client, odoo):
+    # Act
+    lead_id = await client.create('crm.lead', {'name': 'Novo lead'})
+    await client.write('crm.lead', [lead_id], {'tag_ids': [(6, 0, [7, 8])]})
+    [lead] = await client.execute_kw(
+        'crm.lead', 'read', [[lead_id]], {'fields': ['tag_ids']}
+    )
+    await client.unlink('crm.lead', [lead_id])
+
+    # Assert
+    assert lead == {'id': lead_id, 'tag_ids': [7, 8]}
+    assert lead_id not in odoo.records['crm.lead']
+
+
+@pytest.mark.asyncio
+async def test_leitura_repete_apos_503_injetado(client, odoo):
+    # Arrange
+    odoo.fail('http', model='res.partner', method='search_read', times=2)
+
+    # Act
+    partners = await client.search_read('res.partner', [], fields=['name'])
+
+    # Assert
+    assert [p['name'] for p in partners] == ['ACME', 'Globex']
+    assert odoo.calls['res.partner', 'search_read'] == 1
+
+
+@pytest.mark.asyncio
+async def test_fault_injetado_nao_e_repetido(client, odoo):
+    # Arrange
+    odoo.fail('fault', model='res.partner', message='Regra de acesso')
+
+    # Act / Assert
+    with pytest.raises(xmlrpc.client.Fault, match='Regra de acesso'):
+        await client.execute_kw('res.partner', 'search_read', [[]])
+
+
+@pytest.mark.asyncio
+async def test_latencia_injetada_e_chamadas_concorrentes(client, odoo):
+    # Arrange
+    odoo.delay(0.2, model='res.partner')
+    await client.authenticate()
+
+    # Act
+    started = time.monotonic()
+    results = await asyncio.gather(*(
+        client.execute_kw('res.partner', 'search_count', [[]])
+        for _ in range(5)
+    ))
+    elapsed = time.monotonic() - started
+
+    # Assert
+    assert results == [2] * 5
+    # Conexões paralelas: bem menos que 5 x 0.2s
+    assert 0.2 <= elapsed < 0.6
+
+
+def test_json_rpc(odoo):
+    # Arrange
+    def call(service, method, *args):
+        body = json.dumps({
+            'jsonrpc': '2.0',
+            'method': 'call',
+            'params': {'service': service, 'method': method, 'args': args},
+            'id': 1,
+        }).encode()
+        request = urllib.request.Request(
+            f'{odoo.url}/jsonrpc',
+            data=body,
+            headers={'Content-Type': 'application/json'},
+        )
+        with urllib.request.urlopen(request) as response:
+            return json.load(response)
+
+    # Act
+    uid = call('common', 'login', 'odoo', 'admin', 'admin')['result']
+    count = call(
+        'object',
+        'execute_kw',
+        'odoo',
+        uid,
+        'admin',
+        'res.partner',
+        'search_count',
+        [[('name', 'ilike', 'acm')]],
+    )
+    denied = call(
+        'object', 'execute_kw', 'odoo', uid, 'x', 'res.partner', 'read', [1]
+    )
+
+    # Assert
+    assert count['result'] == 1
+    assert denied['error']['data']['message'] == 'Access Denied'
+
+
+def test_endpoint_da_api_contra_o_odoo_falso(client, odoo):
+    # Arrange
+    odoo.seed('helpdesk.team', [{'name': 'Suporte'}])
+    odoo.seed(
+        'helpdesk.ticket',
+        [
+            {'name': f'Chamado {i}', 'team_id': 1, 'partner_id': 1}
+            for i in range(3)
+        ],
+    )
+    get_client = AsyncMock(return_value=client)
+
+    # Act
+    with patch('app.services.helpdesk_service.get_odoo_client', get_client):
+        response = TestClient(app).get('/tickets/1', params={'limit': 2})
+
+    # Assert
+    assert response.status_code == 200
+    tickets = response.json()['chamados']
+    assert [t['name'] for t in tickets] == ['Chamado 0', 'Chamado 1']
+    assert tickets[0]['team_id'] == [1, 'Suporte']
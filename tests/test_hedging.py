@@ -0,0 +1,128 @@
+import asyncio
+import itertools
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.async_odoo_client import AsyncOdooClient
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.hedging import Hedger
+
+CALL = 'res.partner.search_read'
+
+
+def warmed_hedger(**kwargs):
+    options = {'enabled': True, 'budget': 0.5, 'min_samples': 10}
+    options.update(kwargs)
+    hedger = Hedger(**options)
+    for _ in range(20):
+        hedger.observe(CALL, 0.01)
+    return hedger
+
+
+@pytest.fixture
+def client():
+    client = AsyncOdooClient('http://odoo.test', 'db', 'user', 'pass')
+    client._uid = 1
+    client.breaker = CircuitBreaker('http://odoo.test')
+    client.hedger = warmed_hedger()
+    yield client
+    client.close()
+
+
+def slow_first_call(slow=0.5):
+    counter = itertools.count()
+
+    def rpc(*args):
+        if next(counter) == 0:
+            time.sleep(slow)
+            return ['primeira']
+        return ['copia']
+
+    return Mock(side_effect=rpc)
+
+
+def test_sem_amostras_suficientes_nao_ha_hedge():
+    # Arrange
+    hedger = Hedger(enabled=True, min_samples=10)
+    for _ in range(9):
+        hedger.observe(CALL, 0.01)
+
+    # Act / Assert
+    assert hedger.delay(CALL) is None
+
+
+def test_espera_e_o_p95_das_latencias():
+    # Arrange
+    hedger = Hedger(enabled=True, min_samples=10)
+    for latency in range(1, 101):
+        hedger.observe(CALL, latency / 100)
+
+    # Act
+    delay = hedger.delay(CALL)
+
+    # Assert
+    assert delay == 0.95
+
+
+def test_orcamento_limita_as_copias():
+    # Arrange
+    hedger = warmed_hedger(budget=0.1)
+
+    # Act
+    allowed = 0
+    for _ in range(100):
+        hedger.delay(CALL)
+        allowed += hedger.try_spend()
+
+    # Assert
+    # Fichas iniciais mais 10% das leituras
+    assert allowed <= 10 + 100 * 0.1 + 1
+    assert hedger.stats()['denied'] > 0
+
+
+@pytest.mark.asyncio
+async def test_copia_responde_antes_da_tentativa_lenta(client):
+    # Arrange
+    client._rpc = slow_first_call()
+
+    # Act
+    started = time.monotonic()
+    result = await client.execute_kw('res.partner', 'search_read', [[]])
+    elapsed = time.monotonic() - started
+
+    # Assert
+    assert result == ['copia']
+    assert elapsed < 0.4
+    assert client.hedger.stats()['hedged'] == 1
+    assert client.hedger.stats()['win_rate'] == 1.0
+    await asyncio.gather(*client._background_tasks)
+
+
+@pytest.mark.asyncio
+async def test_escritas_nunca_sao_duplicadas(client):
+    # Arrange
+    client._rpc = slow_first_call(slow=0.1)
+
+    # Act
+    result = await client.execute_kw('res.partner', 'write', [[1], {}])
+
+    # Assert
+    assert result == ['primeira']
+    assert client._rpc.call_count == 1
+    assert client.hedger.stats()['hedged'] == 0
+
+
+@pytest.mark.asyncio
+async def test_hedging_desligado_por_padrao(client):
+    # Arrange
+    client.hedger = warmed_hedger(enabled=False)
+    client._rpc = slow_first_call(slow=0.1)
+
+    # Act
+    result = await client.execute_kw('res.partner', 'search_read', [[]])
+
+    # Assert
+    assert result == ['primeira']
+    assert client._rpc.call_count == 1
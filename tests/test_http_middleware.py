@@ -0,0 +1,183 @@
+import gzip
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.main import app as main_app
+from app.middleware import compression
+from app.middleware.compression import CompressionMiddleware, choose_encoding
+from app.middleware.conditional import ConditionalGetMiddleware
+from app.services.cache import MemoryCache
+
+ROWS = [{'id': i, 'name': f'Empresa {i}'} for i in range(200)]
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def client(calls):
+    app = FastAPI()
+
+    @app.get('/company/')
+    async def list_companies():
+        calls.append('list')
+        return {'companies': ROWS}
+
+    @app.get('/company/small')
+    async def small():
+        return {'ok': True}
+
+    @app.post('/company/')
+    async def create_company():
+        return {'company_id': 1}
+
+    @app.get('/export/')
+    async def export():
+        async def lines():
+            for row in ROWS:
+                yield f'{row["id"]},{row["name"]}\n'
+
+        return StreamingResponse(lines(), media_type='text/csv')
+
+    app.add_middleware(ConditionalGetMiddleware, ttl=30)
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    with patch('app.services.cache._cache', MemoryCache()):
+        yield TestClient(app)
+
+
+@pytest.mark.parametrize(
+    'header, expected',
+    [
+        ('gzip, deflate, br', 'br'),
+        ('gzip', 'gzip'),
+        ('br;q=0, gzip;q=0.5', 'gzip'),
+        ('*', 'br'),
+        ('identity', None),
+        ('', None),
+    ],
+)
+def test_choose_encoding(header, expected):
+    if expected == 'br' and compression.brotli is None:
+        expected = 'gzip'
+
+    assert choose_encoding(header) == expected
+
+
+def test_gzip_acima_do_limite_e_sem_compressao_abaixo(client):
+    # Act
+    large = client.get('/company/', headers={'Accept-Encoding': 'gzip'})
+    small = client.get('/company/small', headers={'Accept-Encoding': 'gzip'})
+
+    # Assert
+    assert large.headers['content-encoding'] == 'gzip'
+    assert large.headers['etag'].endswith('-gzip"')
+    assert large.json() == {'companies': ROWS}
+    assert 'content-encoding' not in small.headers
+
+
+def test_streaming_comprimido_em_pedacos(client):
+    # Act
+    response = client.get('/export/', headers={'Accept-Encoding': 'gzip'})
+
+    # Assert
+    assert response.headers['content-encoding'] == 'gzip'
+    assert response.text.count('\n') == len(ROWS)
+    assert 'etag' not in response.headers
+
+
+def test_if_none_match_responde_304_sem_executar_rota(client, calls):
+    # Arrange
+    first = client.get('/company/', headers={'Accept-Encoding': 'gzip'})
+
+    # Act
+    second = client.get(
+        '/company/',
+        headers={
+            'Accept-Encoding': 'gzip',
+            'If-None-Match': first.headers['etag'],
+        },
+    )
+
+    # Assert
+    assert second.status_code == 304
+    assert second.content == b''
+    assert calls == ['list']
+
+
+def test_escrita_invalida_etag(client, calls):
+    # Arrange
+    etag = client.get('/company/').headers['etag']
+
+    # Act
+    client.post('/company/')
+    again = client.get('/company/', headers={'If-None-Match': etag})
+
+    # Assert
+    # A rota roda de novo, mas o corpo igual ainda gera 304
+    assert again.status_code == 304
+    assert calls == ['list', 'list']
+
+
+def test_gzip_manual_nao_e_comprimido_duas_vezes(client):
+    # Arrange
+    app = FastAPI()
+
+    @app.get('/company/gz')
+    async def already_gzipped():
+        body = gzip.compress(b'x' * 2000)
+        return StreamingResponse(
+            iter([body]),
+            media_type='text/plain',
+            headers={'Content-Encoding': 'gzip'},
+        )
+
+    wrapped = TestClient(CompressionMiddleware(app, minimum_size=10))
+
+    # Act
+    response = wrapped.get('/company/gz', headers={'Accept-Encoding': 'br'})
+
+    # Assert
+    assert response.headers['content-encoding'] == 'gzip'
+    assert response.text == 'x' * 2000
+
+
+def test_304_da_api_tem_cors_e_o_mesmo_etag_do_200():
+    # Arrange
+    tickets = [{'id': i, 'name': f'Chamado {i}'} for i in range(200)]
+    headers = {'Origin': 'https://app.example', 'Accept-Encoding': 'gzip'}
+    routes = 'app.routers.helpdesk_endpoints'
+
+    with (
+        patch('app.services.cache._cache', MemoryCache()),
+        patch(f'{routes}.resolve_fields', AsyncMock(return_value=['name'])),
+        patch(
+            f'{routes}.get_helpdesk_info',
+            AsyncMock(return_value=(tickets, None)),
+        ),
+    ):
+        api = TestClient(main_app)
+
+        # Act
+        first = api.get('/tickets/', headers=headers)
+        second = api.get(
+            '/tickets/',
+            headers={**headers, 'If-None-Match': first.headers['etag']},
+        )
+
+    # Assert
+    assert first.status_code == 200
+    assert first.headers['etag'].endswith('-gzip"')
+    assert second.status_code == 304
+    assert second.headers['etag'] == first.headers['etag']
+    for response in (first, second):
+        assert (
+            response.headers['access-control-allow-origin']
+            == 'https://app.example'
+        )
@@ -0,0 +1,117 @@
+import threading
+from xmlrpc.server import SimpleXMLRPCServer
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.metrics import MetricsMiddleware
+from app.services.metrics import Counter, Histogram, render_metrics
+from app.services.rpc_transport import InstrumentedProxy
+
+
+@pytest.fixture
+def odoo_url():
+    server = SimpleXMLRPCServer(
+        ('127.0.0.1', 0), logRequests=False, allow_none=True
+    )
+
+    def execute_kw(db, uid, password, model, method, args, kwargs=None):
+        if method == 'fail':
+            raise ValueError('erro de negócio')
+        return [{'id': i, 'name': 'x' * 100} for i in range(50)]
+
+    server.register_function(execute_kw)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    # O ServerProxy monta '/xmlrpc/2/object', aceito pelo servidor simples
+    server.RequestHandlerClass.rpc_paths = ('/xmlrpc/2/object',)
+    yield f'http://{host}:{port}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_histograma_no_formato_do_prometheus():
+    # Arrange
+    histogram = Histogram(
+        'test_latency_seconds', 'Latência.', ('route',), (0.1, 1)
+    )
+
+    # Act
+    histogram.observe(0.05, route='/a')
+    histogram.observe(0.5, route='/a')
+    histogram.observe(5, route='/a')
+    text = histogram.render()
+
+    # Assert
+    assert '# TYPE test_latency_seconds histogram' in text
+    assert 'test_latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'test_latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'test_latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'test_latency_seconds_count{route="/a"} 3' in text
+
+
+def test_contador_escapa_rotulos():
+    # Arrange
+    counter = Counter('test_total', 'Total.', ('name',))
+
+    # Act
+    counter.inc(name='a"b\\c')
+    counter.inc(2, name='a"b\\c')
+
+    # Assert
+    assert 'test_total{name="a\\"b\\\\c"} 3' in counter.render()
+
+
+def test_proxy_sincrono_registra_latencia_e_payload(odoo_url):
+    # Arrange
+    models = InstrumentedProxy(odoo_url, 'object')
+
+    # Act
+    records = models.execute_kw(
+        'db', 1, 'pass', 'metrics.test', 'search_read', [[]], {}
+    )
+    with pytest.raises(Exception):
+        models.execute_kw('db', 1, 'pass', 'metrics.test', 'fail', [[]], {})
+    text = render_metrics()
+
+    # Assert
+    assert len(records) == 50
+    labels = 'model="metrics.test",method="search_read"'
+    assert f'odoo_rpc_duration_seconds_count{{{labels}}} 1' in text
+    response_sum = next(
+        line
+        for line in text.splitlines()
+        if line.startswith(f'odoo_rpc_response_bytes_sum{{{labels}}}')
+    )
+    # Bytes trafegados: a resposta grande chega comprimida com gzip
+    assert 0 < int(response_sum.rsplit(' ', 1)[1]) < 5000
+    assert (
+        'odoo_rpc_errors_total'
+        '{model="metrics.test",method="fail",error="Fault"}'
+    ) in text
+
+
+def test_latencia_http_rotulada_pelo_padrao_da_rota():
+    # Arrange
+    app = FastAPI()
+
+    @app.get('/metrics-test/{item_id}')
+    async def item(item_id: int):
+        return {'item_id': item_id}
+
+    api = TestClient(MetricsMiddleware(app))
+
+    # Act
+    api.get('/metrics-test/1')
+    api.get('/metrics-test/2')
+    api.get('/inexistente')
+    text = render_metrics()
+
+    # Assert
+    assert (
+        'http_request_duration_seconds_count'
+        '{method="GET",route="/metrics-test/{item_id}",status="200"} 2'
+    ) in text
+    assert 'route="unmatched",status="404"' in text
@@ -0,0 +1,184 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config.settings import CHANGE_FEED_LAG
+from app.routers.tasks_endpoints import router as tasks_router
+from app.services.mirror_service import OdooMirror, read_from_mirror
+
+TICKETS = [
+    {
+        'id': 1,
+        'name': 'Erro no boleto',
+        'team_id': [2, 'Suporte'],
+        'stage_id': [5, 'Novo'],
+        'write_date': '2024-01-01 10:00:00',
+        'active': True,
+    },
+    {
+        'id': 2,
+        'name': 'Dúvida fiscal',
+        'team_id': [2, 'Suporte'],
+        'stage_id': [6, 'Em andamento'],
+        'write_date': '2024-01-01 11:00:00',
+        'active': True,
+    },
+    {
+        'id': 3,
+        'name': 'Chamado arquivado',
+        'team_id': [2, 'Suporte'],
+        'stage_id': [5, 'Novo'],
+        'write_date': '2024-01-01 12:00:00',
+        'active': False,
+    },
+]
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = OdooMirror(str(tmp_path / 'mirror.sqlite3'))
+    yield mirror
+    mirror.close()
+
+
+def test_search_filtra_por_colunas_indexadas_e_ignora_arquivados(mirror):
+    # Arrange
+    mirror.upsert('helpdesk.ticket', TICKETS)
+
+    # Act
+    by_team, _ = mirror.search('helpdesk.ticket', [('team_id', '=', 2)])
+    by_stage, _ = mirror.search(
+        'helpdesk.ticket', [('stage_id_name', 'ilike', 'novo')], ['id']
+    )
+
+    # Assert
+    assert [t['id'] for t in by_team] == [1, 2]
+    assert by_team[0]['stage_id'] == [5, 'Novo']
+    assert by_stage == [{'id': 1}]
+
+
+def test_search_ilike_ignora_caixa_fora_do_ascii(mirror):
+    # Arrange
+    mirror.upsert(
+        'helpdesk.ticket',
+        [{**TICKETS[0], 'stage_id': [5, 'EM ANÁLISE']}],
+    )
+
+    # Act
+    found, _ = mirror.search(
+        'helpdesk.ticket', [('stage_id_name', 'ilike', 'análise')], ['id']
+    )
+
+    # Assert
+    assert found == [{'id': 1}]
+
+
+def test_search_pagina_com_cursor(mirror):
+    # Arrange
+    mirror.upsert('helpdesk.ticket', TICKETS)
+
+    # Act
+    first, cursor = mirror.search(
+        'helpdesk.ticket', [('team_id', '=', 2)], limit=1
+    )
+    second, last_cursor = mirror.search(
+        'helpdesk.ticket', [('team_id', '=', 2)], limit=1, cursor=cursor
+    )
+
+    # Assert
+    assert [t['id'] for t in first + second] == [1, 2]
+    assert last_cursor is None
+
+
+def test_search_rejeita_coluna_nao_indexada(mirror):
+    with pytest.raises(ValueError, match='Filtro não suportado'):
+        mirror.search('helpdesk.ticket', [('name', '=', 'x')])
+
+
+@pytest.mark.asyncio
+async def test_sync_model_grava_deltas_e_marca_sincronizacao(mirror):
+    # Arrange
+    pages = [
+        {'changes': TICKETS[:2], 'next_watermark': 'w1', 'has_more': True},
+        {'changes': TICKETS[2:], 'next_watermark': 'w2', 'has_more': False},
+    ]
+
+    # Act
+    with patch(
+        'app.services.mirror_service.get_changes',
+        AsyncMock(side_effect=pages),
+    ) as get_changes:
+        total = await mirror.sync_model('helpdesk.ticket')
+
+    # Assert
+    assert total == 3
+    assert get_changes.await_args_list[1].args[1] == 'w1'
+    staleness = mirror.staleness('helpdesk.ticket')
+    assert CHANGE_FEED_LAG <= staleness < CHANGE_FEED_LAG + 5
+    assert mirror.ids('helpdesk.ticket') == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_read_from_mirror_respeita_defasagem_maxima(mirror):
+    # Arrange
+    mirror.upsert('helpdesk.ticket', TICKETS)
+    mirror._set_state('helpdesk.ticket', 'w1', synced=True)
+
+    # Act
+    with (
+        patch('app.services.mirror_service.get_mirror', return_value=mirror),
+        patch.object(mirror, 'staleness', return_value=120),
+    ):
+        fresh = await read_from_mirror(
+            'helpdesk.ticket', [('team_id', '=', 2)], max_staleness=300
+        )
+        stale = await read_from_mirror(
+            'helpdesk.ticket', [('team_id', '=', 2)], max_staleness=60
+        )
+        disabled = await read_from_mirror(
+            'helpdesk.ticket', [('team_id', '=', 2)]
+        )
+
+    # Assert
+    assert [t['id'] for t in fresh[0]] == [1, 2]
+    assert stale is None
+    assert disabled is None
+
+
+def test_tarefas_por_estagio_resolve_o_nome_na_leitura(mirror):
+    # Arrange: a réplica ainda guarda o nome anterior do estágio 7
+    mirror.upsert(
+        'project.task',
+        [
+            {
+                'id': 10,
+                'name': 'Tarefa',
+                'project_id': [1, 'Projeto'],
+                'stage_id': [7, 'Antigo'],
+                'write_date': '2024-01-01 10:00:00',
+            }
+        ],
+    )
+    mirror._set_state('project.task', 'w1', synced=True)
+    app = FastAPI()
+    app.include_router(tasks_router)
+
+    # Act
+    with (
+        patch('app.services.mirror_service.get_mirror', return_value=mirror),
+        patch(
+            'app.routers.tasks_endpoints.get_stage_ids_by_name',
+            AsyncMock(return_value=[7]),
+        ) as stage_ids,
+    ):
+        response = TestClient(app).get(
+            '/projects/1/tasks/stage/Renomeado',
+            params={'max_staleness': 86400},
+        )
+
+    # Assert
+    stage_ids.assert_awaited_once_with('Renomeado')
+    assert response.status_code == 200
+    assert [task['id'] for task in response.json()['tasks']] == [10]
@@ -2,7 +2,10 @@ from unittest.mock import patch
 
 import pytest
 
-from app.services.crm_service import get_opportunities_info
+from app.services.crm_service import (
+    OPPORTUNITY_DEFAULT_FIELDS,
+    get_opportunities_info,
+)
 
 
 def test_get_opportunities_info_sucesso(mock_models, mock_execute_kw):
@@ -22,7 +25,11 @@ def test_get_opportunities_info_sucesso(mock_models, mock_execute_kw):
         'crm.lead',
         'search_read',
         [[]],
-        {'limit': 100, 'offset': 0},
+        {
+            'fields': OPPORTUNITY_DEFAULT_FIELDS,
+            'limit': 100,
+            'offset': 0,
+        },
     )
 
 
@@ -44,7 +51,11 @@ def test_get_opportunities_info_com_limite_e_offset_personalizados(
         'crm.lead',
         'search_read',
         [[]],
-        {'limit': 1, 'offset': 2},
+        {
+            'fields': OPPORTUNITY_DEFAULT_FIELDS,
+            'limit': 1,
+            'offset': 2,
+        },
     )
 
 
@@ -99,5 +110,9 @@ def test_get_opportunities_info_parametrizado(
         'crm.lead',
         'search_read',
         [[]],
-        {'limit': limit, 'offset': offset},
+        {
+            'fields': OPPORTUNITY_DEFAULT_FIELDS,
+            'limit': limit,
+            'offset': offset,
+        },
     )
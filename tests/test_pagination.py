@@ -0,0 +1,131 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers.helpdesk_endpoints import router
+from app.services.async_odoo_client import (
+    AsyncOdooClient,
+    decode_cursor,
+    encode_cursor,
+    keyset_domain,
+)
+
+
+@pytest.fixture
+def client():
+    client = AsyncOdooClient('http://odoo.test', 'db', 'user', 'pass')
+    client.search_read = AsyncMock()
+    yield client
+    client.close()
+
+
+def test_cursor_ida_e_volta():
+    cursor = encode_cursor({'id': 42, 'write_date': '2024-01-01 10:00:00'})
+
+    assert decode_cursor(cursor) == {'k': 'id', 'd': 0, 'id': 42}
+
+
+def test_cursor_write_date_inclui_desempate_por_id():
+    record = {'id': 7, 'write_date': '2024-01-01 10:00:00'}
+    position = decode_cursor(
+        encode_cursor(record, 'write_date'), 'write_date'
+    )
+
+    assert keyset_domain([['active', '=', True]], position) == [
+        ['active', '=', True],
+        '|',
+        ['write_date', '>', '2024-01-01 10:00:00'],
+        '&',
+        ['write_date', '=', '2024-01-01 10:00:00'],
+        ['id', '>', 7],
+    ]
+
+
+@pytest.mark.parametrize(
+    'cursor',
+    ['nao-e-base64!', 'e30', encode_cursor({'id': 1}, descending=True)],
+)
+def test_cursor_invalido(cursor):
+    with pytest.raises(ValueError, match='Cursor de paginação inválido'):
+        decode_cursor(cursor)
+
+
+@pytest.mark.asyncio
+async def test_search_read_page_retorna_proximo_cursor(client):
+    # Arrange
+    client.search_read.return_value = [{'id': 1}, {'id': 2}, {'id': 3}]
+
+    # Act
+    records, next_cursor = await client.search_read_page(
+        'res.partner', [], fields=['name'], limit=2
+    )
+
+    # Assert
+    assert records == [{'id': 1}, {'id': 2}]
+    assert decode_cursor(next_cursor)['id'] == 2
+    client.search_read.assert_awaited_once_with(
+        'res.partner',
+        [],
+        fields=['name', 'id'],
+        limit=3,
+        offset=0,
+        order='id asc',
+        raise_on_error=False,
+        context=None,
+        cache_ttl=None,
+        stale_ttl=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_read_page_com_cursor_ignora_offset(client):
+    # Arrange
+    client.search_read.return_value = [{'id': 11}]
+    cursor = encode_cursor({'id': 10})
+
+    # Act
+    records, next_cursor = await client.search_read_page(
+        'res.partner', [], limit=2, cursor=cursor, offset=500
+    )
+
+    # Assert
+    assert records == [{'id': 11}]
+    assert next_cursor is None
+    client.search_read.assert_awaited_once_with(
+        'res.partner',
+        [['id', '>', 10]],
+        fields=None,
+        limit=3,
+        offset=0,
+        order='id asc',
+        raise_on_error=False,
+        context=None,
+        cache_ttl=None,
+        stale_ttl=None,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('limit', [0, -5])
+async def test_search_read_page_rejeita_limite_invalido(client, limit):
+    with pytest.raises(ValueError, match='Tamanho de página inválido'):
+        await client.search_read_page('res.partner', [], limit=limit)
+
+    client.search_read.assert_not_awaited()
+
+
+def test_rota_paginada_rejeita_limite_fora_da_faixa():
+    # Arrange
+    app = FastAPI()
+    app.include_router(router)
+    api = TestClient(app)
+
+    # Act
+    responses = [
+        api.get('/tickets/', params={'limit': limit}) for limit in (0, 1001)
+    ]
+
+    # Assert
+    assert [r.status_code for r in responses] == [422, 422]
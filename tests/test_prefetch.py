@@ -0,0 +1,102 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.async_odoo_client import AsyncOdooClient
+from app.services.cache import MemoryCache
+
+RELATIONS = {
+    'crm.lead': {
+        'partner_id': {'type': 'many2one', 'relation': 'res.partner'},
+        'team_id': {'type': 'many2one', 'relation': 'crm.team'},
+        'tag_ids': {'type': 'many2many', 'relation': 'crm.tag'},
+        'name': {'type': 'char'},
+    },
+    'crm.team': {
+        'user_id': {'type': 'many2one', 'relation': 'res.users'},
+    },
+}
+
+ROWS = {
+    'res.partner': {
+        10: {'id': 10, 'vat': '111'},
+        11: {'id': 11, 'vat': False},
+    },
+    'crm.team': {5: {'id': 5, 'name': 'Vendas', 'user_id': [2, 'Ana']}},
+    'res.users': {2: {'id': 2, 'login': 'ana'}},
+    'crm.tag': {7: {'id': 7, 'name': 'Quente'}, 8: {'id': 8, 'name': 'Frio'}},
+}
+
+
+async def fake_execute_kw(model, method, args, kwargs=None):
+    if method == 'fields_get':
+        return {name: RELATIONS[model][name] for name in args[0]}
+    return [
+        {
+            field: ROWS[model][i].get(field)
+            for field in ['id', *kwargs['fields']]
+        }
+        for i in args[0]
+    ]
+
+
+@pytest.fixture
+def client():
+    client = AsyncOdooClient('http://odoo.test', 'db', 'user', 'pass')
+    client.execute_kw = AsyncMock(side_effect=fake_execute_kw)
+    with patch('app.services.cache._cache', MemoryCache()):
+        yield client
+    client.close()
+
+
+def reads(client):
+    return [
+        call.args[0]
+        for call in client.execute_kw.await_args_list
+        if call.args[1] == 'read'
+    ]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_faz_um_read_por_modelo_e_nivel(client):
+    # Arrange
+    leads = [
+        {'id': 1, 'partner_id': [10, 'ACME'], 'team_id': [5, 'Vendas']},
+        {'id': 2, 'partner_id': [10, 'ACME'], 'team_id': [5, 'Vendas']},
+        {'id': 3, 'partner_id': [11, 'Beta'], 'team_id': False},
+    ]
+
+    # Act
+    await client.prefetch_related(
+        'crm.lead', leads, ['partner_id.vat', 'team_id.user_id.login']
+    )
+
+    # Assert
+    assert sorted(reads(client)) == ['crm.team', 'res.partner', 'res.users']
+    assert [lead['partner_id.vat'] for lead in leads] == ['111', '111', False]
+    assert leads[0]['team_id.user_id'] == [2, 'Ana']
+    assert leads[1]['team_id.user_id.login'] == 'ana'
+    assert leads[2]['team_id.user_id.login'] is None
+
+
+@pytest.mark.asyncio
+async def test_prefetch_x2many_retorna_lista(client):
+    # Arrange
+    leads = [{'id': 1, 'tag_ids': [7, 8]}, {'id': 2, 'tag_ids': []}]
+
+    # Act
+    await client.prefetch_related('crm.lead', leads, ['tag_ids.name'])
+
+    # Assert
+    assert leads[0]['tag_ids.name'] == ['Quente', 'Frio']
+    assert leads[1]['tag_ids.name'] == []
+    assert reads(client) == ['crm.tag']
+
+
+@pytest.mark.asyncio
+async def test_prefetch_campo_nao_relacional_gera_erro(client):
+    # Act / Assert
+    with pytest.raises(ValueError, match='não é relacional'):
+        await client.prefetch_related(
+            'crm.lead', [{'id': 1, 'name': 'X'}], ['name.id']
+        )
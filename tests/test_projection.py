@@ -0,0 +1,80 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.projection import requested_fields, resolve_fields
+
+SCHEMA = {
+    'name': {'type': 'char'},
+    'partner_id': {'type': 'many2one'},
+    'description': {'type': 'html'},
+    'image_1920': {'type': 'binary'},
+    'tag_ids': {'type': 'many2many'},
+    'order_line': {'type': 'one2many'},
+    'amount_total': {'type': 'monetary'},
+}
+
+
+@pytest.fixture
+def mock_registry():
+    with patch('app.services.projection.schema_registry') as registry:
+        registry.get_fields = AsyncMock(return_value=SCHEMA)
+        yield registry
+
+
+def test_requested_fields_aceita_virgulas_e_repeticoes():
+    # Act
+    result = requested_fields(['name, partner_id', 'name', ''])
+
+    # Assert
+    assert result == ['name', 'partner_id']
+    assert requested_fields(None) is None
+    assert requested_fields([' , ']) is None
+
+
+@pytest.mark.asyncio
+async def test_sem_campos_usa_padrao_sem_consultar_schema(mock_registry):
+    # Act
+    result = await resolve_fields('sale.order', None, ['id', 'name'])
+
+    # Assert
+    assert result == ['id', 'name']
+    mock_registry.get_fields.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_asterisco_exclui_campos_pesados(mock_registry):
+    # Act
+    result = await resolve_fields('sale.order', ['*'], ['id'])
+
+    # Assert
+    assert result == ['id', 'name', 'partner_id', 'amount_total']
+
+
+@pytest.mark.asyncio
+async def test_campo_pesado_explicito_e_mantido(mock_registry):
+    # Act
+    result = await resolve_fields('sale.order', ['*', 'order_line'], ['id'])
+
+    # Assert
+    assert result[-1] == 'order_line'
+    assert 'description' not in result
+
+
+@pytest.mark.asyncio
+async def test_campo_inexistente_gera_value_error(mock_registry):
+    # Act / Assert
+    with pytest.raises(ValueError, match='x_nao_existe'):
+        await resolve_fields('sale.order', ['name', 'x_nao_existe'], ['id'])
+
+
+@pytest.mark.asyncio
+async def test_schema_indisponivel_repassa_campos_pedidos(mock_registry):
+    # Arrange
+    mock_registry.get_fields.side_effect = Exception('Odoo fora do ar')
+
+    # Act
+    result = await resolve_fields('sale.order', ['*', 'name'], ['id'])
+
+    # Assert
+    assert result == ['name']
@@ -0,0 +1,76 @@
+import pandas as pd
+
+from app.schemas.schemas import SelectionFieldValue
+from app.services.custom_fields_service import merge_selection_values
+from app.services.stale_opportunities_service import (
+    build_stale_report_rows,
+    render_stale_report,
+)
+
+
+def test_mescla_selecao_adiciona_e_atualiza_rotulos():
+    # Arrange
+    current = "[('a', 'Opção A'), ('b', 'Opção B')]"
+    values = [
+        SelectionFieldValue(value='b', name='Novo B'),
+        SelectionFieldValue(value='c', name='Opção C'),
+    ]
+
+    # Act
+    merged, added = merge_selection_values(current, values)
+
+    # Assert
+    assert merged == {'a': 'Opção A', 'b': 'Novo B', 'c': 'Opção C'}
+    assert added is True
+
+
+def test_mescla_selecao_sem_valores_novos():
+    # Act
+    merged, added = merge_selection_values(
+        "[('a', 'A')]", [SelectionFieldValue(value='a', name='A')]
+    )
+
+    # Assert
+    assert merged == {'a': 'A'}
+    assert added is False
+
+
+def test_mescla_selecao_invalida_comeca_vazia():
+    # Act
+    merged, added = merge_selection_values(
+        'não é uma lista', [SelectionFieldValue(value='x', name='X')]
+    )
+
+    # Assert
+    assert merged == {'x': 'X'}
+    assert added is True
+
+
+def test_relatorio_de_oportunidades_estagnadas():
+    # Arrange
+    opportunities = [
+        {
+            'id': 1,
+            'name': 'Lead 1',
+            'user_id': [2, 'Ana'],
+            'team_id': [3, 'Vendas'],
+            'write_date': '2024-05-01 10:30:00',
+        },
+        {
+            'id': 2,
+            'name': 'Lead 2',
+            'user_id': False,
+            'team_id': False,
+            'write_date': 'ontem',
+        },
+    ]
+
+    # Act
+    rows = build_stale_report_rows(opportunities)
+    sheet = pd.read_excel(render_stale_report(rows), keep_default_na=False)
+
+    # Assert
+    assert rows[0]['Data da Última Atualização'] == '01/05/2024 10:30:00'
+    assert rows[1]['Vendedor'] == 'N/A'
+    assert rows[1]['Data da Última Atualização'] == 'ontem'
+    assert sheet.to_dict('records') == rows
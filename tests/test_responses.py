@@ -0,0 +1,58 @@
+import datetime
+import decimal
+import json
+from unittest.mock import patch
+
+import numpy as np
+
+from app.utils import responses
+from app.utils.responses import FastJSONResponse, dumps, trusted_response
+
+CONTENT = {
+    'id': 1,
+    'name': 'Ação',
+    'date': datetime.date(2024, 5, 1),
+    'amount': decimal.Decimal('10.50'),
+    'total': np.float64(3.5),
+    'stage_id': [2, 'Novo'],
+}
+EXPECTED = {
+    'id': 1,
+    'name': 'Ação',
+    'date': '2024-05-01',
+    'amount': 10.5,
+    'total': 3.5,
+    'stage_id': [2, 'Novo'],
+}
+
+
+def test_dumps_converte_tipos_do_python_e_numpy():
+    # Act
+    result = dumps(CONTENT)
+
+    # Assert
+    assert json.loads(result) == EXPECTED
+
+
+def test_dumps_sem_orjson_usa_json_padrao():
+    # Act
+    with patch.object(responses, 'orjson', None):
+        result = dumps(CONTENT)
+
+    # Assert
+    assert json.loads(result) == EXPECTED
+    assert 'Ação'.encode() in result
+
+
+def test_trusted_response_respeita_configuracao():
+    # Act
+    with patch.object(responses, 'TRUSTED_RESPONSES', True):
+        trusted = trusted_response({'id': 1}, status_code=201)
+    with patch.object(responses, 'TRUSTED_RESPONSES', False):
+        untrusted = trusted_response({'id': 1})
+
+    # Assert
+    assert isinstance(trusted, FastJSONResponse)
+    assert trusted.status_code == 201
+    assert trusted.body == b'{"id":1}'
+    assert untrusted == {'id': 1}
@@ -0,0 +1,259 @@
+import asyncio
+import xmlrpc.client
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.idempotency import IdempotencyMiddleware
+from app.services.async_odoo_client import AsyncOdooClient
+from app.services.cache import MemoryCache
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.retry import (
+    EXHAUSTED,
+    RECOVERED,
+    RETRIED,
+    RetryPolicy,
+    is_retryable,
+)
+
+
+def bad_gateway():
+    return xmlrpc.client.ProtocolError('odoo', 502, 'Bad Gateway', {})
+
+
+@pytest.fixture
+def client():
+    client = AsyncOdooClient('http://odoo.test', 'db', 'user', 'pass')
+    client._uid = 1
+    client.retry_policy = RetryPolicy(
+        attempts=3, base_delay=0.001, max_delay=0.001, deadline=5
+    )
+    client.breaker = CircuitBreaker('http://odoo.test')
+    client._rpc = Mock()
+    yield client
+    client.close()
+
+
+@pytest.mark.parametrize(
+    'error, expected',
+    [
+        (ConnectionResetError(), True),
+        (TimeoutError(), True),
+        (bad_gateway(), True),
+        (xmlrpc.client.ProtocolError('odoo', 404, 'Not Found', {}), False),
+        (xmlrpc.client.Fault(1, 'ValidationError'), False),
+        (ValueError(), False),
+    ],
+)
+def test_is_retryable(error, expected):
+    assert is_retryable(error) is expected
+
+
+def test_backoff_cresce_ate_o_teto():
+    # Arrange
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.3)
+
+    # Act
+    ceilings = [
+        max(policy.backoff(attempt) for _ in range(200))
+        for attempt in (1, 2, 3, 4)
+    ]
+
+    # Assert
+    assert ceilings[0] <= 0.1
+    assert ceilings[1] <= 0.2
+    assert all(ceiling <= 0.3 for ceiling in ceilings)
+
+
+@pytest.mark.asyncio
+async def test_leitura_repetida_apos_falha_transitoria(client):
+    # Arrange
+    client._rpc.side_effect = [
+        ConnectionResetError(),
+        bad_gateway(),
+        [{'id': 1}],
+    ]
+
+    # Act
+    result = await client.execute_kw('res.partner', 'search_read', [[]])
+
+    # Assert
+    assert result == [{'id': 1}]
+    assert client.retry_counts[('res.partner.search_read', RETRIED)] == 2
+    assert client.retry_counts[('res.partner.search_read', RECOVERED)] == 1
+
+
+@pytest.mark.asyncio
+async def test_leitura_desiste_apos_esgotar_tentativas(client):
+    # Arrange
+    client._rpc.side_effect = ConnectionResetError()
+
+    # Act
+    with pytest.raises(ConnectionResetError):
+        await client.execute_kw('res.partner', 'read', [[1]])
+
+    # Assert
+    assert client._rpc.call_count == 3
+    assert client.retry_counts[('res.partner.read', EXHAUSTED)] == 1
+
+
+@pytest.mark.asyncio
+async def test_prazo_total_limita_tentativas(client):
+    # Arrange
+    client.retry_policy = RetryPolicy(
+        attempts=10, base_delay=1, max_delay=1, deadline=0.001
+    )
+    client._rpc.side_effect = TimeoutError()
+
+    # Act
+    with pytest.raises(TimeoutError):
+        await client.execute_kw('res.partner', 'search', [[]])
+
+    # Assert
+    assert client._rpc.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_escrita_e_fault_nao_sao_repetidos(client):
+    # Arrange
+    client._rpc.side_effect = [
+        ConnectionResetError(),
+        xmlrpc.client.Fault(1, 'ValidationError'),
+    ]
+
+    # Act
+    created = await client.create('res.partner', {'name': 'ACME'})
+    with pytest.raises(xmlrpc.client.Fault):
+        await client.execute_kw('res.partner', 'search_read', [[]])
+
+    # Assert
+    assert created is None
+    assert client._rpc.call_count == 2
+    assert not client.retry_counts
+
+
+@pytest.fixture
+def writes():
+    return []
+
+
+@pytest.fixture
+def api(writes):
+    app = FastAPI()
+
+    @app.post('/tickets/')
+    async def create_ticket(request: Request):
+        payload = await request.json()
+        writes.append(payload)
+        if payload.get('fail'):
+            return JSONResponse({'detail': 'erro'}, status_code=503)
+        return {'ticket_id': len(writes)}
+
+    app.add_middleware(IdempotencyMiddleware, ttl=60)
+
+    with patch('app.services.cache._cache', MemoryCache()):
+        yield TestClient(app)
+
+
+def test_repeticao_com_mesma_chave_nao_duplica_escrita(api, writes):
+    # Arrange
+    headers = {'Idempotency-Key': 'abc'}
+    first = api.post('/tickets/', json={'name': 'x'}, headers=headers)
+
+    # Act
+    second = api.post('/tickets/', json={'name': 'x'}, headers=headers)
+    other = api.post(
+        '/tickets/', json={'name': 'x'}, headers={'Idempotency-Key': 'def'}
+    )
+
+    # Assert
+    assert second.json() == first.json() == {'ticket_id': 1}
+    assert second.headers['idempotent-replayed'] == 'true'
+    assert other.json() == {'ticket_id': 2}
+    assert len(writes) == 2
+
+
+def test_mesma_chave_com_outro_corpo_responde_422(api, writes):
+    # Arrange
+    headers = {'Idempotency-Key': 'abc'}
+    api.post('/tickets/', json={'name': 'x'}, headers=headers)
+
+    # Act
+    response = api.post('/tickets/', json={'name': 'y'}, headers=headers)
+
+    # Assert
+    assert response.status_code == 422
+    assert len(writes) == 1
+
+
+def test_falha_5xx_libera_a_chave(api, writes):
+    # Arrange
+    headers = {'Idempotency-Key': 'abc'}
+    api.post('/tickets/', json={'fail': True}, headers=headers)
+
+    # Act
+    retried = api.post('/tickets/', json={'fail': True}, headers=headers)
+
+    # Assert
+    assert retried.status_code == 503
+    assert 'idempotent-replayed' not in retried.headers
+    assert len(writes) == 2
+
+
+def test_cache_fora_do_ar_recusa_escrita_com_chave(api, writes):
+    # Arrange
+    headers = {'Idempotency-Key': 'abc'}
+
+    # Act
+    with patch(
+        'app.services.cache._cache.add',
+        AsyncMock(side_effect=ConnectionError('cache fora do ar')),
+    ):
+        response = api.post('/tickets/', json={'name': 'x'}, headers=headers)
+
+    # Assert
+    assert response.status_code == 503
+    assert writes == []
+
+
+@pytest.mark.asyncio
+async def test_requisicoes_simultaneas_com_mesma_chave_escrevem_uma_vez():
+    # Arrange
+    release = asyncio.Event()
+    writes = []
+
+    async def app(scope, receive, send):
+        writes.append(scope['path'])
+        await release.wait()
+        await JSONResponse({'ticket_id': 1})(scope, receive, send)
+
+    middleware = IdempotencyMiddleware(app, ttl=60)
+    transport = httpx.ASGITransport(app=middleware)
+    headers = {'Idempotency-Key': 'abc'}
+
+    # Act
+    with patch('app.services.cache._cache', MemoryCache()):
+        async with httpx.AsyncClient(
+            transport=transport, base_url='http://api'
+        ) as client:
+            first = asyncio.create_task(
+                client.post('/tickets/', json={}, headers=headers)
+            )
+            second = asyncio.create_task(
+                client.post('/tickets/', json={}, headers=headers)
+            )
+            done, _ = await asyncio.wait({first, second}, timeout=1)
+            release.set()
+            await asyncio.gather(first, second)
+
+    # Assert
+    assert [task.result().status_code for task in done] == [409]
+    assert {first.result().status_code, second.result().status_code} == {
+        200,
+        409,
+    }
+    assert len(writes) == 1
@@ -0,0 +1,132 @@
+import logging
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.rpc_recorder import RpcRecorderMiddleware
+from app.services.rpc_recorder import (
+    RepeatedCallError,
+    RouteReport,
+    expect_repeated_calls,
+)
+from app.services.rpc_transport import TimeoutTransport, call_rpc
+
+
+def odoo_call(model, method, *args):
+    proxy = Mock()
+    proxy.execute_kw.return_value = []
+    call_rpc(
+        proxy,
+        TimeoutTransport(),
+        'object',
+        'execute_kw',
+        ('db', 1, 'pass', model, method, list(args), {}),
+    )
+
+
+def recorded_api(mode, threshold=3):
+    app = FastAPI()
+
+    @app.get('/partners/loop')
+    def partners_loop():
+        for partner_id in range(5):
+            odoo_call('res.partner', 'read', [partner_id])
+        return {}
+
+    @app.get('/partners/search')
+    def partners_search():
+        odoo_call('res.partner', 'search_read', [('id', '=', 1)])
+        odoo_call('res.partner', 'search_read', [('name', '=', 'x')])
+        odoo_call('res.partner', 'search_read', [('vat', '=', 'y')])
+        odoo_call('res.partner', 'search_read', [('ref', '=', 'z')])
+        return {}
+
+    @app.get('/partners/pages')
+    def partners_pages():
+        expect_repeated_calls('res.partner')
+        for page in range(5):
+            odoo_call('res.partner', 'search_read', [('id', '>', page)])
+        return {}
+
+    middleware = RpcRecorderMiddleware(app, mode=mode, threshold=threshold)
+    return TestClient(middleware)
+
+
+@pytest.fixture
+def report():
+    report = RouteReport()
+    with patch('app.middleware.rpc_recorder.route_report', report):
+        yield report
+
+
+def test_chamada_repetida_falha_no_modo_raise(report):
+    # Arrange
+    api = recorded_api('raise')
+
+    # Act / Assert
+    with pytest.raises(RepeatedCallError, match=r'res.partner.read x5'):
+        api.get('/partners/loop')
+
+
+def test_chamada_repetida_so_avisa_no_modo_warn(report, caplog):
+    # Arrange
+    api = recorded_api('warn')
+
+    # Act
+    with caplog.at_level(logging.WARNING):
+        response = api.get('/partners/loop')
+
+    # Assert
+    assert response.status_code == 200
+    assert 'Possível N+1 em GET /partners/loop' in caplog.text
+
+
+def test_dominios_diferentes_nao_sao_repeticao(report):
+    # Act
+    response = recorded_api('raise').get('/partners/search')
+
+    # Assert
+    assert response.status_code == 200
+
+
+def test_repeticao_esperada_e_ignorada(report):
+    # Act
+    response = recorded_api('raise').get('/partners/pages')
+
+    # Assert
+    assert response.status_code == 200
+
+
+def test_relatorio_por_rota(report):
+    # Arrange
+    api = recorded_api('warn')
+
+    # Act
+    api.get('/partners/loop')
+    api.get('/partners/loop')
+    api.get('/partners/search')
+
+    # Assert
+    loop, search = report.report().items()
+    assert loop == (
+        'GET /partners/loop',
+        {
+            'requests': 2,
+            'calls': 10,
+            'max_calls': 5,
+            'shapes': {'res.partner.read': 5},
+        },
+    )
+    assert search[1]['max_calls'] == 4
+    assert search[1]['shapes']["res.partner.search_read [('id', '=', '?')]"]
+
+
+def test_modo_off_nao_conta(report):
+    # Act
+    response = recorded_api('off').get('/partners/loop')
+
+    # Assert
+    assert response.status_code == 200
+    assert report.report() == {}
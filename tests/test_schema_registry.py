@@ -0,0 +1,111 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.cache import MemoryCache
+from app.services.fields_inspection_service import filter_fields
+from app.services.schema_registry import SchemaRegistry
+
+FIELDS = {
+    'name': {'string': 'Nome', 'type': 'char', 'help': False},
+    'stage_id': {'string': 'Estágio', 'type': 'many2one', 'help': False},
+    'x_studio_tese_2': {'string': 'Tese', 'type': 'selection', 'help': ''},
+}
+
+
+@pytest.fixture
+def mock_client():
+    client = AsyncMock()
+    client.execute_kw.return_value = FIELDS
+    with patch('app.services.cache._cache', MemoryCache()), patch(
+        'app.services.schema_registry.get_odoo_client',
+        AsyncMock(return_value=client),
+    ):
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_get_fields_consulta_odoo_uma_vez(mock_client):
+    # Arrange
+    registry = SchemaRegistry(ttl=60)
+
+    # Act
+    first, second = await asyncio.gather(
+        registry.get_fields('project.task'),
+        registry.get_fields('project.task'),
+    )
+    third = await registry.get_fields('project.task')
+
+    # Assert
+    assert first == second == third == FIELDS
+    mock_client.execute_kw.assert_awaited_once_with(
+        'project.task', 'fields_get', [], {}
+    )
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forca_nova_leitura(mock_client):
+    # Arrange
+    registry = SchemaRegistry(ttl=60)
+    await registry.get_fields('project.task')
+
+    # Act
+    await registry.invalidate('project.task')
+    await registry.get_fields('project.task')
+
+    # Assert
+    assert mock_client.execute_kw.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_ttl_expirado_serve_copia_e_atualiza_em_segundo_plano(
+    mock_client,
+):
+    # Arrange
+    registry = SchemaRegistry(ttl=0)
+    await registry.get_fields('project.task')
+    mock_client.execute_kw.return_value = {'name': FIELDS['name']}
+
+    # Act
+    stale = await registry.get_fields('project.task')
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    refreshed = registry._entries['fields:project.task'].value
+
+    # Assert
+    assert stale == FIELDS
+    assert refreshed == {'name': FIELDS['name']}
+
+
+@pytest.mark.asyncio
+async def test_invalidacao_durante_leitura_descarta_resultado(mock_client):
+    # Arrange
+    registry = SchemaRegistry(ttl=60)
+    release = asyncio.Event()
+
+    async def slow_fields_get(*args):
+        await release.wait()
+        return FIELDS
+
+    mock_client.execute_kw.side_effect = slow_fields_get
+
+    # Act
+    pending = asyncio.create_task(registry.get_fields('project.task'))
+    await asyncio.sleep(0)
+    await registry.invalidate('project.task')
+    release.set()
+    await pending
+
+    # Assert
+    assert 'fields:project.task' not in registry._entries
+
+
+def test_filter_fields_por_tipo_termo_e_atributos():
+    # Act
+    result = filter_fields(
+        FIELDS, attributes=['type'], field_type='many2one', search_term='est'
+    )
+
+    # Assert
+    assert result == {'stage_id': {'type': 'many2one'}}
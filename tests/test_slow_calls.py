@@ -0,0 +1,168 @@
+import threading
+import time
+from unittest.mock import patch
+from xmlrpc.server import SimpleXMLRPCServer
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.main import app as main_app
+from app.middleware.request_context import RequestContextMiddleware
+from app.services.async_odoo_client import AsyncOdooClient
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.slow_calls import SlowCallLog, call_shape, domain_shape
+
+TOKEN = 'segredo'
+
+
+@pytest.fixture
+def slow_odoo():
+    server = SimpleXMLRPCServer(
+        ('127.0.0.1', 0), logRequests=False, allow_none=True
+    )
+    server.RequestHandlerClass.rpc_paths = ('/xmlrpc/2/object',)
+
+    def execute_kw(*args):
+        time.sleep(0.05)
+        return [{'id': 1}, {'id': 2}]
+
+    server.register_function(execute_kw)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    yield f'http://{host}:{port}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def admin():
+    with patch('app.routers.admin_endpoints.ADMIN_TOKEN', TOKEN):
+        yield TestClient(main_app)
+
+
+def test_forma_do_dominio_ignora_valores():
+    # Act
+    first = domain_shape([('partner_id', '=', 7), '|', ('active', '=', 1)])
+    second = domain_shape([('partner_id', '=', 9), '|', ('active', '=', 0)])
+
+    # Assert
+    assert first == second
+    assert '7' not in first
+
+
+def test_forma_da_chamada_por_metodo():
+    # Arrange
+    prefix = ('db', 1, 'pass', 'crm.lead')
+
+    # Act
+    search = call_shape(
+        'search_read', (*prefix, 'search_read', [[('id', '=', 1)]], {})
+    )
+    keyword = call_shape(
+        'search_count',
+        (*prefix, 'search_count', [], {'domain': [('id', '=', 1)]}),
+    )
+    write = call_shape('write', (*prefix, 'write', [[1, 2, 3], {}], {}))
+
+    # Assert
+    assert search == ("[('id', '=', '?')]", None)
+    assert keyword == search
+    assert write == (None, 3)
+
+
+def test_registro_guarda_so_chamadas_lentas_e_e_limitado():
+    # Arrange
+    log = SlowCallLog(threshold=0.5, size=2)
+    args = ('db', 1, 'pass', 'crm.lead', 'read', [[1]], {})
+
+    # Act
+    log.record('crm.lead', 'read', args, 0.1)
+    for duration in (1, 2, 3):
+        log.record('crm.lead', 'read', args, duration, records=1)
+
+    # Assert
+    assert [entry['duration'] for entry in log.entries()] == [3, 2]
+    assert log.entries()[0]['route'] is None
+
+
+def test_chamada_lenta_registra_a_rota(slow_odoo):
+    # Arrange
+    client = AsyncOdooClient(slow_odoo, 'db', 'user', 'pass')
+    client._uid = 1
+    client.breaker = CircuitBreaker(slow_odoo)
+    app = FastAPI()
+
+    @app.get('/leads/{stage}')
+    async def leads(stage: str):
+        return await client.execute_kw(
+            'crm.lead', 'search_read', [[('stage_id', '=', stage)]]
+        )
+
+    log = SlowCallLog(threshold=0.01)
+
+    # Act
+    with patch('app.services.rpc_transport.slow_calls', log):
+        TestClient(RequestContextMiddleware(app)).get('/leads/novo')
+    client.close()
+
+    # Assert
+    [entry] = log.entries()
+    assert entry['route'] == 'GET /leads/{stage}'
+    assert entry['model'] == 'crm.lead'
+    assert entry['method'] == 'search_read'
+    assert entry['domain'] == "[('stage_id', '=', '?')]"
+    assert entry['records'] == 2
+    assert entry['duration'] >= 0.05
+
+
+def test_admin_desativado_sem_token_configurado():
+    # Act
+    response = TestClient(main_app).get('/admin/slow-calls')
+
+    # Assert
+    assert response.status_code == 404
+
+
+def test_admin_exige_token_correto(admin):
+    # Act
+    missing = admin.get('/admin/slow-calls')
+    wrong = admin.get('/admin/slow-calls', headers={'X-Admin-Token': 'x'})
+    right = admin.get('/admin/slow-calls', headers={'X-Admin-Token': TOKEN})
+
+    # Assert
+    assert missing.status_code == 401
+    assert wrong.status_code == 401
+    assert right.status_code == 200
+    assert 'calls' in right.json()
+
+
+def busy_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_profiler_retorna_pilhas_no_formato_folded(admin):
+    # Arrange
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_loop, args=(stop,), name='busy')
+    worker.start()
+
+    # Act
+    try:
+        response = admin.get(
+            '/admin/profile',
+            params={'seconds': 0.3},
+            headers={'X-Admin-Token': TOKEN},
+        )
+    finally:
+        stop.set()
+        worker.join()
+
+    # Assert
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    busy = [line for line in lines if line.startswith('busy;')]
+    assert busy
+    assert 'busy_loop (test_slow_calls.py:' in busy[0]
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
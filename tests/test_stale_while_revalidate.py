@@ -0,0 +1,109 @@
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.cache_age import CacheAgeMiddleware
+from app.services.async_odoo_client import AsyncOdooClient
+from app.services.cache import MemoryCache, record_cache_age
+from app.services.circuit_breaker import CircuitBreaker
+
+OLD = [{'id': 1, 'name': 'Antigo'}]
+NEW = [{'id': 1, 'name': 'Novo'}]
+
+
+@pytest.fixture
+def client():
+    client = AsyncOdooClient('http://odoo.test', 'db', 'user', 'pass')
+    client._uid = 1
+    client.breaker = CircuitBreaker('http://odoo.test')
+    client._rpc = Mock(return_value=OLD)
+    with patch('app.services.cache._cache', MemoryCache()):
+        yield client
+    client.close()
+
+
+async def read(client, cache_ttl, stale_ttl):
+    return await client.search_read(
+        'helpdesk.ticket',
+        [['team_id', '=', 1]],
+        cache_ttl=cache_ttl,
+        stale_ttl=stale_ttl,
+    )
+
+
+@pytest.mark.asyncio
+async def test_leitura_vencida_servida_na_hora_e_revalidada(client):
+    # Arrange
+    await read(client, 0.05, 5)
+    client._rpc.return_value = NEW
+    await asyncio.sleep(0.1)
+
+    # Act
+    stale = await asyncio.gather(*(read(client, 0.05, 5) for _ in range(5)))
+    await asyncio.gather(*client._background_tasks)
+    fresh = await read(client, 0.05, 5)
+
+    # Assert
+    assert all(result == OLD for result in stale)
+    assert fresh == NEW
+    # Uma leitura inicial e uma única revalidação
+    assert client._rpc.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_leitura_acima_da_defasagem_maxima_vai_ao_odoo(client):
+    # Arrange
+    await read(client, 0.01, 0.01)
+    client._rpc.return_value = NEW
+    await asyncio.sleep(0.05)
+
+    # Act
+    result = await read(client, 0.01, 0.01)
+
+    # Assert
+    assert result == NEW
+    assert not client._background_tasks
+
+
+@pytest.mark.asyncio
+async def test_escrita_invalida_leituras_do_modelo(client):
+    # Arrange
+    await read(client, 60, 60)
+    client._rpc.return_value = True
+
+    # Act
+    await client.write('helpdesk.ticket', 1, {'stage_id': 2})
+    client._rpc.return_value = NEW
+    result = await read(client, 60, 60)
+
+    # Assert
+    assert result == NEW
+
+
+def test_middleware_informa_idade_dos_dados():
+    # Arrange
+    app = FastAPI()
+
+    @app.get('/cached')
+    async def cached():
+        record_cache_age(3.7)
+        record_cache_age(12.2, stale=True)
+        return {'ok': True}
+
+    @app.get('/live')
+    async def live():
+        return {'ok': True}
+
+    api = TestClient(CacheAgeMiddleware(app))
+
+    # Act
+    cached_response = api.get('/cached')
+    live_response = api.get('/live')
+
+    # Assert
+    assert cached_response.headers['age'] == '12'
+    assert cached_response.headers['x-cache'] == 'stale'
+    assert 'age' not in live_response.headers
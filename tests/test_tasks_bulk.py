@@ -0,0 +1,136 @@
+import xmlrpc.client
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers.tasks_endpoints import router
+from app.services.admission import UpstreamOverloadedError
+from app.services.tasks_project_service import (
+    update_tasks_sale_order_bulk,
+    update_tasks_stage_bulk,
+)
+
+
+@pytest.fixture
+def mock_client():
+    client = AsyncMock()
+    with patch(
+        'app.services.tasks_project_service.get_odoo_client',
+        AsyncMock(return_value=client),
+    ):
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_update_tasks_stage_bulk_agrupa_writes(mock_client):
+    # Arrange
+    mock_client.search_read.return_value = [
+        {'id': 1, 'stage_id': [3, 'Novo']},
+        {'id': 2, 'stage_id': [3, 'Novo']},
+        {'id': 3, 'stage_id': [5, 'Feito']},
+        {'id': 4, 'stage_id': [3, 'Novo']},
+    ]
+    mock_client.write.return_value = True
+
+    # Act
+    result = await update_tasks_stage_bulk([
+        (1, 5),
+        (2, 5),
+        (3, 5),
+        (4, 7),
+        (9, 5),
+    ])
+
+    # Assert
+    mock_client.search_read.assert_called_once_with(
+        'project.task',
+        [['id', 'in', [1, 2, 3, 4, 9]]],
+        fields=['id', 'stage_id'],
+        raise_on_error=True,
+        context={'active_test': False},
+    )
+    assert mock_client.write.await_count == 2
+    mock_client.write.assert_any_await('project.task', [1, 2], {'stage_id': 5})
+    mock_client.write.assert_any_await('project.task', [4], {'stage_id': 7})
+    assert sorted(result['updated']) == [1, 2, 4]
+    assert result['unchanged'] == [3]
+    assert result['not_found'] == [9]
+    assert result['failed'] == []
+
+
+@pytest.mark.asyncio
+async def test_update_tasks_sale_order_bulk_reporta_falhas(mock_client):
+    # Arrange
+    mock_client.search_read.return_value = [
+        {'id': 1, 'sale_order_id': False},
+        {'id': 2, 'sale_order_id': False},
+    ]
+    mock_client.write.side_effect = [True, False]
+
+    # Act
+    result = await update_tasks_sale_order_bulk([(1, 10), (2, 20)])
+
+    # Assert
+    assert result['updated'] == [1]
+    assert result['failed'] == [2]
+    assert result['not_found'] == []
+
+
+@pytest.mark.asyncio
+async def test_update_tasks_stage_bulk_mantem_grupos_gravados(mock_client):
+    # Arrange
+    mock_client.search_read.return_value = [
+        {'id': 1, 'stage_id': False},
+        {'id': 2, 'stage_id': False},
+    ]
+
+    async def write(model, ids, values):
+        if values['stage_id'] == 6:
+            raise UpstreamOverloadedError('Odoo sobrecarregado', 5)
+        return True
+
+    mock_client.write.side_effect = write
+
+    # Act
+    result = await update_tasks_stage_bulk([(1, 5), (2, 6)])
+
+    # Assert
+    assert result['updated'] == [1]
+    assert result['failed'] == [2]
+
+
+@pytest.mark.asyncio
+async def test_update_tasks_stage_bulk_propaga_falha_de_leitura(mock_client):
+    # Arrange
+    mock_client.search_read.side_effect = ConnectionRefusedError()
+
+    # Act / Assert
+    with pytest.raises(ConnectionRefusedError):
+        await update_tasks_stage_bulk([(1, 5)])
+    mock_client.write.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    ('error', 'status'),
+    [
+        (ConnectionRefusedError(), 503),
+        (xmlrpc.client.Fault(2, 'Access Denied'), 502),
+    ],
+)
+def test_bulk_mapeia_falha_do_odoo_para_5xx(mock_client, error, status):
+    # Arrange
+    app = FastAPI()
+    app.include_router(router)
+    mock_client.search_read.side_effect = error
+
+    # Act
+    response = TestClient(app).patch(
+        '/projects/tasks/stage/bulk',
+        json={'updates': [{'task_id': 1, 'stage_id': 5}]},
+    )
+
+    # Assert
+    assert response.status_code == status
+    mock_client.write.assert_not_awaited()
@@ -0,0 +1,182 @@
+import json
+import threading
+from unittest.mock import patch
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.tracing import TracingMiddleware
+from app.services.async_odoo_client import AsyncOdooClient
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.tracing import (
+    CLIENT,
+    SERVER,
+    FileExporter,
+    Span,
+    Tracer,
+    parse_traceparent,
+)
+
+TRACE_ID = '4bf92f3577b34da6a3ce929d0e0e4736'
+PARENT_ID = '00f067aa0ba902b7'
+
+
+class MemoryExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+
+@pytest.fixture
+def odoo():
+    received = []
+
+    class Handler(SimpleXMLRPCRequestHandler):
+        rpc_paths = ('/xmlrpc/2/object',)
+
+        def do_POST(self):
+            received.append(self.headers.get('traceparent'))
+            super().do_POST()
+
+    server = SimpleXMLRPCServer(
+        ('127.0.0.1', 0), Handler, logRequests=False, allow_none=True
+    )
+    server.register_function(
+        lambda *args: [{'id': 1}, {'id': 2}, {'id': 3}], 'execute_kw'
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    yield f'http://{host}:{port}', received
+    server.shutdown()
+    server.server_close()
+
+
+def traced_api(url, sample_rate):
+    client = AsyncOdooClient(url, 'db', 'user', 'pass')
+    client._uid = 1
+    client.breaker = CircuitBreaker(url)
+    app = FastAPI()
+
+    @app.get('/leads/{stage}')
+    async def leads(stage: str):
+        return await client.execute_kw('crm.lead', 'search_read', [[]])
+
+    exporter = MemoryExporter()
+    tracer = Tracer(exporter, sample_rate=sample_rate)
+    return TestClient(TracingMiddleware(app)), tracer, exporter, client
+
+
+def test_traceparent_valido():
+    # Act
+    parsed = parse_traceparent(f'00-{TRACE_ID}-{PARENT_ID}-01')
+
+    # Assert
+    assert parsed == (TRACE_ID, PARENT_ID, True)
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        None,
+        'lixo',
+        f'00-{"0" * 32}-{PARENT_ID}-01',
+        f'00-{TRACE_ID}-{"0" * 16}-01',
+        f'00-{TRACE_ID}-{PARENT_ID}',
+    ],
+)
+def test_traceparent_invalido_e_ignorado(value):
+    assert parse_traceparent(value) is None
+
+
+def test_requisicao_gera_span_pai_da_chamada_ao_odoo(odoo):
+    # Arrange
+    url, received = odoo
+    api, tracer, exporter, client = traced_api(url, sample_rate=1.0)
+
+    # Act
+    with patch('app.services.tracing._tracer', tracer):
+        response = api.get('/leads/novo')
+    tracer.close()
+    client.close()
+
+    # Assert
+    server, rpc = sorted(exporter.spans, key=lambda span: span.kind)
+    assert server.kind == SERVER
+    assert server.name == 'GET /leads/{stage}'
+    assert server.attributes['http.response.status_code'] == 200
+    assert response.headers['X-Trace-Id'] == server.trace_id
+    assert rpc.kind == CLIENT
+    assert rpc.name == 'odoo crm.lead.search_read'
+    assert rpc.trace_id == server.trace_id
+    assert rpc.parent_id == server.span_id
+    assert rpc.attributes['odoo.records'] == 3
+    assert rpc.attributes['odoo.request_bytes'] > 0
+    assert rpc.attributes['odoo.response_bytes'] > 0
+    # O Odoo recebe o traceparent do span da chamada
+    assert received == [f'00-{rpc.trace_id}-{rpc.span_id}-01']
+
+
+def test_traceparent_recebido_continua_o_rastreio(odoo):
+    # Arrange
+    url, _ = odoo
+    api, tracer, exporter, client = traced_api(url, sample_rate=0.0)
+
+    # Act
+    with patch('app.services.tracing._tracer', tracer):
+        api.get(
+            '/leads/novo',
+            headers={'traceparent': f'00-{TRACE_ID}-{PARENT_ID}-01'},
+        )
+    tracer.close()
+    client.close()
+
+    # Assert
+    server = next(s for s in exporter.spans if s.kind == SERVER)
+    assert server.trace_id == TRACE_ID
+    assert server.parent_id == PARENT_ID
+
+
+def test_sem_amostragem_nada_e_rastreado(odoo):
+    # Arrange
+    url, received = odoo
+    api, tracer, exporter, client = traced_api(url, sample_rate=0.0)
+
+    # Act
+    with patch('app.services.tracing._tracer', tracer):
+        response = api.get(
+            '/leads/novo',
+            headers={'traceparent': f'00-{TRACE_ID}-{PARENT_ID}-00'},
+        )
+    tracer.close()
+    client.close()
+
+    # Assert
+    assert response.status_code == 200
+    assert 'X-Trace-Id' not in response.headers
+    assert exporter.spans == []
+    assert received == [None]
+
+
+def test_exportador_de_arquivo_grava_otlp_json(tmp_path):
+    # Arrange
+    path = tmp_path / 'traces.jsonl'
+    span = Span('GET /leads', TRACE_ID, PARENT_ID, end=2, start=1)
+    span.attributes['odoo.records'] = 3
+
+    # Act
+    FileExporter(str(path)).export([span])
+    FileExporter(str(path)).export([span])
+
+    # Assert
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    payload = json.loads(lines[0])
+    exported = payload['resourceSpans'][0]['scopeSpans'][0]['spans'][0]
+    assert exported['traceId'] == TRACE_ID
+    assert exported['attributes'] == [
+        {'key': 'odoo.records', 'value': {'intValue': '3'}}
+    ]
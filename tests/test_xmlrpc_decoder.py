@@ -0,0 +1,207 @@
+import xmlrpc.client
+from array import array
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.services import xmlrpc_decoder
+from app.services.rpc_transport import TimeoutTransport
+
+RECORDS = [
+    {
+        'id': 1,
+        'name': 'Ação & <Cia> "ltda"\n',
+        'partner_id': [7, 'ACME'],
+        'user_id': False,
+        'expected_revenue': 1500.5,
+        'tag_ids': [],
+        'description': '',
+        'extra': {'nested': [[1, 2], {}]},
+    },
+    {
+        'id': 2,
+        'name': 'Lead 2',
+        'partner_id': False,
+        'user_id': [3, 'Ana'],
+        'expected_revenue': 0.0,
+        'tag_ids': [4, 5],
+        'description': None,
+        'extra': {},
+    },
+]
+
+
+def response(*params, **kwargs):
+    return xmlrpc.client.dumps(
+        params, methodresponse=True, allow_none=True, **kwargs
+    ).encode()
+
+
+@pytest.mark.parametrize(
+    'options',
+    [{}, {'use_datetime': True}, {'use_builtin_types': True}],
+)
+def test_resultado_igual_ao_do_xmlrpc_client(options):
+    # Arrange
+    payload = response([
+        *RECORDS,
+        xmlrpc.client.DateTime(datetime(2024, 5, 1, 10, 30)),
+        xmlrpc.client.Binary(b'\x00pdf'),
+        True,
+    ])
+
+    # Act
+    result = xmlrpc_decoder.loads(payload, **options)
+
+    # Assert
+    assert result == xmlrpc.client.loads(payload, **options)
+
+
+def test_value_sem_tipo_formatado_e_extensoes():
+    # Arrange
+    payload = (
+        b"<?xml version='1.0'?><methodResponse><params>"
+        b'<param><value>texto</value></param>'
+        b'<param><value></value></param>'
+        b'<param><value>\n  <int>5</int>\n</value></param>'
+        b'<param><value><ex:nil/></value></param>'
+        b'<param><value><i8>1099511627776</i8></value></param>'
+        b'</params></methodResponse>'
+    )
+
+    # Act
+    params, _ = xmlrpc_decoder.loads(payload)
+
+    # Assert
+    assert params == ('texto', '', 5, None, 2**40)
+
+
+def test_array_compacto_sem_quebras_de_linha():
+    # Arrange
+    payload = (
+        b'<methodResponse><params><param><value><array><data>'
+        b'<value><int>1</int></value><value><string>a</string></value>'
+        b'</data></array></value></param></params></methodResponse>'
+    )
+
+    # Act
+    result = xmlrpc_decoder.loads(payload)
+
+    # Assert
+    assert result == xmlrpc.client.loads(payload) == (([1, 'a'],), None)
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        (b'<value></value>', ''),
+        (b'<value/>', ''),
+        (
+            b'<value><struct><member><name>a</name><value></value>'
+            b'</member></struct></value>',
+            {'a': ''},
+        ),
+        (
+            b'<value><array><data><value></value><value><int>1</int>'
+            b'</value></data></array></value>',
+            ['', 1],
+        ),
+    ],
+)
+def test_strings_vazias_sem_tipo(value, expected):
+    # Arrange
+    payload = (
+        b'<methodResponse><params><param>%s</param></params>'
+        b'</methodResponse>' % value
+    )
+
+    # Act
+    result = xmlrpc_decoder.loads(payload)
+
+    # Assert
+    assert result == xmlrpc.client.loads(payload) == ((expected,), None)
+
+
+def test_falha_no_parse_rapido_usa_o_xmlrpc_client():
+    # Arrange
+    payload = response(RECORDS)
+
+    # Act
+    with patch(
+        'app.services.xmlrpc_decoder.strip_wrappers',
+        return_value=(b'<methodResponse><params>', True),
+    ):
+        result = xmlrpc_decoder.loads(payload)
+
+    # Assert
+    assert result == xmlrpc.client.loads(payload)
+
+
+def test_fault_levanta_excecao():
+    # Arrange
+    payload = xmlrpc.client.dumps(
+        xmlrpc.client.Fault(2, 'Regra de acesso'), methodresponse=True
+    ).encode()
+
+    # Act / Assert
+    with pytest.raises(xmlrpc.client.Fault, match='Regra de acesso'):
+        xmlrpc_decoder.loads(payload)
+
+
+def test_resposta_incompleta_levanta_response_error():
+    # Arrange
+    parser, unmarshaller = xmlrpc_decoder.getparser()
+    parser.feed(b'<methodResponse><params><param><value><array><data>')
+
+    # Act / Assert
+    with pytest.raises(Exception):
+        parser.close()
+    with pytest.raises(xmlrpc.client.ResponseError):
+        unmarshaller.close()
+
+
+def test_modo_colunar():
+    # Act
+    [columns], _ = xmlrpc_decoder.loads(response(RECORDS), columnar=True)
+
+    # Assert
+    assert columns['id'] == array('q', [1, 2])
+    assert columns['expected_revenue'] == array('d', [1500.5, 0.0])
+    assert columns['partner_id'] == [[7, 'ACME'], False]
+    assert columns['extra'] == [{'nested': [[1, 2], {}]}, {}]
+
+
+def test_modo_colunar_preenche_campos_ausentes():
+    # Arrange
+    payload = response([{'id': 1, 'a': 'x'}, {'id': 2, 'b': 'y'}])
+
+    # Act
+    [columns], _ = xmlrpc_decoder.loads(payload, columnar=True)
+
+    # Assert
+    assert columns == {
+        'id': array('q', [1, 2]),
+        'a': ['x', None],
+        'b': [None, 'y'],
+    }
+
+
+def test_modo_colunar_mantem_listas_de_ids():
+    # Act
+    params, _ = xmlrpc_decoder.loads(response([1, 2, 3]), columnar=True)
+
+    # Assert
+    assert params == ([1, 2, 3],)
+
+
+def test_transporte_usa_o_decodificador_rapido_se_habilitado():
+    # Act
+    with patch('app.services.rpc_transport.XMLRPC_FAST_DECODER', True):
+        parser, _ = TimeoutTransport().getparser()
+    with patch('app.services.rpc_transport.XMLRPC_FAST_DECODER', False):
+        stock_parser, _ = TimeoutTransport().getparser()
+
+    # Assert
+    assert isinstance(parser, xmlrpc_decoder.BufferedParser)
+    assert not isinstance(stock_parser, xmlrpc_decoder.BufferedParser)